@@ -1,3 +1,4 @@
+from inference.core.utils.startup_profiling import startup_profiler  # isort:skip
 import json
 from mangum import Mangum
 
@@ -13,13 +14,17 @@ from inference.core.registries.roboflow import (
 from inference.models.utils import ROBOFLOW_MODEL_TYPES
 
 
-model_registry = RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)
+with startup_profiler.stage("model_manager_initialisation"):
+    model_registry = RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)
 
-if ACTIVE_LEARNING_ENABLED:
-    model_manager = ActiveLearningManager(model_registry=model_registry, cache=cache)
-else:
-    model_manager = ModelManager(model_registry)
+    if ACTIVE_LEARNING_ENABLED:
+        model_manager = ActiveLearningManager(model_registry=model_registry, cache=cache)
+    else:
+        model_manager = ModelManager(model_registry)
 
-model_manager = WithFixedSizeCache(model_manager, max_size=MAX_ACTIVE_MODELS)
-interface = HttpInterface(model_manager)
+    model_manager = WithFixedSizeCache(model_manager, max_size=MAX_ACTIVE_MODELS)
+with startup_profiler.stage("http_interface_initialisation"):
+    interface = HttpInterface(model_manager)
 handler = Mangum(interface.app, lifespan="off")
+
+startup_profiler.finish()
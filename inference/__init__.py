@@ -1,3 +1,25 @@
-from inference.core.interfaces.stream.stream import Stream  # isort:skip
-from inference.core.interfaces.stream.inference_pipeline import InferencePipeline
-from inference.models.utils import get_model, get_roboflow_model
+import importlib
+from typing import Any
+
+# public entities of the package are imported on first access, such that importing
+# any `inference.*` module does not pull the whole stream / models stack
+_LAZY_ATTRIBUTES = {
+    "Stream": "inference.core.interfaces.stream.stream",
+    "InferencePipeline": "inference.core.interfaces.stream.inference_pipeline",
+    "get_model": "inference.models.utils",
+    "get_roboflow_model": "inference.models.utils",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES.keys())
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + __all__)
@@ -1,5 +1,5 @@
 from contextlib import contextmanager
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from inference.core import logger
 
@@ -35,6 +35,29 @@ class BaseCache:
         """
         raise NotImplementedError()
 
+    def get_many(self, keys: List[str]) -> List[Any]:
+        """
+        Gets the values associated with the given keys.
+
+        Args:
+            keys (List[str]): The keys to retrieve the values.
+
+        Returns:
+            List[Any]: The values associated with the keys (None for keys which do not exist or are expired).
+        """
+        return [self.get(key) for key in keys]
+
+    def set_many(self, values: Dict[str, Any], expire: float = None) -> None:
+        """
+        Sets values for given keys with an optional expire time.
+
+        Args:
+            values (Dict[str, Any]): The values to store, by key.
+            expire (float, optional): The time, in seconds, after which the keys will expire. Defaults to None.
+        """
+        for key, value in values.items():
+            self.set(key, value, expire=expire)
+
     def zadd(self, key: str, value: str, score: float, expire: float = None):
         """
         Adds a member with the specified score to the sorted set stored at key.
@@ -50,6 +73,19 @@ class BaseCache:
         """
         raise NotImplementedError()
 
+    def zadd_many(
+        self, entries: List[Tuple[str, Any, float]], expire: float = None
+    ) -> None:
+        """
+        Adds multiple members to sorted sets.
+
+        Args:
+            entries (List[Tuple[str, Any, float]]): Tuples of key of the sorted set, value and score.
+            expire (float, optional): The time, in seconds, after which the members will expire. Defaults to None.
+        """
+        for key, value, score in entries:
+            self.zadd(key=key, value=value, score=score, expire=expire)
+
     def zrangebyscore(
         self,
         key: str,
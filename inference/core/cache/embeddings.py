@@ -0,0 +1,396 @@
+import hashlib
+import os
+import shutil
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional
+
+import numpy as np
+
+from inference.core import logger
+from inference.core.env import (
+    EMBEDDINGS_DISK_CACHE_DIR,
+    EMBEDDINGS_DISK_CACHE_MAX_SIZE_MB,
+)
+from inference.core.models.utils.memory import get_object_memory_bytes
+
+BYTES_IN_MB = 1024 * 1024
+ALIASES_DIR = "aliases"
+TMP_PREFIX = ".tmp-"
+ARRAY_EXTENSION = ".npy"
+
+Serializer = Callable[[Any], Dict[str, np.ndarray]]
+Deserializer = Callable[[Dict[str, np.ndarray]], Any]
+
+
+@dataclass
+class EmbeddingsCacheStats:
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.disk_hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return (self.hits + self.disk_hits) / lookups
+
+
+@dataclass(frozen=True)
+class CachedEmbedding:
+    value: Any
+    size: int
+
+
+class DiskEmbeddingsStore:
+    """Persists embeddings as a directory per entry with one `.npy` file per array,
+    such that entries are memory-mapped on load rather than read upfront. Entries are
+    written under digest of the key, aliases are kept as small text files pointing to
+    keys. Store is bounded by total size of files - least recently used entries
+    are removed first."""
+
+    def __init__(self, directory: str, max_size_bytes: int):
+        self._directory = directory
+        self._aliases_directory = os.path.join(directory, ALIASES_DIR)
+        self._max_size_bytes = max(max_size_bytes, 0)
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = Lock()
+        os.makedirs(self._aliases_directory, exist_ok=True)
+        self._load_index()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return get_key_digest(key=key) in self._entries
+
+    def save(self, key: str, arrays: Dict[str, np.ndarray]) -> None:
+        digest = get_key_digest(key=key)
+        with self._lock:
+            if digest in self._entries:
+                self._entries.move_to_end(digest)
+                return None
+        entry_path = os.path.join(self._directory, digest)
+        tmp_path = os.path.join(self._directory, f"{TMP_PREFIX}{uuid.uuid4().hex}")
+        os.makedirs(tmp_path)
+        try:
+            for name, array in arrays.items():
+                np.save(
+                    os.path.join(tmp_path, f"{name}{ARRAY_EXTENSION}"),
+                    array,
+                    allow_pickle=False,
+                )
+            size = get_directory_size(path=tmp_path)
+            os.rename(tmp_path, entry_path)
+        except OSError as error:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            if not os.path.isdir(entry_path):
+                raise error
+            # entry saved concurrently by another writer
+            return None
+        with self._lock:
+            self._entries[digest] = size
+            self._size_bytes += size
+            to_remove = self._pop_excess_entries()
+        remove_directories(paths=[os.path.join(self._directory, d) for d in to_remove])
+
+    def load(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        digest = get_key_digest(key=key)
+        with self._lock:
+            if digest not in self._entries:
+                return None
+            self._entries.move_to_end(digest)
+        entry_path = os.path.join(self._directory, digest)
+        try:
+            arrays = {
+                file_name[: -len(ARRAY_EXTENSION)]: np.load(
+                    os.path.join(entry_path, file_name),
+                    mmap_mode="r",
+                    allow_pickle=False,
+                )
+                for file_name in os.listdir(entry_path)
+                if file_name.endswith(ARRAY_EXTENSION)
+            }
+            os.utime(entry_path)
+        except (OSError, ValueError) as error:
+            logger.warning(f"Could not load embedding {key} from disk: {error}")
+            with self._lock:
+                size = self._entries.pop(digest, None)
+                if size is not None:
+                    self._size_bytes -= size
+            remove_directories(paths=[entry_path])
+            return None
+        return arrays
+
+    def save_alias(self, alias: str, key: str) -> None:
+        alias_path = os.path.join(self._aliases_directory, get_key_digest(key=alias))
+        tmp_path = f"{alias_path}{TMP_PREFIX}{uuid.uuid4().hex}"
+        with open(tmp_path, "w") as f:
+            f.write(key)
+        os.replace(tmp_path, alias_path)
+
+    def resolve_alias(self, alias: str) -> Optional[str]:
+        return read_alias_file(
+            path=os.path.join(self._aliases_directory, get_key_digest(key=alias))
+        )
+
+    def _load_index(self) -> None:
+        found_entries = []
+        for dir_entry in os.scandir(self._directory):
+            if not dir_entry.is_dir() or dir_entry.name == ALIASES_DIR:
+                continue
+            if dir_entry.name.startswith(TMP_PREFIX):
+                shutil.rmtree(dir_entry.path, ignore_errors=True)
+                continue
+            size = get_directory_size(path=dir_entry.path)
+            found_entries.append((dir_entry.stat().st_mtime, dir_entry.name, size))
+        for _, digest, size in sorted(found_entries):
+            self._entries[digest] = size
+            self._size_bytes += size
+        remove_directories(
+            paths=[os.path.join(self._directory, d) for d in self._pop_excess_entries()]
+        )
+        for dir_entry in os.scandir(self._aliases_directory):
+            key = read_alias_file(path=dir_entry.path)
+            if key is None or get_key_digest(key=key) not in self._entries:
+                try:
+                    os.remove(dir_entry.path)
+                except OSError:
+                    pass
+
+    def _pop_excess_entries(self) -> List[str]:
+        removed = []
+        while self._size_bytes > self._max_size_bytes and self._entries:
+            digest, size = self._entries.popitem(last=False)
+            self._size_bytes -= size
+            removed.append(digest)
+        return removed
+
+
+class EmbeddingsCache:
+    """Thread-safe LRU of image embeddings, bounded by number of entries and by total
+    size of the arrays (or tensors) it holds. Entries are expected to be keyed by image hash,
+    while caller-provided identifiers (like `image_id`) may be registered as aliases
+    of the hash - such that the same image is embedded once, regardless of the name.
+
+    Optionally, entries are written through to `DiskEmbeddingsStore` (which requires
+    `serializer` and `deserializer` to convert values into named numpy arrays and back) -
+    entries evicted from memory, or lost on model reload, are brought back from disk
+    instead of being re-computed.
+
+    Indexing, iteration and `in` operator only look at in-memory entries and do not
+    affect the eviction order nor the stats - `get(...)` and `put(...)` are the tiered API.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_size_bytes: int,
+        disk_store: Optional[DiskEmbeddingsStore] = None,
+        serializer: Optional[Serializer] = None,
+        deserializer: Optional[Deserializer] = None,
+    ):
+        if disk_store is not None and (serializer is None or deserializer is None):
+            raise ValueError(
+                "Both `serializer` and `deserializer` must be given to use disk store."
+            )
+        self._max_entries = max(max_entries, 0)
+        self._max_size_bytes = max(max_size_bytes, 0)
+        self._disk_store = disk_store
+        self._serializer = serializer
+        self._deserializer = deserializer
+        self._entries: "OrderedDict[Hashable, CachedEmbedding]" = OrderedDict()
+        self._aliases: Dict[Hashable, Hashable] = {}
+        self._entries_aliases: Dict[Hashable, List[Hashable]] = {}
+        self._size_bytes = 0
+        self._stats = EmbeddingsCacheStats()
+        self._lock = Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    @property
+    def stats(self) -> EmbeddingsCacheStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._aliases.get(key, key) in self._entries
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._entries.keys()))
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            return self._entries[self._aliases.get(key, key)].value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.put(key=key, value=value)
+
+    def get(self, key: Hashable, count_miss: bool = True) -> Optional[Any]:
+        """Looks up the value in memory first, then on disk. Disk hits are promoted into
+        memory. `count_miss=False` is meant for speculative lookups (like by caller-provided
+        identifier, followed by lookup by image hash) not to skew the hit rate."""
+        with self._lock:
+            entry = self._entries.get(self._aliases.get(key, key))
+            if entry is not None:
+                self._entries.move_to_end(self._aliases.get(key, key))
+                self._stats.hits += 1
+                return entry.value
+        value = self._load_from_disk(key=key)
+        with self._lock:
+            if value is not None:
+                self._stats.disk_hits += 1
+            elif count_miss:
+                self._stats.misses += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._put_in_memory(key=key, value=value)
+        if self._disk_store is None or not isinstance(key, str):
+            return None
+        try:
+            self._disk_store.save(key=key, arrays=self._serializer(value))
+        except Exception as error:
+            logger.warning(f"Could not save embedding {key} to disk: {error}")
+
+    def add_alias(self, alias: Hashable, key: Hashable) -> None:
+        with self._lock:
+            self._register_alias(alias=alias, key=key)
+        if self._disk_store is None or not isinstance(alias, str):
+            return None
+        try:
+            self._disk_store.save_alias(alias=alias, key=key)
+        except OSError as error:
+            logger.warning(f"Could not save embedding alias {alias} to disk: {error}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+            self._entries_aliases.clear()
+            self._size_bytes = 0
+
+    def _load_from_disk(self, key: Hashable) -> Optional[Any]:
+        if self._disk_store is None or not isinstance(key, str):
+            return None
+        resolved_key = key
+        if key not in self._disk_store:
+            resolved_key = self._disk_store.resolve_alias(alias=key)
+            if resolved_key is None:
+                return None
+        arrays = self._disk_store.load(key=resolved_key)
+        if arrays is None:
+            return None
+        try:
+            value = self._deserializer(arrays)
+        except Exception as error:
+            logger.warning(f"Could not deserialize embedding {key}: {error}")
+            return None
+        self._put_in_memory(key=resolved_key, value=value)
+        if resolved_key != key:
+            with self._lock:
+                self._register_alias(alias=key, key=resolved_key)
+        return value
+
+    def _put_in_memory(self, key: Hashable, value: Any) -> None:
+        entry = CachedEmbedding(value=value, size=get_object_memory_bytes(value))
+        if self._max_entries == 0 or entry.size > self._max_size_bytes:
+            return None
+        with self._lock:
+            previous_entry = self._entries.pop(key, None)
+            if previous_entry is not None:
+                self._size_bytes -= previous_entry.size
+            self._entries[key] = entry
+            self._size_bytes += entry.size
+            while (
+                len(self._entries) > self._max_entries
+                or self._size_bytes > self._max_size_bytes
+            ):
+                evicted_key, evicted_entry = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_entry.size
+                for alias in self._entries_aliases.pop(evicted_key, []):
+                    self._aliases.pop(alias, None)
+                self._stats.evictions += 1
+
+    def _register_alias(self, alias: Hashable, key: Hashable) -> None:
+        if alias == key or key not in self._entries:
+            return None
+        previous_key = self._aliases.get(alias)
+        if previous_key is not None and alias in self._entries_aliases.get(
+            previous_key, []
+        ):
+            self._entries_aliases[previous_key].remove(alias)
+        self._aliases[alias] = key
+        self._entries_aliases.setdefault(key, []).append(alias)
+
+
+def build_embeddings_cache(
+    model_id: str,
+    max_entries: int,
+    max_size_mb: float,
+    serializer: Optional[Serializer] = None,
+    deserializer: Optional[Deserializer] = None,
+) -> EmbeddingsCache:
+    disk_store = None
+    if (
+        EMBEDDINGS_DISK_CACHE_DIR is not None
+        and serializer is not None
+        and deserializer is not None
+    ):
+        try:
+            disk_store = DiskEmbeddingsStore(
+                directory=os.path.join(EMBEDDINGS_DISK_CACHE_DIR, model_id),
+                max_size_bytes=int(EMBEDDINGS_DISK_CACHE_MAX_SIZE_MB * BYTES_IN_MB),
+            )
+        except OSError as error:
+            logger.warning(
+                f"Could not initialise embeddings disk store for {model_id}: {error}"
+            )
+    return EmbeddingsCache(
+        max_entries=max_entries,
+        max_size_bytes=int(max_size_mb * BYTES_IN_MB),
+        disk_store=disk_store,
+        serializer=serializer,
+        deserializer=deserializer,
+    )
+
+
+def get_key_digest(key: str) -> str:
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def get_directory_size(path: str) -> int:
+    total = 0
+    for dir_entry in os.scandir(path):
+        if dir_entry.is_file():
+            total += dir_entry.stat().st_size
+    return total
+
+
+def read_alias_file(path: str) -> Optional[str]:
+    if TMP_PREFIX in os.path.basename(path):
+        return None
+    try:
+        with open(path) as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def remove_directories(paths: List[str]) -> None:
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
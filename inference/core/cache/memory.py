@@ -1,20 +1,74 @@
+import heapq
+import itertools
 import threading
 import time
+from bisect import bisect_left, bisect_right
 from threading import Lock
-from typing import Any, Optional
+from typing import Any, List, Optional, Tuple
 
 from inference.core.cache.base import BaseCache
 from inference.core.env import MEMORY_CACHE_EXPIRE_INTERVAL
 
 
+class SortedSet:
+    """
+    Members of sorted set kept in order of scores (and insertion order for equal scores),
+    such that range queries are resolved with bisection instead of a scan. Every member
+    is kept separately - members with the same score do not overwrite each other.
+
+    Scores are expected to be mostly increasing (timestamps), for which insertion is an
+    append to the end of the arrays.
+    """
+
+    def __init__(self) -> None:
+        self._scores: List[float] = []
+        self._ids: List[int] = []
+        self._values: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def add(self, member_id: int, value: Any, score: float) -> None:
+        index = bisect_right(self._scores, score)
+        self._scores.insert(index, score)
+        self._ids.insert(index, member_id)
+        self._values.insert(index, value)
+
+    def range_by_score(self, min: float, max: float) -> Tuple[List[Any], List[float]]:
+        start, end = self._find_range(min=min, max=max)
+        return self._values[start:end], self._scores[start:end]
+
+    def remove_range_by_score(self, min: float, max: float) -> int:
+        start, end = self._find_range(min=min, max=max)
+        del self._scores[start:end]
+        del self._ids[start:end]
+        del self._values[start:end]
+        return end - start
+
+    def remove_member(self, member_id: int, score: float) -> bool:
+        start, end = self._find_range(min=score, max=score)
+        for index in range(start, end):
+            if self._ids[index] == member_id:
+                del self._scores[index]
+                del self._ids[index]
+                del self._values[index]
+                return True
+        return False
+
+    def _find_range(self, min: float, max: float) -> Tuple[int, int]:
+        start = bisect_left(self._scores, min)
+        end = bisect_right(self._scores, max, lo=start)
+        return start, end
+
+
 class MemoryCache(BaseCache):
     """
     MemoryCache is an in-memory cache that implements the BaseCache interface.
 
     Attributes:
-        cache (dict): A dictionary to store the cache values.
+        cache (dict): A dictionary to store the cache values (and sorted sets).
         expires (dict): A dictionary to store the expiration times of the cache values.
-        zexpires (dict): A dictionary to store the expiration times of the sorted set values.
+        _expiration_queue (list): A heap of scheduled expirations of cache values and members of sorted sets.
         _expire_thread (threading.Thread): A thread that runs the _expire method.
     """
 
@@ -24,7 +78,9 @@ class MemoryCache(BaseCache):
         """
         self.cache = dict()
         self.expires = dict()
-        self.zexpires = dict()
+        self._expiration_queue: List[Tuple[float, int, str, Optional[float]]] = []
+        self._members_ids = itertools.count()
+        self._state_lock = threading.RLock()
 
         self._expire_thread = threading.Thread(target=self._expire)
         self._expire_thread.daemon = True
@@ -32,29 +88,31 @@ class MemoryCache(BaseCache):
 
     def _expire(self):
         """
-        Removes the expired keys from the cache and zexpires dictionaries.
+        Removes the expired keys and members of sorted sets from the cache.
 
         This method runs in an infinite loop and sleeps for MEMORY_CACHE_EXPIRE_INTERVAL seconds between each iteration.
         """
         while True:
             now = time.time()
-            keys_to_delete = []
-            for k, v in self.expires.copy().items():
-                if v < now:
-                    keys_to_delete.append(k)
-            for k in keys_to_delete:
-                del self.cache[k]
-                del self.expires[k]
-            keys_to_delete = []
-            for k, v in self.zexpires.copy().items():
-                if v < now:
-                    keys_to_delete.append(k)
-            for k in keys_to_delete:
-                del self.cache[k[0]][k[1]]
-                del self.zexpires[k]
+            self._remove_expired(now=now)
             while time.time() - now < MEMORY_CACHE_EXPIRE_INTERVAL:
                 time.sleep(0.1)
 
+    def _remove_expired(self, now: float) -> None:
+        # only expirations which are due are visited - entries of the heap referring to
+        # keys which were overwritten (or members already removed) are skipped
+        with self._state_lock:
+            while self._expiration_queue and self._expiration_queue[0][0] < now:
+                expire_at, member_id, key, score = heapq.heappop(self._expiration_queue)
+                if score is None:
+                    if self.expires.get(key) == expire_at:
+                        del self.cache[key]
+                        del self.expires[key]
+                    continue
+                sorted_set = self.cache.get(key)
+                if isinstance(sorted_set, SortedSet):
+                    sorted_set.remove_member(member_id=member_id, score=score)
+
     def get(self, key: str):
         """
         Gets the value associated with the given key.
@@ -65,12 +123,13 @@ class MemoryCache(BaseCache):
         Returns:
             str: The value associated with the key, or None if the key does not exist or is expired.
         """
-        if key in self.expires:
-            if self.expires[key] < time.time():
-                del self.cache[key]
-                del self.expires[key]
-                return None
-        return self.cache.get(key)
+        with self._state_lock:
+            if key in self.expires:
+                if self.expires[key] < time.time():
+                    del self.cache[key]
+                    del self.expires[key]
+                    return None
+            return self.cache.get(key)
 
     def set(self, key: str, value: str, expire: float = None):
         """
@@ -81,9 +140,16 @@ class MemoryCache(BaseCache):
             value (str): The value to store.
             expire (float, optional): The time, in seconds, after which the key will expire. Defaults to None.
         """
-        self.cache[key] = value
-        if expire:
-            self.expires[key] = expire + time.time()
+        with self._state_lock:
+            self.cache[key] = value
+            if not expire:
+                self.expires.pop(key, None)
+                return None
+            expire_at = expire + time.time()
+            self.expires[key] = expire_at
+            heapq.heappush(
+                self._expiration_queue, (expire_at, next(self._members_ids), key, None)
+            )
 
     def zadd(self, key: str, value: Any, score: float, expire: float = None):
         """
@@ -95,11 +161,30 @@ class MemoryCache(BaseCache):
             score (float): The score associated with the value.
             expire (float, optional): The time, in seconds, after which the key will expire. Defaults to None.
         """
-        if not key in self.cache:
-            self.cache[key] = dict()
-        self.cache[key][score] = value
-        if expire:
-            self.zexpires[(key, score)] = expire + time.time()
+        member_id = next(self._members_ids)
+        with self._state_lock:
+            if not key in self.cache:
+                self.cache[key] = SortedSet()
+            self.cache[key].add(member_id=member_id, value=value, score=score)
+            if expire:
+                heapq.heappush(
+                    self._expiration_queue,
+                    (expire + time.time(), member_id, key, score),
+                )
+
+    def zadd_many(
+        self, entries: List[Tuple[str, Any, float]], expire: float = None
+    ) -> None:
+        """
+        Adds multiple members to sorted sets.
+
+        Args:
+            entries (List[Tuple[str, Any, float]]): Tuples of key of the sorted set, value and score.
+            expire (float, optional): The time, in seconds, after which the members will expire. Defaults to None.
+        """
+        with self._state_lock:
+            for key, value, score in entries:
+                self.zadd(key=key, value=value, score=score, expire=expire)
 
     def zrangebyscore(
         self,
@@ -120,13 +205,13 @@ class MemoryCache(BaseCache):
         Returns:
             list: A list of values (or value-score pairs if withscores is True) in the specified score range.
         """
-        if not key in self.cache:
-            return []
-        keys = sorted([k for k in self.cache[key].keys() if min <= k <= max])
+        with self._state_lock:
+            if not key in self.cache:
+                return []
+            values, scores = self.cache[key].range_by_score(min=min, max=max)
         if withscores:
-            return [(self.cache[key][k], k) for k in keys]
-        else:
-            return [self.cache[key][k] for k in keys]
+            return list(zip(values, scores))
+        return values
 
     def zremrangebyscore(
         self,
@@ -145,11 +230,10 @@ class MemoryCache(BaseCache):
         Returns:
             int: The number of members removed from the sorted set.
         """
-        res = self.zrangebyscore(key, min=min, max=max, withscores=True)
-        keys_to_delete = [k[1] for k in res]
-        for k in keys_to_delete:
-            del self.cache[key][k]
-        return len(keys_to_delete)
+        with self._state_lock:
+            if not key in self.cache:
+                return 0
+            return self.cache[key].remove_range_by_score(min=min, max=max)
 
     def acquire_lock(self, key: str, expire=None) -> Any:
         lock: Optional[Lock] = self.get(key)
@@ -5,25 +5,24 @@ import pickle
 import threading
 import time
 from contextlib import asynccontextmanager
-from copy import copy
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import redis
 
 from inference.core import logger
 from inference.core.cache.base import BaseCache
 from inference.core.entities.responses.inference import InferenceResponseImage
-from inference.core.env import MEMORY_CACHE_EXPIRE_INTERVAL
+from inference.core.env import MEMORY_CACHE_EXPIRE_INTERVAL, REDIS_MAX_CONNECTIONS
 
 
 class RedisCache(BaseCache):
     """
-    MemoryCache is an in-memory cache that implements the BaseCache interface.
+    RedisCache is a Redis-backed cache that implements the BaseCache interface.
 
     Attributes:
-        cache (dict): A dictionary to store the cache values.
-        expires (dict): A dictionary to store the expiration times of the cache values.
-        zexpires (dict): A dictionary to store the expiration times of the sorted set values.
+        client (redis.Redis): Redis client, using a pool of at most `max_connections` connections.
+        _expiring_keys (dict): Keys of sorted sets with members added with expiration time, mapped to
+            the (longest) expiration time requested for the key.
         _expire_thread (threading.Thread): A thread that runs the _expire method.
     """
 
@@ -34,47 +33,71 @@ class RedisCache(BaseCache):
         db: int = 0,
         ssl: bool = False,
         timeout: float = 2.0,
+        max_connections: int = REDIS_MAX_CONNECTIONS,
     ) -> None:
         """
-        Initializes a new instance of the MemoryCache class.
+        Initializes a new instance of the RedisCache class.
         """
-        self.client = redis.Redis(
+        connection_pool = redis.BlockingConnectionPool(
             host=host,
             port=port,
             db=db,
-            decode_responses=False,
-            ssl=ssl,
+            max_connections=max_connections,
+            timeout=timeout,
+            connection_class=redis.SSLConnection if ssl else redis.Connection,
             socket_timeout=timeout,
             socket_connect_timeout=timeout,
         )
+        self.client = redis.Redis(
+            connection_pool=connection_pool, decode_responses=False
+        )
         logger.debug("Attempting to diagnose Redis connection...")
         self.client.ping()
         logger.debug("Redis connection established.")
-        self.zexpires = dict()
+        self._expiring_keys: Dict[str, float] = {}
+        self._expiring_keys_lock = threading.Lock()
 
         self._expire_thread = threading.Thread(target=self._expire, daemon=True)
         self._expire_thread.start()
 
     def _expire(self):
         """
-        Removes the expired keys from the cache and zexpires dictionaries.
+        Removes the expired members of sorted sets.
 
         This method runs in an infinite loop and sleeps for MEMORY_CACHE_EXPIRE_INTERVAL seconds between each iteration.
         """
         while True:
             logger.debug("Redis cleaner thread starts cleaning...")
             now = time.time()
-            for k, v in copy(list(self.zexpires.items())):
-                if v < now:
-                    tolerance_factor = 1e-14  # floating point accuracy
-                    self.zremrangebyscore(
-                        k[0], k[1] - tolerance_factor, k[1] + tolerance_factor
-                    )
-                    del self.zexpires[k]
+            try:
+                self.remove_expired_members(now=now)
+            except redis.RedisError as error:
+                logger.warning(f"Could not remove expired members from Redis: {error}")
             logger.debug("Redis cleaner finished task.")
             sleep_time = MEMORY_CACHE_EXPIRE_INTERVAL - (time.time() - now)
             time.sleep(max(sleep_time, 0))
 
+    def remove_expired_members(self, now: float) -> int:
+        """
+        Removes members of sorted sets which expiration time passed - within single round trip to Redis.
+        Scores of members added with expiration time are timestamps, so expired members of each sorted
+        set are removed with single ranged delete.
+
+        Args:
+            now (float): Timestamp to compare expiration times against.
+
+        Returns:
+            int: The number of members removed.
+        """
+        with self._expiring_keys_lock:
+            expiring_keys = list(self._expiring_keys.items())
+        if not expiring_keys:
+            return 0
+        pipeline = self.client.pipeline(transaction=False)
+        for key, expire in expiring_keys:
+            pipeline.zremrangebyscore(key, "-inf", now - expire)
+        return sum(pipeline.execute())
+
     def get(self, key: str):
         """
         Gets the value associated with the given key.
@@ -85,12 +108,7 @@ class RedisCache(BaseCache):
         Returns:
             str: The value associated with the key, or None if the key does not exist or is expired.
         """
-        item = self.client.get(key)
-        if item is not None:
-            try:
-                return json.loads(item)
-            except (TypeError, ValueError):
-                return item
+        return _deserialize_value(item=self.client.get(key))
 
     def set(self, key: str, value: str, expire: float = None):
         """
@@ -105,6 +123,37 @@ class RedisCache(BaseCache):
             value = json.dumps(value)
         self.client.set(key, value, ex=expire)
 
+    def get_many(self, keys: List[str]) -> List[Any]:
+        """
+        Gets the values associated with the given keys within single round trip to Redis.
+
+        Args:
+            keys (List[str]): The keys to retrieve the values.
+
+        Returns:
+            List[Any]: The values associated with the keys (None for keys which do not exist or are expired).
+        """
+        if not keys:
+            return []
+        return [_deserialize_value(item=item) for item in self.client.mget(keys)]
+
+    def set_many(self, values: Dict[str, Any], expire: float = None) -> None:
+        """
+        Sets values for given keys with an optional expire time within single round trip to Redis.
+
+        Args:
+            values (Dict[str, Any]): The values to store, by key.
+            expire (float, optional): The time, in seconds, after which the keys will expire. Defaults to None.
+        """
+        if not values:
+            return None
+        pipeline = self.client.pipeline(transaction=False)
+        for key, value in values.items():
+            if not isinstance(value, bytes):
+                value = json.dumps(value)
+            pipeline.set(key, value, ex=expire)
+        pipeline.execute()
+
     def zadd(self, key: str, value: Any, score: float, expire: float = None):
         """
         Adds a member with the specified score to the sorted set stored at key.
@@ -112,14 +161,35 @@ class RedisCache(BaseCache):
         Args:
             key (str): The key of the sorted set.
             value (str): The value to add to the sorted set.
-            score (float): The score associated with the value.
-            expire (float, optional): The time, in seconds, after which the key will expire. Defaults to None.
+            score (float): The score associated with the value - timestamp, if `expire` is given.
+            expire (float, optional): The time, in seconds, after which the member will expire
+                (counted from its score). Defaults to None.
+        """
+        self.zadd_many(entries=[(key, value, score)], expire=expire)
+
+    def zadd_many(
+        self, entries: List[Tuple[str, Any, float]], expire: float = None
+    ) -> None:
         """
-        # serializable_value = self.ensure_serializable(value)
-        value = json.dumps(value)
-        self.client.zadd(key, {value: score})
-        if expire:
-            self.zexpires[(key, score)] = expire + time.time()
+        Adds multiple members to sorted sets within single round trip to Redis.
+
+        Args:
+            entries (List[Tuple[str, Any, float]]): Tuples of key of the sorted set, value and score
+                (timestamp, if `expire` is given).
+            expire (float, optional): The time, in seconds, after which the members will expire
+                (counted from their scores). Defaults to None.
+        """
+        if not entries:
+            return None
+        pipeline = self.client.pipeline(transaction=False)
+        for key, value, score in entries:
+            pipeline.zadd(key, {json.dumps(value): score})
+        pipeline.execute()
+        if not expire:
+            return None
+        with self._expiring_keys_lock:
+            for key, _, _ in entries:
+                self._expiring_keys[key] = max(self._expiring_keys.get(key, 0), expire)
 
     def zrangebyscore(
         self,
@@ -194,3 +264,12 @@ class RedisCache(BaseCache):
             return pickle.loads(serialized_value)
         else:
             return None
+
+
+def _deserialize_value(item: Optional[bytes]) -> Any:
+    if item is None:
+        return None
+    try:
+        return json.loads(item)
+    except (TypeError, ValueError):
+        return item
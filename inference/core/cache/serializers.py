@@ -14,13 +14,28 @@ def to_cachable_inference_item(
     infer_request: InferenceRequest,
     infer_response: Union[InferenceResponse, List[InferenceResponse]],
 ) -> dict:
+    return jsonable_encoder(
+        capture_inference_item(
+            infer_request=infer_request, infer_response=infer_response
+        )
+    )
+
+
+def capture_inference_item(
+    infer_request: InferenceRequest,
+    infer_response: Union[InferenceResponse, List[InferenceResponse]],
+) -> dict:
+    """Selects data of inference item to be cached, without JSON-encoding it (see
+    `to_cachable_inference_item(...)`). With TINY_CACHE, only condensed request and
+    response are kept - otherwise request and response objects are referenced as they are.
+    """
     if not TINY_CACHE:
         return {
             "inference_id": infer_request.id,
             "inference_server_version": __version__,
             "inference_server_id": GLOBAL_INFERENCE_SERVER_ID,
-            "request": jsonable_encoder(infer_request),
-            "response": jsonable_encoder(infer_response),
+            "request": infer_request,
+            "response": infer_response,
         }
 
     included_request_fields = {
@@ -38,8 +53,8 @@ def to_cachable_inference_item(
         "inference_id": infer_request.id,
         "inference_server_version": __version__,
         "inference_server_id": GLOBAL_INFERENCE_SERVER_ID,
-        "request": jsonable_encoder(request),
-        "response": jsonable_encoder(response),
+        "request": request,
+        "response": response,
     }
 
 
@@ -40,6 +40,14 @@ class ModelDescriptionEntity(BaseModel):
         None,
         description="Image input width accepted by the model (if registered).",
     )
+    memory_bytes: Optional[int] = Field(
+        None,
+        description="Estimated memory occupied by the model in bytes (if tracked).",
+    )
+    load_time: Optional[float] = Field(
+        None,
+        description="Time it took to load the model in seconds (if tracked).",
+    )
 
     @classmethod
     def from_model_description(
@@ -51,6 +59,8 @@ class ModelDescriptionEntity(BaseModel):
             batch_size=model_description.batch_size,
             input_height=model_description.input_height,
             input_width=model_description.input_width,
+            memory_bytes=model_description.memory_bytes,
+            load_time=model_description.load_time,
         )
 
 
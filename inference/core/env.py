@@ -33,6 +33,15 @@ if BLACKLISTED_DESTINATIONS_FOR_URL_INPUT is not None:
     BLACKLISTED_DESTINATIONS_FOR_URL_INPUT = set(
         BLACKLISTED_DESTINATIONS_FOR_URL_INPUT.split(",")
     )
+# Max size (in MB) of decoded images fetched from URLs kept in memory, 0 (default) disables the cache
+URL_IMAGES_CACHE_MAX_SIZE_MB = float(os.getenv("URL_IMAGES_CACHE_MAX_SIZE_MB", 0))
+# Max time (in seconds) after which cached URL image is revalidated with the origin server
+# (lower `max-age` announced by the origin takes precedence)
+URL_IMAGES_CACHE_TTL = float(os.getenv("URL_IMAGES_CACHE_TTL", 60))
+# Number of keep-alive connections per host used to fetch images from URLs
+URL_IMAGES_CONNECTION_POOL_SIZE = int(os.getenv("URL_IMAGES_CONNECTION_POOL_SIZE", 32))
+# Max number of images from batch fetched concurrently
+URL_IMAGES_FETCH_MAX_WORKERS = int(os.getenv("URL_IMAGES_FETCH_MAX_WORKERS", 8))
 
 # List of allowed origins
 ALLOW_ORIGINS = os.getenv("ALLOW_ORIGINS", "*")
@@ -141,6 +150,28 @@ DEVICE_ID = os.getenv("DEVICE_ID", None)
 # Flag to disable inference cache, default is False
 DISABLE_INFERENCE_CACHE = str2bool(os.getenv("DISABLE_INFERENCE_CACHE", False))
 
+# Max number of inference telemetry events waiting to be written into cache, events
+# recorded when buffer is full are dropped, default is 10000
+INFERENCE_TELEMETRY_BUFFER_SIZE = int(
+    os.getenv("INFERENCE_TELEMETRY_BUFFER_SIZE", 10000)
+)
+
+# Interval (in seconds) of writing buffered inference telemetry into cache, default is 1.0
+INFERENCE_TELEMETRY_FLUSH_INTERVAL = float(
+    os.getenv("INFERENCE_TELEMETRY_FLUSH_INTERVAL", 1.0)
+)
+
+# Max number of inference telemetry events written into cache at once, default is 500
+INFERENCE_TELEMETRY_FLUSH_BATCH_SIZE = int(
+    os.getenv("INFERENCE_TELEMETRY_FLUSH_BATCH_SIZE", 500)
+)
+
+# Fraction of inferences which requests and responses are saved in cache (errors and
+# models usage are always saved), default is 1.0
+INFERENCE_TELEMETRY_SAMPLING_RATE = float(
+    os.getenv("INFERENCE_TELEMETRY_SAMPLING_RATE", 1.0)
+)
+
 # Flag to disable auto-orientation preprocessing, default is False
 DISABLE_PREPROC_AUTO_ORIENT = str2bool(os.getenv("DISABLE_PREPROC_AUTO_ORIENT", False))
 
@@ -210,6 +241,11 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING")
 # Maximum number of active models, default is 8
 MAX_ACTIVE_MODELS = int(os.getenv("MAX_ACTIVE_MODELS", 8))
 
+# Memory budget (in MB) for active models - on top of MAX_ACTIVE_MODELS, default is None (no budget)
+MAX_ACTIVE_MODELS_MEMORY_MB = os.getenv("MAX_ACTIVE_MODELS_MEMORY_MB")
+if MAX_ACTIVE_MODELS_MEMORY_MB is not None:
+    MAX_ACTIVE_MODELS_MEMORY_MB = float(MAX_ACTIVE_MODELS_MEMORY_MB)
+
 # Maximum batch size, default is infinite
 MAX_BATCH_SIZE = os.getenv("MAX_BATCH_SIZE", None)
 if MAX_BATCH_SIZE is not None:
@@ -217,6 +253,12 @@ if MAX_BATCH_SIZE is not None:
 else:
     MAX_BATCH_SIZE = float("inf")
 
+# Flag to enable coalescing of concurrent requests into dynamic batches, default is False
+DYNAMIC_BATCHING_ENABLED = str2bool(os.getenv("DYNAMIC_BATCHING_ENABLED", False))
+
+# Max time (in milliseconds) for the first request of dynamic batch to wait for others, default is 5
+DYNAMIC_BATCHING_MAX_WAIT_MS = float(os.getenv("DYNAMIC_BATCHING_MAX_WAIT_MS", 5))
+
 # Maximum number of candidates, default is 3000
 MAX_CANDIDATES_ENV = "MAX_CANDIDATES"
 DEFAULT_MAX_CANDIDATES = 3000
@@ -270,6 +312,18 @@ PORT = int(os.getenv("PORT", 9001))
 # Profile flag, default is False
 PROFILE = str2bool(os.getenv("PROFILE", False))
 
+# Flag to report import and initialisation time of server modules at startup, default is False
+STARTUP_PROFILING_ENABLED = str2bool(os.getenv("STARTUP_PROFILING_ENABLED", False))
+
+# Number of slowest modules listed in startup profiling report, default is 30
+STARTUP_PROFILING_TOP_MODULES = int(os.getenv("STARTUP_PROFILING_TOP_MODULES", 30))
+
+# Number of threads executing blocking HTTP routes (Workflows, SAM, CLIP, DocTR) off the event loop, default is 8
+SYNC_ROUTES_MAX_WORKERS = int(os.getenv("SYNC_ROUTES_MAX_WORKERS", 8))
+
+# Number of blocking HTTP route calls allowed to wait for a free thread before 503 is returned, default is 32
+SYNC_ROUTES_MAX_QUEUE_SIZE = int(os.getenv("SYNC_ROUTES_MAX_QUEUE_SIZE", 32))
+
 # Redis host, default is None
 REDIS_HOST = os.getenv("REDIS_HOST", None)
 
@@ -290,8 +344,26 @@ ROBOFLOW_SERVICE_SECRET = os.getenv("ROBOFLOW_SERVICE_SECRET", None)
 # Maximum embedding cache size for SAM, default is 10
 SAM_MAX_EMBEDDING_CACHE_SIZE = int(os.getenv("SAM_MAX_EMBEDDING_CACHE_SIZE", 10))
 
+# Maximum size of SAM embeddings and logits kept in memory in MB, default is 512
+SAM_MAX_EMBEDDING_CACHE_SIZE_MB = float(
+    os.getenv("SAM_MAX_EMBEDDING_CACHE_SIZE_MB", 512)
+)
+
 SAM2_MAX_EMBEDDING_CACHE_SIZE = int(os.getenv("SAM2_MAX_EMBEDDING_CACHE_SIZE", 100))
 SAM2_MAX_LOGITS_CACHE_SIZE = int(os.getenv("SAM2_MAX_LOGITS_CACHE_SIZE", 1000))
+# Maximum size of SAM2 embeddings kept in memory in MB, default is 2048
+SAM2_MAX_EMBEDDING_CACHE_SIZE_MB = float(
+    os.getenv("SAM2_MAX_EMBEDDING_CACHE_SIZE_MB", 2048)
+)
+# Maximum size of SAM2 low resolution logits kept in memory in MB, default is 256
+SAM2_MAX_LOGITS_CACHE_SIZE_MB = float(os.getenv("SAM2_MAX_LOGITS_CACHE_SIZE_MB", 256))
+
+# Directory to persist SAM / SAM2 image embeddings in across model reloads, default is None (disabled)
+EMBEDDINGS_DISK_CACHE_DIR = os.getenv("EMBEDDINGS_DISK_CACHE_DIR", None)
+# Maximum size of embeddings persisted on disk per model in MB, default is 4096
+EMBEDDINGS_DISK_CACHE_MAX_SIZE_MB = float(
+    os.getenv("EMBEDDINGS_DISK_CACHE_MAX_SIZE_MB", 4096)
+)
 DISABLE_SAM2_LOGITS_CACHE = str2bool(os.getenv("DISABLE_SAM2_LOGITS_CACHE", False))
 
 # SAM version ID, default is "vit_h"
@@ -355,6 +427,18 @@ PREDICTIONS_QUEUE_SIZE = int(
     os.getenv("INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE", 512)
 )
 RESTART_ATTEMPT_DELAY = int(os.getenv("INFERENCE_PIPELINE_RESTART_ATTEMPT_DELAY", 1))
+# Flag to collect next batch of frames while the current one is inferred, sizing batches to the
+# model batch capacity and tuning batch collection timeout to the measured inference latency
+ADAPTIVE_BATCHING_ENABLED = str2bool(
+    os.getenv("INFERENCE_PIPELINE_ADAPTIVE_BATCHING_ENABLED", False)
+)
+# Number of collected batches of frames that may wait for inference in adaptive batching mode
+BATCHES_QUEUE_SIZE = int(os.getenv("INFERENCE_PIPELINE_BATCHES_QUEUE_SIZE", 1))
+# Number of frames that may be in flight between processes, when video decoding or sink run in
+# separate processes - frames are passed through shared memory buffer of that many slots
+SHARED_MEMORY_FRAMES_SLOTS = int(
+    os.getenv("INFERENCE_PIPELINE_SHARED_MEMORY_FRAMES_SLOTS", 8)
+)
 DEFAULT_BUFFER_SIZE = int(os.getenv("VIDEO_SOURCE_BUFFER_SIZE", "64"))
 DEFAULT_ADAPTIVE_MODE_STREAM_PACE_TOLERANCE = float(
     os.getenv("VIDEO_SOURCE_ADAPTIVE_MODE_STREAM_PACE_TOLERANCE", "0.1")
@@ -368,6 +452,16 @@ DEFAULT_MINIMUM_ADAPTIVE_MODE_SAMPLES = int(
 DEFAULT_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW = int(
     os.getenv("VIDEO_SOURCE_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW", "16")
 )
+# Backend decoding video in VideoSource - "opencv" or "pyav" (requires `pip install inference[pyav]`)
+DEFAULT_VIDEO_DECODER_BACKEND = os.getenv("VIDEO_SOURCE_DECODER_BACKEND", "opencv")
+# Longer side of decoded frames is scaled down to that size, default is no scaling
+DEFAULT_DECODING_MAX_DIMENSION = os.getenv("VIDEO_SOURCE_DECODING_MAX_DIMENSION", None)
+if DEFAULT_DECODING_MAX_DIMENSION is not None:
+    DEFAULT_DECODING_MAX_DIMENSION = int(DEFAULT_DECODING_MAX_DIMENSION)
+# Flag to make decoder skip frames that no other frame refers to (supported by "pyav" backend)
+DEFAULT_SKIP_NON_REFERENCE_FRAMES = str2bool(
+    os.getenv("VIDEO_SOURCE_SKIP_NON_REFERENCE_FRAMES", "False")
+)
 
 NUM_CELERY_WORKERS = os.getenv("NUM_CELERY_WORKERS", 4)
 CELERY_LOG_LEVEL = os.getenv("CELERY_LOG_LEVEL", "WARNING")
@@ -399,12 +493,54 @@ DISABLE_WORKFLOW_ENDPOINTS = str2bool(os.getenv("DISABLE_WORKFLOW_ENDPOINTS", Fa
 WORKFLOWS_STEP_EXECUTION_MODE = os.getenv("WORKFLOWS_STEP_EXECUTION_MODE", "local")
 WORKFLOWS_REMOTE_API_TARGET = os.getenv("WORKFLOWS_REMOTE_API_TARGET", "hosted")
 WORKFLOWS_MAX_CONCURRENT_STEPS = int(os.getenv("WORKFLOWS_MAX_CONCURRENT_STEPS", "8"))
+
+# Max number of connections to Redis kept by the process - requests waiting for free
+# connection are blocked up to REDIS_TIMEOUT, default accounts for all threads which may
+# use the cache at once: threads serving blocking routes, Workflows steps pool shared by
+# them (WORKFLOWS_MAX_CONCURRENT_STEPS * SYNC_ROUTES_MAX_WORKERS), event loop and
+# background threads
+REDIS_MAX_CONNECTIONS = int(
+    os.getenv(
+        "REDIS_MAX_CONNECTIONS",
+        SYNC_ROUTES_MAX_WORKERS * (WORKFLOWS_MAX_CONCURRENT_STEPS + 1) + 4,
+    )
+)
 WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_BATCH_SIZE = int(
     os.getenv("WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_BATCH_SIZE", "1")
 )
 WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_CONCURRENT_REQUESTS = int(
     os.getenv("WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_CONCURRENT_REQUESTS", "8")
 )
+WORKFLOWS_COMPILATION_CACHE_SIZE = int(
+    os.getenv("WORKFLOWS_COMPILATION_CACHE_SIZE", "64")
+)
+# Time (in seconds) after which state of stateful blocks (trackers, zones) for video not seen is dropped,
+# default is 24h. Measured with server clock (not frames timestamps) - state of videos paused for longer
+# is lost (tracker ids restart, time in zone is reset). Set to 0 to disable TTL eviction
+WORKFLOWS_VIDEO_STATE_TTL = float(os.getenv("WORKFLOWS_VIDEO_STATE_TTL", 24 * 60 * 60))
+if WORKFLOWS_VIDEO_STATE_TTL <= 0:
+    WORKFLOWS_VIDEO_STATE_TTL = None
+# Max number of videos which state is kept by single stateful block (least recently seen videos are
+# evicted first), default is 1000. Set to 0 to disable the limit
+WORKFLOWS_VIDEO_STATE_MAX_ENTRIES = int(
+    os.getenv("WORKFLOWS_VIDEO_STATE_MAX_ENTRIES", 1000)
+)
+if WORKFLOWS_VIDEO_STATE_MAX_ENTRIES <= 0:
+    WORKFLOWS_VIDEO_STATE_MAX_ENTRIES = None
+# Max memory (in MB) of videos state kept by single stateful block, default is infinite
+WORKFLOWS_VIDEO_STATE_MAX_MEMORY_MB = os.getenv(
+    "WORKFLOWS_VIDEO_STATE_MAX_MEMORY_MB", None
+)
+if WORKFLOWS_VIDEO_STATE_MAX_MEMORY_MB is not None:
+    WORKFLOWS_VIDEO_STATE_MAX_MEMORY_MB = float(WORKFLOWS_VIDEO_STATE_MAX_MEMORY_MB)
+# Directory to periodically snapshot videos state of stateful blocks into, disabled by default
+WORKFLOWS_VIDEO_STATE_SNAPSHOT_DIR = os.getenv(
+    "WORKFLOWS_VIDEO_STATE_SNAPSHOT_DIR", None
+)
+# Min interval (in seconds) between snapshots of videos state
+WORKFLOWS_VIDEO_STATE_SNAPSHOT_INTERVAL = float(
+    os.getenv("WORKFLOWS_VIDEO_STATE_SNAPSHOT_INTERVAL", 30)
+)
 ALLOW_CUSTOM_PYTHON_EXECUTION_IN_WORKFLOWS = str2bool(
     os.getenv("ALLOW_CUSTOM_PYTHON_EXECUTION_IN_WORKFLOWS", True)
 )
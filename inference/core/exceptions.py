@@ -190,3 +190,7 @@ class ActiveLearningConfigurationError(ActiveLearningError):
 
 class CannotInitialiseModelError(Exception):
     pass
+
+
+class ServiceOverloadedError(Exception):
+    pass
@@ -0,0 +1,492 @@
+import time
+from multiprocessing import Process, Queue
+from queue import Empty
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from inference.core import logger
+from inference.core.env import (
+    DEFAULT_BUFFER_SIZE,
+    DEFAULT_DECODING_MAX_DIMENSION,
+    DEFAULT_SKIP_NON_REFERENCE_FRAMES,
+    DEFAULT_VIDEO_DECODER_BACKEND,
+    SHARED_MEMORY_FRAMES_SLOTS,
+)
+from inference.core.interfaces.camera.entities import (
+    StatusUpdate,
+    UpdateSeverity,
+    VideoFrame,
+    VideoSourceIdentifier,
+)
+from inference.core.interfaces.camera.exceptions import (
+    EndOfStreamError,
+    SourceConnectionError,
+    StreamOperationNotAllowedError,
+)
+from inference.core.interfaces.camera.shared_memory import (
+    SharedMemoryFramesReader,
+    SharedMemoryFramesWriter,
+    SharedVideoFrame,
+    restore_video_frame,
+    share_video_frame,
+    start_worker_process,
+)
+from inference.core.interfaces.camera.video_source import (
+    MUTE_ELIGIBLE_STATES,
+    PAUSE_ELIGIBLE_STATES,
+    RESTART_ELIGIBLE_STATES,
+    RESUME_ELIGIBLE_STATES,
+    START_ELIGIBLE_STATES,
+    TERMINATE_ELIGIBLE_STATES,
+    BufferConsumptionStrategy,
+    BufferFillingStrategy,
+    SourceMetadata,
+    StreamState,
+    VideoDecoderBackend,
+    VideoSource,
+    lock_state_transition,
+)
+
+POLLING_INTERVAL = 0.1
+PROCESS_TERMINATION_TIMEOUT = 5.0
+
+STARTED_MESSAGE = "STARTED"
+FRAME_MESSAGE = "FRAME"
+STATUS_MESSAGE = "STATUS"
+END_MESSAGE = "END"
+ERROR_MESSAGE = "ERROR"
+
+PAUSE_COMMAND = "pause"
+MUTE_COMMAND = "mute"
+RESUME_COMMAND = "resume"
+TERMINATE_COMMAND = "terminate"
+
+
+class ProcessVideoSource:
+    @classmethod
+    def init(
+        cls,
+        video_reference: VideoSourceIdentifier,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        status_update_handlers: Optional[List[Callable[[StatusUpdate], None]]] = None,
+        buffer_filling_strategy: Optional[BufferFillingStrategy] = None,
+        buffer_consumption_strategy: Optional[BufferConsumptionStrategy] = None,
+        video_source_properties: Optional[Dict[str, float]] = None,
+        source_id: Optional[int] = None,
+        shared_memory_slots: int = SHARED_MEMORY_FRAMES_SLOTS,
+        decoder_backend: Union[
+            VideoDecoderBackend, str
+        ] = DEFAULT_VIDEO_DECODER_BACKEND,
+        decoding_max_dimension: Optional[int] = DEFAULT_DECODING_MAX_DIMENSION,
+        skip_non_reference_frames: bool = DEFAULT_SKIP_NON_REFERENCE_FRAMES,
+    ) -> "ProcessVideoSource":
+        """
+        Equivalent of `VideoSource` that decodes the video in a separate process - such that decoding
+        does not compete for GIL with the process consuming frames. `VideoSource` is run in the worker
+        process and decoded frames are passed to the consumer through ring buffer in shared memory
+        (of `shared_memory_slots` slots) - frames are not pickled, consumer copies each frame out of
+        the slot once. When consumer is slow, worker waits for slots to be released - so buffer filling
+        and consumption strategies of `VideoSource` in the worker decide which frames are dropped.
+
+        Interface of `VideoSource` is preserved, so instances can be multiplexed and used in
+        `InferencePipeline`. Status updates of worker source with severity INFO and above are passed
+        to `status_update_handlers` in the consumer process, while frames are read.
+
+        ENV variables involved:
+        * INFERENCE_PIPELINE_SHARED_MEMORY_FRAMES_SLOTS - default: 8
+
+        Args:
+            video_reference (Union[str, int]): Either str with file or stream reference, or int representing device ID
+            buffer_size (int): size of decoding buffer of `VideoSource` in worker process
+            status_update_handlers (Optional[List[Callable[[StatusUpdate], None]]]): List of handlers for status updates
+            buffer_filling_strategy (Optional[BufferFillingStrategy]): Settings for buffer filling strategy
+            buffer_consumption_strategy (Optional[BufferConsumptionStrategy]): Settings for buffer consumption strategy
+            video_source_properties (Optional[dict[str, float]]): Optional dictionary with video source properties
+                corresponding to OpenCV VideoCapture properties cv2.CAP_PROP_* to set values for the video source.
+            source_id (Optional[int]): Optional identifier of video source
+            shared_memory_slots (int): Number of frames that may be passed to the consumer and not read yet
+            decoder_backend (Union[VideoDecoderBackend, str]): Backend to decode video with
+            decoding_max_dimension (Optional[int]): Maximum size of the longer side of decoded frames
+            skip_non_reference_frames (bool): Flag to decide if non-reference frames should not be decoded
+
+        Returns: Instance of `ProcessVideoSource` class
+        """
+        if status_update_handlers is None:
+            status_update_handlers = []
+        return cls(
+            stream_reference=video_reference,
+            status_update_handlers=status_update_handlers,
+            video_source_kwargs={
+                "buffer_size": buffer_size,
+                "buffer_filling_strategy": buffer_filling_strategy,
+                "buffer_consumption_strategy": buffer_consumption_strategy,
+                "video_source_properties": video_source_properties,
+                "source_id": source_id,
+                "decoder_backend": VideoDecoderBackend(decoder_backend),
+                "decoding_max_dimension": decoding_max_dimension,
+                "skip_non_reference_frames": skip_non_reference_frames,
+            },
+            buffer_consumption_strategy=buffer_consumption_strategy,
+            source_id=source_id,
+            shared_memory_slots=shared_memory_slots,
+        )
+
+    def __init__(
+        self,
+        stream_reference: VideoSourceIdentifier,
+        status_update_handlers: List[Callable[[StatusUpdate], None]],
+        video_source_kwargs: Dict[str, Any],
+        buffer_consumption_strategy: Optional[BufferConsumptionStrategy],
+        source_id: Optional[int],
+        shared_memory_slots: int,
+    ):
+        self._stream_reference = stream_reference
+        self._status_update_handlers = status_update_handlers
+        self._video_source_kwargs = video_source_kwargs
+        self._buffer_consumption_strategy = buffer_consumption_strategy
+        self._source_id = source_id
+        self._shared_memory_slots = shared_memory_slots
+        self._state = StreamState.NOT_STARTED
+        self._state_change_lock = Lock()
+        self._source_metadata: Optional[SourceMetadata] = None
+        self._process: Optional[Process] = None
+        self._commands: Optional[Queue] = None
+        self._messages: Optional[Queue] = None
+        self._reader: Optional[SharedMemoryFramesReader] = None
+        self._end_received = False
+
+    @property
+    def source_id(self) -> Optional[int]:
+        return self._source_id
+
+    @lock_state_transition
+    def restart(
+        self, wait_on_frames_consumption: bool = True, purge_frames_buffer: bool = False
+    ) -> None:
+        if self._state not in RESTART_ELIGIBLE_STATES:
+            raise StreamOperationNotAllowedError(
+                f"Could not RESTART stream in state: {self._state}"
+            )
+        self._terminate()
+        self._state = StreamState.RESTARTING
+        self._start()
+
+    @lock_state_transition
+    def start(self) -> None:
+        if self._state not in START_ELIGIBLE_STATES:
+            raise StreamOperationNotAllowedError(
+                f"Could not START stream in state: {self._state}"
+            )
+        self._start()
+
+    @lock_state_transition
+    def terminate(
+        self, wait_on_frames_consumption: bool = True, purge_frames_buffer: bool = False
+    ) -> None:
+        """Terminates worker process - frames which were decoded, but not read yet are
+        dropped, regardless of `wait_on_frames_consumption` and `purge_frames_buffer`.
+        """
+        if self._state not in TERMINATE_ELIGIBLE_STATES:
+            raise StreamOperationNotAllowedError(
+                f"Could not TERMINATE stream in state: {self._state}"
+            )
+        self._terminate()
+
+    @lock_state_transition
+    def pause(self) -> None:
+        if self._state not in PAUSE_ELIGIBLE_STATES:
+            raise StreamOperationNotAllowedError(
+                f"Could not PAUSE stream in state: {self._state}"
+            )
+        self._commands.put(PAUSE_COMMAND)
+        self._state = StreamState.PAUSED
+
+    @lock_state_transition
+    def mute(self) -> None:
+        if self._state not in MUTE_ELIGIBLE_STATES:
+            raise StreamOperationNotAllowedError(
+                f"Could not MUTE stream in state: {self._state}"
+            )
+        self._commands.put(MUTE_COMMAND)
+        self._state = StreamState.MUTED
+
+    @lock_state_transition
+    def resume(self) -> None:
+        if self._state not in RESUME_ELIGIBLE_STATES:
+            raise StreamOperationNotAllowedError(
+                f"Could not RESUME stream in state: {self._state}"
+            )
+        self._commands.put(RESUME_COMMAND)
+        self._state = StreamState.RUNNING
+
+    def get_state(self) -> StreamState:
+        return self._state
+
+    def count_buffered_frames(self) -> int:
+        """Returns approximate number of frames passed by the worker process and not read yet
+        (0 on platforms not supporting `multiprocessing.Queue.qsize()`)."""
+        if self._messages is None:
+            return 0
+        try:
+            return self._messages.qsize()
+        except NotImplementedError:
+            return 0
+
+    def read_frame(self, timeout: Optional[float] = None) -> Optional[VideoFrame]:
+        """
+        Method to be used by the consumer to get decoded source frame.
+
+        Returns: VideoFrame object with decoded frame and its metadata.
+        Throws:
+            * EndOfStreamError: when trying to get the frame from closed source.
+        """
+        if self._end_received or self._messages is None:
+            raise EndOfStreamError(
+                "Attempted to retrieve frame from stream that already ended."
+            )
+        shared_frame = self._get_shared_frame(timeout=timeout)
+        if shared_frame is None:
+            return None
+        if self._buffer_consumption_strategy is BufferConsumptionStrategy.EAGER:
+            shared_frame = self._get_most_recent_shared_frame(shared_frame=shared_frame)
+        return restore_video_frame(shared_video_frame=shared_frame, reader=self._reader)
+
+    def describe_source(self) -> SourceMetadata:
+        source_properties = None
+        buffer_filling_strategy = None
+        if self._source_metadata is not None:
+            source_properties = self._source_metadata.source_properties
+            buffer_filling_strategy = self._source_metadata.buffer_filling_strategy
+        return SourceMetadata(
+            source_properties=source_properties,
+            source_reference=self._stream_reference,
+            buffer_size=self._video_source_kwargs["buffer_size"],
+            state=self._state,
+            buffer_filling_strategy=buffer_filling_strategy,
+            buffer_consumption_strategy=self._buffer_consumption_strategy,
+            source_id=self._source_id,
+        )
+
+    def _start(self) -> None:
+        self._commands = Queue()
+        self._messages = Queue()
+        free_slots = Queue()
+        self._reader = SharedMemoryFramesReader(free_slots=free_slots)
+        self._end_received = False
+        self._process = Process(
+            target=decode_video_in_worker_process,
+            kwargs={
+                "video_reference": self._stream_reference,
+                "video_source_kwargs": self._video_source_kwargs,
+                "commands": self._commands,
+                "messages": self._messages,
+                "free_slots": free_slots,
+                "shared_memory_slots": self._shared_memory_slots,
+            },
+            daemon=True,
+        )
+        start_worker_process(process=self._process)
+        self._state = StreamState.INITIALISING
+        while True:
+            message_type, payload = self._get_message(timeout=None)
+            if message_type == STARTED_MESSAGE:
+                self._source_metadata = payload
+                self._state = StreamState.RUNNING
+                return None
+            if message_type in {ERROR_MESSAGE, END_MESSAGE}:
+                self._join_process()
+                self._state = StreamState.ERROR
+                raise SourceConnectionError(
+                    f"Cannot connect to video source under reference: {self._stream_reference}. "
+                    f"Details: {payload}"
+                )
+
+    def _terminate(self) -> None:
+        if self._process is None:
+            self._state = StreamState.ENDED
+            return None
+        self._commands.put(TERMINATE_COMMAND)
+        deadline = time.monotonic() + PROCESS_TERMINATION_TIMEOUT
+        while self._process.is_alive() and time.monotonic() < deadline:
+            self._release_pending_frames()
+            self._process.join(timeout=POLLING_INTERVAL)
+        self._join_process()
+        self._state = StreamState.ENDED
+
+    def _join_process(self) -> None:
+        if self._process.is_alive():
+            logger.warning(
+                f"Video decoding process of source {self._source_id} did not terminate on time - killing."
+            )
+            self._process.kill()
+        self._process.join()
+        self._process = None
+        self._reader.close()
+        self._end_received = True
+
+    def _release_pending_frames(self) -> None:
+        while True:
+            try:
+                message_type, payload = self._messages.get_nowait()
+            except Empty:
+                return None
+            if message_type == FRAME_MESSAGE:
+                self._reader.release(reference=payload.reference)
+
+    def _get_shared_frame(self, timeout: Optional[float]) -> Optional[SharedVideoFrame]:
+        message_type, payload = self._get_message(timeout=timeout)
+        if message_type is None:
+            return None
+        if message_type == FRAME_MESSAGE:
+            return payload
+        self._end_received = True
+        self._state = StreamState.ENDED
+        # all frames sent are already consumed, so worker is expected to exit promptly
+        self._process.join(timeout=PROCESS_TERMINATION_TIMEOUT)
+        self._join_process()
+        if message_type == ERROR_MESSAGE:
+            self._state = StreamState.ERROR
+            logger.warning(
+                f"Video decoding process of source {self._source_id} failed: {payload}"
+            )
+        raise EndOfStreamError(
+            "Attempted to retrieve frame from stream that already ended."
+        )
+
+    def _get_most_recent_shared_frame(
+        self, shared_frame: SharedVideoFrame
+    ) -> SharedVideoFrame:
+        while True:
+            message_type, payload = self._get_message(timeout=0)
+            if message_type is None:
+                return shared_frame
+            if message_type != FRAME_MESSAGE:
+                # end of stream is reported on the next read
+                self._end_received = True
+                self._state = StreamState.ENDED
+                return shared_frame
+            self._reader.release(reference=shared_frame.reference)
+            shared_frame = payload
+
+    def _get_message(self, timeout: Optional[float]) -> Tuple[Optional[str], Any]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = POLLING_INTERVAL
+            if deadline is not None:
+                remaining = min(max(deadline - time.monotonic(), 0.0), remaining)
+            try:
+                message_type, payload = self._messages.get(timeout=remaining)
+            except Empty:
+                if not self._process.is_alive() and self._messages.empty():
+                    return END_MESSAGE, "Video decoding process exited."
+                if deadline is not None and time.monotonic() >= deadline:
+                    return None, None
+                continue
+            if message_type != STATUS_MESSAGE:
+                return message_type, payload
+            for handler in self._status_update_handlers:
+                try:
+                    handler(payload)
+                except Exception as error:
+                    logger.warning(f"Could not execute handler update. Cause: {error}")
+
+
+def decode_video_in_worker_process(
+    video_reference: VideoSourceIdentifier,
+    video_source_kwargs: Dict[str, Any],
+    commands: Queue,
+    messages: Queue,
+    free_slots: Queue,
+    shared_memory_slots: int,
+) -> None:
+    video_source = VideoSource.init(
+        video_reference=video_reference,
+        status_update_handlers=[
+            lambda status_update: _forward_status_update(
+                status_update=status_update, messages=messages
+            )
+        ],
+        **video_source_kwargs,
+    )
+    try:
+        video_source.start()
+    except Exception as error:
+        messages.put((ERROR_MESSAGE, f"{error.__class__.__name__}: {error}"))
+        return None
+    messages.put((STARTED_MESSAGE, video_source.describe_source()))
+    writer = SharedMemoryFramesWriter(free_slots=free_slots, slots=shared_memory_slots)
+    try:
+        _stream_frames(
+            video_source=video_source,
+            writer=writer,
+            commands=commands,
+            messages=messages,
+        )
+    except Exception as error:
+        logger.exception(f"Error in video decoding process: {error}")
+        messages.put((ERROR_MESSAGE, f"{error.__class__.__name__}: {error}"))
+    finally:
+        _terminate_video_source(video_source=video_source)
+        while not writer.reclaim_slots(timeout=POLLING_INTERVAL):
+            if _get_command(commands=commands) == TERMINATE_COMMAND:
+                break
+        writer.close()
+
+
+def _stream_frames(
+    video_source: VideoSource,
+    writer: SharedMemoryFramesWriter,
+    commands: Queue,
+    messages: Queue,
+) -> None:
+    pending_frame: Optional[VideoFrame] = None
+    while True:
+        command = _get_command(commands=commands)
+        if command == TERMINATE_COMMAND:
+            return None
+        if command is not None:
+            _execute_command(video_source=video_source, command=command)
+        if pending_frame is None:
+            try:
+                pending_frame = video_source.read_frame(timeout=POLLING_INTERVAL)
+            except EndOfStreamError:
+                messages.put((END_MESSAGE, None))
+                return None
+            if pending_frame is None:
+                continue
+        shared_frame = share_video_frame(
+            video_frame=pending_frame, writer=writer, timeout=POLLING_INTERVAL
+        )
+        if shared_frame is None:
+            continue
+        messages.put((FRAME_MESSAGE, shared_frame))
+        pending_frame = None
+
+
+def _get_command(commands: Queue) -> Optional[str]:
+    try:
+        return commands.get_nowait()
+    except Empty:
+        return None
+
+
+def _execute_command(video_source: VideoSource, command: str) -> None:
+    try:
+        getattr(video_source, command)()
+    except StreamOperationNotAllowedError as error:
+        logger.warning(f"Could not {command} video source: {error}")
+
+
+def _terminate_video_source(video_source: VideoSource) -> None:
+    try:
+        video_source.terminate(
+            wait_on_frames_consumption=False, purge_frames_buffer=True
+        )
+    except StreamOperationNotAllowedError:
+        pass
+
+
+def _forward_status_update(status_update: StatusUpdate, messages: Queue) -> None:
+    if status_update.severity.value < UpdateSeverity.INFO.value:
+        return None
+    messages.put((STATUS_MESSAGE, status_update))
@@ -0,0 +1,137 @@
+import sys
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+from inference.core import logger
+from inference.core.interfaces.camera.entities import (
+    SourceProperties,
+    VideoFrameProducer,
+)
+from inference.core.interfaces.camera.exceptions import DecoderNotAvailableError
+
+try:
+    import av
+except ImportError:
+    av = None
+
+
+class PyAVVideoFrameProducer(VideoFrameProducer):
+    """
+    `VideoFrameProducer` decoding video with FFmpeg (through PyAV). Work is split in the same way as
+    in `cv2.VideoCapture` - `grab()` decodes the next frame, while `retrieve()` converts it into BGR
+    image. `VideoSource` only retrieves frames it is going to buffer, so frames dropped by buffer
+    filling strategies never pay for colour conversion and scaling.
+
+    On top of that:
+    * `max_dimension` - decoded frames are scaled down (by FFmpeg, before conversion to BGR), such that
+        their longer side is not bigger than that value
+    * `skip_non_reference_frames` - decoder does not decode frames that no other frame refers to (for
+        instance B-frames) - they are not emitted at all, so stream is delivered at lower FPS
+    * `threads` - number of decoding threads, FFmpeg decides if not given
+    """
+
+    def __init__(
+        self,
+        video: Union[str, int],
+        max_dimension: Optional[int] = None,
+        skip_non_reference_frames: bool = False,
+        threads: Optional[int] = None,
+    ):
+        if av is None:
+            raise DecoderNotAvailableError(
+                "Could not initialise `pyav` video decoder backend due to lack of dependencies. "
+                "Use pip install inference[pyav] to install missing dependencies and try again."
+            )
+        self._container = None
+        self._stream = None
+        self._frames: Optional[Iterator["av.VideoFrame"]] = None
+        self._grabbed_frame: Optional["av.VideoFrame"] = None
+        self._output_size: Optional[Tuple[int, int]] = None
+        try:
+            self._container = _open_container(video=video)
+            self._stream = self._container.streams.video[0]
+        except (av.error.FFmpegError, IndexError, OSError) as error:
+            logger.warning(f"Could not open video source {video}: {error}")
+            self.release()
+            return None
+        codec_context = self._stream.codec_context
+        if threads is not None:
+            codec_context.thread_count = threads
+        self._stream.thread_type = "AUTO"
+        if skip_non_reference_frames:
+            codec_context.skip_frame = "NONREF"
+        self._output_size = get_scaled_size(
+            width=codec_context.width,
+            height=codec_context.height,
+            max_dimension=max_dimension,
+        )
+        self._frames = self._container.decode(self._stream)
+
+    def isOpened(self) -> bool:
+        return self._container is not None
+
+    def grab(self) -> bool:
+        if self._frames is None:
+            return False
+        try:
+            self._grabbed_frame = next(self._frames)
+        except (StopIteration, av.error.FFmpegError):
+            self._grabbed_frame = None
+            return False
+        return True
+
+    def retrieve(self) -> Tuple[bool, np.ndarray]:
+        if self._grabbed_frame is None:
+            return False, None
+        width, height = self._output_size
+        image = self._grabbed_frame.reformat(
+            width=width, height=height, format="bgr24"
+        ).to_ndarray()
+        self._grabbed_frame = None
+        return True, image
+
+    def initialize_source_properties(self, properties: Dict[str, float]) -> None:
+        if properties:
+            logger.warning(
+                f"Video source properties {list(properties.keys())} are not supported by `pyav` "
+                f"decoder backend and will be ignored."
+            )
+
+    def discover_source_properties(self) -> SourceProperties:
+        width, height = self._output_size
+        fps = self._stream.average_rate or self._stream.guessed_rate
+        total_frames = self._stream.frames
+        return SourceProperties(
+            width=width,
+            height=height,
+            total_frames=total_frames,
+            is_file=total_frames > 0,
+            fps=float(fps) if fps is not None else 0.0,
+        )
+
+    def release(self):
+        self._frames = None
+        self._grabbed_frame = None
+        if self._container is not None:
+            self._container.close()
+            self._container = None
+
+
+def get_scaled_size(
+    width: int, height: int, max_dimension: Optional[int]
+) -> Tuple[int, int]:
+    if max_dimension is None or max(width, height) <= max_dimension:
+        return width, height
+    scale = max_dimension / max(width, height)
+    return max(round(width * scale), 1), max(round(height * scale), 1)
+
+
+def _open_container(video: Union[str, int]) -> "av.container.InputContainer":
+    if isinstance(video, int):
+        if not sys.platform.startswith("linux"):
+            raise OSError(
+                "Devices given by ID are only supported by `pyav` backend on Linux."
+            )
+        return av.open(f"/dev/video{video}", format="v4l2")
+    return av.open(video)
@@ -0,0 +1,218 @@
+import os
+from dataclasses import dataclass
+from multiprocessing import Process, Queue, resource_tracker, shared_memory
+from queue import Empty
+from threading import Lock
+from typing import Optional, Tuple
+
+import numpy as np
+
+from inference.core.interfaces.camera.entities import (
+    FrameID,
+    FrameTimestamp,
+    VideoFrame,
+)
+
+# Creating or attaching shared memory holds the lock of multiprocessing resource tracker -
+# if process is forked in the meantime by other thread, the lock is inherited as taken and
+# child deadlocks on its first shared memory operation. Shared memory operations take the
+# lock below, which is also held for the time of fork, such that fork never happens in the
+# middle of shared memory operation.
+SHARED_MEMORY_LOCK = Lock()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=SHARED_MEMORY_LOCK.acquire,
+        after_in_parent=SHARED_MEMORY_LOCK.release,
+        after_in_child=SHARED_MEMORY_LOCK.release,
+    )
+
+
+@dataclass(frozen=True)
+class SharedFrameReference:
+    """Points to the image placed in the slot of shared memory ring. Images that do not fit
+    into ring slot are carried inline (as `image`) instead."""
+
+    ring_name: Optional[str]
+    slot: Optional[int]
+    slot_size: int
+    shape: Tuple[int, ...]
+    dtype: str
+    image: Optional[np.ndarray] = None
+
+
+@dataclass(frozen=True)
+class SharedVideoFrame:
+    reference: SharedFrameReference
+    frame_id: FrameID
+    frame_timestamp: FrameTimestamp
+    fps: Optional[float] = None
+    source_id: Optional[int] = None
+    comes_from_video_file: Optional[bool] = None
+
+
+class SharedMemoryFramesWriter:
+    """Writing end of ring buffer of images in shared memory - such that images are passed
+    between processes without being pickled, only small `SharedFrameReference` needs to be
+    sent to the reader (for instance through `multiprocessing.Queue`).
+
+    Ring of `slots` slots is created on the first write - each slot is as big as the first
+    written image. Slots are handed back by the reader through `free_slots` queue once the
+    image is copied out of the slot, which makes writer wait for the reader once all slots are
+    in use. Ring is owned (and unlinked at `close()`) by the writer."""
+
+    def __init__(self, free_slots: Queue, slots: int):
+        self._free_slots = free_slots
+        self._slots = max(slots, 1)
+        self._ring: Optional[shared_memory.SharedMemory] = None
+        self._slot_size = 0
+        self._slots_reclaimed = 0
+
+    @property
+    def ring_name(self) -> Optional[str]:
+        return None if self._ring is None else self._ring.name
+
+    def write(
+        self, image: np.ndarray, timeout: Optional[float] = None
+    ) -> Optional[SharedFrameReference]:
+        """Places image in free slot of the ring, returns None if no slot was released
+        within `timeout`."""
+        if self._ring is None:
+            self._create_ring(slot_size=image.nbytes)
+        if image.nbytes > self._slot_size:
+            return SharedFrameReference(
+                ring_name=None,
+                slot=None,
+                slot_size=0,
+                shape=image.shape,
+                dtype=image.dtype.name,
+                image=image,
+            )
+        try:
+            slot = self._free_slots.get(timeout=timeout)
+        except Empty:
+            return None
+        slot_array = np.ndarray(
+            image.shape,
+            dtype=image.dtype,
+            buffer=self._ring.buf,
+            offset=slot * self._slot_size,
+        )
+        slot_array[...] = image
+        return SharedFrameReference(
+            ring_name=self._ring.name,
+            slot=slot,
+            slot_size=self._slot_size,
+            shape=image.shape,
+            dtype=image.dtype.name,
+        )
+
+    def reclaim_slots(self, timeout: float) -> bool:
+        """Waits (at max `timeout` for each slot) until reader releases all the slots -
+        to be used before `close()`, such that images which are already sent can be read.
+        """
+        if self._ring is None:
+            return True
+        while self._slots_reclaimed < self._slots:
+            try:
+                self._free_slots.get(timeout=timeout)
+            except Empty:
+                return False
+            self._slots_reclaimed += 1
+        return True
+
+    def close(self) -> None:
+        if self._ring is None:
+            return None
+        with SHARED_MEMORY_LOCK:
+            self._ring.close()
+            self._ring.unlink()
+        self._ring = None
+
+    def _create_ring(self, slot_size: int) -> None:
+        self._slot_size = max(slot_size, 1)
+        with SHARED_MEMORY_LOCK:
+            self._ring = shared_memory.SharedMemory(
+                create=True, size=self._slot_size * self._slots
+            )
+        for slot in range(self._slots):
+            self._free_slots.put(slot)
+
+
+class SharedMemoryFramesReader:
+    """Reading end of `SharedMemoryFramesWriter` ring - images are copied out of the slot
+    (which is then handed back to the writer), so that they may outlive the slot."""
+
+    def __init__(self, free_slots: Queue):
+        self._free_slots = free_slots
+        self._ring: Optional[shared_memory.SharedMemory] = None
+
+    def read(self, reference: SharedFrameReference) -> np.ndarray:
+        if reference.image is not None:
+            return reference.image
+        ring = self._attach_ring(name=reference.ring_name)
+        image = np.ndarray(
+            reference.shape,
+            dtype=reference.dtype,
+            buffer=ring.buf,
+            offset=reference.slot * reference.slot_size,
+        ).copy()
+        self._free_slots.put(reference.slot)
+        return image
+
+    def release(self, reference: SharedFrameReference) -> None:
+        if reference.slot is not None:
+            self._free_slots.put(reference.slot)
+
+    def close(self) -> None:
+        if self._ring is None:
+            return None
+        self._ring.close()
+        self._ring = None
+
+    def _attach_ring(self, name: str) -> shared_memory.SharedMemory:
+        if self._ring is not None and self._ring.name == name:
+            return self._ring
+        self.close()
+        with SHARED_MEMORY_LOCK:
+            self._ring = shared_memory.SharedMemory(name=name)
+        return self._ring
+
+
+def start_worker_process(process: Process) -> None:
+    """Starts process exchanging frames through shared memory - resource tracker is started
+    upfront, so that it is shared with the worker and shared memory created by one process
+    is not reported as leaked by the other."""
+    resource_tracker.ensure_running()
+    process.start()
+
+
+def share_video_frame(
+    video_frame: VideoFrame,
+    writer: SharedMemoryFramesWriter,
+    timeout: Optional[float] = None,
+) -> Optional[SharedVideoFrame]:
+    reference = writer.write(image=video_frame.image, timeout=timeout)
+    if reference is None:
+        return None
+    return SharedVideoFrame(
+        reference=reference,
+        frame_id=video_frame.frame_id,
+        frame_timestamp=video_frame.frame_timestamp,
+        fps=video_frame.fps,
+        source_id=video_frame.source_id,
+        comes_from_video_file=video_frame.comes_from_video_file,
+    )
+
+
+def restore_video_frame(
+    shared_video_frame: SharedVideoFrame,
+    reader: SharedMemoryFramesReader,
+) -> VideoFrame:
+    return VideoFrame(
+        image=reader.read(reference=shared_video_frame.reference),
+        frame_id=shared_video_frame.frame_id,
+        frame_timestamp=shared_video_frame.frame_timestamp,
+        fps=shared_video_frame.fps,
+        source_id=shared_video_frame.source_id,
+        comes_from_video_file=shared_video_frame.comes_from_video_file,
+    )
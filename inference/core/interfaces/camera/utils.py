@@ -246,6 +246,7 @@ def multiplex_videos(
     on_reconnection_error: Callable[
         [Optional[int], SourceConnectionError], None
     ] = log_error,
+    batch_collection_timeout_provider: Optional[Callable[[], Optional[float]]] = None,
 ) -> Generator[List[VideoFrame], None, None]:
     """
     Function that is supposed to provide a generator over frames from multiple video sources. It is capable to
@@ -284,6 +285,9 @@ def multiplex_videos(
         on_reconnection_error (Callable[[Optional[int], SourceConnectionError], None]): Function that will be
             called whenever source cannot re-connect after disconnection. First parameter is source_id, second
             is connection error instance.
+        batch_collection_timeout_provider (Optional[Callable[[], Optional[float]]]): Function to be called
+            before collection of each batch, to dynamically establish `batch_collection_timeout` - if given,
+            takes precedence over `batch_collection_timeout`.
 
     Returns Generator[List[VideoFrame], None, None]: allowing to iterate through frames from multiple video sources.
 
@@ -310,6 +314,7 @@ def multiplex_videos(
         batch_collection_timeout=batch_collection_timeout,
         should_stop=should_stop,
         on_reconnection_error=on_reconnection_error,
+        batch_collection_timeout_provider=batch_collection_timeout_provider,
     )
     if max_fps is None:
         yield from generator
@@ -329,6 +334,7 @@ def _multiplex_videos(
     batch_collection_timeout: Optional[float],
     should_stop: Callable[[], bool],
     on_reconnection_error: Callable[[Optional[int], SourceConnectionError], None],
+    batch_collection_timeout_provider: Optional[Callable[[], Optional[float]]] = None,
 ) -> Generator[List[VideoFrame], None, None]:
     sources_manager = VideoSourcesManager.init(
         video_sources=video_sources,
@@ -336,6 +342,8 @@ def _multiplex_videos(
         on_reconnection_error=on_reconnection_error,
     )
     while not sources_manager.all_sources_ended():
+        if batch_collection_timeout_provider is not None:
+            batch_collection_timeout = batch_collection_timeout_provider()
         batch_frames = sources_manager.retrieve_frames_from_sources(
             batch_collection_timeout=batch_collection_timeout,
         )
@@ -15,8 +15,11 @@ from inference.core.env import (
     DEFAULT_ADAPTIVE_MODE_READER_PACE_TOLERANCE,
     DEFAULT_ADAPTIVE_MODE_STREAM_PACE_TOLERANCE,
     DEFAULT_BUFFER_SIZE,
+    DEFAULT_DECODING_MAX_DIMENSION,
     DEFAULT_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW,
     DEFAULT_MINIMUM_ADAPTIVE_MODE_SAMPLES,
+    DEFAULT_SKIP_NON_REFERENCE_FRAMES,
+    DEFAULT_VIDEO_DECODER_BACKEND,
 )
 from inference.core.interfaces.camera.entities import (
     SourceProperties,
@@ -31,12 +34,17 @@ from inference.core.interfaces.camera.exceptions import (
     SourceConnectionError,
     StreamOperationNotAllowedError,
 )
+from inference.core.interfaces.camera.pyav_video_frame_producer import (
+    PyAVVideoFrameProducer,
+    get_scaled_size,
+)
 
 VIDEO_SOURCE_CONTEXT = "video_source"
 VIDEO_CONSUMER_CONTEXT = "video_consumer"
 SOURCE_STATE_UPDATE_EVENT = "SOURCE_STATE_UPDATE"
 SOURCE_ERROR_EVENT = "SOURCE_ERROR"
 FRAME_CAPTURED_EVENT = "FRAME_CAPTURED"
+FRAME_DECODED_EVENT = "FRAME_DECODED"
 FRAME_DROPPED_EVENT = "FRAME_DROPPED"
 FRAME_CONSUMED_EVENT = "FRAME_CONSUMED"
 VIDEO_CONSUMPTION_STARTED_EVENT = "VIDEO_CONSUMPTION_STARTED"
@@ -100,6 +108,11 @@ DROP_OLDEST_STRATEGIES = {
 }
 
 
+class VideoDecoderBackend(Enum):
+    OPENCV = "opencv"
+    PYAV = "pyav"
+
+
 class BufferConsumptionStrategy(Enum):
     LAZY = "LAZY"
     EAGER = "EAGER"
@@ -131,8 +144,9 @@ def lock_state_transition(
 
 
 class CV2VideoFrameProducer(VideoFrameProducer):
-    def __init__(self, video: Union[str, int]):
+    def __init__(self, video: Union[str, int], max_dimension: Optional[int] = None):
         self.stream = cv2.VideoCapture(video)
+        self._max_dimension = max_dimension
 
     def isOpened(self) -> bool:
         return self.stream.isOpened()
@@ -141,7 +155,16 @@ class CV2VideoFrameProducer(VideoFrameProducer):
         return self.stream.grab()
 
     def retrieve(self) -> Tuple[bool, ndarray]:
-        return self.stream.retrieve()
+        success, image = self.stream.retrieve()
+        if not success or self._max_dimension is None:
+            return success, image
+        height, width = image.shape[:2]
+        scaled_size = get_scaled_size(
+            width=width, height=height, max_dimension=self._max_dimension
+        )
+        if scaled_size == (width, height):
+            return success, image
+        return success, cv2.resize(image, scaled_size, interpolation=cv2.INTER_AREA)
 
     def initialize_source_properties(self, properties: Dict[str, float]) -> None:
         for property_id, value in properties.items():
@@ -149,8 +172,11 @@ class CV2VideoFrameProducer(VideoFrameProducer):
             self.stream.set(cv2_id, value)
 
     def discover_source_properties(self) -> SourceProperties:
-        width = int(self.stream.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(self.stream.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        width, height = get_scaled_size(
+            width=int(self.stream.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            height=int(self.stream.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            max_dimension=self._max_dimension,
+        )
         fps = self.stream.get(cv2.CAP_PROP_FPS)
         total_frames = int(self.stream.get(cv2.CAP_PROP_FRAME_COUNT))
         return SourceProperties(
@@ -180,6 +206,11 @@ class VideoSource:
         maximum_adaptive_frames_dropped_in_row: int = DEFAULT_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW,
         video_source_properties: Optional[Dict[str, float]] = None,
         source_id: Optional[int] = None,
+        decoder_backend: Union[
+            VideoDecoderBackend, str
+        ] = DEFAULT_VIDEO_DECODER_BACKEND,
+        decoding_max_dimension: Optional[int] = DEFAULT_DECODING_MAX_DIMENSION,
+        skip_non_reference_frames: bool = DEFAULT_SKIP_NON_REFERENCE_FRAMES,
     ):
         """
         This class is meant to represent abstraction over video sources - both video files and
@@ -251,6 +282,15 @@ class VideoSource:
         reader pace and maximum number of consecutive frames dropped in ADAPTIVE mode are configurable by clients,
         with reasonable defaults being set.
 
+        Frames are decoded by one of `VideoDecoderBackend`: OPENCV (`cv2.VideoCapture`, default) or PYAV (FFmpeg
+        through PyAV - requires `pip install inference[pyav]`). In both cases, frames are grabbed from the source
+        one-by-one, but only the ones to be buffered are converted into images - frames dropped by buffer
+        filling strategy only pay for grabbing. With `decoding_max_dimension`, frames are scaled down to have
+        longer side not bigger than given value (PYAV backend scales before conversion into BGR image, which makes
+        the conversion cheaper). PYAV backend may also skip decoding of non-reference frames (like B-frames) at all
+        with `skip_non_reference_frames` - such frames are never emitted, which lowers FPS of the source in
+        exchange for large reduction of decoding work. Video source properties are only supported by OPENCV backend.
+
         `VideoSource` emits events regarding its activity - which can be intercepted by custom handlers. Take
         into account that they are always executed in context of thread invoking them (and should be fast to complete,
         otherwise may block the flow of stream consumption). All errors raised will be emitted as logger warnings only.
@@ -265,6 +305,9 @@ class VideoSource:
         * VIDEO_SOURCE_ADAPTIVE_MODE_READER_PACE_TOLERANCE - default: 5.0
         * VIDEO_SOURCE_MINIMUM_ADAPTIVE_MODE_SAMPLES - default: 10
         * VIDEO_SOURCE_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW - default: 16
+        * VIDEO_SOURCE_DECODER_BACKEND - default: opencv
+        * VIDEO_SOURCE_DECODING_MAX_DIMENSION - default: None
+        * VIDEO_SOURCE_SKIP_NON_REFERENCE_FRAMES - default: False
 
         As an `inference` user, please use .init() method instead of constructor to instantiate objects.
 
@@ -289,6 +332,12 @@ class VideoSource:
             source_id (Optional[int]): Optional identifier of video source - mainly useful to recognise specific source
                 when multiple ones are in use. Identifier will be added to emitted frames and updates. It is advised
                 to keep it unique within all sources in use.
+            decoder_backend (Union[VideoDecoderBackend, str]): Backend to decode video with - ignored if
+                `video_reference` is a callable producing `VideoFrameProducer`
+            decoding_max_dimension (Optional[int]): Maximum size of the longer side of decoded frames - frames
+                are scaled down if needed
+            skip_non_reference_frames (bool): Flag to decide if non-reference frames should not be decoded at
+                all (supported by PYAV backend only)
 
         Returns: Instance of `VideoSource` class
         """
@@ -311,6 +360,9 @@ class VideoSource:
             video_consumer=video_consumer,
             video_source_properties=video_source_properties,
             source_id=source_id,
+            decoder_backend=VideoDecoderBackend(decoder_backend),
+            decoding_max_dimension=decoding_max_dimension,
+            skip_non_reference_frames=skip_non_reference_frames,
         )
 
     def __init__(
@@ -322,6 +374,9 @@ class VideoSource:
         video_consumer: "VideoConsumer",
         video_source_properties: Optional[Dict[str, float]],
         source_id: Optional[int],
+        decoder_backend: VideoDecoderBackend = VideoDecoderBackend.OPENCV,
+        decoding_max_dimension: Optional[int] = None,
+        skip_non_reference_frames: bool = False,
     ):
         self._stream_reference = stream_reference
         self._video: Optional[VideoFrameProducer] = None
@@ -337,6 +392,9 @@ class VideoSource:
         self._state_change_lock = Lock()
         self._video_source_properties = video_source_properties or {}
         self._source_id = source_id
+        self._decoder_backend = decoder_backend
+        self._decoding_max_dimension = decoding_max_dimension
+        self._skip_non_reference_frames = skip_non_reference_frames
 
     @property
     def source_id(self) -> Optional[int]:
@@ -500,6 +558,10 @@ class VideoSource:
         """
         return self._state
 
+    def count_buffered_frames(self) -> int:
+        """Returns number of decoded frames waiting in the buffer to be read."""
+        return self._frames_buffer.qsize()
+
     def frame_ready(self) -> bool:
         """
         Method to check if decoded frame is ready for consumer
@@ -569,7 +631,12 @@ class VideoSource:
         if callable(self._stream_reference):
             self._video = self._stream_reference()
         else:
-            self._video = CV2VideoFrameProducer(self._stream_reference)
+            self._video = create_video_frame_producer(
+                video=self._stream_reference,
+                decoder_backend=self._decoder_backend,
+                max_dimension=self._decoding_max_dimension,
+                skip_non_reference_frames=self._skip_non_reference_frames,
+            )
         if not self._video.isOpened():
             self._change_state(target_state=StreamState.ERROR)
             raise SourceConnectionError(
@@ -895,6 +962,7 @@ class VideoConsumer:
                 source_id=source_id,
                 fps=declared_source_fps,
                 comes_from_video_file=is_source_video_file,
+                status_update_handlers=self._status_update_handlers,
             )
         if self._buffer_filling_strategy in DROP_OLDEST_STRATEGIES:
             return self._process_stream_frame_dropping_oldest(
@@ -987,9 +1055,30 @@ class VideoConsumer:
             decoding_pace_monitor=self._decoding_pace_monitor,
             source_id=source_id,
             comes_from_video_file=is_video_file,
+            status_update_handlers=self._status_update_handlers,
         )
 
 
+def create_video_frame_producer(
+    video: Union[str, int],
+    decoder_backend: VideoDecoderBackend,
+    max_dimension: Optional[int] = None,
+    skip_non_reference_frames: bool = False,
+) -> VideoFrameProducer:
+    if decoder_backend is VideoDecoderBackend.PYAV:
+        return PyAVVideoFrameProducer(
+            video=video,
+            max_dimension=max_dimension,
+            skip_non_reference_frames=skip_non_reference_frames,
+        )
+    if skip_non_reference_frames:
+        logger.warning(
+            "Skipping non-reference frames is not supported by `opencv` decoder backend - "
+            "all frames will be decoded."
+        )
+    return CV2VideoFrameProducer(video=video, max_dimension=max_dimension)
+
+
 def get_from_queue(
     queue: Queue,
     timeout: Optional[float] = None,
@@ -1094,11 +1183,24 @@ def decode_video_frame_to_buffer(
     source_id: Optional[int],
     fps: Optional[float] = None,
     comes_from_video_file: Optional[bool] = None,
+    status_update_handlers: Optional[List[Callable[[StatusUpdate], None]]] = None,
 ) -> bool:
     success, image = video.retrieve()
     if not success:
         return False
     decoding_pace_monitor.tick()
+    if status_update_handlers:
+        send_video_source_status_update(
+            severity=UpdateSeverity.DEBUG,
+            event_type=FRAME_DECODED_EVENT,
+            payload={
+                "frame_timestamp": frame_timestamp,
+                "frame_id": frame_id,
+                "source_id": source_id,
+            },
+            status_update_handlers=status_update_handlers,
+            sub_context=VIDEO_CONSUMER_CONTEXT,
+        )
     video_frame = VideoFrame(
         image=image,
         frame_id=frame_id,
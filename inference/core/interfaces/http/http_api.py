@@ -1,5 +1,6 @@
 import base64
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial, wraps
 from time import sleep
 from typing import Any, Dict, List, Optional, Union
@@ -119,6 +120,8 @@ from inference.core.env import (
     NOTEBOOK_PORT,
     PROFILE,
     ROBOFLOW_SERVICE_SECRET,
+    SYNC_ROUTES_MAX_QUEUE_SIZE,
+    SYNC_ROUTES_MAX_WORKERS,
     WORKFLOWS_MAX_CONCURRENT_STEPS,
     WORKFLOWS_STEP_EXECUTION_MODE,
 )
@@ -143,6 +146,7 @@ from inference.core.exceptions import (
     RoboflowAPINotNotFoundError,
     RoboflowAPIUnsuccessfulRequestError,
     ServiceConfigurationError,
+    ServiceOverloadedError,
     WorkspaceLoadError,
 )
 from inference.core.interfaces.base import BaseInterface
@@ -154,6 +158,7 @@ from inference.core.interfaces.http.orjson_utils import (
     orjson_response,
     serialise_workflow_result,
 )
+from inference.core.interfaces.http.sync_routes_executor import SyncRoutesExecutor
 from inference.core.managers.base import ModelManager
 from inference.core.roboflow_api import (
     get_roboflow_dataset_type,
@@ -347,6 +352,13 @@ def with_route_exceptions(route):
                 content={"message": "Internal error. Request to Roboflow API failed."},
             )
             traceback.print_exc()
+        except ServiceOverloadedError as error:
+            resp = JSONResponse(
+                status_code=503,
+                content={"message": "Service is overloaded. Try again later."},
+                headers={"Retry-After": "1"},
+            )
+            logger.warning(f"Rejected request due to overload: {error}")
         except RoboflowAPIConnectionError:
             resp = JSONResponse(
                 status_code=503,
@@ -560,6 +572,20 @@ class HttpInterface(BaseInterface):
 
         self.app = app
         self.model_manager = model_manager
+        self.sync_routes_executor = SyncRoutesExecutor(
+            max_workers=SYNC_ROUTES_MAX_WORKERS,
+            max_queue_size=SYNC_ROUTES_MAX_QUEUE_SIZE,
+        )
+        # steps of all Workflows run by the server share one pool - each run still
+        # executes at most WORKFLOWS_MAX_CONCURRENT_STEPS steps at a time
+        self.workflows_steps_executor = ThreadPoolExecutor(
+            max_workers=WORKFLOWS_MAX_CONCURRENT_STEPS * SYNC_ROUTES_MAX_WORKERS,
+            thread_name_prefix="workflow_step",
+        )
+
+        @app.on_event("shutdown")
+        def shutdown_workflows_steps_executor() -> None:
+            self.workflows_steps_executor.shutdown(wait=False)
 
         async def process_inference_request(
             inference_request: InferenceRequest, **kwargs
@@ -596,8 +622,14 @@ class HttpInterface(BaseInterface):
                 init_parameters=workflow_init_parameters,
                 max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
                 prevent_local_images_loading=True,
+                steps_executor=self.workflows_steps_executor,
             )
-            result = execution_engine.run(runtime_parameters=workflow_request.inputs)
+            try:
+                result = execution_engine.run(
+                    runtime_parameters=workflow_request.inputs
+                )
+            finally:
+                execution_engine.close()
             outputs = serialise_workflow_result(
                 result=result,
                 excluded_fields=workflow_request.excluded_fields,
@@ -605,6 +637,23 @@ class HttpInterface(BaseInterface):
             response = WorkflowInferenceResponse(outputs=outputs)
             return orjson_response(response=response)
 
+        def process_predefined_workflow_inference_request(
+            workspace_name: str,
+            workflow_id: str,
+            workflow_request: WorkflowInferenceRequest,
+            background_tasks: Optional[BackgroundTasks],
+        ) -> WorkflowInferenceResponse:
+            workflow_specification = get_workflow_specification(
+                api_key=workflow_request.api_key,
+                workspace_id=workspace_name,
+                workflow_id=workflow_id,
+            )
+            return process_workflow_inference_request(
+                workflow_request=workflow_request,
+                workflow_specification=workflow_specification,
+                background_tasks=background_tasks,
+            )
+
         def load_core_model(
             inference_request: InferenceRequest,
             api_key: Optional[str] = None,
@@ -1031,15 +1080,11 @@ class HttpInterface(BaseInterface):
                 workflow_request: WorkflowInferenceRequest,
                 background_tasks: BackgroundTasks,
             ) -> WorkflowInferenceResponse:
-                # TODO: get rid of async: https://github.com/roboflow/inference/issues/569
-                workflow_specification = get_workflow_specification(
-                    api_key=workflow_request.api_key,
-                    workspace_id=workspace_name,
+                return await self.sync_routes_executor.run(
+                    process_predefined_workflow_inference_request,
+                    workspace_name=workspace_name,
                     workflow_id=workflow_id,
-                )
-                return process_workflow_inference_request(
                     workflow_request=workflow_request,
-                    workflow_specification=workflow_specification,
                     background_tasks=background_tasks if not LAMBDA else None,
                 )
 
@@ -1061,8 +1106,8 @@ class HttpInterface(BaseInterface):
                 workflow_request: WorkflowSpecificationInferenceRequest,
                 background_tasks: BackgroundTasks,
             ) -> WorkflowInferenceResponse:
-                # TODO: get rid of async: https://github.com/roboflow/inference/issues/569
-                return process_workflow_inference_request(
+                return await self.sync_routes_executor.run(
+                    process_workflow_inference_request,
                     workflow_request=workflow_request,
                     workflow_specification=workflow_request.specification,
                     background_tasks=background_tasks if not LAMBDA else None,
@@ -1176,12 +1221,14 @@ class HttpInterface(BaseInterface):
                     "workflows_core.background_tasks": None,
                     "workflows_core.step_execution_mode": step_execution_mode,
                 }
-                _ = ExecutionEngine.init(
+                execution_engine = ExecutionEngine.init(
                     workflow_definition=specification,
                     init_parameters=workflow_init_parameters,
                     max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
                     prevent_local_images_loading=True,
+                    steps_executor=self.workflows_steps_executor,
                 )
+                execution_engine.close()
                 return WorkflowValidationStatus(status="ok")
 
         if CORE_MODELS_ENABLED:
@@ -1214,9 +1261,13 @@ class HttpInterface(BaseInterface):
                         ClipEmbeddingResponse: The response containing the embedded image.
                     """
                     logger.debug(f"Reached /clip/embed_image")
-                    clip_model_id = load_clip_model(inference_request, api_key=api_key)
-                    response = await self.model_manager.infer_from_request(
-                        clip_model_id, inference_request
+                    clip_model_id = await self.sync_routes_executor.run(
+                        load_clip_model, inference_request, api_key=api_key
+                    )
+                    response = await self.sync_routes_executor.run(
+                        self.model_manager.infer_from_request_sync,
+                        clip_model_id,
+                        inference_request,
                     )
                     if LAMBDA:
                         actor = request.scope["aws.event"]["requestContext"][
@@ -1252,9 +1303,13 @@ class HttpInterface(BaseInterface):
                         ClipEmbeddingResponse: The response containing the embedded text.
                     """
                     logger.debug(f"Reached /clip/embed_text")
-                    clip_model_id = load_clip_model(inference_request, api_key=api_key)
-                    response = await self.model_manager.infer_from_request(
-                        clip_model_id, inference_request
+                    clip_model_id = await self.sync_routes_executor.run(
+                        load_clip_model, inference_request, api_key=api_key
+                    )
+                    response = await self.sync_routes_executor.run(
+                        self.model_manager.infer_from_request_sync,
+                        clip_model_id,
+                        inference_request,
                     )
                     if LAMBDA:
                         actor = request.scope["aws.event"]["requestContext"][
@@ -1290,9 +1345,13 @@ class HttpInterface(BaseInterface):
                         ClipCompareResponse: The response containing the similarity scores.
                     """
                     logger.debug(f"Reached /clip/compare")
-                    clip_model_id = load_clip_model(inference_request, api_key=api_key)
-                    response = await self.model_manager.infer_from_request(
-                        clip_model_id, inference_request
+                    clip_model_id = await self.sync_routes_executor.run(
+                        load_clip_model, inference_request, api_key=api_key
+                    )
+                    response = await self.sync_routes_executor.run(
+                        self.model_manager.infer_from_request_sync,
+                        clip_model_id,
+                        inference_request,
                     )
                     if LAMBDA:
                         actor = request.scope["aws.event"]["requestContext"][
@@ -1418,11 +1477,13 @@ class HttpInterface(BaseInterface):
                         M.OCRInferenceResponse: The response containing the embedded image.
                     """
                     logger.debug(f"Reached /doctr/ocr")
-                    doctr_model_id = load_doctr_model(
-                        inference_request, api_key=api_key
+                    doctr_model_id = await self.sync_routes_executor.run(
+                        load_doctr_model, inference_request, api_key=api_key
                     )
-                    response = await self.model_manager.infer_from_request(
-                        doctr_model_id, inference_request
+                    response = await self.sync_routes_executor.run(
+                        self.model_manager.infer_from_request_sync,
+                        doctr_model_id,
+                        inference_request,
                     )
                     if LAMBDA:
                         actor = request.scope["aws.event"]["requestContext"][
@@ -1460,9 +1521,13 @@ class HttpInterface(BaseInterface):
                         M.SamEmbeddingResponse or Response: The response containing the embedded image.
                     """
                     logger.debug(f"Reached /sam/embed_image")
-                    sam_model_id = load_sam_model(inference_request, api_key=api_key)
-                    model_response = await self.model_manager.infer_from_request(
-                        sam_model_id, inference_request
+                    sam_model_id = await self.sync_routes_executor.run(
+                        load_sam_model, inference_request, api_key=api_key
+                    )
+                    model_response = await self.sync_routes_executor.run(
+                        self.model_manager.infer_from_request_sync,
+                        sam_model_id,
+                        inference_request,
                     )
                     if LAMBDA:
                         actor = request.scope["aws.event"]["requestContext"][
@@ -1503,9 +1568,13 @@ class HttpInterface(BaseInterface):
                         M.SamSegmentationResponse or Response: The response containing the segmented image.
                     """
                     logger.debug(f"Reached /sam/segment_image")
-                    sam_model_id = load_sam_model(inference_request, api_key=api_key)
-                    model_response = await self.model_manager.infer_from_request(
-                        sam_model_id, inference_request
+                    sam_model_id = await self.sync_routes_executor.run(
+                        load_sam_model, inference_request, api_key=api_key
+                    )
+                    model_response = await self.sync_routes_executor.run(
+                        self.model_manager.infer_from_request_sync,
+                        sam_model_id,
+                        inference_request,
                     )
                     if LAMBDA:
                         actor = request.scope["aws.event"]["requestContext"][
@@ -1548,9 +1617,13 @@ class HttpInterface(BaseInterface):
                         M.Sam2EmbeddingResponse or Response: The response affirming the image has been embedded
                     """
                     logger.debug(f"Reached /sam2/embed_image")
-                    sam2_model_id = load_sam2_model(inference_request, api_key=api_key)
-                    model_response = await self.model_manager.infer_from_request(
-                        sam2_model_id, inference_request
+                    sam2_model_id = await self.sync_routes_executor.run(
+                        load_sam2_model, inference_request, api_key=api_key
+                    )
+                    model_response = await self.sync_routes_executor.run(
+                        self.model_manager.infer_from_request_sync,
+                        sam2_model_id,
+                        inference_request,
                     )
                     return model_response
 
@@ -1581,9 +1654,13 @@ class HttpInterface(BaseInterface):
                         M.SamSegmentationResponse or Response: The response containing the segmented image.
                     """
                     logger.debug(f"Reached /sam2/segment_image")
-                    sam2_model_id = load_sam2_model(inference_request, api_key=api_key)
-                    model_response = await self.model_manager.infer_from_request(
-                        sam2_model_id, inference_request
+                    sam2_model_id = await self.sync_routes_executor.run(
+                        load_sam2_model, inference_request, api_key=api_key
+                    )
+                    model_response = await self.sync_routes_executor.run(
+                        self.model_manager.infer_from_request_sync,
+                        sam2_model_id,
+                        inference_request,
                     )
                     if inference_request.format == "binary":
                         return Response(
@@ -0,0 +1,62 @@
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+from typing import Any, Callable, TypeVar
+
+from inference.core.exceptions import ServiceOverloadedError
+
+T = TypeVar("T")
+
+
+class SyncRoutesExecutor:
+    """Runs blocking route handlers (Workflows execution, foundation models inference)
+    in a bounded thread pool, such that the event loop stays responsive. At most
+    `max_workers` calls run at the same time and at most `max_queue_size` calls wait
+    for a free thread - calls beyond that limit are rejected immediately with
+    `ServiceOverloadedError` instead of piling up latency for everyone."""
+
+    def __init__(self, max_workers: int, max_queue_size: int):
+        if max_workers <= 0:
+            raise ValueError(
+                f"SyncRoutesExecutor requires max_workers > 0, got {max_workers}"
+            )
+        self._max_workers = max_workers
+        self._max_pending = max_workers + max(max_queue_size, 0)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="sync_route",
+        )
+        self._pending = 0
+        self._lock = Lock()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self._lock:
+            if self._pending >= self._max_pending:
+                raise ServiceOverloadedError(
+                    f"Could not schedule blocking call - {self._pending} calls already "
+                    f"pending with limit of {self._max_pending}."
+                )
+            self._pending += 1
+        context = contextvars.copy_context()
+        try:
+            future = self._executor.submit(context.run, partial(func, *args, **kwargs))
+        except Exception:
+            self._release()
+            raise
+        # slot is released when the call finishes, not when the awaiting coroutine
+        # gets cancelled (for instance on client disconnect) - thread is busy anyway
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
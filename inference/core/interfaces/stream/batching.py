@@ -0,0 +1,160 @@
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Thread
+from typing import Any, Generator, Iterator, List, Optional, Union
+
+from inference.core.env import MAX_BATCH_SIZE
+from inference.core.interfaces.camera.entities import VideoFrame
+
+# weight of the latest measurement in exponential moving average of batch inference latency
+LATENCY_SMOOTHING_FACTOR = 0.2
+MIN_BATCH_COLLECTION_TIMEOUT = 0.001
+QUEUE_OPERATIONS_TIMEOUT = 0.1
+
+
+class _CollectionError:
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+_COLLECTION_END = object()
+
+
+class AdaptiveBatchCollectionTimeout:
+    """Tunes the time that frames collection from multiple sources may wait for the batch to
+    be filled. While batch is being inferred, the next one is collected - so waiting longer
+    than inference of a batch takes would only starve the model, and waiting shorter makes
+    batches smaller without making processing faster. Hence, timeout follows exponential
+    moving average of batch inference latency, bounded by `max_timeout` (if given).
+    Until first latency is registered - `max_timeout` is used."""
+
+    def __init__(
+        self,
+        max_timeout: Optional[float] = None,
+        min_timeout: float = MIN_BATCH_COLLECTION_TIMEOUT,
+        smoothing_factor: float = LATENCY_SMOOTHING_FACTOR,
+    ):
+        self._max_timeout = max_timeout
+        self._min_timeout = min_timeout
+        self._smoothing_factor = smoothing_factor
+        self._latency: Optional[float] = None
+        self._lock = Lock()
+
+    @property
+    def latency(self) -> Optional[float]:
+        return self._latency
+
+    def register_inference_latency(self, latency: float) -> None:
+        with self._lock:
+            if self._latency is None:
+                self._latency = latency
+                return None
+            self._latency = (
+                self._smoothing_factor * latency
+                + (1 - self._smoothing_factor) * self._latency
+            )
+
+    def get_timeout(self) -> Optional[float]:
+        latency = self._latency
+        if latency is None:
+            return self._max_timeout
+        timeout = max(latency, self._min_timeout)
+        if self._max_timeout is None:
+            return timeout
+        return min(timeout, self._max_timeout)
+
+
+def get_model_max_batch_size(model: Any) -> Union[int, float]:
+    # models with dynamic batch size accept up to MAX_BATCH_SIZE inputs, the ones with
+    # static batch size expose it as `batch_size`
+    if getattr(model, "batching_enabled", False):
+        return MAX_BATCH_SIZE
+    batch_size = getattr(model, "batch_size", None)
+    if isinstance(batch_size, int) and batch_size > 0:
+        return batch_size
+    return MAX_BATCH_SIZE
+
+
+def split_batch(
+    video_frames: List[VideoFrame],
+    max_batch_size: Optional[Union[int, float]],
+) -> List[List[VideoFrame]]:
+    if max_batch_size is None or len(video_frames) <= max_batch_size:
+        return [video_frames]
+    max_batch_size = int(max_batch_size)
+    return [
+        video_frames[i : i + max_batch_size]
+        for i in range(0, len(video_frames), max_batch_size)
+    ]
+
+
+def collect_batches_in_background(
+    batches: Iterator[List[VideoFrame]],
+    max_batches_in_queue: int,
+    stop_collection: Event,
+) -> Generator[List[VideoFrame], None, None]:
+    """Iterates over `batches` in separate thread, keeping at max `max_batches_in_queue`
+    batches collected ahead of consumer - such that the next batch is collected while the
+    current one is processed. Errors raised by `batches` are re-raised in the consumer.
+    `stop_collection` is set once the generator is closed - `batches` is expected to
+    watch it to stop waiting for frames."""
+    batches_queue = Queue(maxsize=max(max_batches_in_queue, 1))
+    collector = Thread(
+        target=_collect_batches,
+        args=(batches, batches_queue, stop_collection),
+        daemon=True,
+    )
+    collector.start()
+    try:
+        while True:
+            item = _get_until_stopped(batches_queue=batches_queue, collector=collector)
+            if item is _COLLECTION_END:
+                return None
+            if isinstance(item, _CollectionError):
+                raise item.error
+            yield item
+    finally:
+        stop_collection.set()
+        collector.join()
+
+
+def _collect_batches(
+    batches: Iterator[List[VideoFrame]],
+    batches_queue: Queue,
+    stop_collection: Event,
+) -> None:
+    try:
+        for batch in batches:
+            if not _put_until_stopped(
+                batches_queue=batches_queue, item=batch, stop_collection=stop_collection
+            ):
+                return None
+        _put_until_stopped(
+            batches_queue=batches_queue,
+            item=_COLLECTION_END,
+            stop_collection=stop_collection,
+        )
+    except Exception as error:
+        _put_until_stopped(
+            batches_queue=batches_queue,
+            item=_CollectionError(error=error),
+            stop_collection=stop_collection,
+        )
+
+
+def _put_until_stopped(batches_queue: Queue, item: Any, stop_collection: Event) -> bool:
+    while not stop_collection.is_set():
+        try:
+            batches_queue.put(item, timeout=QUEUE_OPERATIONS_TIMEOUT)
+            return True
+        except Full:
+            pass
+    return False
+
+
+def _get_until_stopped(batches_queue: Queue, collector: Thread) -> Any:
+    while True:
+        try:
+            return batches_queue.get(timeout=QUEUE_OPERATIONS_TIMEOUT)
+        except Empty:
+            if not collector.is_alive() and batches_queue.empty():
+                return _COLLECTION_END
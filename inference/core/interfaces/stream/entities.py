@@ -112,12 +112,38 @@ class LatencyMonitorReport:
     e2e_latency: Optional[float] = None
 
 
+@dataclass(frozen=True)
+class PipelineStageReport:
+    stage: str
+    source_id: Optional[int]
+    samples: int
+    average: float
+    p50: float
+    p90: float
+    p99: float
+
+
+@dataclass(frozen=True)
+class SourceProfilingReport:
+    source_id: Optional[int]
+    buffered_frames: int
+    dropped_frames: int
+
+
+@dataclass(frozen=True)
+class PipelineProfilingReport:
+    stages_reports: List[PipelineStageReport]
+    sources_reports: List[SourceProfilingReport]
+    predictions_queue_size: int
+
+
 @dataclass(frozen=True)
 class PipelineStateReport:
     video_source_status_updates: List[StatusUpdate]
     latency_reports: List[LatencyMonitorReport]
     inference_throughput: float
     sources_metadata: List[SourceMetadata]
+    profiling_report: Optional[PipelineProfilingReport] = None
 
 
 InferenceHandler = Callable[[List[VideoFrame]], List[AnyPrediction]]
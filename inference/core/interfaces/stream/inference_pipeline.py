@@ -3,7 +3,8 @@ from datetime import datetime
 from enum import Enum
 from functools import partial
 from queue import Queue
-from threading import Thread
+from threading import Event, Thread
+from time import perf_counter
 from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
 from inference.core import logger
@@ -14,7 +15,9 @@ from inference.core.active_learning.middlewares import (
 from inference.core.cache import cache
 from inference.core.env import (
     ACTIVE_LEARNING_ENABLED,
+    ADAPTIVE_BATCHING_ENABLED,
     API_KEY,
+    BATCHES_QUEUE_SIZE,
     DISABLE_PREPROC_AUTO_ORIENT,
     MAX_ACTIVE_MODELS,
     PREDICTIONS_QUEUE_SIZE,
@@ -32,6 +35,12 @@ from inference.core.interfaces.camera.video_source import (
     BufferFillingStrategy,
     VideoSource,
 )
+from inference.core.interfaces.stream.batching import (
+    AdaptiveBatchCollectionTimeout,
+    collect_batches_in_background,
+    get_model_max_batch_size,
+    split_batch,
+)
 from inference.core.interfaces.stream.entities import (
     AnyPrediction,
     InferenceHandler,
@@ -41,9 +50,17 @@ from inference.core.interfaces.stream.entities import (
 from inference.core.interfaces.stream.model_handlers.roboflow_models import (
     default_process_frame,
 )
-from inference.core.interfaces.stream.sinks import active_learning_sink, multi_sink
-from inference.core.interfaces.stream.utils import prepare_video_sources
+from inference.core.interfaces.stream.sinks import (
+    ProcessSink,
+    active_learning_sink,
+    multi_sink,
+)
+from inference.core.interfaces.stream.utils import (
+    chain_callbacks,
+    prepare_video_sources,
+)
 from inference.core.interfaces.stream.watchdog import (
+    INFERENCE_STAGE,
     NullPipelineWatchdog,
     PipelineWatchDog,
 )
@@ -51,6 +68,7 @@ from inference.core.managers.active_learning import BackgroundTaskActiveLearning
 from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
 from inference.core.registries.roboflow import RoboflowModelRegistry
 from inference.core.utils.function import experimental
+from inference.core.utils.stage_timing import collect_stages_durations
 from inference.core.workflows.core_steps.common.entities import StepExecutionMode
 from inference.models.aliases import resolve_roboflow_model_alias
 from inference.models.utils import ROBOFLOW_MODEL_TYPES, get_model
@@ -98,6 +116,9 @@ class InferencePipeline:
         active_learning_target_dataset: Optional[str] = None,
         batch_collection_timeout: Optional[float] = None,
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
+        adaptive_batching: Optional[bool] = None,
+        decode_in_separate_processes: bool = False,
+        sink_in_separate_process: bool = False,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from Roboflow models against video stream.
@@ -205,10 +226,24 @@ class InferencePipeline:
                 `video_frame: List[Optional[VideoFrame]]`. It is also possible to process multiple videos using
                 old sinks - but then `SinkMode.SEQUENTIAL` is to be used, causing sink to be called on each
                 prediction element.
+            adaptive_batching (Optional[bool]): Flag to decouple frames collection from inference - next batch
+                of frames is collected in background while the current one is inferred. Batches are split to
+                not exceed model batch capacity and `batch_collection_timeout` becomes the upper bound of
+                timeout tuned to measured batch inference latency. If not given - env
+                `INFERENCE_PIPELINE_ADAPTIVE_BATCHING_ENABLED` decides.
+            decode_in_separate_processes (bool): Flag to decode each video source in a separate process
+                (see `ProcessVideoSource`) - frames are passed to the inference process through shared memory,
+                such that decoding does not compete for GIL with inference. Default: False.
+            sink_in_separate_process (bool): Flag to run `on_prediction` in a separate process (see `ProcessSink`) -
+                sink errors are then logged by sink process instead of being emitted as status updates.
+                Default: False.
 
         Other ENV variables involved in low-level configuration:
         * INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE - size of buffer for predictions that are ready for dispatching
         * INFERENCE_PIPELINE_RESTART_ATTEMPT_DELAY - delay for restarts on stream connection drop
+        * INFERENCE_PIPELINE_ADAPTIVE_BATCHING_ENABLED - controls adaptive batching if explicit parameter not given
+        * INFERENCE_PIPELINE_BATCHES_QUEUE_SIZE - number of batches collected ahead of inference in adaptive batching
+        * INFERENCE_PIPELINE_SHARED_MEMORY_FRAMES_SLOTS - number of frames in flight between processes
         * ACTIVE_LEARNING_ENABLED - controls Active Learning middleware if explicit parameter not given
 
         Returns: Instance of InferencePipeline
@@ -232,6 +267,10 @@ class InferencePipeline:
         on_video_frame = partial(
             default_process_frame, model=model, inference_config=inference_config
         )
+        process_sink = None
+        if sink_in_separate_process and on_prediction is not None:
+            process_sink = ProcessSink.init(on_prediction=on_prediction)
+            on_prediction = process_sink.on_prediction
         active_learning_middleware = NullActiveLearningMiddleware()
         if active_learning_enabled is None:
             logger.info(
@@ -267,6 +306,13 @@ class InferencePipeline:
             on_prediction = partial(multi_sink, sinks=[on_prediction, al_sink])
         on_pipeline_start = active_learning_middleware.start_registration_thread
         on_pipeline_end = active_learning_middleware.stop_registration_thread
+        if process_sink is not None:
+            on_pipeline_start = chain_callbacks(
+                callbacks=[process_sink.start, on_pipeline_start]
+            )
+            on_pipeline_end = chain_callbacks(
+                callbacks=[process_sink.stop, on_pipeline_end]
+            )
         return InferencePipeline.init_with_custom_logic(
             video_reference=video_reference,
             on_video_frame=on_video_frame,
@@ -281,6 +327,9 @@ class InferencePipeline:
             video_source_properties=video_source_properties,
             batch_collection_timeout=batch_collection_timeout,
             sink_mode=sink_mode,
+            adaptive_batching=adaptive_batching,
+            max_batch_size=get_model_max_batch_size(model=model),
+            decode_in_separate_processes=decode_in_separate_processes,
         )
 
     @classmethod
@@ -303,6 +352,9 @@ class InferencePipeline:
         video_source_properties: Optional[Dict[str, float]] = None,
         batch_collection_timeout: Optional[float] = None,
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
+        adaptive_batching: Optional[bool] = None,
+        decode_in_separate_processes: bool = False,
+        sink_in_separate_process: bool = False,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from YoloWorld against video stream.
@@ -369,11 +421,25 @@ class InferencePipeline:
                 `video_frame: List[Optional[VideoFrame]]`. It is also possible to process multiple videos using
                 old sinks - but then `SinkMode.SEQUENTIAL` is to be used, causing sink to be called on each
                 prediction element.
+            adaptive_batching (Optional[bool]): Flag to decouple frames collection from inference - next batch
+                of frames is collected in background while the current one is inferred. Batches are split to
+                not exceed model batch capacity and `batch_collection_timeout` becomes the upper bound of
+                timeout tuned to measured batch inference latency. If not given - env
+                `INFERENCE_PIPELINE_ADAPTIVE_BATCHING_ENABLED` decides.
+            decode_in_separate_processes (bool): Flag to decode each video source in a separate process
+                (see `ProcessVideoSource`) - frames are passed to the inference process through shared memory,
+                such that decoding does not compete for GIL with inference. Default: False.
+            sink_in_separate_process (bool): Flag to run `on_prediction` in a separate process (see `ProcessSink`) -
+                sink errors are then logged by sink process instead of being emitted as status updates.
+                Default: False.
 
 
         Other ENV variables involved in low-level configuration:
         * INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE - size of buffer for predictions that are ready for dispatching
         * INFERENCE_PIPELINE_RESTART_ATTEMPT_DELAY - delay for restarts on stream connection drop
+        * INFERENCE_PIPELINE_ADAPTIVE_BATCHING_ENABLED - controls adaptive batching if explicit parameter not given
+        * INFERENCE_PIPELINE_BATCHES_QUEUE_SIZE - number of batches collected ahead of inference in adaptive batching
+        * INFERENCE_PIPELINE_SHARED_MEMORY_FRAMES_SLOTS - number of frames in flight between processes
 
         Returns: Instance of InferencePipeline
 
@@ -417,6 +483,9 @@ class InferencePipeline:
             video_source_properties=video_source_properties,
             batch_collection_timeout=batch_collection_timeout,
             sink_mode=sink_mode,
+            adaptive_batching=adaptive_batching,
+            decode_in_separate_processes=decode_in_separate_processes,
+            sink_in_separate_process=sink_in_separate_process,
         )
 
     @classmethod
@@ -444,6 +513,10 @@ class InferencePipeline:
         workflows_thread_pool_workers: int = 4,
         cancel_thread_pool_tasks_on_exit: bool = True,
         video_metadata_input_name: str = "video_metadata",
+        batch_collection_timeout: Optional[float] = None,
+        adaptive_batching: Optional[bool] = None,
+        decode_in_separate_processes: bool = False,
+        sink_in_separate_process: bool = False,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from given workflow against video stream.
@@ -502,9 +575,26 @@ class InferencePipeline:
             video_metadata_input_name (str): Name of input for video metadata defined in `workflow_specification` or
                 Workflow definition saved  on the Roboflow Platform. `InferencePipeline` will be injecting video frames
                 metadata to workflows through that parameter name.
+            batch_collection_timeout (Optional[float]): Parameter of multiplex_videos(...) dictating how long process
+                to grab frames from multiple sources can wait for batch to be filled before yielding already collected
+                frames. Please set this value in PRODUCTION to avoid performance drops when specific sources shows
+                unstable latency. Visit `multiplex_videos(...)` for more information about multiplexing process.
+            adaptive_batching (Optional[bool]): Flag to decouple frames collection from workflow execution - next
+                batch of frames is collected in background while the current one is processed, with
+                `batch_collection_timeout` being the upper bound of timeout tuned to measured processing latency.
+                If not given - env `INFERENCE_PIPELINE_ADAPTIVE_BATCHING_ENABLED` decides.
+            decode_in_separate_processes (bool): Flag to decode each video source in a separate process
+                (see `ProcessVideoSource`) - frames are passed to the inference process through shared memory,
+                such that decoding does not compete for GIL with workflow execution. Default: False.
+            sink_in_separate_process (bool): Flag to run `on_prediction` in a separate process (see `ProcessSink`) -
+                sink errors are then logged by sink process instead of being emitted as status updates.
+                Default: False.
         Other ENV variables involved in low-level configuration:
         * INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE - size of buffer for predictions that are ready for dispatching
         * INFERENCE_PIPELINE_RESTART_ATTEMPT_DELAY - delay for restarts on stream connection drop
+        * INFERENCE_PIPELINE_ADAPTIVE_BATCHING_ENABLED - controls adaptive batching if explicit parameter not given
+        * INFERENCE_PIPELINE_BATCHES_QUEUE_SIZE - number of batches collected ahead of inference in adaptive batching
+        * INFERENCE_PIPELINE_SHARED_MEMORY_FRAMES_SLOTS - number of frames in flight between processes
 
         Returns: Instance of InferencePipeline
 
@@ -531,6 +621,9 @@ class InferencePipeline:
                 WorkflowRunner,
             )
             from inference.core.roboflow_api import get_workflow_specification
+            from inference.core.workflows.core_steps.common.video_state_store import (
+                compute_config_hash,
+            )
             from inference.core.workflows.execution_engine.core import ExecutionEngine
 
             if workflow_specification is None:
@@ -566,6 +659,12 @@ class InferencePipeline:
             workflow_init_parameters["workflows_core.thread_pool_executor"] = (
                 thread_pool_executor
             )
+            # state of stateful blocks (and its snapshots) is kept separately for each pipeline
+            # - stable across restarts of the same pipeline
+            workflow_init_parameters.setdefault(
+                "workflows_core.video_state_namespace",
+                compute_config_hash(workflow_specification, str(video_reference)),
+            )
             execution_engine = ExecutionEngine.init(
                 workflow_definition=workflow_specification,
                 init_parameters=workflow_init_parameters,
@@ -589,8 +688,14 @@ class InferencePipeline:
             on_video_frame=on_video_frame,
             on_prediction=on_prediction,
             on_pipeline_start=None,
-            on_pipeline_end=lambda: thread_pool_executor.shutdown(
-                cancel_futures=cancel_thread_pool_tasks_on_exit
+            on_pipeline_end=chain_callbacks(
+                callbacks=[
+                    partial(
+                        thread_pool_executor.shutdown,
+                        cancel_futures=cancel_thread_pool_tasks_on_exit,
+                    ),
+                    execution_engine.close,
+                ]
             ),
             max_fps=max_fps,
             watchdog=watchdog,
@@ -598,6 +703,10 @@ class InferencePipeline:
             source_buffer_filling_strategy=source_buffer_filling_strategy,
             source_buffer_consumption_strategy=source_buffer_consumption_strategy,
             video_source_properties=video_source_properties,
+            batch_collection_timeout=batch_collection_timeout,
+            adaptive_batching=adaptive_batching,
+            decode_in_separate_processes=decode_in_separate_processes,
+            sink_in_separate_process=sink_in_separate_process,
         )
 
     @classmethod
@@ -616,6 +725,10 @@ class InferencePipeline:
         video_source_properties: Optional[Dict[str, float]] = None,
         batch_collection_timeout: Optional[float] = None,
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
+        adaptive_batching: Optional[bool] = None,
+        decode_in_separate_processes: bool = False,
+        sink_in_separate_process: bool = False,
+        max_batch_size: Optional[Union[int, float]] = None,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from given workflow against video stream.
@@ -677,11 +790,28 @@ class InferencePipeline:
                 `video_frame: List[Optional[VideoFrame]]`. It is also possible to process multiple videos using
                 old sinks - but then `SinkMode.SEQUENTIAL` is to be used, causing sink to be called on each
                 prediction element.
+            adaptive_batching (Optional[bool]): Flag to decouple frames collection from inference - next batch
+                of frames is collected in background while the current one is inferred. Batches are split to
+                not exceed model batch capacity and `batch_collection_timeout` becomes the upper bound of
+                timeout tuned to measured batch inference latency. If not given - env
+                `INFERENCE_PIPELINE_ADAPTIVE_BATCHING_ENABLED` decides.
+            decode_in_separate_processes (bool): Flag to decode each video source in a separate process
+                (see `ProcessVideoSource`) - frames are passed to the inference process through shared memory,
+                such that decoding does not compete for GIL with inference. Default: False.
+            sink_in_separate_process (bool): Flag to run `on_prediction` in a separate process (see `ProcessSink`) -
+                sink errors are then logged by sink process instead of being emitted as status updates.
+                Default: False.
+            max_batch_size (Optional[Union[int, float]]): Max number of frames passed to `on_video_frame` at once
+                when adaptive batching is enabled - batches collected from more sources are split. Not bounded
+                by default.
 
 
         Other ENV variables involved in low-level configuration:
         * INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE - size of buffer for predictions that are ready for dispatching
         * INFERENCE_PIPELINE_RESTART_ATTEMPT_DELAY - delay for restarts on stream connection drop
+        * INFERENCE_PIPELINE_ADAPTIVE_BATCHING_ENABLED - controls adaptive batching if explicit parameter not given
+        * INFERENCE_PIPELINE_BATCHES_QUEUE_SIZE - number of batches collected ahead of inference in adaptive batching
+        * INFERENCE_PIPELINE_SHARED_MEMORY_FRAMES_SLOTS - number of frames in flight between processes
 
         Returns: Instance of InferencePipeline
 
@@ -700,9 +830,22 @@ class InferencePipeline:
             status_update_handlers=status_update_handlers,
             source_buffer_filling_strategy=source_buffer_filling_strategy,
             source_buffer_consumption_strategy=source_buffer_consumption_strategy,
+            decode_in_separate_processes=decode_in_separate_processes,
         )
+        if sink_in_separate_process and on_prediction is not None:
+            process_sink = ProcessSink.init(on_prediction=on_prediction)
+            on_prediction = process_sink.on_prediction
+            on_pipeline_start = chain_callbacks(
+                callbacks=[process_sink.start, on_pipeline_start]
+            )
+            on_pipeline_end = chain_callbacks(
+                callbacks=[process_sink.stop, on_pipeline_end]
+            )
         watchdog.register_video_sources(video_sources=video_sources)
         predictions_queue = Queue(maxsize=PREDICTIONS_QUEUE_SIZE)
+        watchdog.register_predictions_queue(predictions_queue=predictions_queue)
+        if adaptive_batching is None:
+            adaptive_batching = ADAPTIVE_BATCHING_ENABLED
         return cls(
             on_video_frame=on_video_frame,
             video_sources=video_sources,
@@ -715,6 +858,8 @@ class InferencePipeline:
             on_pipeline_end=on_pipeline_end,
             batch_collection_timeout=batch_collection_timeout,
             sink_mode=sink_mode,
+            adaptive_batching=adaptive_batching,
+            max_batch_size=max_batch_size,
         )
 
     def __init__(
@@ -730,6 +875,8 @@ class InferencePipeline:
         max_fps: Optional[float] = None,
         batch_collection_timeout: Optional[float] = None,
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
+        adaptive_batching: bool = False,
+        max_batch_size: Optional[Union[int, float]] = None,
     ):
         self._on_video_frame = on_video_frame
         self._video_sources = video_sources
@@ -747,6 +894,11 @@ class InferencePipeline:
         self._on_pipeline_end = on_pipeline_end
         self._batch_collection_timeout = batch_collection_timeout
         self._sink_mode = sink_mode
+        self._adaptive_batching = adaptive_batching
+        self._max_batch_size = max_batch_size
+        self._batch_collection_timeout_tuner = AdaptiveBatchCollectionTimeout(
+            max_timeout=batch_collection_timeout
+        )
 
     def start(self, use_main_thread: bool = True) -> None:
         self._stop = False
@@ -800,11 +952,27 @@ class InferencePipeline:
         )
         logger.info(f"Inference thread started")
         try:
-            for video_frames in self._generate_frames():
+            collection_start = perf_counter()
+            for video_frames in self._generate_batches():
+                self._watchdog.on_batch_collected(
+                    frames=video_frames,
+                    collection_duration=perf_counter() - collection_start,
+                )
                 self._watchdog.on_model_inference_started(
                     frames=video_frames,
                 )
-                predictions = self._on_video_frame(video_frames)
+                inference_start = perf_counter()
+                with collect_stages_durations() as stages_durations:
+                    predictions = self._on_video_frame(video_frames)
+                inference_latency = perf_counter() - inference_start
+                self._batch_collection_timeout_tuner.register_inference_latency(
+                    latency=inference_latency
+                )
+                stages_durations[INFERENCE_STAGE] = inference_latency
+                self._watchdog.on_model_inference_stages_measured(
+                    frames=video_frames,
+                    stages_durations=stages_durations,
+                )
                 self._watchdog.on_model_prediction_ready(
                     frames=video_frames,
                 )
@@ -819,7 +987,7 @@ class InferencePipeline:
                     },
                     status_update_handlers=self._status_update_handlers,
                 )
-
+                collection_start = perf_counter()
         except Exception as error:
             payload = {
                 "error_type": error.__class__.__name__,
@@ -852,10 +1020,15 @@ class InferencePipeline:
                 break
             predictions, video_frames = inference_results
             if self._on_prediction is not None:
+                dispatching_start = perf_counter()
                 self._handle_predictions_dispatching(
                     predictions=predictions,
                     video_frames=video_frames,
                 )
+                self._watchdog.on_predictions_dispatched(
+                    frames=video_frames,
+                    dispatching_duration=perf_counter() - dispatching_start,
+                )
             self._predictions_queue.task_done()
 
     def _handle_predictions_dispatching(
@@ -917,16 +1090,43 @@ class InferencePipeline:
             )
             logger.warning(f"Error in results dispatching - {error}")
 
+    def _generate_batches(
+        self,
+    ) -> Generator[List[VideoFrame], None, None]:
+        if not self._adaptive_batching:
+            yield from self._generate_frames()
+            return None
+        stop_collection = Event()
+        frames = self._generate_frames(
+            should_stop=lambda: self._stop or stop_collection.is_set(),
+            batch_collection_timeout_provider=self._batch_collection_timeout_tuner.get_timeout,
+        )
+        for video_frames in collect_batches_in_background(
+            batches=frames,
+            max_batches_in_queue=BATCHES_QUEUE_SIZE,
+            stop_collection=stop_collection,
+        ):
+            yield from split_batch(
+                video_frames=video_frames, max_batch_size=self._max_batch_size
+            )
+
     def _generate_frames(
         self,
+        should_stop: Optional[Callable[[], bool]] = None,
+        batch_collection_timeout_provider: Optional[
+            Callable[[], Optional[float]]
+        ] = None,
     ) -> Generator[List[VideoFrame], None, None]:
+        if should_stop is None:
+            should_stop = lambda: self._stop
         for video_source in self._video_sources:
             video_source.start()
         yield from multiplex_videos(
             videos=self._video_sources,
             max_fps=self._max_fps,
             batch_collection_timeout=self._batch_collection_timeout,
-            should_stop=lambda: self._stop,
+            should_stop=should_stop,
+            batch_collection_timeout_provider=batch_collection_timeout_provider,
         )
 
 
@@ -1,8 +1,11 @@
 import json
 import socket
+import time
 from datetime import datetime
 from functools import partial
-from typing import Callable, List, Optional, Tuple, Union
+from multiprocessing import Process, Queue
+from queue import Full
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
@@ -11,7 +14,16 @@ from supervision.annotators.base import BaseAnnotator
 
 from inference.core import logger
 from inference.core.active_learning.middlewares import ActiveLearningMiddleware
+from inference.core.env import SHARED_MEMORY_FRAMES_SLOTS
 from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.camera.shared_memory import (
+    SharedMemoryFramesReader,
+    SharedMemoryFramesWriter,
+    SharedVideoFrame,
+    restore_video_frame,
+    share_video_frame,
+    start_worker_process,
+)
 from inference.core.interfaces.stream.entities import SinkHandler
 from inference.core.interfaces.stream.utils import wrap_in_list
 from inference.core.utils.drawing import create_tiles
@@ -20,6 +32,8 @@ from inference.core.utils.preprocess import letterbox_image
 DEFAULT_BBOX_ANNOTATOR = sv.BoundingBoxAnnotator()
 DEFAULT_LABEL_ANNOTATOR = sv.LabelAnnotator()
 DEFAULT_FPS_MONITOR = sv.FPSMonitor()
+PROCESS_SINK_POLLING_INTERVAL = 0.1
+PROCESS_SINK_STOP_TIMEOUT = 30.0
 
 ImageWithSourceID = Tuple[Optional[int], np.ndarray]
 
@@ -539,3 +553,166 @@ class VideoFileSink:
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.release()
+
+
+class ProcessSink:
+    @classmethod
+    def init(
+        cls,
+        on_prediction: SinkHandler,
+        shared_memory_slots: int = SHARED_MEMORY_FRAMES_SLOTS,
+    ) -> "ProcessSink":
+        """
+        Creates `InferencePipeline` predictions sink that runs given sink in a separate process - such that
+        heavy results processing (like annotations rendering) does not compete for GIL with inference.
+        Video frames are passed to the sink process through ring buffer in shared memory (of
+        `shared_memory_slots` slots) instead of being pickled, predictions are pickled. Once all slots are
+        in use, `on_prediction(...)` of `ProcessSink` waits for the sink process to catch up.
+
+        Sink process is started on first predictions (or explicitly with `start()`) and must be stopped
+        with `stop()` once processing ends - sink process not done within stop timeout is terminated. `on_prediction` given must be possible to be pickled if
+        processes are not forked. Errors raised by the sink are logged in sink process.
+
+        As an `inference` user, please use .init() method instead of constructor to instantiate objects.
+        Args:
+            on_prediction (SinkHandler): sink to be run in a separate process
+            shared_memory_slots (int): number of frames that may wait for the sink process
+
+        Returns: Initialized object of `ProcessSink` class.
+
+        Example:
+            ```python
+            from inference import InferencePipeline
+            from inference.core.interfaces.stream.sinks import ProcessSink, render_boxes
+
+            process_sink = ProcessSink.init(on_prediction=render_boxes)
+
+            pipeline = InferencePipeline.init(
+                model_id="your-model/3",
+                video_reference="./some_file.mp4",
+                on_prediction=process_sink.on_prediction,
+            )
+            pipeline.start()
+            pipeline.join()
+            process_sink.stop()
+            ```
+        """
+        return cls(on_prediction=on_prediction, shared_memory_slots=shared_memory_slots)
+
+    def __init__(self, on_prediction: SinkHandler, shared_memory_slots: int):
+        self._on_prediction = on_prediction
+        self._shared_memory_slots = shared_memory_slots
+        self._process: Optional[Process] = None
+        self._messages: Optional[Queue] = None
+        self._writer: Optional[SharedMemoryFramesWriter] = None
+
+    def start(self) -> None:
+        if self._process is not None:
+            return None
+        free_slots = Queue()
+        self._messages = Queue(maxsize=max(self._shared_memory_slots, 1))
+        self._writer = SharedMemoryFramesWriter(
+            free_slots=free_slots, slots=self._shared_memory_slots
+        )
+        self._process = Process(
+            target=run_sink_in_worker_process,
+            kwargs={
+                "on_prediction": self._on_prediction,
+                "messages": self._messages,
+                "free_slots": free_slots,
+            },
+            daemon=True,
+        )
+        start_worker_process(process=self._process)
+
+    def stop(self, timeout: float = PROCESS_SINK_STOP_TIMEOUT) -> None:
+        """Waits up to `timeout` seconds for the sink process to handle all predictions sent
+        and stops it - the process is terminated if it does not finish in time."""
+        if self._process is None:
+            return None
+        stop_started = time.monotonic()
+        if self._put_message(message=None, timeout=timeout):
+            remaining_time = timeout - (time.monotonic() - stop_started)
+            self._process.join(timeout=max(remaining_time, 0.0))
+        if self._process.is_alive():
+            logger.warning(
+                f"Sink process did not finish within {timeout}s - terminating it."
+            )
+            self._process.terminate()
+            self._process.join()
+            # messages not consumed by terminated process must not block exit
+            self._messages.cancel_join_thread()
+        self._writer.close()
+        self._process = None
+
+    def on_prediction(
+        self,
+        predictions: Union[dict, List[Optional[dict]]],
+        video_frame: Union[VideoFrame, List[Optional[VideoFrame]]],
+    ) -> None:
+        if self._process is None:
+            self.start()
+        is_batch = issubclass(type(video_frame), list)
+        shared_frames = [
+            None if frame is None else self._share_video_frame(video_frame=frame)
+            for frame in wrap_in_list(element=video_frame)
+        ]
+        if not self._put_message(message=(predictions, shared_frames, is_batch)):
+            raise RuntimeError("Sink process is not running.")
+
+    def _put_message(self, message: Any, timeout: Optional[float] = None) -> bool:
+        # blocking put would hang forever once the sink process is dead
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._process.is_alive():
+            try:
+                self._messages.put(message, timeout=PROCESS_SINK_POLLING_INTERVAL)
+                return True
+            except Full:
+                pass
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+        return False
+
+    def _share_video_frame(self, video_frame: VideoFrame) -> SharedVideoFrame:
+        while True:
+            shared_frame = share_video_frame(
+                video_frame=video_frame,
+                writer=self._writer,
+                timeout=PROCESS_SINK_POLLING_INTERVAL,
+            )
+            if shared_frame is not None:
+                return shared_frame
+            if not self._process.is_alive():
+                raise RuntimeError("Sink process is not running.")
+
+
+def run_sink_in_worker_process(
+    on_prediction: SinkHandler,
+    messages: Queue,
+    free_slots: Queue,
+) -> None:
+    reader = SharedMemoryFramesReader(free_slots=free_slots)
+    try:
+        while True:
+            message = messages.get()
+            if message is None:
+                break
+            predictions, shared_frames, is_batch = message
+            video_frames = [
+                (
+                    None
+                    if shared_frame is None
+                    else restore_video_frame(
+                        shared_video_frame=shared_frame, reader=reader
+                    )
+                )
+                for shared_frame in shared_frames
+            ]
+            try:
+                on_prediction(
+                    predictions, video_frames if is_batch else video_frames[0]
+                )
+            except Exception as error:
+                logger.warning(f"Error in results dispatching - {error}")
+    finally:
+        reader.close()
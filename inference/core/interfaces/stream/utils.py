@@ -4,6 +4,7 @@ from inference.core.interfaces.camera.entities import (
     StatusUpdate,
     VideoSourceIdentifier,
 )
+from inference.core.interfaces.camera.process_video_source import ProcessVideoSource
 from inference.core.interfaces.camera.video_source import (
     BufferConsumptionStrategy,
     BufferFillingStrategy,
@@ -21,7 +22,8 @@ def prepare_video_sources(
     status_update_handlers: Optional[List[Callable[[StatusUpdate], None]]],
     source_buffer_filling_strategy: Optional[BufferFillingStrategy],
     source_buffer_consumption_strategy: Optional[BufferConsumptionStrategy],
-) -> List[VideoSource]:
+    decode_in_separate_processes: bool = False,
+) -> List[Union[VideoSource, ProcessVideoSource]]:
     video_reference = wrap_in_list(element=video_reference)
     if len(video_reference) < 1:
         raise ValueError(
@@ -40,6 +42,7 @@ def prepare_video_sources(
         status_update_handlers=status_update_handlers,
         source_buffer_filling_strategy=source_buffer_filling_strategy,
         source_buffer_consumption_strategy=source_buffer_consumption_strategy,
+        decode_in_separate_processes=decode_in_separate_processes,
     )
 
 
@@ -67,9 +70,13 @@ def initialise_video_sources(
     status_update_handlers: Optional[List[Callable[[StatusUpdate], None]]],
     source_buffer_filling_strategy: Optional[BufferFillingStrategy],
     source_buffer_consumption_strategy: Optional[BufferConsumptionStrategy],
-) -> List[VideoSource]:
+    decode_in_separate_processes: bool = False,
+) -> List[Union[VideoSource, ProcessVideoSource]]:
+    video_source_class = (
+        ProcessVideoSource if decode_in_separate_processes else VideoSource
+    )
     return [
-        VideoSource.init(
+        video_source_class.init(
             video_reference=reference,
             status_update_handlers=status_update_handlers,
             buffer_filling_strategy=source_buffer_filling_strategy,
@@ -81,3 +88,14 @@ def initialise_video_sources(
             zip(video_reference, video_source_properties)
         )
     ]
+
+
+def chain_callbacks(
+    callbacks: List[Optional[Callable[[], None]]]
+) -> Callable[[], None]:
+    def execute_callbacks() -> None:
+        for callback in callbacks:
+            if callback is not None:
+                callback()
+
+    return execute_callbacks
@@ -4,28 +4,67 @@ observability. Please consider them internal details of implementation.
 """
 
 from abc import ABC, abstractmethod
-from collections import deque
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import replace
 from datetime import datetime
-from typing import Any, Deque, Dict, Iterable, List, Optional, TypeVar
+from queue import Queue
+from threading import Lock
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, TypeVar
 
+import numpy as np
+import prometheus_client
 import supervision as sv
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
 
 from inference.core.interfaces.camera.entities import (
     StatusUpdate,
     UpdateSeverity,
     VideoFrame,
 )
-from inference.core.interfaces.camera.video_source import VideoSource
+from inference.core.interfaces.camera.video_source import (
+    FRAME_DECODED_EVENT,
+    FRAME_DROPPED_EVENT,
+    VideoSource,
+)
 from inference.core.interfaces.stream.entities import (
     LatencyMonitorReport,
     ModelActivityEvent,
+    PipelineProfilingReport,
+    PipelineStageReport,
     PipelineStateReport,
+    SourceProfilingReport,
 )
 
 T = TypeVar("T")
 
 MAX_LATENCY_CONTEXT = 64
 MAX_UPDATES_CONTEXT = 512
+MAX_PROFILING_CONTEXT = 1024
+# decoded frames awaiting inference are tracked to measure buffer wait - frames dropped after
+# decoding never reach inference, so only that many most recent frames are kept per source
+MAX_TRACKED_DECODED_FRAMES = 1024
+STAGE_DURATION_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+DECODE_STAGE = "decode"
+BUFFER_WAIT_STAGE = "buffer_wait"
+BATCH_ASSEMBLY_STAGE = "batch_assembly"
+INFERENCE_STAGE = "inference"
+SINK_STAGE = "sink"
 
 
 class PipelineWatchDog(ABC):
@@ -58,6 +97,24 @@ class PipelineWatchDog(ABC):
     def get_report(self) -> Optional[PipelineStateReport]:
         pass
 
+    def register_predictions_queue(self, predictions_queue: Queue) -> None:
+        pass
+
+    def on_batch_collected(
+        self, frames: List[VideoFrame], collection_duration: float
+    ) -> None:
+        pass
+
+    def on_model_inference_stages_measured(
+        self, frames: List[VideoFrame], stages_durations: Dict[str, float]
+    ) -> None:
+        pass
+
+    def on_predictions_dispatched(
+        self, frames: List[VideoFrame], dispatching_duration: float
+    ) -> None:
+        pass
+
 
 class NullPipelineWatchdog(PipelineWatchDog):
     def register_video_sources(self, video_sources: VideoSource) -> None:
@@ -254,3 +311,220 @@ class BasePipelineWatchDog(PipelineWatchDog):
             inference_throughput=_inference_throughput_fps,
             sources_metadata=sources_metadata,
         )
+
+
+class ProfilingPipelineWatchDog(BasePipelineWatchDog):
+    """
+    Extension of `BasePipelineWatchDog` that measures duration of each stage of frames processing:
+    * `decode` - from the moment of frame being grabbed from the source until it is decoded (per source)
+    * `buffer_wait` - from the moment of frame being decoded until it is passed to inference (per source)
+    * `batch_assembly` - time that inference thread waits for the batch of frames
+    * `preprocess`, `forward`, `postprocess` - stages of model inference (reported by models
+        inheriting from `BaseInference`), `inference` - whole inference of the batch
+    * `sink` - time of predictions dispatching to the sink
+    On top of that - number of frames dropped by video sources, frames waiting in sources buffers and
+    predictions waiting for the sink are tracked. `decode` and `buffer_wait` stages and dropped frames
+    are based on DEBUG updates of `VideoSource` - sources decoding in separate processes do not report them.
+
+    Metrics are exposed in Prometheus format (with `export_metrics()` or `start_metrics_server(...)`),
+    while `get_report()` summarises `profiling_window` most recent measurements of each stage.
+    Metrics are kept in registry private for the instance - so multiple pipelines may be profiled at once.
+    """
+
+    def __init__(self, profiling_window: int = MAX_PROFILING_CONTEXT):
+        super().__init__()
+        self._profiling_window = profiling_window
+        self._lock = Lock()
+        self._predictions_queue: Optional[Queue] = None
+        self._stages_durations: Dict[Tuple[str, Optional[int]], Deque[float]] = {}
+        self._dropped_frames: Dict[Optional[int], int] = defaultdict(int)
+        self._decoded_frames: Dict[Optional[int], OrderedDict] = defaultdict(
+            OrderedDict
+        )
+        self._registry = CollectorRegistry()
+        self._stage_duration_histogram = Histogram(
+            "inference_pipeline_stage_duration_seconds",
+            "Duration of InferencePipeline processing stages",
+            labelnames=["stage", "source_id"],
+            buckets=STAGE_DURATION_BUCKETS,
+            registry=self._registry,
+        )
+        self._dropped_frames_counter = Counter(
+            "inference_pipeline_dropped_frames",
+            "Number of frames dropped by video sources",
+            labelnames=["source_id"],
+            registry=self._registry,
+        )
+        self._buffered_frames_gauge = Gauge(
+            "inference_pipeline_buffered_frames",
+            "Number of decoded frames waiting in video source buffer",
+            labelnames=["source_id"],
+            registry=self._registry,
+        )
+        self._predictions_queue_size_gauge = Gauge(
+            "inference_pipeline_predictions_queue_size",
+            "Number of predictions waiting to be dispatched to the sink",
+            registry=self._registry,
+        )
+
+    def register_predictions_queue(self, predictions_queue: Queue) -> None:
+        self._predictions_queue = predictions_queue
+
+    def on_status_update(self, status_update: StatusUpdate) -> None:
+        super().on_status_update(status_update=status_update)
+        if status_update.event_type == FRAME_DECODED_EVENT:
+            self._register_frame_decoded(status_update=status_update)
+        elif status_update.event_type == FRAME_DROPPED_EVENT:
+            source_id = status_update.payload.get("source_id")
+            with self._lock:
+                self._dropped_frames[source_id] += 1
+            self._dropped_frames_counter.labels(
+                source_id=_source_id_label(source_id=source_id)
+            ).inc()
+
+    def on_model_inference_started(self, frames: List[VideoFrame]) -> None:
+        super().on_model_inference_started(frames=frames)
+        inference_start = datetime.now()
+        for frame in frames:
+            with self._lock:
+                decoding_timestamp = self._decoded_frames[frame.source_id].pop(
+                    frame.frame_id, None
+                )
+            if decoding_timestamp is not None:
+                self._register_stage_duration(
+                    stage=BUFFER_WAIT_STAGE,
+                    duration=(inference_start - decoding_timestamp).total_seconds(),
+                    source_id=frame.source_id,
+                )
+        self._measure_queues_sizes()
+
+    def on_batch_collected(
+        self, frames: List[VideoFrame], collection_duration: float
+    ) -> None:
+        self._register_stage_duration(
+            stage=BATCH_ASSEMBLY_STAGE, duration=collection_duration
+        )
+
+    def on_model_inference_stages_measured(
+        self, frames: List[VideoFrame], stages_durations: Dict[str, float]
+    ) -> None:
+        for stage, duration in stages_durations.items():
+            self._register_stage_duration(stage=stage, duration=duration)
+
+    def on_predictions_dispatched(
+        self, frames: List[VideoFrame], dispatching_duration: float
+    ) -> None:
+        self._register_stage_duration(stage=SINK_STAGE, duration=dispatching_duration)
+
+    def get_report(self) -> PipelineStateReport:
+        report = super().get_report()
+        return replace(report, profiling_report=self.get_profiling_report())
+
+    def get_profiling_report(self) -> PipelineProfilingReport:
+        with self._lock:
+            stages_durations = {
+                key: list(durations)
+                for key, durations in self._stages_durations.items()
+            }
+            dropped_frames = dict(self._dropped_frames)
+        stages_reports = [
+            summarise_stage_durations(
+                stage=stage, source_id=source_id, durations=durations
+            )
+            for (stage, source_id), durations in stages_durations.items()
+        ]
+        sources_ids = [s.source_id for s in self._video_sources or []]
+        sources_ids += [
+            source_id for source_id in dropped_frames if source_id not in sources_ids
+        ]
+        buffered_frames = self._count_buffered_frames()
+        sources_reports = [
+            SourceProfilingReport(
+                source_id=source_id,
+                buffered_frames=buffered_frames.get(source_id, 0),
+                dropped_frames=dropped_frames.get(source_id, 0),
+            )
+            for source_id in sources_ids
+        ]
+        return PipelineProfilingReport(
+            stages_reports=stages_reports,
+            sources_reports=sources_reports,
+            predictions_queue_size=self._get_predictions_queue_size(),
+        )
+
+    def export_metrics(self) -> bytes:
+        """Returns metrics in Prometheus text exposition format."""
+        return prometheus_client.generate_latest(self._registry)
+
+    def start_metrics_server(self, port: int, address: str = "0.0.0.0") -> None:
+        """Starts HTTP server (in daemon thread) exposing metrics to be scraped by Prometheus."""
+        prometheus_client.start_http_server(
+            port=port, addr=address, registry=self._registry
+        )
+
+    def _register_frame_decoded(self, status_update: StatusUpdate) -> None:
+        source_id = status_update.payload.get("source_id")
+        frame_id = status_update.payload.get("frame_id")
+        frame_timestamp = status_update.payload.get("frame_timestamp")
+        if frame_timestamp is not None:
+            self._register_stage_duration(
+                stage=DECODE_STAGE,
+                duration=(status_update.timestamp - frame_timestamp).total_seconds(),
+                source_id=source_id,
+            )
+        with self._lock:
+            decoded_frames = self._decoded_frames[source_id]
+            decoded_frames[frame_id] = status_update.timestamp
+            if len(decoded_frames) > MAX_TRACKED_DECODED_FRAMES:
+                decoded_frames.popitem(last=False)
+
+    def _register_stage_duration(
+        self, stage: str, duration: float, source_id: Optional[int] = None
+    ) -> None:
+        with self._lock:
+            key = (stage, source_id)
+            if key not in self._stages_durations:
+                self._stages_durations[key] = deque(maxlen=self._profiling_window)
+            self._stages_durations[key].append(duration)
+        self._stage_duration_histogram.labels(
+            stage=stage, source_id=_source_id_label(source_id=source_id)
+        ).observe(duration)
+
+    def _measure_queues_sizes(self) -> None:
+        for source_id, buffered_frames in self._count_buffered_frames().items():
+            self._buffered_frames_gauge.labels(
+                source_id=_source_id_label(source_id=source_id)
+            ).set(buffered_frames)
+        self._predictions_queue_size_gauge.set(self._get_predictions_queue_size())
+
+    def _count_buffered_frames(self) -> Dict[Optional[int], int]:
+        if self._video_sources is None:
+            return {}
+        return {
+            source.source_id: source.count_buffered_frames()
+            for source in self._video_sources
+        }
+
+    def _get_predictions_queue_size(self) -> int:
+        if self._predictions_queue is None:
+            return 0
+        return self._predictions_queue.qsize()
+
+
+def summarise_stage_durations(
+    stage: str, source_id: Optional[int], durations: List[float]
+) -> PipelineStageReport:
+    p50, p90, p99 = np.percentile(durations, [50, 90, 99]).tolist()
+    return PipelineStageReport(
+        stage=stage,
+        source_id=source_id,
+        samples=len(durations),
+        average=sum(durations) / len(durations),
+        p50=p50,
+        p90=p90,
+        p99=p99,
+    )
+
+
+def _source_id_label(source_id: Optional[int]) -> str:
+    return "" if source_id is None else str(source_id)
@@ -2,24 +2,21 @@ import time
 from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
-from fastapi.encoders import jsonable_encoder
 
-from inference.core.cache import cache
-from inference.core.cache.serializers import to_cachable_inference_item
-from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
 from inference.core.entities.requests.inference import InferenceRequest
 from inference.core.entities.responses.inference import InferenceResponse
 from inference.core.env import (
     DISABLE_INFERENCE_CACHE,
     METRICS_ENABLED,
-    METRICS_INTERVAL,
     ROBOFLOW_SERVER_UUID,
 )
 from inference.core.exceptions import InferenceModelNotFound
 from inference.core.logger import logger
 from inference.core.managers.entities import ModelDescription
 from inference.core.managers.pingback import PingbackInfo
+from inference.core.managers.telemetry import inference_telemetry
 from inference.core.models.base import Model, PreprocessReturnMetadata
+from inference.core.models.types import NativeDetections
 from inference.core.registries.base import ModelRegistry
 
 
@@ -102,52 +99,21 @@ class ModelManager:
             logger.debug(
                 f"ModelManager - inference from request finished for model_id={model_id}."
             )
-            finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
-                logger.debug(
-                    f"ModelManager - caching inference request started for model_id={model_id}"
-                )
-                cache.zadd(
-                    f"models",
-                    value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                if (
-                    hasattr(request, "image")
-                    and hasattr(request.image, "type")
-                    and request.image.type == "numpy"
-                ):
-                    request.image.value = str(request.image.value)
-                cache.zadd(
-                    f"inference:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value=to_cachable_inference_item(request, rtn_val),
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                logger.debug(
-                    f"ModelManager - caching inference request finished for model_id={model_id}"
+                inference_telemetry.record_inference(
+                    model_id=model_id,
+                    request=request,
+                    response=rtn_val,
+                    finish_time=time.time(),
                 )
             return rtn_val
         except Exception as e:
-            finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
-                cache.zadd(
-                    f"models",
-                    value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                cache.zadd(
-                    f"error:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value={
-                        "request": jsonable_encoder(
-                            request.dict(exclude={"image", "subject", "prompt"})
-                        ),
-                        "error": str(e),
-                    },
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
+                inference_telemetry.record_error(
+                    model_id=model_id,
+                    request=request,
+                    error=e,
+                    finish_time=time.time(),
                 )
             raise
 
@@ -176,52 +142,78 @@ class ModelManager:
             logger.debug(
                 f"ModelManager - inference from request finished for model_id={model_id}."
             )
-            finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
-                logger.debug(
-                    f"ModelManager - caching inference request started for model_id={model_id}"
-                )
-                cache.zadd(
-                    f"models",
-                    value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
+                inference_telemetry.record_inference(
+                    model_id=model_id,
+                    request=request,
+                    response=rtn_val,
+                    finish_time=time.time(),
                 )
-                if (
-                    hasattr(request, "image")
-                    and hasattr(request.image, "type")
-                    and request.image.type == "numpy"
-                ):
-                    request.image.value = str(request.image.value)
-                cache.zadd(
-                    f"inference:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value=to_cachable_inference_item(request, rtn_val),
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
+            return rtn_val
+        except Exception as e:
+            if not DISABLE_INFERENCE_CACHE:
+                inference_telemetry.record_error(
+                    model_id=model_id,
+                    request=request,
+                    error=e,
+                    finish_time=time.time(),
                 )
-                logger.debug(
-                    f"ModelManager - caching inference request finished for model_id={model_id}"
+            raise
+
+    def supports_native_inference(self, model_id: str) -> bool:
+        """Checks whether the model can return predictions as numpy arrays - see
+        `infer_from_request_native(...)`.
+
+        Args:
+            model_id (str): The identifier of the model.
+
+        Returns:
+            bool: Flag indicating if native inference is supported.
+        """
+        model = self._models.get(model_id)
+        return getattr(model, "native_inference_supported", False)
+
+    def infer_from_request_native(
+        self, model_id: str, request: InferenceRequest, **kwargs
+    ) -> List[NativeDetections]:
+        """Runs inference on the specified model with the given request, returning post-processed
+        predictions as numpy arrays (one `NativeDetections` for each image) instead of response
+        objects. Meant for in-process consumers - as there is no response, only model usage and
+        errors are recorded in telemetry.
+
+        Args:
+            model_id (str): The identifier of the model.
+            request (InferenceRequest): The request to process.
+
+        Returns:
+            List[NativeDetections]: Predictions for each image.
+        """
+        logger.debug(
+            f"ModelManager - native inference from request started for model_id={model_id}."
+        )
+        if METRICS_ENABLED and self.pingback:
+            logger.debug("ModelManager - setting pingback fallback api key...")
+            self.pingback.fallback_api_key = request.api_key
+        self.check_for_model(model_id)
+        try:
+            rtn_val = self._models[model_id].infer_native_from_request(request)
+            logger.debug(
+                f"ModelManager - native inference from request finished for model_id={model_id}."
+            )
+            if not DISABLE_INFERENCE_CACHE:
+                inference_telemetry.record_model_usage(
+                    model_id=model_id,
+                    request=request,
+                    finish_time=time.time(),
                 )
             return rtn_val
         except Exception as e:
-            finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
-                cache.zadd(
-                    f"models",
-                    value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                cache.zadd(
-                    f"error:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value={
-                        "request": jsonable_encoder(
-                            request.dict(exclude={"image", "subject", "prompt"})
-                        ),
-                        "error": str(e),
-                    },
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
+                inference_telemetry.record_error(
+                    model_id=model_id,
+                    request=request,
+                    error=e,
+                    finish_time=time.time(),
                 )
             raise
 
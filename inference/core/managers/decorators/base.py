@@ -6,7 +6,7 @@ from inference.core.entities.requests.inference import InferenceRequest
 from inference.core.entities.responses.inference import InferenceResponse
 from inference.core.env import API_KEY
 from inference.core.managers.base import Model, ModelManager
-from inference.core.models.types import PreprocessReturnMetadata
+from inference.core.models.types import NativeDetections, PreprocessReturnMetadata
 
 
 class ModelManagerDecorator(ModelManager):
@@ -89,6 +89,23 @@ class ModelManagerDecorator(ModelManager):
         """
         return self.model_manager.infer_from_request_sync(model_id, request, **kwargs)
 
+    def supports_native_inference(self, model_id: str) -> bool:
+        return self.model_manager.supports_native_inference(model_id)
+
+    def infer_from_request_native(
+        self, model_id: str, request: InferenceRequest, **kwargs
+    ) -> List[NativeDetections]:
+        """Processes a complete inference request, returning predictions as numpy arrays.
+
+        Args:
+            model_id (str): The identifier of the model.
+            request (InferenceRequest): The request to process.
+
+        Returns:
+            List[NativeDetections]: Predictions for each image.
+        """
+        return self.model_manager.infer_from_request_native(model_id, request, **kwargs)
+
     def infer_only(self, model_id: str, request, img_in, img_dims, batch_size=None):
         """Performs only the inference part of a request.
 
@@ -0,0 +1,241 @@
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Union
+
+from inference.core import logger
+from inference.core.entities.requests.inference import (
+    ClassificationInferenceRequest,
+    InferenceRequest,
+    ObjectDetectionInferenceRequest,
+)
+from inference.core.entities.responses.inference import InferenceResponse
+from inference.core.env import DYNAMIC_BATCHING_MAX_WAIT_MS, MAX_BATCH_SIZE
+from inference.core.exceptions import InferenceModelNotFound
+from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators.base import ModelManagerDecorator
+
+BATCHABLE_REQUEST_TYPES = (
+    ObjectDetectionInferenceRequest,
+    ClassificationInferenceRequest,
+)
+REQUEST_FIELDS_EXCLUDED_FROM_BATCH_KEY = {"id", "image", "start"}
+KWARGS_EXCLUDED_FROM_BATCH_KEY = {"background_tasks"}
+
+
+@dataclass
+class PendingBatch:
+    model_id: str
+    kwargs: Dict[str, Any]
+    requests: List[InferenceRequest] = field(default_factory=list)
+    futures: List[asyncio.Future] = field(default_factory=list)
+    images_count: int = 0
+    is_full: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class WithDynamicBatching(ModelManagerDecorator):
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        max_batch_size: Union[int, float] = MAX_BATCH_SIZE,
+        max_wait_ms: float = DYNAMIC_BATCHING_MAX_WAIT_MS,
+    ):
+        """Dynamic batching decorator - concurrent requests to the same model, that only differ by
+        input images, are coalesced into a single inference request. Batch is dispatched once it
+        collects `max_batch_size` images or when `max_wait_ms` passes since the first request
+        arrived - whatever comes first. Results are split back to callers. Coalescing is only
+        applied to models supporting dynamic batch size (`batching_enabled`).
+
+        Args:
+            model_manager (ModelManager): Instance of a ModelManager.
+            max_batch_size (Union[int, float], optional): Max number of images in a batch. Defaults to MAX_BATCH_SIZE.
+            max_wait_ms (float, optional): Max time the first request of the batch waits for others. Defaults to DYNAMIC_BATCHING_MAX_WAIT_MS.
+        """
+        super().__init__(model_manager)
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._pending_batches: Dict[str, PendingBatch] = {}
+
+    async def infer_from_request(
+        self, model_id: str, request: InferenceRequest, **kwargs
+    ) -> InferenceResponse:
+        """Processes a complete inference request, coalescing it with concurrent compatible requests.
+
+        Args:
+            model_id (str): The identifier of the model.
+            request (InferenceRequest): The request to process.
+
+        Returns:
+            InferenceResponse: The response from the inference.
+        """
+        images_count = _count_images(request=request)
+        if (
+            not self._is_request_batchable(model_id=model_id, request=request)
+            or images_count >= self.max_batch_size
+        ):
+            return await super().infer_from_request(model_id, request, **kwargs)
+        batch_key = _compute_batch_key(model_id=model_id, request=request, **kwargs)
+        batch = self._pending_batches.get(batch_key)
+        if batch is None or batch.images_count + images_count > self.max_batch_size:
+            if batch is not None:
+                self._dispatch(batch_key=batch_key, batch=batch)
+            batch = PendingBatch(model_id=model_id, kwargs=kwargs)
+            self._pending_batches[batch_key] = batch
+            asyncio.get_running_loop().create_task(
+                self._execute_batch(batch_key=batch_key, batch=batch)
+            )
+        future = asyncio.get_running_loop().create_future()
+        batch.requests.append(request)
+        batch.futures.append(future)
+        batch.images_count += images_count
+        if batch.images_count >= self.max_batch_size:
+            self._dispatch(batch_key=batch_key, batch=batch)
+        return await future
+
+    def _is_request_batchable(self, model_id: str, request: InferenceRequest) -> bool:
+        if not isinstance(request, BATCHABLE_REQUEST_TYPES):
+            return False
+        if getattr(request, "visualize_predictions", False):
+            return False
+        try:
+            return bool(getattr(self[model_id], "batching_enabled", False))
+        except InferenceModelNotFound:
+            return False
+
+    def _dispatch(self, batch_key: str, batch: PendingBatch) -> None:
+        if self._pending_batches.get(batch_key) is batch:
+            del self._pending_batches[batch_key]
+        batch.is_full.set()
+
+    async def _execute_batch(self, batch_key: str, batch: PendingBatch) -> None:
+        try:
+            await asyncio.wait_for(
+                batch.is_full.wait(), timeout=self.max_wait_ms / 1000
+            )
+        except asyncio.TimeoutError:
+            pass
+        self._dispatch(batch_key=batch_key, batch=batch)
+        if len(batch.requests) == 1:
+            await self._execute_single_request(batch=batch)
+            return None
+        logger.debug(
+            f"Executing dynamic batch of {len(batch.requests)} requests "
+            f"({batch.images_count} images) for model {batch.model_id}"
+        )
+        merged_request = _merge_requests(requests=batch.requests)
+        try:
+            responses = await super().infer_from_request(
+                batch.model_id, merged_request, **batch.kwargs
+            )
+            responses = _split_responses(requests=batch.requests, responses=responses)
+        except Exception as error:
+            # single faulty request must not fail the whole batch - each request
+            # is retried on its own, such that callers only see their own errors
+            logger.warning(
+                f"Dynamic batch of {len(batch.requests)} requests for model {batch.model_id} "
+                f"failed, falling back to processing requests one by one. Cause: {error}"
+            )
+            await asyncio.gather(
+                *[
+                    self._execute_request(
+                        model_id=batch.model_id,
+                        request=request,
+                        future=future,
+                        kwargs=batch.kwargs,
+                    )
+                    for request, future in zip(batch.requests, batch.futures)
+                ]
+            )
+            return None
+        for future, response in zip(batch.futures, responses):
+            if not future.done():
+                future.set_result(response)
+
+    async def _execute_single_request(self, batch: PendingBatch) -> None:
+        await self._execute_request(
+            model_id=batch.model_id,
+            request=batch.requests[0],
+            future=batch.futures[0],
+            kwargs=batch.kwargs,
+        )
+
+    async def _execute_request(
+        self,
+        model_id: str,
+        request: InferenceRequest,
+        future: asyncio.Future,
+        kwargs: Dict[str, Any],
+    ) -> None:
+        try:
+            response = await super().infer_from_request(model_id, request, **kwargs)
+        except Exception as error:
+            if not future.done():
+                future.set_exception(error)
+            return None
+        if not future.done():
+            future.set_result(response)
+
+
+def _count_images(request: InferenceRequest) -> int:
+    image = getattr(request, "image", None)
+    if isinstance(image, list):
+        return len(image)
+    return 1
+
+
+def _compute_batch_key(model_id: str, request: InferenceRequest, **kwargs) -> str:
+    request_parameters = request.model_dump(
+        exclude=REQUEST_FIELDS_EXCLUDED_FROM_BATCH_KEY
+    )
+    kwargs_parameters = {
+        name: value
+        for name, value in kwargs.items()
+        if name not in KWARGS_EXCLUDED_FROM_BATCH_KEY
+    }
+    return json.dumps(
+        {
+            "model_id": model_id,
+            "request_type": type(request).__name__,
+            "request": request_parameters,
+            "kwargs": kwargs_parameters,
+        },
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _merge_requests(requests: List[InferenceRequest]) -> InferenceRequest:
+    images = []
+    for request in requests:
+        if isinstance(request.image, list):
+            images.extend(request.image)
+        else:
+            images.append(request.image)
+    return requests[0].model_copy(update={"image": images})
+
+
+def _split_responses(
+    requests: List[InferenceRequest],
+    responses: Union[InferenceResponse, List[InferenceResponse]],
+) -> List[Union[InferenceResponse, List[InferenceResponse]]]:
+    if not isinstance(responses, list):
+        responses = [responses]
+    if len(responses) != sum(_count_images(request=r) for r in requests):
+        raise ValueError(
+            f"Dynamic batch of {len(requests)} requests resulted in unexpected number of "
+            f"responses: {len(responses)}"
+        )
+    results = []
+    offset = 0
+    for request in requests:
+        images_count = _count_images(request=request)
+        request_responses = responses[offset : offset + images_count]
+        offset += images_count
+        for response in request_responses:
+            if hasattr(response, "inference_id"):
+                response.inference_id = request.id
+        if isinstance(request.image, list):
+            results.append(request_responses)
+        else:
+            results.append(request_responses[0])
+    return results
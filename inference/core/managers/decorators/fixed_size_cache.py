@@ -1,30 +1,75 @@
-from collections import deque
-from typing import List, Optional
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from threading import Lock
+from time import perf_counter
+from typing import Dict, Iterator, List, Optional
 
 from inference.core import logger
 from inference.core.entities.requests.inference import InferenceRequest
 from inference.core.entities.responses.inference import InferenceResponse
+from inference.core.env import MAX_ACTIVE_MODELS_MEMORY_MB
 from inference.core.managers.base import Model, ModelManager
 from inference.core.managers.decorators.base import ModelManagerDecorator
 from inference.core.managers.entities import ModelDescription
+from inference.core.models.types import NativeDetections
+from inference.core.models.utils.memory import (
+    estimate_model_memory_bytes,
+    estimate_weights_memory_bytes,
+)
+
+BYTES_IN_MB = 1024 * 1024
+MIN_LOAD_TIME = 1e-3
+
+
+@dataclass
+class ModelUsage:
+    hits: int = 0
+    load_time: float = 0.0
+    memory_bytes: int = 0
+    weights_memory_bytes: Optional[int] = None
+    clock: float = 0.0
+    loading: bool = False
+
+
+@dataclass
+class ModelLoadLock:
+    lock: Lock
+    users: int = 0
 
 
 class WithFixedSizeCache(ModelManagerDecorator):
-    def __init__(self, model_manager: ModelManager, max_size: int = 8):
-        """Cache decorator, models will be evicted based on the last utilization (`.infer` call). Internally, a [double-ended queue](https://docs.python.org/3/library/collections.html#collections.deque) is used to keep track of model utilization.
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        max_size: int = 8,
+        max_memory_mb: Optional[float] = MAX_ACTIVE_MODELS_MEMORY_MB,
+    ):
+        """Cache decorator, models will be evicted once there are `max_size` of them loaded, or their
+        estimated resident memory exceeds `max_memory_mb`. Eviction follows Greedy-Dual-Size-Frequency
+        policy - a hybrid of LRU and LFU which also accounts for model size and load cost. Models which
+        are rarely used, large and cheap to reload go first. Recency is tracked with ordered dict, so
+        bookkeeping on each `.infer` call is O(1).
 
         Args:
             model_manager (ModelManager): Instance of a ModelManager.
             max_size (int, optional): Max number of models at the same time. Defaults to 8.
+            max_memory_mb (Optional[float], optional): Max estimated memory of models in MB. Defaults to MAX_ACTIVE_MODELS_MEMORY_MB.
         """
         super().__init__(model_manager)
         self.max_size = max_size
-        self._key_queue = deque(self.model_manager.keys())
+        self.max_memory_mb = max_memory_mb
+        self._models_usage: "OrderedDict[str, ModelUsage]" = OrderedDict(
+            (model_id, ModelUsage()) for model_id in self.model_manager.keys()
+        )
+        self._clock = 0.0
+        self._lock = Lock()
+        self._models_locks: Dict[str, ModelLoadLock] = {}
 
     def add_model(
         self, model_id: str, api_key: str, model_id_alias: Optional[str] = None
     ) -> None:
-        """Adds a model to the manager and evicts the least recently used if the cache is full.
+        """Adds a model to the manager and evicts models if the cache is full.
 
         Args:
             model_id (str): The identifier of the model.
@@ -33,32 +78,65 @@ class WithFixedSizeCache(ModelManagerDecorator):
         queue_id = self._resolve_queue_id(
             model_id=model_id, model_id_alias=model_id_alias
         )
+        # concurrent requests for the same model must not load it twice
+        with self._model_lock(model_id=queue_id):
+            self._add_model(
+                queue_id=queue_id,
+                model_id=model_id,
+                api_key=api_key,
+                model_id_alias=model_id_alias,
+            )
+
+    def _add_model(
+        self,
+        queue_id: str,
+        model_id: str,
+        api_key: str,
+        model_id_alias: Optional[str],
+    ) -> None:
         if queue_id in self:
             logger.debug(
                 f"Detected {queue_id} in WithFixedSizeCache models queue -> marking as most recently used."
             )
-            self._key_queue.remove(queue_id)
-            self._key_queue.append(queue_id)
+            self._mark_as_used(model_id=queue_id)
             return None
 
         logger.debug(f"Current capacity of ModelManager: {len(self)}/{self.max_size}")
-        while len(self) >= self.max_size:
-            to_remove_model_id = self._key_queue.popleft()
-            logger.debug(
-                f"Reached maximum capacity of ModelManager. Unloading model {to_remove_model_id}"
-            )
-            super().remove(to_remove_model_id)
-            logger.debug(f"Model {to_remove_model_id} successfully unloaded.")
+        while len(self) >= self.max_size and self._evict(protected_model_id=queue_id):
+            pass
         logger.debug(f"Marking new model {queue_id} as most recently used.")
-        self._key_queue.append(queue_id)
+        with self._lock:
+            # model being loaded is registered upfront (to count towards the limit), but must
+            # not be selected for eviction before the load finishes
+            self._models_usage[queue_id] = ModelUsage(
+                hits=1, clock=self._clock, loading=True
+            )
+        start = perf_counter()
         try:
-            return super().add_model(model_id, api_key, model_id_alias=model_id_alias)
+            super().add_model(model_id, api_key, model_id_alias=model_id_alias)
         except Exception as error:
             logger.debug(
                 f"Could not initialise model {queue_id}. Removing from WithFixedSizeCache models queue."
             )
-            self._key_queue.remove(queue_id)
+            with self._lock:
+                self._models_usage.pop(queue_id, None)
             raise error
+        load_time = perf_counter() - start
+        weights_memory_bytes = self._estimate_weights_memory_bytes(model_id=queue_id)
+        with self._lock:
+            usage = self._models_usage.get(queue_id)
+            if usage is not None:
+                usage.load_time = load_time
+                usage.weights_memory_bytes = weights_memory_bytes
+                usage.loading = False
+        if self.max_memory_mb is None:
+            return None
+        self._refresh_memory_usage()
+        while self._memory_budget_exceeded() and self._evict(
+            protected_model_id=queue_id
+        ):
+            pass
+        return None
 
     def clear(self) -> None:
         """Removes all models from the manager."""
@@ -66,9 +144,9 @@ class WithFixedSizeCache(ModelManagerDecorator):
             self.remove(model_id)
 
     def remove(self, model_id: str) -> Model:
-        try:
-            self._key_queue.remove(model_id)
-        except ValueError:
+        with self._lock:
+            usage = self._models_usage.pop(model_id, None)
+        if usage is None:
             logger.warning(
                 f"Could not successfully purge model {model_id} from  WithFixedSizeCache models queue"
             )
@@ -86,8 +164,7 @@ class WithFixedSizeCache(ModelManagerDecorator):
         Returns:
             InferenceResponse: The response from the inference.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._mark_as_used(model_id=model_id)
         return await super().infer_from_request(model_id, request, **kwargs)
 
     def infer_from_request_sync(
@@ -102,10 +179,24 @@ class WithFixedSizeCache(ModelManagerDecorator):
         Returns:
             InferenceResponse: The response from the inference.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._mark_as_used(model_id=model_id)
         return super().infer_from_request_sync(model_id, request, **kwargs)
 
+    def infer_from_request_native(
+        self, model_id: str, request: InferenceRequest, **kwargs
+    ) -> List[NativeDetections]:
+        """Processes a complete inference request (returning predictions as numpy arrays) and updates the cache.
+
+        Args:
+            model_id (str): The identifier of the model.
+            request (InferenceRequest): The request to process.
+
+        Returns:
+            List[NativeDetections]: Predictions for each image.
+        """
+        self._mark_as_used(model_id=model_id)
+        return super().infer_from_request_native(model_id, request, **kwargs)
+
     def infer_only(self, model_id: str, request, img_in, img_dims, batch_size=None):
         """Performs only the inference part of a request and updates the cache.
 
@@ -119,8 +210,7 @@ class WithFixedSizeCache(ModelManagerDecorator):
         Returns:
             Response from the inference-only operation.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._mark_as_used(model_id=model_id)
         return super().infer_only(model_id, request, img_in, img_dims, batch_size)
 
     def preprocess(self, model_id: str, request):
@@ -130,12 +220,152 @@ class WithFixedSizeCache(ModelManagerDecorator):
             model_id (str): The identifier of the model.
             request (InferenceRequest): The request to preprocess.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._mark_as_used(model_id=model_id)
         return super().preprocess(model_id, request)
 
     def describe_models(self) -> List[ModelDescription]:
-        return self.model_manager.describe_models()
+        self._refresh_memory_usage(force=True)
+        descriptions = []
+        for description in self.model_manager.describe_models():
+            with self._lock:
+                usage = self._models_usage.get(description.model_id)
+                if usage is not None:
+                    description = replace(
+                        description,
+                        memory_bytes=usage.memory_bytes,
+                        load_time=usage.load_time,
+                    )
+            descriptions.append(description)
+        return descriptions
+
+    def _mark_as_used(self, model_id: str) -> None:
+        with self._lock:
+            usage = self._models_usage.get(model_id)
+            if usage is None:
+                return None
+            self._models_usage.move_to_end(model_id)
+            usage.hits += 1
+            usage.clock = self._clock
+
+    @contextmanager
+    def _model_lock(self, model_id: str) -> Iterator[None]:
+        # lock is only kept while some thread holds or awaits it - such that locks
+        # of evicted (or never successfully loaded) models do not pile up
+        with self._lock:
+            model_lock = self._models_locks.get(model_id)
+            if model_lock is None:
+                model_lock = ModelLoadLock(lock=Lock())
+                self._models_locks[model_id] = model_lock
+            model_lock.users += 1
+        try:
+            with model_lock.lock:
+                yield None
+        finally:
+            with self._lock:
+                model_lock.users -= 1
+                if model_lock.users == 0:
+                    del self._models_locks[model_id]
+
+    def _estimate_weights_memory_bytes(self, model_id: str) -> Optional[int]:
+        try:
+            return estimate_weights_memory_bytes(model=self.model_manager[model_id])
+        except Exception as error:
+            logger.debug(f"Could not estimate weights of model {model_id}: {error}")
+            return None
+
+    def _refresh_memory_usage(self, force: bool = False) -> None:
+        # memory is only needed for eviction decisions when the budget is set
+        if self.max_memory_mb is None and not force:
+            return None
+        # models caches (like SAM embeddings) grow over time, hence re-estimation
+        # (weights are estimated once - when model is loaded); estimation happens
+        # outside of the lock not to block bookkeeping of inference calls
+        with self._lock:
+            loaded_models = [
+                (model_id, usage.weights_memory_bytes)
+                for model_id, usage in self._models_usage.items()
+                if not usage.loading
+            ]
+        for model_id, weights_memory_bytes in loaded_models:
+            if weights_memory_bytes is None:
+                weights_memory_bytes = self._estimate_weights_memory_bytes(
+                    model_id=model_id
+                )
+            try:
+                memory_bytes = estimate_model_memory_bytes(
+                    model=self.model_manager[model_id],
+                    weights_memory_bytes=weights_memory_bytes,
+                )
+            except Exception as error:
+                logger.debug(f"Could not estimate memory of model {model_id}: {error}")
+                continue
+            with self._lock:
+                usage = self._models_usage.get(model_id)
+                if usage is None:
+                    continue
+                usage.weights_memory_bytes = weights_memory_bytes
+                usage.memory_bytes = memory_bytes
+
+    def _memory_budget_exceeded(self) -> bool:
+        if self.max_memory_mb is None:
+            return False
+        with self._lock:
+            total_memory_bytes = sum(
+                u.memory_bytes for u in self._models_usage.values()
+            )
+        return total_memory_bytes > self.max_memory_mb * BYTES_IN_MB
+
+    def _evict(self, protected_model_id: str) -> bool:
+        self._refresh_memory_usage()
+        with self._lock:
+            to_remove_model_id = self._select_model_to_evict(
+                protected_model_id=protected_model_id
+            )
+            if to_remove_model_id is None:
+                return False
+            self._clock = self._compute_priority(
+                usage=self._models_usage[to_remove_model_id],
+                default_memory_bytes=self._get_default_memory_bytes(),
+            )
+        logger.debug(
+            f"Reached maximum capacity of ModelManager. Unloading model {to_remove_model_id}"
+        )
+        self.remove(to_remove_model_id)
+        logger.debug(f"Model {to_remove_model_id} successfully unloaded.")
+        return True
+
+    def _select_model_to_evict(self, protected_model_id: str) -> Optional[str]:
+        # iteration goes from least recently used, so it breaks ties in LRU fashion
+        selected_model_id, selected_priority = None, None
+        default_memory_bytes = self._get_default_memory_bytes()
+        for model_id, usage in self._models_usage.items():
+            if model_id == protected_model_id or usage.loading:
+                continue
+            priority = self._compute_priority(
+                usage=usage, default_memory_bytes=default_memory_bytes
+            )
+            if selected_priority is None or priority < selected_priority:
+                selected_model_id, selected_priority = model_id, priority
+        return selected_model_id
+
+    def _get_default_memory_bytes(self) -> float:
+        # models with unknown memory are assumed to be of an average size
+        known_sizes = [
+            u.memory_bytes for u in self._models_usage.values() if u.memory_bytes > 0
+        ]
+        if not known_sizes:
+            return BYTES_IN_MB
+        return sum(known_sizes) / len(known_sizes)
+
+    def _compute_priority(
+        self, usage: ModelUsage, default_memory_bytes: float
+    ) -> float:
+        memory_bytes = usage.memory_bytes
+        if memory_bytes <= 0:
+            memory_bytes = default_memory_bytes
+        memory_mb = memory_bytes / BYTES_IN_MB
+        load_time = max(usage.load_time, MIN_LOAD_TIME)
+        return usage.clock + usage.hits * load_time / memory_mb
 
     def _resolve_queue_id(
         self, model_id: str, model_id_alias: Optional[str] = None
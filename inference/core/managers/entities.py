@@ -9,3 +9,5 @@ class ModelDescription:
     batch_size: Optional[int]
     input_height: Optional[int]
     input_width: Optional[int]
+    memory_bytes: Optional[int] = None
+    load_time: Optional[float] = None
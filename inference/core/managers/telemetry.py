@@ -0,0 +1,270 @@
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, List, Optional, Tuple, Union
+
+from fastapi.encoders import jsonable_encoder
+
+from inference.core.cache import cache
+from inference.core.cache.base import BaseCache
+from inference.core.cache.serializers import capture_inference_item
+from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
+from inference.core.entities.requests.inference import (
+    InferenceRequest,
+    InferenceRequestImage,
+)
+from inference.core.entities.responses.inference import InferenceResponse
+from inference.core.env import (
+    INFERENCE_TELEMETRY_BUFFER_SIZE,
+    INFERENCE_TELEMETRY_FLUSH_BATCH_SIZE,
+    INFERENCE_TELEMETRY_FLUSH_INTERVAL,
+    INFERENCE_TELEMETRY_SAMPLING_RATE,
+    METRICS_INTERVAL,
+)
+from inference.core.logger import logger
+
+
+@dataclass(frozen=True)
+class TelemetryStats:
+    recorded: int
+    sampled_out: int
+    dropped: int
+    flushed: int
+    failed_to_flush: int
+
+
+@dataclass(frozen=True)
+class _TelemetryEvent:
+    """Data captured when the event is recorded - for sampled inferences, the inference item
+    selected by `capture_inference_item(...)` (condensed request and response with TINY_CACHE,
+    which is the default), JSON-encoded by the flusher, off the request path. Image payloads of
+    requests are never kept, full responses are only referenced with TINY_CACHE disabled."""
+
+    model_id: str
+    api_key: Optional[str]
+    finish_time: float
+    inference: Optional[dict] = None
+    error: Optional[str] = None
+    error_request: Optional[dict] = None
+
+
+class InferenceTelemetryBuffer:
+    """Bounded buffer of inference telemetry events (models usage, inferences and
+    errors), written into the cache by a background thread - such that recording the
+    event is just an append to in-memory queue, while round trips to the cache happen
+    off the request path. Recording the event only captures what is to be saved (condensed
+    inference items with TINY_CACHE, never image payloads) - JSON encoding is done by the flusher.
+
+    Appends and pops rely on `deque` operations being atomic - no lock is taken when
+    the event is recorded. When buffer is full, new events are dropped (and counted in
+    stats, which are best-effort under concurrent updates)."""
+
+    def __init__(
+        self,
+        cache: BaseCache,
+        capacity: int = INFERENCE_TELEMETRY_BUFFER_SIZE,
+        flush_interval: float = INFERENCE_TELEMETRY_FLUSH_INTERVAL,
+        flush_batch_size: int = INFERENCE_TELEMETRY_FLUSH_BATCH_SIZE,
+        sampling_rate: float = INFERENCE_TELEMETRY_SAMPLING_RATE,
+        expire: float = METRICS_INTERVAL * 2,
+    ):
+        self._cache = cache
+        self._capacity = capacity
+        self._flush_interval = flush_interval
+        self._flush_batch_size = max(flush_batch_size, 1)
+        self._sampling_rate = sampling_rate
+        self._expire = expire
+        self._events: Deque[_TelemetryEvent] = deque()
+        self._flush_requested = threading.Event()
+        self._stop_requested = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._recorded = 0
+        self._sampled_out = 0
+        self._dropped = 0
+        self._flushed = 0
+        self._failed_to_flush = 0
+
+    @property
+    def stats(self) -> TelemetryStats:
+        return TelemetryStats(
+            recorded=self._recorded,
+            sampled_out=self._sampled_out,
+            dropped=self._dropped,
+            flushed=self._flushed,
+            failed_to_flush=self._failed_to_flush,
+        )
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def record_inference(
+        self,
+        model_id: str,
+        request: InferenceRequest,
+        response: Union[InferenceResponse, List[InferenceResponse]],
+        finish_time: float,
+    ) -> None:
+        sampled = self._sampling_rate >= 1.0 or random.random() < self._sampling_rate
+        if not sampled:
+            self._sampled_out += 1
+            return self.record_model_usage(
+                model_id=model_id, request=request, finish_time=finish_time
+            )
+        self._record(
+            _TelemetryEvent(
+                model_id=model_id,
+                api_key=request.api_key,
+                finish_time=finish_time,
+                inference=capture_inference_item(
+                    infer_request=_strip_image_payloads(request=request),
+                    infer_response=response,
+                ),
+            )
+        )
+
+    def record_model_usage(
+        self,
+        model_id: str,
+        request: InferenceRequest,
+        finish_time: float,
+    ) -> None:
+        """Records usage of the model for inference which has no response to be saved."""
+        self._record(
+            _TelemetryEvent(
+                model_id=model_id,
+                api_key=request.api_key,
+                finish_time=finish_time,
+            )
+        )
+
+    def record_error(
+        self,
+        model_id: str,
+        request: InferenceRequest,
+        error: Exception,
+        finish_time: float,
+    ) -> None:
+        self._record(
+            _TelemetryEvent(
+                model_id=model_id,
+                api_key=request.api_key,
+                finish_time=finish_time,
+                error=str(error),
+                error_request=jsonable_encoder(
+                    request.model_dump(exclude={"image", "subject", "prompt"})
+                ),
+            )
+        )
+
+    def flush(self) -> int:
+        """Writes all buffered events into the cache, returns number of events written."""
+        flushed = 0
+        with self._flush_lock:
+            while self._events:
+                events = []
+                while self._events and len(events) < self._flush_batch_size:
+                    events.append(self._events.popleft())
+                flushed += self._write_events(events=events)
+        return flushed
+
+    def start(self) -> None:
+        with self._flusher_lock:
+            if self._flusher is not None:
+                return None
+            self._stop_requested.clear()
+            self._flusher = threading.Thread(target=self._run_flusher, daemon=True)
+            self._flusher.start()
+
+    def stop(self) -> None:
+        with self._flusher_lock:
+            if self._flusher is None:
+                return None
+            self._stop_requested.set()
+            self._flush_requested.set()
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+
+    def _record(self, event: _TelemetryEvent) -> None:
+        if self._flusher is None:
+            self.start()
+        if len(self._events) >= self._capacity:
+            self._dropped += 1
+            return None
+        self._events.append(event)
+        self._recorded += 1
+        if len(self._events) >= self._flush_batch_size:
+            self._flush_requested.set()
+
+    def _run_flusher(self) -> None:
+        while not self._stop_requested.is_set():
+            self._flush_requested.wait(timeout=self._flush_interval)
+            self._flush_requested.clear()
+            self.flush()
+
+    def _write_events(self, events: List[_TelemetryEvent]) -> int:
+        try:
+            entries = []
+            for event in events:
+                entries.extend(_serialise_event(event=event))
+            self._cache.zadd_many(entries=entries, expire=self._expire)
+        except Exception as error:
+            logger.warning(
+                f"Could not save {len(events)} inference telemetry events: {error}"
+            )
+            self._failed_to_flush += len(events)
+            return 0
+        self._flushed += len(events)
+        return len(events)
+
+
+def _serialise_event(event: _TelemetryEvent) -> List[Tuple[str, Any, float]]:
+    entries = [
+        (
+            "models",
+            f"{GLOBAL_INFERENCE_SERVER_ID}:{event.api_key}:{event.model_id}",
+            event.finish_time,
+        )
+    ]
+    if event.error is not None:
+        entries.append(
+            (
+                f"error:{GLOBAL_INFERENCE_SERVER_ID}:{event.model_id}",
+                {"request": event.error_request, "error": event.error},
+                event.finish_time,
+            )
+        )
+    elif event.inference is not None:
+        entries.append(
+            (
+                f"inference:{GLOBAL_INFERENCE_SERVER_ID}:{event.model_id}",
+                jsonable_encoder(event.inference),
+                event.finish_time,
+            )
+        )
+    return entries
+
+
+def _strip_image_payloads(request: InferenceRequest) -> InferenceRequest:
+    """Shallow copy of the request without (possibly large) image data - only references
+    to images by URL are kept."""
+    image = getattr(request, "image", None)
+    if image is None:
+        return request
+    if isinstance(image, list):
+        stripped_image = [_strip_image_payload(image=i) for i in image]
+    else:
+        stripped_image = _strip_image_payload(image=image)
+    return request.model_copy(update={"image": stripped_image})
+
+
+def _strip_image_payload(image: Any) -> Any:
+    if not isinstance(image, InferenceRequestImage) or image.type == "url":
+        return image
+    return image.model_copy(update={"value": None})
+
+
+inference_telemetry = InferenceTelemetryBuffer(cache=cache)
@@ -1,12 +1,18 @@
 from time import perf_counter
-from typing import Any, List, Tuple, Union
+from typing import Any, Callable, List, Tuple, Union
 
 import numpy as np
 
 from inference.core import logger
 from inference.core.entities.requests.inference import InferenceRequest
 from inference.core.entities.responses.inference import InferenceResponse
-from inference.core.models.types import PreprocessReturnMetadata
+from inference.core.models.types import NativeDetections, PreprocessReturnMetadata
+from inference.core.utils.stage_timing import (
+    FORWARD_STAGE,
+    POSTPROCESS_STAGE,
+    PREPROCESS_STAGE,
+    measure_stage,
+)
 from inference.usage_tracking.collector import usage_collector
 
 
@@ -16,18 +22,40 @@ class BaseInference:
     This class provides a basic interface for inference tasks.
     """
 
+    # models which implement `postprocess_native(...)` set the flag
+    native_inference_supported = False
+
     @usage_collector
     def infer(self, image: Any, **kwargs) -> Any:
         """Runs inference on given data.
         - image:
             can be a BGR numpy array, filepath, InferenceRequestImage, PIL Image, byte-string, etc.
         """
-        preproc_image, returned_metadata = self.preprocess(image, **kwargs)
+        return self._run_inference(image, postprocess=self.postprocess, **kwargs)
+
+    @usage_collector
+    def infer_native(self, image: Any, **kwargs) -> List[NativeDetections]:
+        """Runs inference on given data, just as `infer(...)`, but post-processed predictions are
+        returned as numpy arrays (one `NativeDetections` for each image), without building response
+        objects for each prediction.
+        """
+        return self._run_inference(image, postprocess=self.postprocess_native, **kwargs)
+
+    def _run_inference(
+        self,
+        image: Any,
+        postprocess: Callable[..., Any],
+        **kwargs,
+    ) -> Any:
+        with measure_stage(PREPROCESS_STAGE):
+            preproc_image, returned_metadata = self.preprocess(image, **kwargs)
         logger.debug(
             f"Preprocessed input shape: {getattr(preproc_image, 'shape', None)}"
         )
-        predicted_arrays = self.predict(preproc_image, **kwargs)
-        postprocessed = self.postprocess(predicted_arrays, returned_metadata, **kwargs)
+        with measure_stage(FORWARD_STAGE):
+            predicted_arrays = self.predict(preproc_image, **kwargs)
+        with measure_stage(POSTPROCESS_STAGE):
+            postprocessed = postprocess(predicted_arrays, returned_metadata, **kwargs)
 
         return postprocessed
 
@@ -47,6 +75,14 @@ class BaseInference:
     ) -> Any:
         raise NotImplementedError
 
+    def postprocess_native(
+        self,
+        predictions: Tuple[np.ndarray, ...],
+        preprocess_return_metadata: PreprocessReturnMetadata,
+        **kwargs,
+    ) -> List[NativeDetections]:
+        raise NotImplementedError(self.__class__.__name__ + ".postprocess_native")
+
     def infer_from_request(
         self, request: InferenceRequest
     ) -> Union[InferenceResponse, List[InferenceResponse]]:
@@ -142,6 +178,24 @@ class Model(BaseInference):
 
         return responses
 
+    def infer_native_from_request(
+        self,
+        request: InferenceRequest,
+    ) -> List[NativeDetections]:
+        """
+        Perform inference based on the details provided in the request, returning post-processed predictions
+        as numpy arrays - one `NativeDetections` for each input image (regardless of whether request carries
+        a list of images). Meant for in-process consumers (like Workflows blocks) which do not need response
+        objects - supported only by models with `native_inference_supported` flag set.
+
+        Args:
+            request (InferenceRequest): The request object containing details for inference.
+
+        Returns:
+            List[NativeDetections]: Post-processed predictions for each image.
+        """
+        return self.infer_native(**request.dict(), return_image_dims=False)
+
     def make_response(
         self, *args, **kwargs
     ) -> Union[InferenceResponse, List[InferenceResponse]]:
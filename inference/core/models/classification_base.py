@@ -183,50 +183,23 @@ class ClassificationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
     def preprocess(
         self, image: Any, **kwargs
     ) -> Tuple[np.ndarray, PreprocessReturnMetadata]:
-        if isinstance(image, list):
-            imgs_with_dims = [
-                self.preproc_image(
-                    i,
-                    disable_preproc_auto_orient=kwargs.get(
-                        "disable_preproc_auto_orient", False
-                    ),
-                    disable_preproc_contrast=kwargs.get(
-                        "disable_preproc_contrast", False
-                    ),
-                    disable_preproc_grayscale=kwargs.get(
-                        "disable_preproc_grayscale", False
-                    ),
-                    disable_preproc_static_crop=kwargs.get(
-                        "disable_preproc_static_crop", False
-                    ),
-                )
-                for i in image
-            ]
-            imgs, img_dims = zip(*imgs_with_dims)
-            img_in = np.concatenate(imgs, axis=0)
-        else:
-            img_in, img_dims = self.preproc_image(
-                image,
-                disable_preproc_auto_orient=kwargs.get(
-                    "disable_preproc_auto_orient", False
-                ),
-                disable_preproc_contrast=kwargs.get("disable_preproc_contrast", False),
-                disable_preproc_grayscale=kwargs.get(
-                    "disable_preproc_grayscale", False
-                ),
-                disable_preproc_static_crop=kwargs.get(
-                    "disable_preproc_static_crop", False
-                ),
-            )
-            img_dims = [img_dims]
+        img_in, img_dims = self.load_image(
+            image,
+            disable_preproc_auto_orient=kwargs.get(
+                "disable_preproc_auto_orient", False
+            ),
+            disable_preproc_contrast=kwargs.get("disable_preproc_contrast", False),
+            disable_preproc_grayscale=kwargs.get("disable_preproc_grayscale", False),
+            disable_preproc_static_crop=kwargs.get(
+                "disable_preproc_static_crop", False
+            ),
+        )
 
         img_in /= 255.0
 
         mean = (0.5, 0.5, 0.5)
         std = (0.5, 0.5, 0.5)
 
-        img_in = img_in.astype(np.float32)
-
         img_in[:, 0, :, :] = (img_in[:, 0, :, :] - mean[0]) / std[0]
         img_in[:, 1, :, :] = (img_in[:, 1, :, :] - mean[1]) / std[1]
         img_in[:, 2, :, :] = (img_in[:, 2, :, :] - mean[2]) / std[2]
@@ -1,4 +1,4 @@
-from typing import Any, List, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -10,7 +10,13 @@ from inference.core.entities.responses.inference import (
 )
 from inference.core.exceptions import InvalidMaskDecodeArgument
 from inference.core.models.roboflow import OnnxRoboflowInferenceModel
-from inference.core.models.types import PreprocessReturnMetadata
+from inference.core.models.types import NativeDetections, PreprocessReturnMetadata
+from inference.core.models.utils.native_detections import (
+    CLASS_ID_INDEX,
+    create_native_detections,
+    get_class_filter_mask,
+    predictions_to_array,
+)
 from inference.core.models.utils.validate import (
     get_num_classes_from_model_prediction_shape,
 )
@@ -18,6 +24,7 @@ from inference.core.nms import w_np_non_max_suppression
 from inference.core.utils.postprocess import (
     masks2poly,
     post_process_bboxes,
+    post_process_masks,
     post_process_polygons,
     process_mask_accurate,
     process_mask_fast,
@@ -44,6 +51,7 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
 
     task_type = "instance-segmentation"
     num_masks = 32
+    native_inference_supported = True
 
     def infer(
         self,
@@ -120,15 +128,7 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
         List[InstanceSegmentationInferenceResponse],
     ]:
         predictions, protos = predictions
-        predictions = w_np_non_max_suppression(
-            predictions,
-            conf_thresh=kwargs["confidence"],
-            iou_thresh=kwargs["iou_threshold"],
-            class_agnostic=kwargs["class_agnostic_nms"],
-            max_detections=kwargs["max_detections"],
-            max_candidate_detections=kwargs["max_candidates"],
-            num_masks=self.num_masks,
-        )
+        predictions = self.apply_nms(predictions, **kwargs)
         infer_shape = (self.img_size_h, self.img_size_w)
         masks = []
         mask_decode_mode = kwargs["mask_decode_mode"]
@@ -143,33 +143,13 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             if pred.size == 0:
                 masks.append([])
                 continue
-            if mask_decode_mode == "accurate":
-                batch_masks = process_mask_accurate(
-                    proto, pred[:, 7:], pred[:, :4], img_in_shape[2:]
-                )
-                output_mask_shape = img_in_shape[2:]
-            elif mask_decode_mode == "tradeoff":
-                if not 0 <= tradeoff_factor <= 1:
-                    raise InvalidMaskDecodeArgument(
-                        f"Invalid tradeoff_factor: {tradeoff_factor}. Must be in [0.0, 1.0]"
-                    )
-                batch_masks = process_mask_tradeoff(
-                    proto,
-                    pred[:, 7:],
-                    pred[:, :4],
-                    img_in_shape[2:],
-                    tradeoff_factor,
-                )
-                output_mask_shape = batch_masks.shape[1:]
-            elif mask_decode_mode == "fast":
-                batch_masks = process_mask_fast(
-                    proto, pred[:, 7:], pred[:, :4], img_in_shape[2:]
-                )
-                output_mask_shape = batch_masks.shape[1:]
-            else:
-                raise InvalidMaskDecodeArgument(
-                    f"Invalid mask_decode_mode: {mask_decode_mode}. Must be one of ['accurate', 'fast', 'tradeoff']"
-                )
+            batch_masks = decode_masks(
+                pred=pred,
+                proto=proto,
+                img_in_shape=img_in_shape,
+                mask_decode_mode=mask_decode_mode,
+                tradeoff_factor=tradeoff_factor,
+            )
             polys = masks2poly(batch_masks)
             pred[:, :4] = post_process_bboxes(
                 [pred[:, :4]],
@@ -184,7 +164,7 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             polys = post_process_polygons(
                 img_dim,
                 polys,
-                output_mask_shape,
+                batch_masks.shape[1:],
                 self.preproc,
                 resize_method=self.resize_method,
             )
@@ -193,6 +173,87 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             predictions, masks, preprocess_return_metadata["img_dims"], **kwargs
         )
 
+    def postprocess_native(
+        self,
+        predictions: Tuple[np.ndarray, np.ndarray],
+        preprocess_return_metadata: PreprocessReturnMetadata,
+        class_filter: Optional[List[str]] = None,
+        **kwargs,
+    ) -> List[NativeDetections]:
+        """Postprocesses predictions, just as `postprocess(...)`, but returns them as numpy arrays -
+        instances masks are decoded straight into the coordinates system of input images instead of
+        being converted into polygons. Instances with empty masks are dropped (just as the ones without
+        valid polygon would be when polygons are rasterised).
+        """
+        predictions, protos = predictions
+        predictions = self.apply_nms(predictions, **kwargs)
+        infer_shape = (self.img_size_h, self.img_size_w)
+        img_in_shape = preprocess_return_metadata["im_shape"]
+        disable_preproc_static_crop = preprocess_return_metadata[
+            "disable_preproc_static_crop"
+        ]
+        class_names = np.asarray(self.class_names)
+        results = []
+        for pred, proto, img_dim in zip(
+            predictions, protos, preprocess_return_metadata["img_dims"]
+        ):
+            pred = predictions_to_array(pred)
+            pred = pred[
+                get_class_filter_mask(
+                    class_ids=pred[:, CLASS_ID_INDEX].astype(int),
+                    class_names=class_names,
+                    class_filter=class_filter,
+                )
+            ]
+            instances_masks = np.zeros((0, img_dim[0], img_dim[1]), dtype=bool)
+            if len(pred) > 0:
+                batch_masks = decode_masks(
+                    pred=pred,
+                    proto=proto,
+                    img_in_shape=img_in_shape,
+                    mask_decode_mode=kwargs["mask_decode_mode"],
+                    tradeoff_factor=kwargs["tradeoff_factor"],
+                )
+                instances_masks = post_process_masks(
+                    masks=batch_masks,
+                    origin_shape=img_dim,
+                    preproc=self.preproc,
+                    disable_preproc_static_crop=disable_preproc_static_crop,
+                    resize_method=self.resize_method,
+                )
+                pred[:, :4] = post_process_bboxes(
+                    [pred[:, :4]],
+                    infer_shape,
+                    [img_dim],
+                    self.preproc,
+                    resize_method=self.resize_method,
+                    disable_preproc_static_crop=disable_preproc_static_crop,
+                )[0]
+                not_empty = instances_masks.any(axis=(1, 2))
+                pred, instances_masks = pred[not_empty], instances_masks[not_empty]
+            results.append(
+                create_native_detections(
+                    predictions=pred,
+                    class_names=class_names,
+                    image_dimensions=img_dim,
+                    mask=instances_masks,
+                )
+            )
+        return results
+
+    def apply_nms(
+        self, predictions: np.ndarray, **kwargs
+    ) -> List[Union[np.ndarray, List[List[float]]]]:
+        return w_np_non_max_suppression(
+            predictions,
+            conf_thresh=kwargs["confidence"],
+            iou_thresh=kwargs["iou_threshold"],
+            class_agnostic=kwargs["class_agnostic_nms"],
+            max_detections=kwargs["max_detections"],
+            max_candidate_detections=kwargs["max_candidates"],
+            num_masks=self.num_masks,
+        )
+
     def preprocess(
         self, image: Any, **kwargs
     ) -> Tuple[np.ndarray, PreprocessReturnMetadata]:
@@ -298,3 +359,31 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             raise ValueError(
                 f"Number of classes in model ({num_classes}) does not match the number of classes in the environment ({self.num_classes})"
             )
+
+
+def decode_masks(
+    pred: np.ndarray,
+    proto: np.ndarray,
+    img_in_shape: Tuple[int, ...],
+    mask_decode_mode: str,
+    tradeoff_factor: float,
+) -> np.ndarray:
+    if mask_decode_mode == "accurate":
+        return process_mask_accurate(proto, pred[:, 7:], pred[:, :4], img_in_shape[2:])
+    if mask_decode_mode == "tradeoff":
+        if not 0 <= tradeoff_factor <= 1:
+            raise InvalidMaskDecodeArgument(
+                f"Invalid tradeoff_factor: {tradeoff_factor}. Must be in [0.0, 1.0]"
+            )
+        return process_mask_tradeoff(
+            proto,
+            pred[:, 7:],
+            pred[:, :4],
+            img_in_shape[2:],
+            tradeoff_factor,
+        )
+    if mask_decode_mode == "fast":
+        return process_mask_fast(proto, pred[:, 7:], pred[:, :4], img_in_shape[2:])
+    raise InvalidMaskDecodeArgument(
+        f"Invalid mask_decode_mode: {mask_decode_mode}. Must be one of ['accurate', 'fast', 'tradeoff']"
+    )
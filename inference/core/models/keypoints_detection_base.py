@@ -12,8 +12,17 @@ from inference.core.exceptions import ModelArtefactError
 from inference.core.models.object_detection_base import (
     ObjectDetectionBaseOnnxRoboflowInferenceModel,
 )
-from inference.core.models.types import PreprocessReturnMetadata
-from inference.core.models.utils.keypoints import model_keypoints_to_response
+from inference.core.models.types import NativeDetections, PreprocessReturnMetadata
+from inference.core.models.utils.keypoints import (
+    model_keypoints_to_arrays,
+    model_keypoints_to_response,
+)
+from inference.core.models.utils.native_detections import (
+    CLASS_ID_INDEX,
+    create_native_detections,
+    get_class_filter_mask,
+    predictions_to_array,
+)
 from inference.core.models.utils.validate import (
     get_num_classes_from_model_prediction_shape,
 )
@@ -45,7 +54,7 @@ class KeypointsDetectionBaseOnnxRoboflowInferenceModel(
         """
         return ["environment.json", "class_names.txt", "keypoints_metadata.json"]
 
-    def postprocess(
+    def postprocess_predictions(
         self,
         predictions: Tuple[np.ndarray],
         preproc_return_metadata: PreprocessReturnMetadata,
@@ -54,14 +63,12 @@ class KeypointsDetectionBaseOnnxRoboflowInferenceModel(
         iou_threshold: float = DEFAULT_IOU_THRESH,
         max_candidates: int = DEFAULT_MAX_CANDIDATES,
         max_detections: int = DEFAUlT_MAX_DETECTIONS,
-        return_image_dims: bool = False,
         **kwargs,
-    ) -> List[KeypointsDetectionInferenceResponse]:
-        """Postprocesses the object detection predictions.
+    ) -> List[List[List[float]]]:
+        """Applies NMS to raw predictions and scales boxes and keypoints into the coordinates system of input images.
 
         Args:
             predictions (np.ndarray): Raw predictions from the model.
-            img_dims (List[Tuple[int, int]]): Dimensions of the images.
             class_agnostic_nms (bool): Whether to apply class-agnostic non-max suppression. Default is False.
             confidence (float): Confidence threshold for filtering detections. Default is 0.5.
             iou_threshold (float): IoU threshold for non-max suppression. Default is 0.5.
@@ -69,7 +76,7 @@ class KeypointsDetectionBaseOnnxRoboflowInferenceModel(
             max_detections (int): Maximum number of final detections. Default is 300.
 
         Returns:
-            List[KeypointsDetectionInferenceResponse]: The post-processed predictions.
+            List[List[List[float]]]: The post-processed predictions.
         """
         predictions = predictions[0]
         number_of_classes = len(self.get_class_names)
@@ -96,7 +103,7 @@ class KeypointsDetectionBaseOnnxRoboflowInferenceModel(
                 "disable_preproc_static_crop"
             ],
         )
-        predictions = post_process_keypoints(
+        return post_process_keypoints(
             predictions=predictions,
             keypoints_start_index=-num_masks,
             infer_shape=infer_shape,
@@ -107,7 +114,6 @@ class KeypointsDetectionBaseOnnxRoboflowInferenceModel(
                 "disable_preproc_static_crop"
             ],
         )
-        return self.make_response(predictions, img_dims, **kwargs)
 
     def make_response(
         self,
@@ -165,6 +171,53 @@ class KeypointsDetectionBaseOnnxRoboflowInferenceModel(
         ]
         return responses
 
+    def make_native_detections(
+        self,
+        predictions: List[List[List[float]]],
+        img_dims: List[Tuple[int, int]],
+        class_filter: Optional[List[str]] = None,
+        **kwargs,
+    ) -> List[NativeDetections]:
+        """Constructs numpy representation of predictions - counterpart of `make_response(...)`.
+
+        Args:
+            predictions (List[List[List[float]]]): The list of predictions.
+            img_dims (List[Tuple[int, int]]): Dimensions of the images.
+            class_filter (Optional[List[str]]): A list of class names to filter, if provided.
+
+        Returns:
+            List[NativeDetections]: Predictions (with keypoints) for each image.
+        """
+        keypoint_confidence_threshold = 0.0
+        if "request" in kwargs:
+            keypoint_confidence_threshold = kwargs["request"].keypoint_confidence
+        class_names = np.asarray(self.class_names)
+        results = []
+        for batch_predictions, image_dimensions in zip(predictions, img_dims):
+            batch_predictions = predictions_to_array(batch_predictions)
+            class_ids = batch_predictions[:, CLASS_ID_INDEX].astype(int)
+            selected = get_class_filter_mask(
+                class_ids=class_ids,
+                class_names=class_names,
+                class_filter=class_filter,
+            )
+            batch_predictions = batch_predictions[selected]
+            keypoints = model_keypoints_to_arrays(
+                keypoints_metadata=self.keypoints_metadata,
+                keypoints=batch_predictions[:, CLASS_ID_INDEX + 1 :],
+                predicted_objects_class_ids=class_ids[selected],
+                keypoint_confidence_threshold=keypoint_confidence_threshold,
+            )
+            results.append(
+                create_native_detections(
+                    predictions=batch_predictions,
+                    class_names=class_names,
+                    image_dimensions=image_dimensions,
+                    keypoints=keypoints,
+                )
+            )
+        return results
+
     def keypoints_count(self) -> int:
         raise NotImplementedError
 
@@ -17,7 +17,13 @@ from inference.core.models.defaults import (
     DEFAUlT_MAX_DETECTIONS,
 )
 from inference.core.models.roboflow import OnnxRoboflowInferenceModel
-from inference.core.models.types import PreprocessReturnMetadata
+from inference.core.models.types import NativeDetections, PreprocessReturnMetadata
+from inference.core.models.utils.native_detections import (
+    CLASS_ID_INDEX,
+    create_native_detections,
+    get_class_filter_mask,
+    predictions_to_array,
+)
 from inference.core.models.utils.validate import (
     get_num_classes_from_model_prediction_shape,
 )
@@ -30,6 +36,7 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
 
     task_type = "object-detection"
     box_format = "xywh"
+    native_inference_supported = True
 
     def infer(
         self,
@@ -141,6 +148,42 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         ]
         return responses
 
+    def make_native_detections(
+        self,
+        predictions: List[List[List[float]]],
+        img_dims: List[Tuple[int, int]],
+        class_filter: Optional[List[str]] = None,
+        **kwargs,
+    ) -> List[NativeDetections]:
+        """Constructs numpy representation of predictions - counterpart of `make_response(...)`.
+
+        Args:
+            predictions (List[List[List[float]]]): The list of predictions.
+            img_dims (List[Tuple[int, int]]): Dimensions of the images.
+            class_filter (Optional[List[str]]): A list of class names to filter, if provided.
+
+        Returns:
+            List[NativeDetections]: Predictions for each image.
+        """
+        class_names = np.asarray(self.class_names)
+        results = []
+        # zip() drops empty predictions at the end of fixed size batch
+        for batch_predictions, image_dimensions in zip(predictions, img_dims):
+            batch_predictions = predictions_to_array(batch_predictions)
+            selected = get_class_filter_mask(
+                class_ids=batch_predictions[:, CLASS_ID_INDEX].astype(int),
+                class_names=class_names,
+                class_filter=class_filter,
+            )
+            results.append(
+                create_native_detections(
+                    predictions=batch_predictions[selected],
+                    class_names=class_names,
+                    image_dimensions=image_dimensions,
+                )
+            )
+        return results
+
     def postprocess(
         self,
         predictions: Tuple[np.ndarray, ...],
@@ -167,6 +210,52 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         Returns:
             List[ObjectDetectionInferenceResponse]: The post-processed predictions.
         """
+        img_dims = preproc_return_metadata["img_dims"]
+        predictions = self.postprocess_predictions(
+            predictions,
+            preproc_return_metadata,
+            class_agnostic_nms=class_agnostic_nms,
+            confidence=confidence,
+            iou_threshold=iou_threshold,
+            max_candidates=max_candidates,
+            max_detections=max_detections,
+        )
+        return self.make_response(predictions, img_dims, **kwargs)
+
+    def postprocess_native(
+        self,
+        predictions: Tuple[np.ndarray, ...],
+        preproc_return_metadata: PreprocessReturnMetadata,
+        **kwargs,
+    ) -> List[NativeDetections]:
+        """Postprocesses the object detection predictions, just as `postprocess(...)`, but
+        returns them as numpy arrays.
+
+        Returns:
+            List[NativeDetections]: The post-processed predictions.
+        """
+        img_dims = preproc_return_metadata["img_dims"]
+        predictions = self.postprocess_predictions(
+            predictions, preproc_return_metadata, **kwargs
+        )
+        return self.make_native_detections(predictions, img_dims, **kwargs)
+
+    def postprocess_predictions(
+        self,
+        predictions: Tuple[np.ndarray, ...],
+        preproc_return_metadata: PreprocessReturnMetadata,
+        class_agnostic_nms=DEFAULT_CLASS_AGNOSTIC_NMS,
+        confidence: float = DEFAULT_CONFIDENCE,
+        iou_threshold: float = DEFAULT_IOU_THRESH,
+        max_candidates: int = DEFAULT_MAX_CANDIDATES,
+        max_detections: int = DEFAUlT_MAX_DETECTIONS,
+        **kwargs,
+    ) -> List[List[List[float]]]:
+        """Applies NMS to raw predictions and scales boxes into the coordinates system of input images.
+
+        Returns:
+            List[List[List[float]]]: Predictions for each image, indices are: batch x prediction x [x1, y1, x2, y2, confidence, class confidence, class id, ...].
+        """
         predictions = predictions[0]
         predictions = w_np_non_max_suppression(
             predictions,
@@ -180,7 +269,7 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
 
         infer_shape = (self.img_size_h, self.img_size_w)
         img_dims = preproc_return_metadata["img_dims"]
-        predictions = post_process_bboxes(
+        return post_process_bboxes(
             predictions,
             infer_shape,
             img_dims,
@@ -190,7 +279,6 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
                 "disable_preproc_static_crop"
             ],
         )
-        return self.make_response(predictions, img_dims, **kwargs)
 
     def preprocess(
         self,
@@ -7,7 +7,6 @@ from functools import partial
 from time import perf_counter
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-import cv2
 import numpy as np
 import onnxruntime
 from PIL import Image
@@ -49,6 +48,7 @@ from inference.core.env import (
 from inference.core.exceptions import ModelArtefactError, OnnxProviderNotAvailable
 from inference.core.logger import logger
 from inference.core.models.base import Model
+from inference.core.models.types import NativeDetections
 from inference.core.models.utils.batching import create_batches
 from inference.core.models.utils.onnx import has_trt
 from inference.core.roboflow_api import (
@@ -58,7 +58,7 @@ from inference.core.roboflow_api import (
 )
 from inference.core.utils.image_utils import load_image
 from inference.core.utils.onnx import get_onnxruntime_execution_providers
-from inference.core.utils.preprocess import letterbox_image, prepare
+from inference.core.utils.preprocess import prepare, resize_into_nchw_buffer
 from inference.core.utils.visualisation import draw_detection_predictions
 from inference.models.aliases import resolve_roboflow_model_alias
 
@@ -383,6 +383,40 @@ class RoboflowInferenceModel(Model):
         Returns:
             Tuple[np.ndarray, Tuple[int, int]]: A tuple containing a numpy array of the preprocessed image pixel data and a tuple of the images original size.
         """
+        img_in = np.empty((1, 3, self.img_size_h, self.img_size_w), dtype=np.float32)
+        img_dims = self.preproc_image_into_buffer(
+            image,
+            buffer=img_in[0],
+            disable_preproc_auto_orient=disable_preproc_auto_orient,
+            disable_preproc_contrast=disable_preproc_contrast,
+            disable_preproc_grayscale=disable_preproc_grayscale,
+            disable_preproc_static_crop=disable_preproc_static_crop,
+        )
+        return img_in, img_dims
+
+    def preproc_image_into_buffer(
+        self,
+        image: Union[Any, InferenceRequestImage],
+        buffer: np.ndarray,
+        disable_preproc_auto_orient: bool = False,
+        disable_preproc_contrast: bool = False,
+        disable_preproc_grayscale: bool = False,
+        disable_preproc_static_crop: bool = False,
+    ) -> Tuple[int, int]:
+        """
+        Preprocesses an inference request image just like `preproc_image(...)`, but writes the result directly into given CHW float32 buffer (usually a slice of preallocated NCHW batch), fusing resize, letterboxing, channel swap and cast into a single write.
+
+        Args:
+            image (Union[Any, InferenceRequestImage]): An object containing information necessary to load the image for inference.
+            buffer (np.ndarray): float32 array of shape (3, img_size_h, img_size_w) to write preprocessed image into.
+            disable_preproc_auto_orient (bool, optional): If true, the auto orient preprocessing step is disabled for this call. Default is False.
+            disable_preproc_contrast (bool, optional): If true, the contrast preprocessing step is disabled for this call. Default is False.
+            disable_preproc_grayscale (bool, optional): If true, the grayscale preprocessing step is disabled for this call. Default is False.
+            disable_preproc_static_crop (bool, optional): If true, the static crop preprocessing step is disabled for this call. Default is False.
+
+        Returns:
+            Tuple[int, int]: The image original size.
+        """
         np_image, is_bgr = load_image(
             image,
             disable_preproc_auto_orient=disable_preproc_auto_orient
@@ -395,35 +429,13 @@ class RoboflowInferenceModel(Model):
             disable_preproc_grayscale=disable_preproc_grayscale,
             disable_preproc_static_crop=disable_preproc_static_crop,
         )
-
-        if self.resize_method == "Stretch to":
-            resized = cv2.resize(
-                preprocessed_image, (self.img_size_w, self.img_size_h), cv2.INTER_CUBIC
-            )
-        elif self.resize_method == "Fit (black edges) in":
-            resized = letterbox_image(
-                preprocessed_image, (self.img_size_w, self.img_size_h)
-            )
-        elif self.resize_method == "Fit (white edges) in":
-            resized = letterbox_image(
-                preprocessed_image,
-                (self.img_size_w, self.img_size_h),
-                color=(255, 255, 255),
-            )
-        elif self.resize_method == "Fit (grey edges) in":
-            resized = letterbox_image(
-                preprocessed_image,
-                (self.img_size_w, self.img_size_h),
-                color=(114, 114, 114),
-            )
-
-        if is_bgr:
-            resized = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
-        img_in = np.transpose(resized, (2, 0, 1))
-        img_in = img_in.astype(np.float32)
-        img_in = np.expand_dims(img_in, axis=0)
-
-        return img_in, img_dims
+        resize_into_nchw_buffer(
+            image=preprocessed_image,
+            buffer=buffer,
+            resize_method=self.resize_method,
+            bgr_to_rgb=is_bgr,
+        )
+        return img_dims
 
     def preprocess_image(
         self,
@@ -636,6 +648,20 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
             inference_results.append(batch_inference_results)
         return self.merge_inference_results(inference_results=inference_results)
 
+    def infer_native(self, image: Any, **kwargs) -> List[NativeDetections]:
+        """Runs native inference on given data, chunking the input just as `infer(...)` does,
+        so that no single pass exceeds the maximum batch size of the model.
+        """
+        input_elements = len(image) if isinstance(image, list) else 1
+        max_batch_size = MAX_BATCH_SIZE if self.batching_enabled else self.batch_size
+        if (input_elements == 1) or (max_batch_size == float("inf")):
+            return super().infer_native(image, **kwargs)
+        inference_results = []
+        for batch_input in create_batches(sequence=image, batch_size=max_batch_size):
+            batch_inference_results = super().infer_native(batch_input, **kwargs)
+            inference_results.append(batch_inference_results)
+        return list(itertools.chain(*inference_results))
+
     def merge_inference_results(self, inference_results: List[Any]) -> Any:
         return list(itertools.chain(*inference_results))
 
@@ -797,16 +823,19 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
         disable_preproc_static_crop: bool = False,
     ) -> Tuple[np.ndarray, Tuple[int, int]]:
         if isinstance(image, list):
+            img_in = np.empty(
+                (len(image), 3, self.img_size_h, self.img_size_w), dtype=np.float32
+            )
             preproc_image = partial(
-                self.preproc_image,
+                self.preproc_image_into_buffer,
                 disable_preproc_auto_orient=disable_preproc_auto_orient,
                 disable_preproc_contrast=disable_preproc_contrast,
                 disable_preproc_grayscale=disable_preproc_grayscale,
                 disable_preproc_static_crop=disable_preproc_static_crop,
             )
-            imgs_with_dims = self.image_loader_threadpool.map(preproc_image, image)
-            imgs, img_dims = zip(*imgs_with_dims)
-            img_in = np.concatenate(imgs, axis=0)
+            img_dims = list(
+                self.image_loader_threadpool.map(preproc_image, image, img_in)
+            )
         else:
             img_in, img_dims = self.preproc_image(
                 image,
@@ -1,3 +1,34 @@
-from typing import Dict, NewType
+from dataclasses import dataclass
+from typing import Dict, List, NewType, Optional, Tuple
+
+import numpy as np
 
 PreprocessReturnMetadata = NewType("PreprocessReturnMetadata", Dict)
+
+
+@dataclass(frozen=True)
+class NativeDetections:
+    """Post-processed predictions of detection model for single image, kept as numpy arrays
+    (in the coordinates system of the input image) instead of being turned into response objects.
+
+    * `xyxy` - (N, 4) array of boxes
+    * `confidence`, `class_id`, `class_name` - (N, ) arrays
+    * `image_dimensions` - (height, width) of the input image
+    * `mask` - (N, H, W) boolean array of instances masks (for instance segmentation)
+    * `keypoints_*` - (for keypoints detection) list with an array of detected keypoints
+        properties for each detection
+    """
+
+    xyxy: np.ndarray
+    confidence: np.ndarray
+    class_id: np.ndarray
+    class_name: np.ndarray
+    image_dimensions: Tuple[int, int]
+    mask: Optional[np.ndarray] = None
+    keypoints_xy: Optional[List[np.ndarray]] = None
+    keypoints_confidence: Optional[List[np.ndarray]] = None
+    keypoints_class_id: Optional[List[np.ndarray]] = None
+    keypoints_class_name: Optional[List[np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.xyxy)
@@ -1,4 +1,6 @@
-from typing import List
+from typing import List, Tuple
+
+import numpy as np
 
 from inference.core.entities.responses.inference import Keypoint
 from inference.core.exceptions import ModelArtefactError
@@ -39,3 +41,49 @@ def model_keypoints_to_response(
         )
         results.append(keypoint)
     return results
+
+
+def model_keypoints_to_arrays(
+    keypoints_metadata: dict,
+    keypoints: np.ndarray,
+    predicted_objects_class_ids: np.ndarray,
+    keypoint_confidence_threshold: float,
+) -> Tuple[List[np.ndarray], List[np.ndarray], List[np.ndarray], List[np.ndarray]]:
+    """Numpy counterpart of `model_keypoints_to_response(...)` for a batch of detections - returns
+    keypoints coordinates, confidences, class ids and class names (one array for each detection).
+    """
+    if keypoints_metadata is None:
+        raise ModelArtefactError("Keypoints metadata not available.")
+    keypoints_names = {
+        class_id: np.asarray([names[i] for i in range(len(names))])
+        for class_id, names in keypoints_metadata.items()
+    }
+    keypoints_xy, keypoints_confidence, keypoints_class_id, keypoints_class_name = (
+        [],
+        [],
+        [],
+        [],
+    )
+    if len(keypoints) == 0:
+        return (
+            keypoints_xy,
+            keypoints_confidence,
+            keypoints_class_id,
+            keypoints_class_name,
+        )
+    keypoints = keypoints.reshape((len(keypoints), -1, 3))
+    for object_keypoints, class_id in zip(keypoints, predicted_objects_class_ids):
+        keypoint_id2name = keypoints_names[int(class_id)]
+        # Ultralytics only supports single class keypoint detection, so points might be padded with zeros
+        object_keypoints = object_keypoints[: len(keypoint_id2name)]
+        selected = object_keypoints[:, 2] >= keypoint_confidence_threshold
+        keypoints_xy.append(object_keypoints[selected, :2].astype(np.float32))
+        keypoints_confidence.append(object_keypoints[selected, 2].astype(np.float32))
+        keypoints_class_id.append(np.arange(len(object_keypoints))[selected])
+        keypoints_class_name.append(keypoint_id2name[: len(object_keypoints)][selected])
+    return (
+        keypoints_xy,
+        keypoints_confidence,
+        keypoints_class_id,
+        keypoints_class_name,
+    )
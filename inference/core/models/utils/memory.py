@@ -0,0 +1,65 @@
+import os
+from typing import Any, Optional
+
+import numpy as np
+
+CACHE_ATTRIBUTE_SUFFIX = "cache"
+
+
+def estimate_model_memory_bytes(
+    model: Any, weights_memory_bytes: Optional[int] = None
+) -> int:
+    """Estimates resident memory of a model - weights (approximated by size of model
+    artefacts, which is what ONNX / torch sessions keep in memory) plus in-memory caches
+    the model maintains (like SAM embeddings). Weights do not change once model is loaded,
+    so callers are expected to estimate them once and pass `weights_memory_bytes`, such that
+    model artefacts are not walked on disk each time. Models may override the estimation by
+    exposing `memory_footprint() -> int` method."""
+    memory_footprint = getattr(model, "memory_footprint", None)
+    if callable(memory_footprint):
+        return int(memory_footprint())
+    if weights_memory_bytes is None:
+        weights_memory_bytes = estimate_weights_memory_bytes(model=model)
+    return weights_memory_bytes + estimate_caches_memory_bytes(model=model)
+
+
+def estimate_weights_memory_bytes(model: Any) -> int:
+    cache_dir = getattr(model, "cache_dir", None)
+    if not isinstance(cache_dir, str) or not os.path.isdir(cache_dir):
+        return 0
+    total = 0
+    for root, _, files in os.walk(cache_dir):
+        for file_name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, file_name))
+            except OSError:
+                continue
+    return total
+
+
+def estimate_caches_memory_bytes(model: Any) -> int:
+    total = 0
+    for name, value in vars(model).items():
+        if not name.endswith(CACHE_ATTRIBUTE_SUFFIX):
+            continue
+        if isinstance(value, dict):
+            total += sum(get_object_memory_bytes(v) for v in list(value.values()))
+        elif isinstance(value, (list, tuple)):
+            total += sum(get_object_memory_bytes(v) for v in list(value))
+        elif isinstance(getattr(value, "size_bytes", None), int):
+            # dedicated caches (like `EmbeddingsCache`) track their size
+            total += value.size_bytes
+    return total
+
+
+def get_object_memory_bytes(value: Any) -> int:
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if hasattr(value, "element_size") and hasattr(value, "nelement"):
+        # torch.Tensor - checked structurally not to import torch
+        return value.element_size() * value.nelement()
+    if isinstance(value, dict):
+        return sum(get_object_memory_bytes(v) for v in list(value.values()))
+    if isinstance(value, (list, tuple)):
+        return sum(get_object_memory_bytes(v) for v in value)
+    return 0
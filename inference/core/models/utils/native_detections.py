@@ -0,0 +1,54 @@
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from inference.core.models.types import NativeDetections
+
+# post-processed prediction row: x_min, y_min, x_max, y_max, confidence, class confidence, class id, ...
+CONFIDENCE_INDEX = 4
+CLASS_ID_INDEX = 6
+PREDICTION_ROW_MIN_LENGTH = 7
+
+
+def predictions_to_array(
+    predictions: Union[np.ndarray, List[List[float]]]
+) -> np.ndarray:
+    predictions = np.asarray(predictions, dtype=np.float64)
+    if predictions.size == 0:
+        return np.empty((0, PREDICTION_ROW_MIN_LENGTH), dtype=np.float64)
+    return predictions
+
+
+def get_class_filter_mask(
+    class_ids: np.ndarray,
+    class_names: np.ndarray,
+    class_filter: Optional[List[str]],
+) -> np.ndarray:
+    if not class_filter:
+        return np.ones(len(class_ids), dtype=bool)
+    return np.isin(class_names[class_ids], class_filter)
+
+
+def create_native_detections(
+    predictions: np.ndarray,
+    class_names: np.ndarray,
+    image_dimensions: Tuple[int, int],
+    mask: Optional[np.ndarray] = None,
+    keypoints: Optional[Tuple[List[np.ndarray], ...]] = None,
+) -> NativeDetections:
+    class_id = predictions[:, CLASS_ID_INDEX].astype(int)
+    keypoints_xy, keypoints_confidence, keypoints_class_id, keypoints_class_name = (
+        keypoints if keypoints is not None else (None, None, None, None)
+    )
+    return NativeDetections(
+        xyxy=predictions[:, :4],
+        confidence=predictions[:, CONFIDENCE_INDEX],
+        class_id=class_id,
+        class_name=class_names[class_id],
+        image_dimensions=(int(image_dimensions[0]), int(image_dimensions[1])),
+        mask=mask,
+        keypoints_xy=keypoints_xy,
+        keypoints_confidence=keypoints_confidence,
+        keypoints_class_id=keypoints_class_id,
+        keypoints_class_name=keypoints_class_name,
+    )
@@ -0,0 +1,76 @@
+import importlib
+from collections.abc import MutableMapping
+from typing import Any, Dict, Hashable, Iterator, Union
+
+from inference.core.logger import logger
+
+LazyClass = Union[type, str]
+
+
+class LazyModelTypes(MutableMapping):
+    """Mapping of model types into model classes, which accepts either the classes or
+    their import paths (`"package.module:ClassName"`). Classes given by path are imported
+    on the first lookup of the model type, so registering models is free and the cost
+    of importing model (and its dependencies) is only paid once the model is actually
+    requested.
+
+    Model types whose classes fail to import are reported as not present in the mapping
+    (`in` operator returns False and lookup raises `KeyError`) - which is how
+    registries handled models with missing dependencies when classes were imported upfront.
+    Note that iteration over values / items imports all registered classes."""
+
+    def __init__(self, *args, **kwargs):
+        self._entries: Dict[Hashable, LazyClass] = {}
+        self._failed_imports: Dict[Hashable, Exception] = {}
+        self.update(*args, **kwargs)
+
+    def __getitem__(self, key: Hashable) -> type:
+        if key in self._failed_imports:
+            raise KeyError(key)
+        entry = self._entries[key]
+        if not isinstance(entry, str):
+            return entry
+        try:
+            model_class = import_class(path=entry)
+        except Exception as error:
+            # besides missing modules, imports of models dependencies fail with
+            # arbitrary errors (e.g. OSError for missing shared libraries)
+            logger.warning(
+                f"Could not import model class for {key} from {entry}: {error}"
+            )
+            self._failed_imports[key] = error
+            raise KeyError(key) from error
+        self._entries[key] = model_class
+        return model_class
+
+    def __setitem__(self, key: Hashable, value: LazyClass) -> None:
+        self._failed_imports.pop(key, None)
+        self._entries[key] = value
+
+    def __delitem__(self, key: Hashable) -> None:
+        self._failed_imports.pop(key, None)
+        del self._entries[key]
+
+    def __contains__(self, key: Any) -> bool:
+        if key not in self._entries:
+            return False
+        try:
+            _ = self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter([k for k in self._entries if k not in self._failed_imports])
+
+    def __len__(self) -> int:
+        return len(self._entries) - len(self._failed_imports)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._entries!r})"
+
+
+def import_class(path: str) -> type:
+    module_name, _, class_name = path.partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
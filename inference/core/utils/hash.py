@@ -1,5 +1,17 @@
 import hashlib
 
+import numpy as np
+
 
 def get_text_hash(text: str) -> str:
     return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+def get_image_hash(image: np.ndarray) -> str:
+    # full 128-bit digest - hash is used as cache key, so collisions would
+    # silently serve embeddings computed for different image
+    image_hash = hashlib.blake2b(
+        f"{image.shape}{image.dtype}".encode("utf-8"), digest_size=16
+    )
+    image_hash.update(np.ascontiguousarray(image).data)
+    return image_hash.hexdigest()
@@ -10,7 +10,6 @@ from typing import Any, Optional, Tuple, Union
 import cv2
 import numpy as np
 import pybase64
-import requests
 import tldextract
 from _io import _IOBase
 from PIL import Image
@@ -25,6 +24,9 @@ from inference.core.env import (
     ALLOW_URL_INPUT,
     ALLOW_URL_INPUT_WITHOUT_FQDN,
     BLACKLISTED_DESTINATIONS_FOR_URL_INPUT,
+    URL_IMAGES_CACHE_MAX_SIZE_MB,
+    URL_IMAGES_CACHE_TTL,
+    URL_IMAGES_CONNECTION_POOL_SIZE,
     WHITELISTED_DESTINATIONS_FOR_URL_INPUT,
 )
 from inference.core.exceptions import (
@@ -35,8 +37,19 @@ from inference.core.exceptions import (
 )
 from inference.core.utils.function import deprecated
 from inference.core.utils.requests import api_key_safe_raise_for_status
+from inference.core.utils.url_images_cache import (
+    UrlImagesCache,
+    get_response_cache_ttl,
+    get_revalidated_response_cache_ttl,
+    get_url_images_session,
+)
 
 BASE64_DATA_TYPE_PATTERN = re.compile(r"^data:image\/[a-z]+;base64,")
+TLD_EXTRACTOR = tldextract.TLDExtract(suffix_list_urls=())
+URL_IMAGES_CACHE = UrlImagesCache(
+    max_size_bytes=int(URL_IMAGES_CACHE_MAX_SIZE_MB * 1024 * 1024),
+    ttl=URL_IMAGES_CACHE_TTL,
+)
 
 
 class ImageType(Enum):
@@ -388,7 +401,7 @@ def load_image_from_url(
             public_message=message,
         ) from error
     _ensure_resource_schema_allowed(schema=parsed_url.scheme)
-    domain_extraction_result = tldextract.TLDExtract(suffix_list_urls=())(
+    domain_extraction_result = TLD_EXTRACTOR(
         parsed_url.netloc
     )  # we get rid of potential ports and parse FQDNs
     _ensure_resource_fqdn_allowed(fqdn=domain_extraction_result.fqdn)
@@ -403,11 +416,7 @@ def load_image_from_url(
         destination=address_parts_concatenated
     )
     try:
-        response = requests.get(value, stream=True)
-        api_key_safe_raise_for_status(response=response)
-        return load_image_from_encoded_bytes(
-            value=response.content, cv_imread_flags=cv_imread_flags
-        )
+        return _fetch_image_from_url(value=value, cv_imread_flags=cv_imread_flags)
     except (RequestException, ConnectionError) as error:
         raise InputImageLoadError(
             message=f"Could not load image from url: {value}. Details: {error}",
@@ -415,6 +424,40 @@ def load_image_from_url(
         )
 
 
+def _fetch_image_from_url(value: str, cv_imread_flags: int) -> np.ndarray:
+    # cached arrays are never handed out directly, as callers are free to modify
+    # images in-place - copy of decoded image is still much cheaper than re-download
+    cached_image = URL_IMAGES_CACHE.get(url=value, cv_imread_flags=cv_imread_flags)
+    if cached_image is not None and URL_IMAGES_CACHE.is_fresh(entry=cached_image):
+        return cached_image.image.copy()
+    headers = cached_image.revalidation_headers() if cached_image is not None else {}
+    session = get_url_images_session(pool_size=URL_IMAGES_CONNECTION_POOL_SIZE)
+    response = session.get(value, headers=headers)
+    if response.status_code == 304 and cached_image is not None:
+        URL_IMAGES_CACHE.refresh(
+            url=value,
+            cv_imread_flags=cv_imread_flags,
+            entry=cached_image,
+            ttl=get_revalidated_response_cache_ttl(response=response),
+        )
+        return cached_image.image.copy()
+    api_key_safe_raise_for_status(response=response)
+    image = load_image_from_encoded_bytes(
+        value=response.content, cv_imread_flags=cv_imread_flags
+    )
+    cache_ttl = get_response_cache_ttl(response=response)
+    if cache_ttl is not None:
+        URL_IMAGES_CACHE.put(
+            url=value,
+            cv_imread_flags=cv_imread_flags,
+            image=image.copy(),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            ttl=cache_ttl,
+        )
+    return image
+
+
 def _ensure_url_input_allowed() -> None:
     if not ALLOW_URL_INPUT:
         message = "Providing images via URL is not supported in this configuration of `inference`."
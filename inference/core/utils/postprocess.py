@@ -470,6 +470,70 @@ def undo_image_padding_for_predicted_polygons(
     return result
 
 
+def post_process_masks(
+    masks: np.ndarray,
+    origin_shape: Tuple[int, int],
+    preproc: dict,
+    disable_preproc_static_crop: bool = False,
+    resize_method: str = "Stretch to",
+) -> np.ndarray:
+    """Brings masks decoded by instance segmentation model (given in the coordinates system of model
+    input, possibly downscaled) into the coordinates system of the source image. This is the counterpart
+    of `post_process_polygons(...)` for consumers that need masks - conversion to polygons and back is skipped.
+
+    Args:
+        masks (np.ndarray): Masks of shape (N, h, w) - pixels with value above zero belong to the instance.
+        origin_shape (tuple of int): Shape of the source image (height, width).
+        preproc (dict): Preprocessing details used for generating the transformation.
+        disable_preproc_static_crop (bool, optional): If true, the static crop preprocessing step is disabled for this call. Default is False.
+        resize_method (str, optional): Resizing method, either "Stretch to", "Fit (black edges) in", "Fit (white edges) in", or "Fit (grey edges) in". Defaults to "Stretch to".
+
+    Returns:
+        np.ndarray: Boolean masks of shape (N, H, W), where (H, W) is `origin_shape`.
+    """
+    (crop_shift_x, crop_shift_y), crop_shape = get_static_crop_dimensions(
+        origin_shape,
+        preproc,
+        disable_preproc_static_crop=disable_preproc_static_crop,
+    )
+    result = np.zeros((len(masks), origin_shape[0], origin_shape[1]), dtype=bool)
+    if len(masks) == 0 or crop_shape[0] == 0 or crop_shape[1] == 0:
+        return result
+    masks = (masks > 0).astype(np.float32)
+    if resize_method in {
+        "Fit (black edges) in",
+        "Fit (white edges) in",
+        "Fit (grey edges) in",
+    }:
+        masks = undo_image_padding_for_predicted_masks(
+            masks=masks,
+            origin_shape=crop_shape,
+        )
+    crop_area = result[
+        :,
+        crop_shift_y : crop_shift_y + crop_shape[0],
+        crop_shift_x : crop_shift_x + crop_shape[1],
+    ]
+    target_size = (crop_area.shape[2], crop_area.shape[1])
+    for mask, target in zip(masks, crop_area):
+        resized_mask = cv2.resize(mask, target_size, interpolation=cv2.INTER_LINEAR)
+        target[...] = resized_mask >= 0.5
+    return result
+
+
+def undo_image_padding_for_predicted_masks(
+    masks: np.ndarray,
+    origin_shape: Tuple[int, int],
+) -> np.ndarray:
+    mask_h, mask_w = masks.shape[1:]
+    scale = min(mask_h / origin_shape[0], mask_w / origin_shape[1])
+    inter_w = max(int(origin_shape[1] * scale), 1)
+    inter_h = max(int(origin_shape[0] * scale), 1)
+    pad_x = int((mask_w - inter_w) / 2)
+    pad_y = int((mask_h - inter_h) / 2)
+    return masks[:, pad_y : pad_y + inter_h, pad_x : pad_x + inter_w]
+
+
 def get_static_crop_dimensions(
     orig_shape: Tuple[int, int],
     preproc: dict,
@@ -1,3 +1,4 @@
+import threading
 from enum import Enum
 from typing import Dict, Tuple
 
@@ -226,7 +227,25 @@ def resize_image_keeping_aspect_ratio(
     - image: numpy array representing the image.
     - desired_size: tuple (width, height) representing the target dimensions.
     """
-    img_ratio = image.shape[1] / image.shape[0]
+    new_width, new_height = get_size_keeping_aspect_ratio(
+        image_shape=image.shape, desired_size=desired_size
+    )
+    # Resize the image to new dimensions
+    return cv2.resize(image, (new_width, new_height))
+
+
+def get_size_keeping_aspect_ratio(
+    image_shape: Tuple[int, ...],
+    desired_size: Tuple[int, int],
+) -> Tuple[int, int]:
+    """
+    Computes (width, height) of image fitted into desired size with its aspect ratio preserved.
+
+    Parameters:
+    - image_shape: shape of numpy array representing the image.
+    - desired_size: tuple (width, height) representing the target dimensions.
+    """
+    img_ratio = image_shape[1] / image_shape[0]
     desired_ratio = desired_size[0] / desired_size[1]
 
     # Determine the new dimensions
@@ -238,6 +257,85 @@ def resize_image_keeping_aspect_ratio(
         # Resize by height
         new_height = desired_size[1]
         new_width = int(desired_size[1] * img_ratio)
+    return new_width, new_height
 
-    # Resize the image to new dimensions
-    return cv2.resize(image, (new_width, new_height))
+
+def resize_into_nchw_buffer(
+    image: np.ndarray,
+    buffer: np.ndarray,
+    resize_method: str,
+    bgr_to_rgb: bool,
+) -> None:
+    """
+    Resizes (or letterboxes) HWC image and writes it directly into CHW float32 `buffer` -
+    typically a view of preallocated NCHW batch. Letterbox padding, channel swap, transposition
+    and cast to float32 are fused into the write, such that no intermediate padded, colour
+    converted, transposed or cast copies of the image are created. Resize output lands in
+    per-thread scratch buffer reused across calls for given input size.
+
+    Parameters:
+    - image: numpy array representing the image (HWC).
+    - buffer: float32 array of shape (C, H, W) to write the result into.
+    - resize_method: one of resize methods supported by Roboflow platform.
+    - bgr_to_rgb: flag to decide if channels order should be reversed.
+    """
+    channels, target_height, target_width = buffer.shape
+    if image.ndim == 2:
+        image = image[:, :, np.newaxis]
+    if image.shape[2] != channels:
+        raise PreProcessingError(
+            f"Could not fit image with {image.shape[2]} channels into buffer with {channels} channels."
+        )
+    source_channels = list(range(channels))
+    if bgr_to_rgb:
+        source_channels = source_channels[::-1]
+    padding_color = LETTERBOX_PADDING_COLORS.get(resize_method)
+    if padding_color is None:
+        resized = _resize_into_scratch(
+            image=image, width=target_width, height=target_height
+        )
+        target_region = buffer
+    else:
+        new_width, new_height = get_size_keeping_aspect_ratio(
+            image_shape=image.shape, desired_size=(target_width, target_height)
+        )
+        resized = _resize_into_scratch(image=image, width=new_width, height=new_height)
+        top = (target_height - new_height) // 2
+        left = (target_width - new_width) // 2
+        bottom, right = top + new_height, left + new_width
+        for target_channel, source_channel in enumerate(source_channels):
+            color = padding_color[source_channel % len(padding_color)]
+            buffer[target_channel, :top, :] = color
+            buffer[target_channel, bottom:, :] = color
+            buffer[target_channel, top:bottom, :left] = color
+            buffer[target_channel, top:bottom, right:] = color
+        target_region = buffer[:, top:bottom, left:right]
+    for target_channel, source_channel in enumerate(source_channels):
+        target_region[target_channel] = resized[:, :, source_channel]
+
+
+LETTERBOX_PADDING_COLORS = {
+    "Fit (black edges) in": (0, 0, 0),
+    "Fit (white edges) in": (255, 255, 255),
+    "Fit (grey edges) in": (114, 114, 114),
+}
+
+_RESIZE_SCRATCH = threading.local()
+
+
+def _resize_into_scratch(image: np.ndarray, width: int, height: int) -> np.ndarray:
+    if image.shape[0] == height and image.shape[1] == width:
+        return image
+    scratch_buffers = getattr(_RESIZE_SCRATCH, "buffers", None)
+    if scratch_buffers is None:
+        scratch_buffers = {}
+        _RESIZE_SCRATCH.buffers = scratch_buffers
+    key = (height, width, image.shape[2], image.dtype.str)
+    scratch = scratch_buffers.get(key)
+    if scratch is None:
+        scratch = np.empty((height, width, image.shape[2]), dtype=image.dtype)
+        scratch_buffers[key] = scratch
+    resized = cv2.resize(image, (width, height), dst=scratch)
+    if resized.ndim == 2:
+        resized = resized[:, :, np.newaxis]
+    return resized
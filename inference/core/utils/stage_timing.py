@@ -0,0 +1,39 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Dict, Generator, Optional
+
+PREPROCESS_STAGE = "preprocess"
+FORWARD_STAGE = "forward"
+POSTPROCESS_STAGE = "postprocess"
+
+_stages_durations: ContextVar[Optional[Dict[str, float]]] = ContextVar(
+    "stages_durations", default=None
+)
+
+
+@contextmanager
+def collect_stages_durations() -> Generator[Dict[str, float], None, None]:
+    """Collects durations of stages measured with `measure_stage(...)` by the code run within
+    the context (in the same thread) - durations of repeated stages are summed up."""
+    stages_durations = {}
+    token = _stages_durations.set(stages_durations)
+    try:
+        yield stages_durations
+    finally:
+        _stages_durations.reset(token)
+
+
+@contextmanager
+def measure_stage(stage: str) -> Generator[None, None, None]:
+    stages_durations = _stages_durations.get()
+    if stages_durations is None:
+        yield None
+        return None
+    start = perf_counter()
+    try:
+        yield None
+    finally:
+        stages_durations[stage] = (
+            stages_durations.get(stage, 0.0) + perf_counter() - start
+        )
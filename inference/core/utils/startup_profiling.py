@@ -0,0 +1,234 @@
+import sys
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec
+from time import perf_counter
+from typing import Dict, Generator, List, Optional, Sequence
+
+from inference.core.env import STARTUP_PROFILING_ENABLED, STARTUP_PROFILING_TOP_MODULES
+from inference.core.logger import logger
+
+INFERENCE_PACKAGE = "inference"
+
+
+@dataclass(frozen=True)
+class ModuleImportTime:
+    name: str
+    self_time: float
+    cumulative_time: float
+
+
+@dataclass(frozen=True)
+class StartupReport:
+    total_time: float
+    imports_time: float
+    slowest_modules: List[ModuleImportTime]
+    packages_import_time: Dict[str, float]
+    stages_time: Dict[str, float]
+
+    def format(self) -> str:
+        lines = [
+            f"Startup took {self.total_time:.3f}s, "
+            f"{self.imports_time:.3f}s of which spent on imports.",
+            "Initialisation stages:",
+        ]
+        for stage, duration in self.stages_time.items():
+            lines.append(f"  {duration:8.3f}s  {stage}")
+        lines.append("Import time by package (self time):")
+        for package, duration in self.packages_import_time.items():
+            lines.append(f"  {duration:8.3f}s  {package}")
+        lines.append("Slowest modules (self time / cumulative time):")
+        for module in self.slowest_modules:
+            lines.append(
+                f"  {module.self_time:8.3f}s / {module.cumulative_time:8.3f}s  {module.name}"
+            )
+        return "\n".join(lines)
+
+
+@dataclass
+class _ImportFrame:
+    name: str
+    start: float
+    children_time: float = 0.0
+
+
+class _ImportTimingFinder(MetaPathFinder):
+    """Delegates finding the module to the rest of `sys.meta_path` and instruments
+    `exec_module(...)` of the found loader, so that execution time of each module
+    body is recorded. Only per-module loaders are instrumented - built-in and frozen
+    modules are ignored."""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]] = None,
+        target: Optional[object] = None,
+    ) -> Optional[ModuleSpec]:
+        if getattr(self._local, "searching", False):
+            return None
+        self._local.searching = True
+        try:
+            spec = self._find_spec_with_other_finders(fullname, path, target)
+        finally:
+            self._local.searching = False
+        if spec is None or spec.loader is None or isinstance(spec.loader, type):
+            return spec
+        exec_module = getattr(spec.loader, "exec_module", None)
+        if exec_module is None:
+            return spec
+        try:
+            spec.loader.exec_module = self._instrument(
+                name=fullname, exec_module=exec_module
+            )
+        except AttributeError:
+            pass
+        return spec
+
+    def _find_spec_with_other_finders(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[object],
+    ) -> Optional[ModuleSpec]:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                return spec
+        return None
+
+    def _instrument(self, name: str, exec_module):
+        def timed_exec_module(module) -> None:
+            stack = self._get_stack()
+            frame = _ImportFrame(name=name, start=perf_counter())
+            stack.append(frame)
+            try:
+                exec_module(module)
+            finally:
+                stack.pop()
+                cumulative_time = perf_counter() - frame.start
+                if stack:
+                    stack[-1].children_time += cumulative_time
+                self._profiler.record_import(
+                    name=name,
+                    self_time=cumulative_time - frame.children_time,
+                    cumulative_time=cumulative_time,
+                    is_top_level=not stack,
+                )
+
+        return timed_exec_module
+
+    def _get_stack(self) -> List[_ImportFrame]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+
+class StartupProfiler:
+    """Records how long it takes to import each module and to run named initialisation
+    stages of the process. Imports are recorded only between `start()` and `stop()`,
+    so profiler is meant to be started as early as possible - `inference.core` package
+    and its dependencies are imported before the profiler can be started."""
+
+    def __init__(self):
+        self._finder = _ImportTimingFinder(profiler=self)
+        self._imports: Dict[str, ModuleImportTime] = {}
+        self._imports_time = 0.0
+        self._stages: Dict[str, float] = {}
+        self._start_time: Optional[float] = None
+        self._stop_time: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._finder in sys.meta_path
+
+    def start(self) -> None:
+        if self.is_running:
+            return None
+        self._start_time = perf_counter()
+        self._stop_time = None
+        sys.meta_path.insert(0, self._finder)
+
+    def stop(self) -> None:
+        if not self.is_running:
+            return None
+        sys.meta_path.remove(self._finder)
+        self._stop_time = perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Generator[None, None, None]:
+        start = perf_counter()
+        try:
+            yield None
+        finally:
+            with self._lock:
+                self._stages[name] = self._stages.get(name, 0.0) + (
+                    perf_counter() - start
+                )
+
+    def record_import(
+        self, name: str, self_time: float, cumulative_time: float, is_top_level: bool
+    ) -> None:
+        with self._lock:
+            self._imports[name] = ModuleImportTime(
+                name=name, self_time=self_time, cumulative_time=cumulative_time
+            )
+            if is_top_level:
+                self._imports_time += cumulative_time
+
+    def report(self, top_modules: int = STARTUP_PROFILING_TOP_MODULES) -> StartupReport:
+        with self._lock:
+            imports = list(self._imports.values())
+            stages_time = dict(self._stages)
+            imports_time = self._imports_time
+        end_time = self._stop_time if self._stop_time is not None else perf_counter()
+        total_time = end_time - self._start_time if self._start_time else 0.0
+        slowest_modules = sorted(imports, key=lambda m: m.self_time, reverse=True)
+        packages_import_time = defaultdict(float)
+        for module in imports:
+            packages_import_time[
+                get_package_name(module_name=module.name)
+            ] += module.self_time
+        return StartupReport(
+            total_time=total_time,
+            imports_time=imports_time,
+            slowest_modules=slowest_modules[:top_modules],
+            packages_import_time=dict(
+                sorted(packages_import_time.items(), key=lambda e: e[1], reverse=True)[
+                    :top_modules
+                ]
+            ),
+            stages_time=stages_time,
+        )
+
+    def finish(self) -> None:
+        """Stops recording imports and logs the report - to be called once the
+        process is ready to serve. Report is logged as warning, as profiling is
+        explicitly enabled and default log level would hide it otherwise."""
+        if not self.is_running:
+            return None
+        self.stop()
+        logger.warning(f"Startup profiling report:\n{self.report().format()}")
+
+
+def get_package_name(module_name: str) -> str:
+    # `inference` modules are grouped by sub-package, third-party ones by distribution
+    chunks = module_name.split(".")
+    if chunks[0] == INFERENCE_PACKAGE:
+        return ".".join(chunks[:3])
+    return chunks[0]
+
+
+startup_profiler = StartupProfiler()
+
+if STARTUP_PROFILING_ENABLED:
+    startup_profiler.start()
@@ -0,0 +1,204 @@
+import http.cookiejar
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+from inference.core import logger
+
+NO_STORE_DIRECTIVE = "no-store"
+NO_CACHE_DIRECTIVE = "no-cache"
+PRIVATE_DIRECTIVE = "private"
+MAX_AGE_DIRECTIVE = "max-age"
+
+CacheKey = Tuple[str, int]
+
+
+@dataclass(frozen=True)
+class CachedUrlImage:
+    image: np.ndarray
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    ttl: float
+
+    @property
+    def size(self) -> int:
+        return self.image.nbytes
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def revalidation_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class UrlImagesCache:
+    """Thread-safe LRU of images decoded from URLs, bounded by total size of decoded
+    pixels (not number of entries) - such that a few 4K frames cannot push out hundreds
+    of small reference images unnoticed. Entries are keyed by URL and decoding flags.
+    Entries older than `ttl` (or `max-age` announced by the origin, if lower) are not
+    dropped but marked stale - caller is expected to revalidate them with the origin
+    (using ETag / Last-Modified) before reuse. Entries without validators are never
+    considered fresh."""
+
+    def __init__(self, max_size_bytes: int, ttl: float):
+        self._max_size_bytes = max(max_size_bytes, 0)
+        self._ttl = ttl
+        self._entries: "OrderedDict[CacheKey, CachedUrlImage]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size_bytes > 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def get(self, url: str, cv_imread_flags: int) -> Optional[CachedUrlImage]:
+        if not self.enabled:
+            return None
+        key = (url, cv_imread_flags)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry: CachedUrlImage) -> bool:
+        if not entry.has_validators:
+            return False
+        return time.monotonic() - entry.fetched_at < entry.ttl
+
+    def put(
+        self,
+        url: str,
+        cv_imread_flags: int,
+        image: np.ndarray,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        ttl: float = math.inf,
+    ) -> None:
+        if not self.enabled or image.nbytes > self._max_size_bytes:
+            return None
+        key = (url, cv_imread_flags)
+        entry = CachedUrlImage(
+            image=image,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=time.monotonic(),
+            ttl=min(self._ttl, ttl),
+        )
+        with self._lock:
+            previous_entry = self._entries.pop(key, None)
+            if previous_entry is not None:
+                self._size_bytes -= previous_entry.size
+            self._entries[key] = entry
+            self._size_bytes += entry.size
+            while self._size_bytes > self._max_size_bytes:
+                evicted_key, evicted_entry = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_entry.size
+                logger.debug(f"Evicted image from URL images cache: {evicted_key[0]}")
+
+    def refresh(
+        self,
+        url: str,
+        cv_imread_flags: int,
+        entry: CachedUrlImage,
+        ttl: float = math.inf,
+    ) -> None:
+        self.put(
+            url=url,
+            cv_imread_flags=cv_imread_flags,
+            image=entry.image,
+            etag=entry.etag,
+            last_modified=entry.last_modified,
+            ttl=ttl,
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+
+def get_response_cache_ttl(response: requests.Response) -> Optional[float]:
+    """Interprets `Cache-Control` of origin response. Returns `None` if response must
+    not be cached at all (`no-store`, `private` or no validators to revalidate it later),
+    otherwise - max number of seconds the response may be served without revalidation
+    (`0` for `no-cache`, `max-age` if announced, infinity if origin set no limit)."""
+    if not response.headers.get("ETag") and not response.headers.get("Last-Modified"):
+        return None
+    directives = parse_cache_control(
+        cache_control=response.headers.get("Cache-Control", "")
+    )
+    if NO_STORE_DIRECTIVE in directives or PRIVATE_DIRECTIVE in directives:
+        return None
+    if NO_CACHE_DIRECTIVE in directives:
+        return 0.0
+    return get_max_age(directives=directives)
+
+
+def get_revalidated_response_cache_ttl(response: requests.Response) -> float:
+    directives = parse_cache_control(
+        cache_control=response.headers.get("Cache-Control", "")
+    )
+    if NO_CACHE_DIRECTIVE in directives:
+        return 0.0
+    return get_max_age(directives=directives)
+
+
+def parse_cache_control(cache_control: str) -> Dict[str, Optional[str]]:
+    directives = {}
+    for directive in cache_control.split(","):
+        name, _, value = directive.partition("=")
+        name = name.strip().lower()
+        if name:
+            directives[name] = value.strip().strip('"') or None
+    return directives
+
+
+def get_max_age(directives: Dict[str, Optional[str]]) -> float:
+    try:
+        return max(float(directives[MAX_AGE_DIRECTIVE]), 0.0)
+    except (KeyError, TypeError, ValueError):
+        return math.inf
+
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = Lock()
+
+
+def get_url_images_session(pool_size: int) -> requests.Session:
+    """Returns process-wide HTTP session used to fetch images from URLs, such that
+    connections to the same hosts are kept alive and reused across requests. Session
+    accepts no cookies - it is shared by requests of all clients, so cookies set by
+    one's image URL must not be sent along with images fetched for others."""
+    global _SESSION
+    if _SESSION is not None:
+        return _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            session.cookies.set_policy(
+                http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            )
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION = session
+    return _SESSION
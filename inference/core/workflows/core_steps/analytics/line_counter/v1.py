@@ -1,9 +1,15 @@
-from typing import Dict, List, Optional, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
 import supervision as sv
 from pydantic import ConfigDict, Field
 from typing_extensions import Literal, Type
 
+from inference.core import logger
+from inference.core.workflows.core_steps.common.video_state_store import (
+    VideoStateStore,
+    compose_namespace,
+    compute_config_hash,
+)
 from inference.core.workflows.execution_engine.entities.base import (
     OutputDefinition,
     VideoMetadata,
@@ -89,8 +95,21 @@ class LineCounterManifest(WorkflowBlockManifest):
 
 
 class LineCounterBlockV1(WorkflowBlock):
-    def __init__(self):
-        self._batch_of_line_zones: Dict[str, sv.LineZone] = {}
+    def __init__(
+        self,
+        step_name: Optional[str] = None,
+        video_state_namespace: Optional[str] = None,
+    ):
+        namespace = compose_namespace(video_state_namespace, step_name)
+        self._batch_of_line_zones: VideoStateStore[sv.LineZone] = (
+            VideoStateStore.init_from_env(
+                name="line_counter_v1_line_zones", namespace=namespace
+            )
+        )
+
+    @classmethod
+    def get_init_parameters(cls) -> List[str]:
+        return ["step_name", "video_state_namespace"]
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -107,7 +126,19 @@ class LineCounterBlockV1(WorkflowBlock):
             raise ValueError(
                 f"tracker_id not initialized, {self.__class__.__name__} requires detections to be tracked"
             )
-        if metadata.video_identifier not in self._batch_of_line_zones:
+        state_key = f"{metadata.video_identifier}/{compute_config_hash(line_segment, triggering_anchor)}"
+        line_zone = self._batch_of_line_zones.get(state_key)
+        if line_zone is not None and not line_zone_matches(
+            line_zone=line_zone,
+            line_segment=line_segment,
+            triggering_anchor=triggering_anchor,
+        ):
+            logger.warning(
+                f"Line zone of {self.__class__.__name__} restored for video {metadata.video_identifier} "
+                f"does not match the configured one - line zone and its counters are reset."
+            )
+            line_zone = None
+        if line_zone is None:
             if not isinstance(line_segment, list) or len(line_segment) != 2:
                 raise ValueError(
                     f"{self.__class__.__name__} requires line zone to be a list containing exactly 2 points"
@@ -123,12 +154,12 @@ class LineCounterBlockV1(WorkflowBlock):
                 raise ValueError(
                     f"{self.__class__.__name__} requires each coordinate of line zone to be a number"
                 )
-            self._batch_of_line_zones[metadata.video_identifier] = sv.LineZone(
+            line_zone = sv.LineZone(
                 start=sv.Point(*line_segment[0]),
                 end=sv.Point(*line_segment[1]),
                 triggering_anchors=[sv.Position(triggering_anchor)],
             )
-        line_zone = self._batch_of_line_zones[metadata.video_identifier]
+            self._batch_of_line_zones.set(state_key, line_zone)
 
         line_zone.trigger(detections=detections)
 
@@ -136,3 +167,14 @@ class LineCounterBlockV1(WorkflowBlock):
             OUTPUT_KEY_COUNT_IN: line_zone.in_count,
             OUTPUT_KEY_COUNT_OUT: line_zone.out_count,
         }
+
+
+def line_zone_matches(
+    line_zone: sv.LineZone,
+    line_segment: List[Tuple[int, int]],
+    triggering_anchor: str,
+) -> bool:
+    start, end = line_zone.vector.start, line_zone.vector.end
+    return [[start.x, start.y], [end.x, end.y]] == [
+        list(point) for point in line_segment
+    ] and line_zone.triggering_anchors == [sv.Position(triggering_anchor)]
@@ -1,10 +1,17 @@
-from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, replace
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 import supervision as sv
 from pydantic import ConfigDict, Field
 from typing_extensions import Literal, Type
 
+from inference.core import logger
+from inference.core.workflows.core_steps.common.video_state_store import (
+    VideoStateStore,
+    compose_namespace,
+    compute_config_hash,
+)
 from inference.core.workflows.execution_engine.entities.base import (
     OutputDefinition,
     VideoMetadata,
@@ -102,10 +109,91 @@ class TimeInZoneManifest(WorkflowBlockManifest):
         return ">=1.0.0,<2.0.0"
 
 
+@dataclass
+class TrackedIdsInZone:
+    """Tracker ids of objects present in zone (sorted, to be looked up with
+    `np.searchsorted(...)`) along with timestamps of objects entering the zone."""
+
+    tracker_ids: np.ndarray
+    entry_timestamps: np.ndarray
+
+    @classmethod
+    def empty(cls) -> "TrackedIdsInZone":
+        return cls(
+            tracker_ids=np.empty((0,), dtype=np.int64),
+            entry_timestamps=np.empty((0,), dtype=np.float64),
+        )
+
+    def lookup(self, tracker_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns mask of tracker ids found in zone and their indices (valid for found ids)"""
+        indices = np.searchsorted(self.tracker_ids, tracker_ids)
+        found = indices < len(self.tracker_ids)
+        found[found] = self.tracker_ids[indices[found]] == tracker_ids[found]
+        return found, indices
+
+
+class CompactPolygonZone:
+    """Polygon zone which keeps the mask only within bounding box of the polygon (not the whole
+    frame), giving the same results as `sv.PolygonZone(...)`."""
+
+    def __init__(self, polygon: np.ndarray, triggering_anchor: sv.Position):
+        self.polygon = polygon.astype(int)
+        self.triggering_anchor = triggering_anchor
+        self.origin = np.min(self.polygon, axis=0)
+        x_max, y_max = np.max(self.polygon, axis=0)
+        self.frame_resolution_wh = (x_max + 1, y_max + 1)
+        mask_wh = (x_max + 2 - self.origin[0], y_max + 2 - self.origin[1])
+        self.mask = sv.polygon_to_mask(
+            polygon=self.polygon - self.origin, resolution_wh=mask_wh
+        ).astype(bool)
+
+    def matches(self, polygon: np.ndarray, triggering_anchor: sv.Position) -> bool:
+        return (
+            np.array_equal(self.polygon, polygon.astype(int))
+            and self.triggering_anchor == triggering_anchor
+        )
+
+    def trigger(self, detections: sv.Detections) -> np.ndarray:
+        clipped_detections = sv.Detections(
+            xyxy=sv.clip_boxes(
+                xyxy=detections.xyxy, resolution_wh=self.frame_resolution_wh
+            )
+        )
+        anchors = (
+            np.ceil(
+                clipped_detections.get_anchors_coordinates(self.triggering_anchor)
+            ).astype(int)
+            - self.origin
+        )
+        is_within_mask_bounds = np.all(anchors >= 0, axis=1)
+        is_in_zone = np.zeros(len(detections), dtype=bool)
+        is_in_zone[is_within_mask_bounds] = self.mask[
+            anchors[is_within_mask_bounds, 1], anchors[is_within_mask_bounds, 0]
+        ]
+        return is_in_zone
+
+
 class TimeInZoneBlockV1(WorkflowBlock):
-    def __init__(self):
-        self._batch_of_tracked_ids_in_zone: Dict[str, Dict[Union[int, str], float]] = {}
-        self._batch_of_polygon_zones: Dict[str, sv.PolygonZone] = {}
+    def __init__(
+        self,
+        step_name: Optional[str] = None,
+        video_state_namespace: Optional[str] = None,
+    ):
+        namespace = compose_namespace(video_state_namespace, step_name)
+        self._batch_of_tracked_ids_in_zone: VideoStateStore[TrackedIdsInZone] = (
+            VideoStateStore.init_from_env(
+                name="time_in_zone_v1_tracked_ids_in_zone", namespace=namespace
+            )
+        )
+        self._batch_of_polygon_zones: VideoStateStore[CompactPolygonZone] = (
+            VideoStateStore.init_from_env(
+                name="time_in_zone_v1_polygon_zones", namespace=namespace
+            )
+        )
+
+    @classmethod
+    def get_init_parameters(cls) -> List[str]:
+        return ["step_name", "video_state_namespace"]
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -125,7 +213,18 @@ class TimeInZoneBlockV1(WorkflowBlock):
             raise ValueError(
                 f"tracker_id not initialized, {self.__class__.__name__} requires detections to be tracked"
             )
-        if metadata.video_identifier not in self._batch_of_polygon_zones:
+        state_key = f"{metadata.video_identifier}/{compute_config_hash(zone, triggering_anchor)}"
+        polygon_zone = self._batch_of_polygon_zones.get(state_key)
+        if polygon_zone is not None and not polygon_zone.matches(
+            polygon=np.array(zone), triggering_anchor=sv.Position(triggering_anchor)
+        ):
+            logger.warning(
+                f"Zone of {self.__class__.__name__} restored for video {metadata.video_identifier} "
+                f"does not match the configured one - zone and its timers are reset."
+            )
+            self._batch_of_tracked_ids_in_zone.pop(state_key)
+            polygon_zone = None
+        if polygon_zone is None:
             if not isinstance(zone, list) or len(zone) < 3:
                 raise ValueError(
                     f"{self.__class__.__name__} requires zone to be a list containing more than 2 points"
@@ -144,44 +243,77 @@ class TimeInZoneBlockV1(WorkflowBlock):
                 raise ValueError(
                     f"{self.__class__.__name__} requires each coordinate of zone to be a number"
                 )
-            self._batch_of_polygon_zones[metadata.video_identifier] = sv.PolygonZone(
+            polygon_zone = CompactPolygonZone(
                 polygon=np.array(zone),
-                frame_resolution_wh=image.numpy_image.shape[:-1],
-                triggering_anchors=(sv.Position(triggering_anchor),),
+                triggering_anchor=sv.Position(triggering_anchor),
             )
-        polygon_zone = self._batch_of_polygon_zones[metadata.video_identifier]
-        tracked_ids_in_zone = self._batch_of_tracked_ids_in_zone.setdefault(
-            metadata.video_identifier, {}
+            self._batch_of_polygon_zones.set(state_key, polygon_zone)
+        tracked_ids_in_zone = self._batch_of_tracked_ids_in_zone.get_or_create(
+            video_identifier=state_key, factory=TrackedIdsInZone.empty
         )
-        result_detections = []
         if metadata.comes_from_video_file and metadata.fps != 0:
             ts_end = metadata.frame_number / metadata.fps
         else:
             ts_end = metadata.frame_timestamp.timestamp()
-        for i, is_in_zone, tracker_id in zip(
-            range(len(detections)),
-            polygon_zone.trigger(detections),
-            detections.tracker_id,
-        ):
-            if (
-                not is_in_zone
-                and tracker_id in tracked_ids_in_zone
-                and reset_out_of_zone_detections
-            ):
-                del tracked_ids_in_zone[tracker_id]
-            if not is_in_zone and remove_out_of_zone_detections:
-                continue
-
-            # copy
-            detection = detections[i]
-
-            detection[DETECTIONS_TIME_IN_ZONE_PARAM] = np.array([0], dtype=np.float64)
-            if is_in_zone:
-                ts_start = tracked_ids_in_zone.setdefault(tracker_id, ts_end)
-                detection[DETECTIONS_TIME_IN_ZONE_PARAM] = np.array(
-                    [ts_end - ts_start], dtype=np.float64
-                )
-            elif tracker_id in tracked_ids_in_zone:
-                del tracked_ids_in_zone[tracker_id]
-            result_detections.append(detection)
-        return {OUTPUT_KEY: sv.Detections.merge(result_detections)}
+        if len(detections) == 0:
+            return {OUTPUT_KEY: sv.Detections.empty()}
+        tracker_ids = np.asarray(detections.tracker_id)
+        is_in_zone = polygon_zone.trigger(detections)
+        is_tracked, tracked_indices = tracked_ids_in_zone.lookup(
+            tracker_ids=tracker_ids
+        )
+        time_in_zone = np.zeros(len(detections), dtype=np.float64)
+        tracked_in_zone = is_in_zone & is_tracked
+        time_in_zone[tracked_in_zone] = (
+            ts_end
+            - tracked_ids_in_zone.entry_timestamps[tracked_indices[tracked_in_zone]]
+        )
+        leaving_zone = ~is_in_zone & is_tracked
+        if remove_out_of_zone_detections and not reset_out_of_zone_detections:
+            # objects out of zone are removed from output, but their timers keep running
+            leaving_zone[:] = False
+        self._batch_of_tracked_ids_in_zone.set(
+            state_key,
+            update_tracked_ids_in_zone(
+                tracked_ids_in_zone=tracked_ids_in_zone,
+                removed_indices=tracked_indices[leaving_zone],
+                added_tracker_ids=tracker_ids[is_in_zone & ~is_tracked],
+                timestamp=ts_end,
+            ),
+        )
+        result_detections = replace(
+            detections,
+            data={**detections.data, DETECTIONS_TIME_IN_ZONE_PARAM: time_in_zone},
+        )
+        if remove_out_of_zone_detections:
+            result_detections = result_detections[is_in_zone]
+            if len(result_detections) == 0:
+                return {OUTPUT_KEY: sv.Detections.empty()}
+        return {OUTPUT_KEY: result_detections}
+
+
+def update_tracked_ids_in_zone(
+    tracked_ids_in_zone: TrackedIdsInZone,
+    removed_indices: np.ndarray,
+    added_tracker_ids: np.ndarray,
+    timestamp: float,
+) -> TrackedIdsInZone:
+    if len(removed_indices) == 0 and len(added_tracker_ids) == 0:
+        return tracked_ids_in_zone
+    keep = np.ones(len(tracked_ids_in_zone.tracker_ids), dtype=bool)
+    keep[removed_indices] = False
+    added_tracker_ids = np.unique(added_tracker_ids)
+    tracker_ids = np.concatenate(
+        [tracked_ids_in_zone.tracker_ids[keep], added_tracker_ids]
+    )
+    entry_timestamps = np.concatenate(
+        [
+            tracked_ids_in_zone.entry_timestamps[keep],
+            np.full(len(added_tracker_ids), timestamp, dtype=np.float64),
+        ]
+    )
+    order = np.argsort(tracker_ids, kind="stable")
+    return TrackedIdsInZone(
+        tracker_ids=tracker_ids[order],
+        entry_timestamps=entry_timestamps[order],
+    )
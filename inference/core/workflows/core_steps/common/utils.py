@@ -14,6 +14,7 @@ from inference.core.entities.requests.doctr import DoctrOCRInferenceRequest
 from inference.core.entities.requests.sam2 import Sam2InferenceRequest
 from inference.core.entities.requests.yolo_world import YOLOWorldInferenceRequest
 from inference.core.managers.base import ModelManager
+from inference.core.models.types import NativeDetections
 from inference.core.workflows.execution_engine.constants import (
     DETECTION_ID_KEY,
     HEIGHT_KEY,
@@ -113,6 +114,58 @@ def convert_inference_detections_batch_to_sv_detections(
     return batch_of_detections
 
 
+def convert_native_detections_batch_to_sv_detections(
+    predictions: List[NativeDetections],
+    inference_id: Optional[str] = None,
+) -> List[sv.Detections]:
+    batch_of_detections: List[sv.Detections] = []
+    for p in predictions:
+        detections_number = len(p)
+        height, width = p.image_dimensions
+        detections = sv.Detections(
+            xyxy=p.xyxy,
+            confidence=p.confidence,
+            class_id=p.class_id,
+            mask=p.mask if detections_number > 0 else None,
+            data={CLASS_NAME_DATA_FIELD: p.class_name},
+        )
+        detections[DETECTION_ID_KEY] = np.array(
+            [str(uuid.uuid4()) for _ in range(detections_number)]
+        )
+        detections[PARENT_ID_KEY] = np.array([""] * detections_number)
+        detections[IMAGE_DIMENSIONS_KEY] = np.array(
+            [[height, width]] * detections_number
+        )
+        if inference_id is not None:
+            detections[INFERENCE_ID_KEY] = np.array([inference_id] * detections_number)
+        if p.keypoints_xy is not None:
+            add_native_keypoints_to_sv_detections(
+                native_detections=p,
+                detections=detections,
+            )
+        batch_of_detections.append(detections)
+    return batch_of_detections
+
+
+def add_native_keypoints_to_sv_detections(
+    native_detections: NativeDetections,
+    detections: sv.Detections,
+) -> sv.Detections:
+    detections[KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS] = np.array(
+        native_detections.keypoints_class_name, dtype="object"
+    )
+    detections[KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS] = np.array(
+        native_detections.keypoints_class_id, dtype="object"
+    )
+    detections[KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS] = np.array(
+        native_detections.keypoints_confidence, dtype="object"
+    )
+    detections[KEYPOINTS_XY_KEY_IN_SV_DETECTIONS] = np.array(
+        native_detections.keypoints_xy, dtype="object"
+    )
+    return detections
+
+
 def add_inference_keypoints_to_sv_detections(
     inference_prediction: List[dict],
     detections: sv.Detections,
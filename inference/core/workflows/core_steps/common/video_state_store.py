@@ -0,0 +1,376 @@
+import atexit
+import hashlib
+import json
+import os
+import pickle
+import re
+import sys
+import tempfile
+import time
+import types
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+import numpy as np
+
+from inference.core import logger
+from inference.core.env import (
+    WORKFLOWS_VIDEO_STATE_MAX_ENTRIES,
+    WORKFLOWS_VIDEO_STATE_MAX_MEMORY_MB,
+    WORKFLOWS_VIDEO_STATE_SNAPSHOT_DIR,
+    WORKFLOWS_VIDEO_STATE_SNAPSHOT_INTERVAL,
+    WORKFLOWS_VIDEO_STATE_TTL,
+)
+
+V = TypeVar("V")
+
+SNAPSHOTS_FLUSH_INTERVAL = 1.0
+SNAPSHOT_FILE_NAME_UNSAFE_CHARACTERS = re.compile(r"[^A-Za-z0-9_.-]")
+
+NOT_TRAVERSED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+)
+
+
+@dataclass
+class VideoStateEntry(Generic[V]):
+    value: V
+    last_seen: float
+    size_bytes: int = 0
+
+
+@dataclass(frozen=True)
+class VideoStateStoreStatistics:
+    entries: int
+    memory_usage_bytes: int
+    evictions: int
+
+
+class VideoStateStore(Generic[V]):
+    """Thread-safe store of per-video state of stateful Workflows blocks (trackers, zones, counters),
+    keyed by `video_identifier`. When `max_entries` or `max_memory_bytes` is exceeded - state of least
+    recently seen videos is evicted first. Optionally, state of videos not accessed for `ttl` seconds
+    (measured with `clock`, not with frames timestamps - which are not comparable across videos) is
+    evicted as well. Store built with `init_from_env(...)` is bounded by default (see
+    `WORKFLOWS_VIDEO_STATE_MAX_ENTRIES` and `WORKFLOWS_VIDEO_STATE_TTL`) - such that state of rotating
+    video identifiers (and of outdated blocks configurations) does not pile up.
+
+    Stores are namespaced (usually by the name of the step owning them, prefixed with namespace of
+    the Workflow or pipeline running it - see `compose_namespace(...)`), such that different steps
+    of the same type never share the state (nor the snapshot file). Blocks are expected to also include hash of
+    their configuration in keys (see `compute_config_hash(...)`), such that state created for
+    one configuration is not reused once it changes.
+
+    Memory usage is only accounted when `max_memory_bytes` is set (as traversing state on each
+    access has its cost). Entry size is estimated when the entry is accessed - as blocks mutate
+    the state in-place after retrieval, accounting lags one frame behind.
+
+    If `snapshot_dir` is given, the whole store is pickled to `<snapshot_dir>/<name>.<namespace>.pickle`
+    at most every `snapshot_interval` seconds (by background thread, never on the frames processing path)
+    and restored on creation - such that state survives restarts of pipelines. Snapshots are best-effort:
+    store lock only guards the entries mapping, while blocks mutate retrieved state outside of it - so
+    snapshot may capture state of a video in the middle of frame update, and pickling may fail (in which
+    case the snapshot is retried by the next flush).
+    """
+
+    @classmethod
+    def init_from_env(
+        cls, name: str, namespace: Optional[str] = None
+    ) -> "VideoStateStore[V]":
+        max_memory_bytes = None
+        if WORKFLOWS_VIDEO_STATE_MAX_MEMORY_MB is not None:
+            max_memory_bytes = int(WORKFLOWS_VIDEO_STATE_MAX_MEMORY_MB * 1024 * 1024)
+        return cls(
+            name=name,
+            namespace=namespace,
+            ttl=WORKFLOWS_VIDEO_STATE_TTL,
+            max_entries=WORKFLOWS_VIDEO_STATE_MAX_ENTRIES,
+            max_memory_bytes=max_memory_bytes,
+            snapshot_dir=WORKFLOWS_VIDEO_STATE_SNAPSHOT_DIR,
+            snapshot_interval=WORKFLOWS_VIDEO_STATE_SNAPSHOT_INTERVAL,
+        )
+
+    def __init__(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_memory_bytes: Optional[int] = None,
+        snapshot_dir: Optional[str] = None,
+        snapshot_interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._name = f"{name}.{namespace}" if namespace else name
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._max_memory_bytes = max_memory_bytes
+        self._snapshot_path = None
+        if snapshot_dir:
+            file_name = SNAPSHOT_FILE_NAME_UNSAFE_CHARACTERS.sub("_", self._name)
+            self._snapshot_path = os.path.join(snapshot_dir, f"{file_name}.pickle")
+        self._snapshot_interval = snapshot_interval
+        self._clock = clock
+        self._entries: "OrderedDict[str, VideoStateEntry[V]]" = OrderedDict()
+        self._memory_usage_bytes = 0
+        self._evictions = 0
+        self._lock = Lock()
+        self._snapshot_lock = Lock()
+        self._last_snapshot = self._clock()
+        if self._snapshot_path is not None:
+            self._load_snapshot()
+            SNAPSHOTS_FLUSHER.register(store=self)
+
+    def __contains__(self, video_identifier: str) -> bool:
+        with self._lock:
+            return video_identifier in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def memory_usage_bytes(self) -> int:
+        return self._memory_usage_bytes
+
+    def get(self, video_identifier: str) -> Optional[V]:
+        with self._lock:
+            entry = self._touch(video_identifier=video_identifier)
+            self._evict(protected_video_identifier=video_identifier)
+        return entry.value if entry is not None else None
+
+    def get_or_create(self, video_identifier: str, factory: Callable[[], V]) -> V:
+        with self._lock:
+            entry = self._touch(video_identifier=video_identifier)
+            if entry is None:
+                entry = VideoStateEntry(value=factory(), last_seen=self._clock())
+                self._entries[video_identifier] = entry
+                self._update_size(entry=entry)
+            self._evict(protected_video_identifier=video_identifier)
+        return entry.value
+
+    def set(self, video_identifier: str, value: V) -> None:
+        with self._lock:
+            previous_entry = self._entries.pop(video_identifier, None)
+            if previous_entry is not None:
+                self._memory_usage_bytes -= previous_entry.size_bytes
+            entry = VideoStateEntry(value=value, last_seen=self._clock())
+            self._entries[video_identifier] = entry
+            self._update_size(entry=entry)
+            self._evict(protected_video_identifier=video_identifier)
+
+    def pop(self, video_identifier: str) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.pop(video_identifier, None)
+            if entry is None:
+                return None
+            self._memory_usage_bytes -= entry.size_bytes
+            return entry.value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._memory_usage_bytes = 0
+
+    def get_statistics(self) -> VideoStateStoreStatistics:
+        with self._lock:
+            return VideoStateStoreStatistics(
+                entries=len(self._entries),
+                memory_usage_bytes=self._memory_usage_bytes,
+                evictions=self._evictions,
+            )
+
+    def save_snapshot(self) -> None:
+        if self._snapshot_path is None:
+            return None
+        with self._snapshot_lock:
+            with self._lock:
+                snapshot = {
+                    video_identifier: entry.value
+                    for video_identifier, entry in self._entries.items()
+                }
+            # pickling outside of the lock - frames processing is not blocked
+            payload = pickle.dumps(snapshot)
+            with self._lock:
+                self._last_snapshot = self._clock()
+            snapshot_dir = os.path.dirname(self._snapshot_path)
+            os.makedirs(snapshot_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=snapshot_dir, prefix=f"{os.path.basename(self._snapshot_path)}."
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, self._snapshot_path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+    def save_snapshot_if_due(self) -> None:
+        if self._snapshot_path is None:
+            return None
+        with self._lock:
+            if self._clock() - self._last_snapshot < self._snapshot_interval:
+                return None
+        self.save_snapshot()
+
+    def _touch(self, video_identifier: str) -> Optional[VideoStateEntry[V]]:
+        entry = self._entries.get(video_identifier)
+        if entry is None:
+            return None
+        entry.last_seen = self._clock()
+        self._entries.move_to_end(video_identifier)
+        self._update_size(entry=entry)
+        return entry
+
+    def _update_size(self, entry: VideoStateEntry[V]) -> None:
+        if self._max_memory_bytes is None:
+            return None
+        size_bytes = estimate_memory_usage(value=entry.value)
+        self._memory_usage_bytes += size_bytes - entry.size_bytes
+        entry.size_bytes = size_bytes
+
+    def _evict(self, protected_video_identifier: Optional[str] = None) -> None:
+        now = self._clock()
+        while self._entries:
+            video_identifier, entry = next(iter(self._entries.items()))
+            if video_identifier == protected_video_identifier:
+                break
+            is_expired = self._ttl is not None and now - entry.last_seen > self._ttl
+            is_over_entries_limit = (
+                self._max_entries is not None and len(self._entries) > self._max_entries
+            )
+            is_over_memory_limit = (
+                self._max_memory_bytes is not None
+                and self._memory_usage_bytes > self._max_memory_bytes
+            )
+            if not (is_expired or is_over_entries_limit or is_over_memory_limit):
+                break
+            del self._entries[video_identifier]
+            self._memory_usage_bytes -= entry.size_bytes
+            self._evictions += 1
+            logger.debug(
+                f"Evicted state of video {video_identifier} from {self._name} store."
+            )
+
+    def _load_snapshot(self) -> None:
+        if not os.path.isfile(self._snapshot_path):
+            return None
+        try:
+            # snapshots are only read from location configured by server operator
+            with open(self._snapshot_path, "rb") as f:
+                snapshot: Dict[str, V] = pickle.load(f)
+        except Exception as error:
+            logger.warning(
+                f"Could not restore snapshot of {self._name} store. Cause: {error}"
+            )
+            return None
+        now = self._clock()
+        for video_identifier, value in snapshot.items():
+            entry = VideoStateEntry(value=value, last_seen=now)
+            self._entries[video_identifier] = entry
+            self._update_size(entry=entry)
+        self._evict()
+
+
+class SnapshotsFlusher:
+    """Periodically saves snapshots of registered stores in a background thread (and once more
+    at interpreter exit). Stores are referenced weakly, so registration does not prolong their life.
+    """
+
+    def __init__(self, interval: float):
+        self._interval = interval
+        self._stores: "weakref.WeakSet[VideoStateStore]" = weakref.WeakSet()
+        self._lock = Lock()
+        self._thread: Optional[Thread] = None
+
+    def register(self, store: VideoStateStore) -> None:
+        with self._lock:
+            self._stores.add(store)
+            if self._thread is not None:
+                return None
+            self._thread = Thread(
+                target=self._run, name="video_state_snapshots", daemon=True
+            )
+            self._thread.start()
+            atexit.register(self.flush, force=True)
+
+    def flush(self, force: bool = False) -> None:
+        with self._lock:
+            stores = list(self._stores)
+        for store in stores:
+            try:
+                if force:
+                    store.save_snapshot()
+                else:
+                    store.save_snapshot_if_due()
+            except Exception as error:
+                logger.warning(
+                    f"Could not save snapshot of {store.name} store. Cause: {error}"
+                )
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self._interval)
+            self.flush()
+
+
+SNAPSHOTS_FLUSHER = SnapshotsFlusher(interval=SNAPSHOTS_FLUSH_INTERVAL)
+
+
+def compose_namespace(*parts: Optional[str]) -> Optional[str]:
+    """Joins non-empty parts of store namespace (like namespace of the pipeline and step name)."""
+    namespace = ".".join(part for part in parts if part)
+    return namespace or None
+
+
+def compute_config_hash(*values: Any) -> str:
+    """Computes stable hash of (JSON-like) configuration values - to be used in keys of stored state,
+    such that state built for one configuration is not reused once configuration changes.
+    """
+    serialised = json.dumps(values, sort_keys=True, default=str)
+    return hashlib.blake2b(serialised.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def estimate_memory_usage(value: Any) -> int:
+    """Approximates memory held by the object graph - numpy arrays are accounted by their
+    buffers size, containers and objects (with `__dict__` or `__slots__`) are traversed.
+    """
+    visited = set()
+    to_visit = [value]
+    size_bytes = 0
+    while to_visit:
+        current = to_visit.pop()
+        if id(current) in visited:
+            continue
+        visited.add(id(current))
+        if isinstance(current, np.ndarray):
+            size_bytes += current.nbytes
+            continue
+        if isinstance(current, NOT_TRAVERSED_TYPES):
+            continue
+        size_bytes += sys.getsizeof(current)
+        if isinstance(current, (str, bytes, int, float, bool, type(None))):
+            continue
+        if isinstance(current, dict):
+            to_visit.extend(current.keys())
+            to_visit.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            to_visit.extend(current)
+        if hasattr(current, "__dict__"):
+            to_visit.append(vars(current))
+        for slot in getattr(type(current), "__slots__", ()):
+            if hasattr(current, slot):
+                to_visit.append(getattr(current, slot))
+    return size_bytes
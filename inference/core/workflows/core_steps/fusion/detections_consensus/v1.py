@@ -1,8 +1,7 @@
-import math
 import statistics
 from collections import Counter
 from enum import Enum
-from typing import Dict, Generator, List, Literal, Optional, Set, Tuple, Type, Union
+from typing import Dict, List, Literal, Optional, Tuple, Type, Union
 from uuid import uuid4
 
 import numpy as np
@@ -271,54 +270,54 @@ def filter_predictions(
 
 
 def get_detections_from_different_sources_with_max_overlap(
-    detection: sv.Detections,
-    source: int,
-    detections_from_sources: List[sv.Detections],
+    source_id: int,
+    detection_index: int,
+    pairwise_iou: Dict[Tuple[int, int], np.ndarray],
     iou_threshold: float,
-    class_aware: bool,
-    detections_already_considered: Set[str],
-) -> Dict[int, Tuple[sv.Detections, float]]:
+    detections_already_considered: List[np.ndarray],
+) -> Dict[int, Tuple[int, float]]:
     current_max_overlap = {}
-    for other_source, other_detection in enumerate_detections(
-        detections_from_sources=detections_from_sources,
-        excluded_source_id=source,
+    for other_source_id, other_source_considered in enumerate(
+        detections_already_considered
     ):
-        if other_detection[DETECTION_ID_KEY][0] in detections_already_considered:
-            continue
-        if (
-            class_aware
-            and detection["class_name"][0] != other_detection["class_name"][0]
-        ):
+        if other_source_id == source_id or len(other_source_considered) == 0:
             continue
-        iou_value = calculate_iou(
-            detection_a=detection,
-            detection_b=other_detection,
+        iou_values = np.where(
+            other_source_considered,
+            0.0,
+            pairwise_iou[(source_id, other_source_id)][detection_index],
         )
-        if iou_value <= iou_threshold:
+        # np.argmax(...) points to the first one among equally overlapping candidates
+        best_match_index = int(np.argmax(iou_values))
+        if iou_values[best_match_index] <= iou_threshold:
             continue
-        if current_max_overlap.get(other_source) is None:
-            current_max_overlap[other_source] = (other_detection, iou_value)
-        if current_max_overlap[other_source][1] < iou_value:
-            current_max_overlap[other_source] = (other_detection, iou_value)
+        current_max_overlap[other_source_id] = (
+            best_match_index,
+            float(iou_values[best_match_index]),
+        )
     return current_max_overlap
 
 
-def enumerate_detections(
+def calculate_pairwise_iou(
     detections_from_sources: List[sv.Detections],
-    excluded_source_id: Optional[int] = None,
-) -> Generator[Tuple[int, sv.Detections], None, None]:
+    class_aware: bool,
+) -> Dict[Tuple[int, int], np.ndarray]:
+    pairwise_iou = {}
     for source_id, detections in enumerate(detections_from_sources):
-        if excluded_source_id == source_id:
-            continue
-        for i in range(len(detections)):
-            yield source_id, detections[i]
-
-
-def calculate_iou(detection_a: sv.Detections, detection_b: sv.Detections) -> float:
-    iou = float(sv.box_iou_batch(detection_a.xyxy, detection_b.xyxy)[0][0])
-    if math.isnan(iou):
-        iou = 0
-    return iou
+        for other_source_id in range(source_id + 1, len(detections_from_sources)):
+            other_detections = detections_from_sources[other_source_id]
+            iou = np.nan_to_num(
+                sv.box_iou_batch(detections.xyxy, other_detections.xyxy), nan=0.0
+            )
+            if class_aware and iou.size > 0:
+                classes_match = np.equal.outer(
+                    np.asarray(detections["class_name"]),
+                    np.asarray(other_detections["class_name"]),
+                )
+                iou = np.where(classes_match, iou, 0.0)
+            pairwise_iou[(source_id, other_source_id)] = iou
+            pairwise_iou[(other_source_id, source_id)] = iou.T
+    return pairwise_iou
 
 
 def agree_on_consensus_for_all_detections_sources(
@@ -344,27 +343,28 @@ def agree_on_consensus_for_all_detections_sources(
         predictions=detections_from_sources,
         classes_to_consider=classes_to_consider,
     )
-    detections_already_considered = set()
+    pairwise_iou = calculate_pairwise_iou(
+        detections_from_sources=detections_from_sources,
+        class_aware=class_aware,
+    )
+    detections_already_considered = [
+        np.zeros(len(detections), dtype=bool) for detections in detections_from_sources
+    ]
     consensus_detections = []
-    for source_id, detection in enumerate_detections(
-        detections_from_sources=detections_from_sources
-    ):
-        (
-            consensus_detections_update,
-            detections_already_considered,
-        ) = get_consensus_for_single_detection(
-            detection=detection,
-            source_id=source_id,
-            detections_from_sources=detections_from_sources,
-            iou_threshold=iou_threshold,
-            class_aware=class_aware,
-            required_votes=required_votes,
-            confidence=confidence,
-            detections_merge_confidence_aggregation=detections_merge_confidence_aggregation,
-            detections_merge_coordinates_aggregation=detections_merge_coordinates_aggregation,
-            detections_already_considered=detections_already_considered,
-        )
-        consensus_detections += consensus_detections_update
+    for source_id, detections in enumerate(detections_from_sources):
+        for detection_index in range(len(detections)):
+            consensus_detections += get_consensus_for_single_detection(
+                source_id=source_id,
+                detection_index=detection_index,
+                detections_from_sources=detections_from_sources,
+                pairwise_iou=pairwise_iou,
+                iou_threshold=iou_threshold,
+                required_votes=required_votes,
+                confidence=confidence,
+                detections_merge_confidence_aggregation=detections_merge_confidence_aggregation,
+                detections_merge_coordinates_aggregation=detections_merge_coordinates_aggregation,
+                detections_already_considered=detections_already_considered,
+            )
     consensus_detections = sv.Detections.merge(consensus_detections)
     (
         object_present,
@@ -384,37 +384,43 @@ def agree_on_consensus_for_all_detections_sources(
 
 
 def get_consensus_for_single_detection(
-    detection: sv.Detections,
     source_id: int,
+    detection_index: int,
     detections_from_sources: List[sv.Detections],
+    pairwise_iou: Dict[Tuple[int, int], np.ndarray],
     iou_threshold: float,
-    class_aware: bool,
     required_votes: int,
     confidence: float,
     detections_merge_confidence_aggregation: AggregationMode,
     detections_merge_coordinates_aggregation: AggregationMode,
-    detections_already_considered: Set[str],
-) -> Tuple[List[sv.Detections], Set[str]]:
-    if detection and detection["detection_id"][0] in detections_already_considered:
-        return [], detections_already_considered
-    consensus_detections = []
+    detections_already_considered: List[np.ndarray],
+) -> List[sv.Detections]:
+    """Matches detection with the most overlapping, not yet considered detections from other
+    sources. When consensus is reached - merged detection is returned and all detections
+    taking part in the vote are marked in `detections_already_considered` (in-place).
+    """
+    if detections_already_considered[source_id][detection_index]:
+        return []
     detections_with_max_overlap = (
         get_detections_from_different_sources_with_max_overlap(
-            detection=detection,
-            source=source_id,
-            detections_from_sources=detections_from_sources,
+            source_id=source_id,
+            detection_index=detection_index,
+            pairwise_iou=pairwise_iou,
             iou_threshold=iou_threshold,
-            class_aware=class_aware,
             detections_already_considered=detections_already_considered,
         )
     )
-
     if len(detections_with_max_overlap) < (required_votes - 1):
-        # Returning empty sv.Detections
-        return consensus_detections, detections_already_considered
+        return []
     detections_to_merge = sv.Detections.merge(
-        [detection]
-        + [matched_value[0] for matched_value in detections_with_max_overlap.values()]
+        [detections_from_sources[source_id][detection_index]]
+        + [
+            detections_from_sources[other_source_id][matched_index]
+            for other_source_id, (
+                matched_index,
+                _,
+            ) in detections_with_max_overlap.items()
+        ]
     )
     merged_detection = merge_detections(
         detections=detections_to_merge,
@@ -422,13 +428,14 @@ def get_consensus_for_single_detection(
         boxes_aggregation_mode=detections_merge_coordinates_aggregation,
     )
     if merged_detection.confidence[0] < confidence:
-        # Returning empty sv.Detections
-        return consensus_detections, detections_already_considered
-    consensus_detections.append(merged_detection)
-    detections_already_considered.add(detection[DETECTION_ID_KEY][0])
-    for matched_value in detections_with_max_overlap.values():
-        detections_already_considered.add(matched_value[0][DETECTION_ID_KEY][0])
-    return consensus_detections, detections_already_considered
+        return []
+    merged_detections_ids = detections_to_merge[DETECTION_ID_KEY]
+    for considered, detections in zip(
+        detections_already_considered, detections_from_sources
+    ):
+        if len(detections) > 0:
+            considered |= np.isin(detections[DETECTION_ID_KEY], merged_detections_ids)
+    return [merged_detection]
 
 
 def check_objects_presence_in_consensus_detections(
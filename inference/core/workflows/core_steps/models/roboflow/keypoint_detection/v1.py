@@ -1,5 +1,6 @@
 from typing import List, Literal, Optional, Type, Union
 
+import supervision as sv
 from pydantic import ConfigDict, Field, PositiveInt
 
 from inference.core.entities.requests.inference import (
@@ -19,6 +20,7 @@ from inference.core.workflows.core_steps.common.utils import (
     attach_parents_coordinates_to_batch_of_sv_detections,
     attach_prediction_type_info_to_sv_detections_batch,
     convert_inference_detections_batch_to_sv_detections,
+    convert_native_detections_batch_to_sv_detections,
     filter_out_unwanted_classes_from_sv_detections_batch,
 )
 from inference.core.workflows.execution_engine.constants import INFERENCE_ID_KEY
@@ -270,6 +272,19 @@ class RoboflowKeypointDetectionModelBlockV1(WorkflowBlock):
             model_id=model_id,
             api_key=self._api_key,
         )
+        if self._model_manager.supports_native_inference(model_id=model_id):
+            detections = convert_native_detections_batch_to_sv_detections(
+                predictions=self._model_manager.infer_from_request_native(
+                    model_id=model_id, request=request
+                ),
+                inference_id=request.id,
+            )
+            return self._post_process_detections(
+                images=images,
+                detections=detections,
+                inference_id=request.id,
+                class_filter=class_filter,
+            )
         predictions = self._model_manager.infer_from_request_sync(
             model_id=model_id, request=request
         )
@@ -350,6 +365,20 @@ class RoboflowKeypointDetectionModelBlockV1(WorkflowBlock):
                 inference_prediction=prediction["predictions"],
                 detections=image_detections,
             )
+        return self._post_process_detections(
+            images=images,
+            detections=detections,
+            inference_id=inference_id,
+            class_filter=class_filter,
+        )
+
+    def _post_process_detections(
+        self,
+        images: Batch[WorkflowImageData],
+        detections: List[sv.Detections],
+        inference_id: Optional[str],
+        class_filter: Optional[List[str]],
+    ) -> BlockResult:
         detections = attach_prediction_type_info_to_sv_detections_batch(
             predictions=detections,
             prediction_type="keypoint-detection",
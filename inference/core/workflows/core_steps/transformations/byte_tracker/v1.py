@@ -1,9 +1,16 @@
-from typing import Dict, List, Literal, Optional, Type, Union
+from dataclasses import replace
+from typing import List, Literal, Optional, Type, Union
 
 import supervision as sv
 from pydantic import ConfigDict, Field
 
+from inference.core.workflows.core_steps.common.video_state_store import (
+    VideoStateStore,
+    compose_namespace,
+    compute_config_hash,
+)
 from inference.core.workflows.execution_engine.entities.base import (
+    Batch,
     OutputDefinition,
     VideoMetadata,
 )
@@ -90,6 +97,10 @@ class ByteTrackerBlockManifest(WorkflowBlockManifest):
         examples=[1, "$inputs.min_consecutive_frames"],
     )
 
+    @classmethod
+    def accepts_batch_input(cls) -> bool:
+        return True
+
     @classmethod
     def describe_outputs(cls) -> List[OutputDefinition]:
         return [
@@ -104,8 +115,17 @@ class ByteTrackerBlockManifest(WorkflowBlockManifest):
 class ByteTrackerBlockV1(WorkflowBlock):
     def __init__(
         self,
+        step_name: Optional[str] = None,
+        video_state_namespace: Optional[str] = None,
     ):
-        self._trackers: Dict[str, sv.ByteTrack] = {}
+        namespace = compose_namespace(video_state_namespace, step_name)
+        self._trackers: VideoStateStore[sv.ByteTrack] = VideoStateStore.init_from_env(
+            name="byte_tracker_v1_trackers", namespace=namespace
+        )
+
+    @classmethod
+    def get_init_parameters(cls) -> List[str]:
+        return ["step_name", "video_state_namespace"]
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -113,27 +133,56 @@ class ByteTrackerBlockV1(WorkflowBlock):
 
     def run(
         self,
-        metadata: VideoMetadata,
-        detections: sv.Detections,
+        metadata: Batch[VideoMetadata],
+        detections: Batch[sv.Detections],
         track_activation_threshold: float = 0.25,
         lost_track_buffer: int = 30,
         minimum_matching_threshold: float = 0.8,
         minimum_consecutive_frames: int = 1,
     ) -> BlockResult:
+        return [
+            {
+                OUTPUT_KEY: self._track(
+                    metadata=video_metadata,
+                    detections=video_detections,
+                    track_activation_threshold=track_activation_threshold,
+                    lost_track_buffer=lost_track_buffer,
+                    minimum_matching_threshold=minimum_matching_threshold,
+                    minimum_consecutive_frames=minimum_consecutive_frames,
+                )
+            }
+            for video_metadata, video_detections in zip(metadata, detections)
+        ]
+
+    def _track(
+        self,
+        metadata: VideoMetadata,
+        detections: sv.Detections,
+        track_activation_threshold: float,
+        lost_track_buffer: int,
+        minimum_matching_threshold: float,
+        minimum_consecutive_frames: int,
+    ) -> sv.Detections:
         if not metadata.fps:
             raise ValueError(
                 f"Malformed fps in VideoMetadata, {self.__class__.__name__} requires fps in order to initialize ByteTrack"
             )
-        if metadata.video_identifier not in self._trackers:
-            self._trackers[metadata.video_identifier] = sv.ByteTrack(
+        config_hash = compute_config_hash(
+            track_activation_threshold,
+            lost_track_buffer,
+            minimum_matching_threshold,
+            minimum_consecutive_frames,
+        )
+        tracker = self._trackers.get_or_create(
+            video_identifier=f"{metadata.video_identifier}/{config_hash}",
+            factory=lambda: sv.ByteTrack(
                 track_activation_threshold=track_activation_threshold,
                 lost_track_buffer=lost_track_buffer,
                 minimum_matching_threshold=minimum_matching_threshold,
                 minimum_consecutive_frames=minimum_consecutive_frames,
                 frame_rate=metadata.fps,
-            )
-        tracker = self._trackers[metadata.video_identifier]
-        tracked_detections = tracker.update_with_detections(
-            sv.Detections.merge(detections[i] for i in range(len(detections)))
+            ),
         )
-        return {OUTPUT_KEY: tracked_detections}
+        # tracker assigns tracker_id to detections passed - shallow copy is enough
+        # to keep the input intact, while arrays (including masks) are shared
+        return tracker.update_with_detections(replace(detections))
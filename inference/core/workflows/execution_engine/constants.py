@@ -33,3 +33,4 @@ CLASS_NAME_KEY = "class"
 POLYGON_KEY = "points"
 TRACKER_ID_KEY = "tracker_id"
 INFERENCE_ID_KEY = "inference_id"
+STEP_NAME_INIT_PARAMETER = "step_name"
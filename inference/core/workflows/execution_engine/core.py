@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Type
 
 from packaging.specifiers import SpecifierSet
@@ -35,6 +36,7 @@ class ExecutionEngine(BaseExecutionEngine):
         max_concurrent_steps: int = 1,
         prevent_local_images_loading: bool = False,
         workflow_id: Optional[str] = None,
+        steps_executor: Optional[ThreadPoolExecutor] = None,
     ) -> "ExecutionEngine":
         requested_engine_version = retrieve_requested_execution_engine_version(
             workflow_definition=workflow_definition,
@@ -48,6 +50,7 @@ class ExecutionEngine(BaseExecutionEngine):
             max_concurrent_steps=max_concurrent_steps,
             prevent_local_images_loading=prevent_local_images_loading,
             workflow_id=workflow_id,
+            steps_executor=steps_executor,
         )
         return cls(engine=engine)
 
@@ -69,6 +72,9 @@ class ExecutionEngine(BaseExecutionEngine):
             _is_preview=_is_preview,
         )
 
+    def close(self) -> None:
+        self._engine.close()
+
 
 def retrieve_requested_execution_engine_version(workflow_definition: dict) -> Version:
     raw_version = workflow_definition.get("version")
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 
@@ -13,6 +14,7 @@ class BaseExecutionEngine(ABC):
         max_concurrent_steps: int = 1,
         prevent_local_images_loading: bool = False,
         workflow_id: Optional[str] = None,
+        steps_executor: Optional[ThreadPoolExecutor] = None,
     ) -> "BaseExecutionEngine":
         pass
 
@@ -24,3 +26,7 @@ class BaseExecutionEngine(ABC):
         _is_preview: bool = False,
     ) -> List[Dict[str, Any]]:
         pass
+
+    def close(self) -> None:
+        """Releases resources held by the engine (like threads pools) - engine must not be used afterwards."""
+        pass
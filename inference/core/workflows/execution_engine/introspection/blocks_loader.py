@@ -7,11 +7,6 @@ from typing import Any, Callable, Dict, List, Optional, Union
 from packaging.specifiers import SpecifierSet
 from packaging.version import Version
 
-from inference.core.workflows.core_steps.loader import (
-    REGISTERED_INITIALIZERS,
-    load_blocks,
-    load_kinds,
-)
 from inference.core.workflows.errors import (
     PluginInterfaceError,
     PluginLoadingError,
@@ -33,6 +28,9 @@ from inference.core.workflows.prototypes.block import WorkflowBlock
 
 WORKFLOWS_PLUGINS_ENV = "WORKFLOWS_PLUGINS"
 WORKFLOWS_CORE_PLUGIN_NAME = "workflows_core"
+# core blocks are imported on first use (like plugins), not to pay the price of
+# importing all blocks (and their dependencies) at start of the process
+WORKFLOWS_CORE_BLOCKS_MODULE = "inference.core.workflows.core_steps.loader"
 
 
 def describe_available_blocks(
@@ -132,7 +130,7 @@ def load_workflow_blocks(
 
 
 def load_core_workflow_blocks() -> List[BlockSpecification]:
-    core_blocks = load_blocks()
+    core_blocks = importlib.import_module(WORKFLOWS_CORE_BLOCKS_MODULE).load_blocks()
     already_spotted_blocks = set()
     result = []
     for block in core_blocks:
@@ -244,9 +242,12 @@ def load_initializers() -> Dict[str, Union[Any, Callable[[None], Any]]]:
 
 
 def load_core_blocks_initializers() -> Dict[str, Union[Any, Callable[[None], Any]]]:
+    registered_initializers = importlib.import_module(
+        WORKFLOWS_CORE_BLOCKS_MODULE
+    ).REGISTERED_INITIALIZERS
     return {
         f"{WORKFLOWS_CORE_PLUGIN_NAME}.{parameter_name}": initializer
-        for parameter_name, initializer in REGISTERED_INITIALIZERS.items()
+        for parameter_name, initializer in registered_initializers.items()
     }
 
 
@@ -313,7 +314,9 @@ def _validate_used_kinds_uniqueness(declared_kinds: List[Kind]) -> None:
 
 
 def load_all_defined_kinds() -> List[Kind]:
-    core_blocks_kinds = load_kinds()
+    core_blocks_kinds = importlib.import_module(
+        WORKFLOWS_CORE_BLOCKS_MODULE
+    ).load_kinds()
     plugins_kinds = load_plugins_kinds()
     declared_kinds = core_blocks_kinds + plugins_kinds
     declared_kinds = list(set(declared_kinds))
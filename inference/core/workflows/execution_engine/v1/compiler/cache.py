@@ -0,0 +1,109 @@
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, Generic, List, Optional, TypeVar
+
+from inference.core import logger
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStatistics:
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+
+class BasicWorkflowsCache(Generic[V]):
+    """Thread-safe, bounded LRU cache used to memoise costly Workflows
+    compilation artefacts. Cache of size 0 is disabled - it never stores
+    entries and every lookup is a miss."""
+
+    def __init__(self, max_size: int):
+        self._max_size = max(max_size, 0)
+        self._entries: "OrderedDict[str, V]" = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0
+
+    def get(self, key: Optional[str]) -> Optional[V]:
+        if key is None or not self.enabled:
+            return None
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def cache(self, key: Optional[str], value: V) -> None:
+        if key is None or not self.enabled:
+            return None
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                evicted_key, _ = self._entries.popitem(last=False)
+                logger.debug(f"Evicted entry {evicted_key} from Workflows cache.")
+
+    def invalidate(self, key: str) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get_statistics(self) -> CacheStatistics:
+        with self._lock:
+            return CacheStatistics(
+                size=len(self._entries),
+                max_size=self._max_size,
+                hits=self._hits,
+                misses=self._misses,
+            )
+
+
+def compute_workflow_definition_hash(
+    workflow_definition: Dict[str, Any],
+    discriminators: Optional[List[str]] = None,
+) -> Optional[str]:
+    """Computes canonical hash of Workflow definition - key ordering and
+    whitespace do not influence the result. `discriminators` are mixed into
+    the hash to separate entries compiled in different environments (for
+    instance with different set of plugins). Returns None for definitions
+    that cannot be serialised to JSON - those must not be cached."""
+    try:
+        serialised_definition = json.dumps(
+            workflow_definition,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+    except (TypeError, ValueError):
+        return None
+    hash_state = hashlib.sha256()
+    for discriminator in discriminators or []:
+        hash_state.update(discriminator.encode("utf-8"))
+        hash_state.update(b"\x00")
+    hash_state.update(serialised_definition.encode("utf-8"))
+    return hash_state.hexdigest()
@@ -2,15 +2,22 @@ from typing import Any, Callable, Dict, List, Optional, Union
 
 from packaging.version import Version
 
+from inference.core.env import WORKFLOWS_COMPILATION_CACHE_SIZE
 from inference.core.workflows.execution_engine.entities.base import WorkflowParameter
 from inference.core.workflows.execution_engine.introspection.blocks_loader import (
+    get_plugin_modules,
     load_initializers,
     load_workflow_blocks,
 )
+from inference.core.workflows.execution_engine.v1.compiler.cache import (
+    BasicWorkflowsCache,
+    compute_workflow_definition_hash,
+)
 from inference.core.workflows.execution_engine.v1.compiler.entities import (
     CompiledWorkflow,
     InputSubstitution,
     ParsedWorkflowDefinition,
+    WorkflowDefinitionCompilationResult,
 )
 from inference.core.workflows.execution_engine.v1.compiler.graph_constructor import (
     prepare_execution_graph,
@@ -35,16 +42,54 @@ from inference.core.workflows.execution_engine.v1.dynamic_blocks.block_assembler
 )
 from inference.core.workflows.prototypes.block import WorkflowBlockManifest
 
+COMPILATION_CACHE = BasicWorkflowsCache[WorkflowDefinitionCompilationResult](
+    max_size=WORKFLOWS_COMPILATION_CACHE_SIZE,
+)
+
 
 def compile_workflow(
     workflow_definition: dict,
     init_parameters: Dict[str, Union[Any, Callable[[None], Any]]],
     execution_engine_version: Optional[Version] = None,
 ) -> CompiledWorkflow:
+    cache_key = compute_compilation_cache_key(
+        workflow_definition=workflow_definition,
+        execution_engine_version=execution_engine_version,
+    )
+    compilation_result = COMPILATION_CACHE.get(key=cache_key)
+    if compilation_result is None:
+        compilation_result = compile_workflow_definition(
+            workflow_definition=workflow_definition,
+            execution_engine_version=execution_engine_version,
+        )
+        COMPILATION_CACHE.cache(key=cache_key, value=compilation_result)
+    # steps are initialised on each call, as init parameters (like API key or
+    # background tasks) are request-scoped and blocks may be stateful
+    initializers = load_initializers()
+    steps = initialise_steps(
+        steps_manifest=compilation_result.parsed_workflow_definition.steps,
+        available_bocks=compilation_result.available_blocks,
+        explicit_init_parameters=init_parameters,
+        initializers=initializers,
+    )
+    steps_by_name = {step.manifest.name: step for step in steps}
+    return CompiledWorkflow(
+        workflow_definition=compilation_result.parsed_workflow_definition,
+        workflow_json=workflow_definition,
+        init_parameters=init_parameters,
+        execution_graph=compilation_result.execution_graph,
+        steps=steps_by_name,
+        input_substitutions=compilation_result.input_substitutions,
+    )
+
+
+def compile_workflow_definition(
+    workflow_definition: dict,
+    execution_engine_version: Optional[Version] = None,
+) -> WorkflowDefinitionCompilationResult:
     statically_defined_blocks = load_workflow_blocks(
         execution_engine_version=execution_engine_version
     )
-    initializers = load_initializers()
     dynamic_blocks = compile_dynamic_blocks(
         dynamic_blocks_definitions=workflow_definition.get(
             "dynamic_blocks_definitions", []
@@ -59,27 +104,38 @@ def compile_workflow(
     execution_graph = prepare_execution_graph(
         workflow_definition=parsed_workflow_definition,
     )
-    steps = initialise_steps(
-        steps_manifest=parsed_workflow_definition.steps,
-        available_bocks=statically_defined_blocks + dynamic_blocks,
-        explicit_init_parameters=init_parameters,
-        initializers=initializers,
-    )
     input_substitutions = collect_input_substitutions(
         workflow_definition=parsed_workflow_definition,
     )
-    steps_by_name = {step.manifest.name: step for step in steps}
     dump_execution_graph(execution_graph=execution_graph)
-    return CompiledWorkflow(
-        workflow_definition=parsed_workflow_definition,
-        workflow_json=workflow_definition,
-        init_parameters=init_parameters,
+    return WorkflowDefinitionCompilationResult(
+        parsed_workflow_definition=parsed_workflow_definition,
         execution_graph=execution_graph,
-        steps=steps_by_name,
         input_substitutions=input_substitutions,
+        available_blocks=statically_defined_blocks + dynamic_blocks,
     )
 
 
+def compute_compilation_cache_key(
+    workflow_definition: dict,
+    execution_engine_version: Optional[Version] = None,
+) -> Optional[str]:
+    if not COMPILATION_CACHE.enabled:
+        return None
+    if workflow_definition.get("dynamic_blocks_definitions"):
+        # dynamic blocks carry custom Python code, which must be compiled
+        # in isolation for each Workflow instance
+        return None
+    return compute_workflow_definition_hash(
+        workflow_definition=workflow_definition,
+        discriminators=[str(execution_engine_version)] + get_plugin_modules(),
+    )
+
+
+def clear_compilation_cache() -> None:
+    COMPILATION_CACHE.clear()
+
+
 def collect_input_substitutions(
     workflow_definition: ParsedWorkflowDefinition,
 ) -> List[InputSubstitution]:
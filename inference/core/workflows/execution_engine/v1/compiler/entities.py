@@ -45,6 +45,14 @@ class InputSubstitution:
     manifest_property: str
 
 
+@dataclass(frozen=True)
+class WorkflowDefinitionCompilationResult:
+    parsed_workflow_definition: ParsedWorkflowDefinition
+    execution_graph: nx.DiGraph
+    input_substitutions: List[InputSubstitution]
+    available_blocks: List[BlockSpecification]
+
+
 @dataclass(frozen=True)
 class CompiledWorkflow:
     workflow_definition: ParsedWorkflowDefinition
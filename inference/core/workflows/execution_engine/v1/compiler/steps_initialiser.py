@@ -5,6 +5,7 @@ from inference.core.workflows.errors import (
     BlockInterfaceError,
     UnknownManifestType,
 )
+from inference.core.workflows.execution_engine.constants import STEP_NAME_INIT_PARAMETER
 from inference.core.workflows.execution_engine.v1.compiler.entities import (
     BlockSpecification,
     InitialisedStep,
@@ -98,6 +99,8 @@ def retrieve_init_parameter_values(
     explicit_init_parameters: Dict[str, Union[Any, Callable[[None], Any]]],
     initializers: Dict[str, Union[Any, Callable[[None], Any]]],
 ) -> Any:
+    if block_init_parameter == STEP_NAME_INIT_PARAMETER:
+        return block_name
     full_parameter_name = f"{block_source}.{block_init_parameter}"
     if full_parameter_name in explicit_init_parameters:
         return explicit_init_parameters[full_parameter_name]
@@ -1,3 +1,5 @@
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from packaging.version import Version
@@ -30,6 +32,7 @@ class ExecutionEngineV1(BaseExecutionEngine):
         max_concurrent_steps: int = 1,
         prevent_local_images_loading: bool = False,
         workflow_id: Optional[str] = None,
+        steps_executor: Optional[ThreadPoolExecutor] = None,
     ) -> "ExecutionEngineV1":
         if init_parameters is None:
             init_parameters = {}
@@ -43,6 +46,7 @@ class ExecutionEngineV1(BaseExecutionEngine):
             max_concurrent_steps=max_concurrent_steps,
             prevent_local_images_loading=prevent_local_images_loading,
             workflow_id=workflow_id,
+            steps_executor=steps_executor,
         )
 
     def __init__(
@@ -51,11 +55,24 @@ class ExecutionEngineV1(BaseExecutionEngine):
         max_concurrent_steps: int,
         prevent_local_images_loading: bool,
         workflow_id: Optional[str] = None,
+        steps_executor: Optional[ThreadPoolExecutor] = None,
     ):
         self._compiled_workflow = compiled_workflow
         self._max_concurrent_steps = max_concurrent_steps
         self._prevent_local_images_loading = prevent_local_images_loading
         self._workflow_id = workflow_id
+        self._steps_executor = steps_executor
+        self._steps_executor_finalizer = None
+        if steps_executor is None:
+            # pool owned by the engine is shut down on `close()` - or once the engine
+            # is garbage collected, if the caller never closes it
+            self._steps_executor = ThreadPoolExecutor(
+                max_workers=max_concurrent_steps,
+                thread_name_prefix="workflow_step",
+            )
+            self._steps_executor_finalizer = weakref.finalize(
+                self, self._steps_executor.shutdown, wait=False
+            )
 
     def run(
         self,
@@ -76,7 +93,12 @@ class ExecutionEngineV1(BaseExecutionEngine):
             workflow=self._compiled_workflow,
             runtime_parameters=runtime_parameters,
             max_concurrent_steps=self._max_concurrent_steps,
+            executor=self._steps_executor,
             usage_fps=fps,
             usage_workflow_id=self._workflow_id,
             usage_workflow_preview=_is_preview,
         )
+
+    def close(self) -> None:
+        if self._steps_executor_finalizer is not None:
+            self._steps_executor_finalizer()
@@ -1,6 +1,7 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from functools import partial
-from typing import Any, Dict, List
+from typing import Any, Deque, Dict, List, Optional
 
 from inference.core import logger
 from inference.core.workflows.errors import (
@@ -18,14 +19,11 @@ from inference.core.workflows.execution_engine.v1.executor.execution_data_manage
     ExecutionDataManager,
 )
 from inference.core.workflows.execution_engine.v1.executor.flow_coordinator import (
-    ParallelStepExecutionCoordinator,
+    DataFlowStepExecutionCoordinator,
 )
 from inference.core.workflows.execution_engine.v1.executor.output_constructor import (
     construct_workflow_output,
 )
-from inference.core.workflows.execution_engine.v1.executor.utils import (
-    run_steps_in_parallel,
-)
 from inference.core.workflows.prototypes.block import WorkflowBlock
 from inference.usage_tracking.collector import usage_collector
 from inference_sdk.http.utils.iterables import make_batches
@@ -36,23 +34,32 @@ def run_workflow(
     workflow: CompiledWorkflow,
     runtime_parameters: Dict[str, Any],
     max_concurrent_steps: int,
+    executor: Optional[ThreadPoolExecutor] = None,
 ) -> List[Dict[str, Any]]:
     execution_data_manager = ExecutionDataManager.init(
         execution_graph=workflow.execution_graph,
         runtime_parameters=runtime_parameters,
     )
-    execution_coordinator = ParallelStepExecutionCoordinator.init(
+    execution_coordinator = DataFlowStepExecutionCoordinator.init(
         execution_graph=workflow.execution_graph,
     )
-    next_steps = execution_coordinator.get_steps_to_execute_next()
-    while next_steps is not None:
-        execute_steps(
-            next_steps=next_steps,
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=max_concurrent_steps) as executor:
+            execute_steps_in_data_flow_order(
+                workflow=workflow,
+                execution_coordinator=execution_coordinator,
+                execution_data_manager=execution_data_manager,
+                executor=executor,
+                max_concurrent_steps=max_concurrent_steps,
+            )
+    else:
+        execute_steps_in_data_flow_order(
             workflow=workflow,
+            execution_coordinator=execution_coordinator,
             execution_data_manager=execution_data_manager,
+            executor=executor,
             max_concurrent_steps=max_concurrent_steps,
         )
-        next_steps = execution_coordinator.get_steps_to_execute_next()
     return construct_workflow_output(
         workflow_outputs=workflow.workflow_definition.outputs,
         execution_graph=workflow.execution_graph,
@@ -60,23 +67,56 @@ def run_workflow(
     )
 
 
-def execute_steps(
-    next_steps: List[str],
+def execute_steps_in_data_flow_order(
     workflow: CompiledWorkflow,
+    execution_coordinator: DataFlowStepExecutionCoordinator,
     execution_data_manager: ExecutionDataManager,
+    executor: ThreadPoolExecutor,
     max_concurrent_steps: int,
 ) -> None:
-    logger.info(f"Executing steps: {next_steps}.")
-    steps_functions = [
-        partial(
-            safe_execute_step,
-            step_selector=step_selector,
-            workflow=workflow,
-            execution_data_manager=execution_data_manager,
+    # executor may be shared with other runs - no more than `max_concurrent_steps`
+    # steps of this run are submitted at a time, ready steps beyond that wait here
+    max_steps_in_progress = max(max_concurrent_steps, 1)
+    steps_in_progress: Dict[Future, str] = {}
+    ready_steps: Deque[str] = deque()
+    first_error: Optional[Exception] = None
+    next_steps = execution_coordinator.get_steps_to_execute_next()
+    ready_steps.extend(next_steps or [])
+    while steps_in_progress or (ready_steps and first_error is None):
+        if first_error is None:
+            while ready_steps and len(steps_in_progress) < max_steps_in_progress:
+                step_selector = ready_steps.popleft()
+                logger.info(f"Executing step: {step_selector}.")
+                future = executor.submit(
+                    safe_execute_step,
+                    step_selector=step_selector,
+                    workflow=workflow,
+                    execution_data_manager=execution_data_manager,
+                )
+                steps_in_progress[future] = step_selector
+        done, _ = wait(steps_in_progress, return_when=FIRST_COMPLETED)
+        for future in done:
+            step_selector = steps_in_progress.pop(future)
+            error = future.exception()
+            if error is not None:
+                first_error = first_error or error
+                continue
+            execution_coordinator.mark_step_as_executed(step_selector=step_selector)
+        next_steps = execution_coordinator.get_steps_to_execute_next()
+        ready_steps.extend(next_steps or [])
+    if first_error is not None:
+        # steps already in progress are awaited not to let them alter
+        # execution data once the error is propagated
+        raise first_error
+    if next_steps is not None:
+        raise ExecutionEngineRuntimeError(
+            public_message=f"Error in execution engine. Could not establish order of steps execution "
+            f"- steps are left with unmet dependencies. This is most likely bug. "
+            f"Contact Roboflow team through github issues "
+            f"(https://github.com/roboflow/inference/issues) providing full context of"
+            f"the problem - including workflow definition you use.",
+            context="workflow_execution | steps_scheduling",
         )
-        for step_selector in next_steps
-    ]
-    _ = run_steps_in_parallel(steps=steps_functions, max_workers=max_concurrent_steps)
 
 
 def safe_execute_step(
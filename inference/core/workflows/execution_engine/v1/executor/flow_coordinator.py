@@ -4,10 +4,6 @@ from typing import List, Optional
 import networkx as nx
 
 from inference.core.workflows.execution_engine.v1.compiler.entities import NodeCategory
-from inference.core.workflows.execution_engine.v1.compiler.graph_traversal import (
-    assign_max_distances_from_start,
-    group_nodes_by_sorted_key_value,
-)
 from inference.core.workflows.execution_engine.v1.compiler.utils import (
     get_nodes_of_specific_category,
 )
@@ -24,55 +20,61 @@ class StepExecutionCoordinator(metaclass=abc.ABCMeta):
     def get_steps_to_execute_next(self) -> Optional[List[str]]:
         pass
 
+    @abc.abstractmethod
+    def mark_step_as_executed(self, step_selector: str) -> None:
+        pass
+
 
-class ParallelStepExecutionCoordinator(StepExecutionCoordinator):
+class DataFlowStepExecutionCoordinator(StepExecutionCoordinator):
+    """Coordinator releasing each step as soon as all of its predecessors
+    in the execution graph are executed, instead of waiting for whole layer
+    of the graph to finish. Caller is expected to report finished steps via
+    `mark_step_as_executed(...)` - `get_steps_to_execute_next()` returns
+    empty list when no step is ready at the moment and None once all
+    steps are dispatched."""
 
     @classmethod
-    def init(cls, execution_graph: nx.DiGraph) -> "StepExecutionCoordinator":
+    def init(cls, execution_graph: nx.DiGraph) -> "DataFlowStepExecutionCoordinator":
         return cls(execution_graph=execution_graph)
 
     def __init__(self, execution_graph: nx.DiGraph):
-        self._execution_graph = execution_graph.copy()
-        self.__execution_order: Optional[List[List[str]]] = None
-        self.__execution_pointer = 0
+        super_start_node = "<start>"
+        steps_flow_graph = construct_steps_flow_graph(
+            execution_graph=execution_graph,
+            super_start_node=super_start_node,
+        )
+        steps_flow_graph.remove_node(super_start_node)
+        self._successors = {
+            step: list(steps_flow_graph.successors(step))
+            for step in steps_flow_graph.nodes
+        }
+        self._pending_predecessors = {
+            step: steps_flow_graph.in_degree(step) for step in steps_flow_graph.nodes
+        }
+        self._ready_steps = [
+            step
+            for step, predecessors in self._pending_predecessors.items()
+            if predecessors == 0
+        ]
+        self._not_dispatched_steps = set(steps_flow_graph.nodes)
+        self._executed_steps = set()
 
     def get_steps_to_execute_next(self) -> Optional[List[str]]:
-        if self.__execution_order is None:
-            self.__execution_order = establish_execution_order(
-                execution_graph=self._execution_graph
-            )
-            self.__execution_pointer = 0
-        next_step = None
-        while self.__execution_pointer < len(self.__execution_order):
-            candidate_steps = [
-                e for e in self.__execution_order[self.__execution_pointer]
-            ]
-            self.__execution_pointer += 1
-            if len(candidate_steps) == 0:
-                continue
-            return candidate_steps
-        return next_step
-
+        if not self._not_dispatched_steps:
+            return None
+        ready_steps = self._ready_steps
+        self._ready_steps = []
+        self._not_dispatched_steps.difference_update(ready_steps)
+        return ready_steps
 
-def establish_execution_order(
-    execution_graph: nx.DiGraph,
-) -> List[List[str]]:
-    super_start_node = "<start>"
-    steps_flow_graph = construct_steps_flow_graph(
-        execution_graph=execution_graph,
-        super_start_node=super_start_node,
-    )
-    distance_key = "distance"
-    steps_flow_graph = assign_max_distances_from_start(
-        graph=steps_flow_graph,
-        start_node=super_start_node,
-        distance_key=distance_key,
-    )
-    return group_nodes_by_sorted_key_value(
-        graph=steps_flow_graph,
-        excluded_nodes={super_start_node},
-        key=distance_key,
-    )
+    def mark_step_as_executed(self, step_selector: str) -> None:
+        if step_selector in self._executed_steps:
+            return None
+        self._executed_steps.add(step_selector)
+        for successor in self._successors.get(step_selector, []):
+            self._pending_predecessors[successor] -= 1
+            if self._pending_predecessors[successor] == 0:
+                self._ready_steps.append(successor)
 
 
 def construct_steps_flow_graph(
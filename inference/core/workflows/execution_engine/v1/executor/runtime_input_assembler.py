@@ -1,10 +1,13 @@
 import os.path
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any, Dict, List, Optional
 
 import cv2
 import numpy as np
 from pydantic import ValidationError
 
+from inference.core.env import URL_IMAGES_FETCH_MAX_WORKERS
 from inference.core.utils.image_utils import (
     attempt_loading_image_from_string,
     load_image_from_url,
@@ -86,15 +89,18 @@ def assemble_input_image(
                 prevent_local_images_loading=prevent_local_images_loading,
             )
         ] * input_batch_size
-    result = [
-        _assemble_input_image(
-            parameter=parameter,
-            image=element,
-            identifier=idx,
-            prevent_local_images_loading=prevent_local_images_loading,
-        )
-        for idx, element in enumerate(image)
-    ]
+    assemble_element = partial(
+        _assemble_input_image,
+        parameter,
+        prevent_local_images_loading=prevent_local_images_loading,
+    )
+    urls_to_fetch = sum(1 for element in image if _is_image_url(element))
+    if urls_to_fetch > 1 and URL_IMAGES_FETCH_MAX_WORKERS > 1:
+        max_workers = min(urls_to_fetch, URL_IMAGES_FETCH_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            result = list(executor.map(assemble_element, image, range(len(image))))
+    else:
+        result = [assemble_element(element, idx) for idx, element in enumerate(image)]
     if len(result) != input_batch_size:
         raise RuntimeInputError(
             public_message="Expected all batch-oriented workflow inputs be the same length, or of length 1 - "
@@ -105,6 +111,14 @@ def assemble_input_image(
     return result
 
 
+def _is_image_url(image: Any) -> bool:
+    if isinstance(image, dict):
+        image = image.get("value")
+    return isinstance(image, str) and (
+        image.startswith("http://") or image.startswith("https://")
+    )
+
+
 def _assemble_input_image(
     parameter: str,
     image: Any,
@@ -1,3 +1,6 @@
+import importlib
+from typing import Any, Dict
+
 from inference.core.env import (
     CORE_MODEL_CLIP_ENABLED,
     CORE_MODEL_COGVLM_ENABLED,
@@ -10,80 +13,70 @@ from inference.core.env import (
     CORE_MODELS_ENABLED,
 )
 
-if CORE_MODELS_ENABLED:
-    if CORE_MODEL_CLIP_ENABLED:
-        try:
-            from inference.models.clip import Clip
-        except:
-            pass
-
-    if CORE_MODEL_GAZE_ENABLED:
-        try:
-            from inference.models.gaze import Gaze
-        except:
-            pass
+# Model classes are imported on first access - such that importing the package does not
+# pull heavy dependencies (like torch or transformers) of models which are never used.
+# Core models disabled by env flags are not exposed at all.
+_CORE_MODELS = {
+    "Clip": ("inference.models.clip", CORE_MODEL_CLIP_ENABLED),
+    "Gaze": ("inference.models.gaze", CORE_MODEL_GAZE_ENABLED),
+    "SegmentAnything": ("inference.models.sam", CORE_MODEL_SAM_ENABLED),
+    "SegmentAnything2": ("inference.models.sam2", CORE_MODEL_SAM2_ENABLED),
+    "DocTR": ("inference.models.doctr", CORE_MODEL_DOCTR_ENABLED),
+    "GroundingDINO": (
+        "inference.models.grounding_dino",
+        CORE_MODEL_GROUNDINGDINO_ENABLED,
+    ),
+    "CogVLM": ("inference.models.cogvlm", CORE_MODEL_COGVLM_ENABLED),
+    "YOLOWorld": ("inference.models.yolo_world", CORE_MODEL_YOLO_WORLD_ENABLED),
+}
 
-    if CORE_MODEL_SAM_ENABLED:
-        try:
-            from inference.models.sam import SegmentAnything
-        except:
-            pass
+_MODELS = {
+    "PaliGemma": "inference.models.paligemma",
+    "LoRAPaliGemma": "inference.models.paligemma",
+    "Florence2": "inference.models.florence2",
+    "LoRAFlorence2": "inference.models.florence2",
+    "TrOCR": "inference.models.trocr",
+    "VitClassification": "inference.models.vit",
+    "YOLACT": "inference.models.yolact",
+    "YOLONASObjectDetection": "inference.models.yolonas",
+    "YOLOv5InstanceSegmentation": "inference.models.yolov5",
+    "YOLOv5ObjectDetection": "inference.models.yolov5",
+    "YOLOv7InstanceSegmentation": "inference.models.yolov7",
+    "YOLOv8Classification": "inference.models.yolov8",
+    "YOLOv8InstanceSegmentation": "inference.models.yolov8",
+    "YOLOv8KeypointsDetection": "inference.models.yolov8",
+    "YOLOv8ObjectDetection": "inference.models.yolov8",
+    "YOLOv9ObjectDetection": "inference.models.yolov9",
+    "YOLOv10ObjectDetection": "inference.models.yolov10",
+}
 
-    if CORE_MODEL_SAM2_ENABLED:
-        try:
-            from inference.models.sam2 import SegmentAnything2
-        except:
-            pass
 
-    if CORE_MODEL_DOCTR_ENABLED:
-        try:
-            from inference.models.doctr import DocTR
-        except:
-            pass
+def _get_available_models() -> Dict[str, str]:
+    available_models = {}
+    if CORE_MODELS_ENABLED:
+        available_models.update(
+            {
+                name: module
+                for name, (module, enabled) in _CORE_MODELS.items()
+                if enabled
+            }
+        )
+    available_models.update(_MODELS)
+    return available_models
 
-    if CORE_MODEL_GROUNDINGDINO_ENABLED:
-        try:
-            from inference.models.grounding_dino import GroundingDINO
-        except:
-            pass
 
-    if CORE_MODEL_COGVLM_ENABLED:
-        try:
-            from inference.models.cogvlm import CogVLM
-        except:
-            pass
+_AVAILABLE_MODELS = _get_available_models()
 
-    if CORE_MODEL_YOLO_WORLD_ENABLED:
-        try:
-            from inference.models.yolo_world import YOLOWorld
-        except:
-            pass
+__all__ = list(_AVAILABLE_MODELS.keys())
 
-try:
-    from inference.models.paligemma import LoRAPaliGemma, PaliGemma
-except:
-    pass
 
-try:
-    from inference.models.florence2 import Florence2, LoRAFlorence2
-except:
-    pass
+def __getattr__(name: str) -> Any:
+    if name not in _AVAILABLE_MODELS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_AVAILABLE_MODELS[name]), name)
+    globals()[name] = value
+    return value
 
-try:
-    from inference.models.trocr import TrOCR
-except:
-    pass
 
-from inference.models.vit import VitClassification
-from inference.models.yolact import YOLACT
-from inference.models.yolonas import YOLONASObjectDetection
-from inference.models.yolov5 import YOLOv5InstanceSegmentation, YOLOv5ObjectDetection
-from inference.models.yolov7 import YOLOv7InstanceSegmentation
-from inference.models.yolov8 import (
-    YOLOv8Classification,
-    YOLOv8InstanceSegmentation,
-    YOLOv8KeypointsDetection,
-    YOLOv8ObjectDetection,
-)
-from inference.models.yolov9 import YOLOv9ObjectDetection
-from inference.models.yolov10 import YOLOv10ObjectDetection
+def __dir__():
+    return sorted(list(globals().keys()) + __all__)
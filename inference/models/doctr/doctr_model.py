@@ -1,6 +1,7 @@
 import os
 import shutil
 import tempfile
+import threading
 from time import perf_counter
 from typing import Any, List, Union
 
@@ -54,6 +55,9 @@ class DocTR(RoboflowCoreModel):
             reco_arch=self.rec_model.version_id,
             pretrained=True,
         )
+        # DocTR predictor is not documented as thread-safe - requests served concurrently
+        # run it one at a time
+        self.model_lock = threading.Lock()
         self.task_type = "ocr"
 
     def clear_cache(self) -> None:
@@ -99,7 +103,8 @@ class DocTR(RoboflowCoreModel):
 
             doc = DocumentFile.from_images([f.name])
 
-            result = self.model(doc).export()
+            with self.model_lock:
+                result = self.model(doc).export()
 
             result = result["pages"][0]["blocks"]
 
@@ -1,7 +1,8 @@
 import base64
+import threading
 from io import BytesIO
 from time import perf_counter
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import onnxruntime
@@ -10,6 +11,7 @@ import torch
 from segment_anything import SamPredictor, sam_model_registry
 from shapely.geometry import Polygon as ShapelyPolygon
 
+from inference.core.cache.embeddings import build_embeddings_cache
 from inference.core.entities.requests.inference import InferenceRequestImage
 from inference.core.entities.requests.sam import (
     SamEmbeddingRequest,
@@ -20,8 +22,13 @@ from inference.core.entities.responses.sam import (
     SamEmbeddingResponse,
     SamSegmentationResponse,
 )
-from inference.core.env import SAM_MAX_EMBEDDING_CACHE_SIZE, SAM_VERSION_ID
+from inference.core.env import (
+    SAM_MAX_EMBEDDING_CACHE_SIZE,
+    SAM_MAX_EMBEDDING_CACHE_SIZE_MB,
+    SAM_VERSION_ID,
+)
 from inference.core.models.roboflow import RoboflowCoreModel
+from inference.core.utils.hash import get_image_hash
 from inference.core.utils.image_utils import load_image_rgb
 from inference.core.utils.postprocess import masks2poly
 
@@ -32,12 +39,10 @@ class SegmentAnything(RoboflowCoreModel):
     Attributes:
         sam: The segmentation model.
         predictor: The predictor for the segmentation model.
+        predictor_lock: Serialises use of the (stateful) predictor across concurrent requests.
         ort_session: ONNX runtime inference session.
-        embedding_cache: Cache for embeddings.
-        image_size_cache: Cache for image sizes.
-        embedding_cache_keys: Keys for the embedding cache.
+        embedding_cache: Cache for embeddings and image sizes, keyed by image hash.
         low_res_logits_cache: Cache for low resolution logits.
-        segmentation_cache_keys: Keys for the segmentation cache.
     """
 
     def __init__(self, *args, model_id: str = f"sam/{SAM_VERSION_ID}", **kwargs):
@@ -53,6 +58,9 @@ class SegmentAnything(RoboflowCoreModel):
         )
         self.sam.to(device="cuda" if torch.cuda.is_available() else "cpu")
         self.predictor = SamPredictor(self.sam)
+        # predictor keeps features of the last image set as its state - concurrent requests
+        # must not interleave between setting the image and reading its embedding
+        self.predictor_lock = threading.Lock()
         self.ort_session = onnxruntime.InferenceSession(
             self.cache_file("decoder.onnx"),
             providers=[
@@ -61,12 +69,18 @@ class SegmentAnything(RoboflowCoreModel):
                 "CPUExecutionProvider",
             ],
         )
-        self.embedding_cache = {}
-        self.image_size_cache = {}
-        self.embedding_cache_keys = []
-
-        self.low_res_logits_cache = {}
-        self.segmentation_cache_keys = []
+        self.embedding_cache = build_embeddings_cache(
+            model_id=model_id,
+            max_entries=SAM_MAX_EMBEDDING_CACHE_SIZE,
+            max_size_mb=SAM_MAX_EMBEDDING_CACHE_SIZE_MB,
+            serializer=serialize_embedding,
+            deserializer=deserialize_embedding,
+        )
+        self.low_res_logits_cache = build_embeddings_cache(
+            model_id=model_id,
+            max_entries=SAM_MAX_EMBEDDING_CACHE_SIZE,
+            max_size_mb=SAM_MAX_EMBEDDING_CACHE_SIZE_MB,
+        )
         self.task_type = "unsupervised-segmentation"
 
     def get_infer_bucket_file_list(self) -> List[str]:
@@ -79,8 +93,8 @@ class SegmentAnything(RoboflowCoreModel):
 
     def embed_image(self, image: Any, image_id: Optional[str] = None, **kwargs):
         """
-        Embeds an image and caches the result if an image_id is provided. If the image has been embedded before and cached,
-        the cached result will be returned.
+        Embeds an image and caches the result under the image hash (and image_id, if provided). If the image has
+        been embedded before and cached, the cached result will be returned.
 
         Args:
             image (Any): The image to be embedded. The format should be compatible with the preproc_image method.
@@ -94,31 +108,37 @@ class SegmentAnything(RoboflowCoreModel):
 
         Notes:
             - Embeddings and image sizes are cached to improve performance on repeated requests for the same image.
-            - The cache has a maximum size defined by SAM_MAX_EMBEDDING_CACHE_SIZE. When the cache exceeds this size,
-              the oldest entries are removed.
+            - The cache has a maximum size defined by SAM_MAX_EMBEDDING_CACHE_SIZE and SAM_MAX_EMBEDDING_CACHE_SIZE_MB.
+              When the cache exceeds this size, the least recently used entries are removed. If EMBEDDINGS_DISK_CACHE_DIR
+              is set, embeddings are persisted on disk and survive model reloads.
 
         Example:
             >>> img_array = ... # some image array
             >>> embed_image(img_array, image_id="sample123")
             (array([...]), (224, 224))
         """
-        if image_id and image_id in self.embedding_cache:
-            return (
-                self.embedding_cache[image_id],
-                self.image_size_cache[image_id],
+        if image_id:
+            cached_embedding = self.embedding_cache.get(
+                image_id, count_miss=image is None
+            )
+            if cached_embedding is not None:
+                return cached_embedding
+        if image is None:
+            raise ValueError(
+                f"Image ID {image_id} not in embedding cache, must provide the image or embeddings"
             )
         img_in = self.preproc_image(image)
-        self.predictor.set_image(img_in)
-        embedding = self.predictor.get_image_embedding().cpu().numpy()
+        image_hash = get_image_hash(img_in)
+        cached_embedding = self.embedding_cache.get(image_hash)
+        if cached_embedding is None:
+            with self.predictor_lock:
+                self.predictor.set_image(img_in)
+                embedding = self.predictor.get_image_embedding().cpu().numpy()
+            cached_embedding = (embedding, img_in.shape[:2])
+            self.embedding_cache.put(image_hash, cached_embedding)
         if image_id:
-            self.embedding_cache[image_id] = embedding
-            self.image_size_cache[image_id] = img_in.shape[:2]
-            self.embedding_cache_keys.append(image_id)
-            if len(self.embedding_cache_keys) > SAM_MAX_EMBEDDING_CACHE_SIZE:
-                cache_key = self.embedding_cache_keys.pop(0)
-                del self.embedding_cache[cache_key]
-                del self.image_size_cache[cache_key]
-        return (embedding, img_in.shape[:2])
+            self.embedding_cache.add_alias(alias=image_id, key=image_hash)
+        return cached_embedding
 
     def infer_from_request(self, request: SamInferenceRequest):
         """Performs inference based on the request type.
@@ -225,18 +245,14 @@ class SegmentAnything(RoboflowCoreModel):
         Notes:
             - Embeddings, segmentations, and low-resolution logits can be cached to improve performance
               on repeated requests for the same image.
-            - The cache has a maximum size defined by SAM_MAX_EMBEDDING_CACHE_SIZE. When the cache exceeds this size,
-              the oldest entries are removed.
+            - The cache has a maximum size defined by SAM_MAX_EMBEDDING_CACHE_SIZE and SAM_MAX_EMBEDDING_CACHE_SIZE_MB.
+              When the cache exceeds this size, the least recently used entries are removed.
         """
         if not embeddings:
             if not image and not image_id:
                 raise ValueError(
                     "Must provide either image, cached image_id, or embeddings"
                 )
-            elif image_id and not image and image_id not in self.embedding_cache:
-                raise ValueError(
-                    f"Image ID {image_id} not in embedding cache, must provide the image or embeddings"
-                )
             embedding, original_image_size = self.embed_image(
                 image=image, image_id=image_id
             )
@@ -306,13 +322,22 @@ class SegmentAnything(RoboflowCoreModel):
         }
         masks, _, low_res_logits = self.ort_session.run(None, ort_inputs)
         if image_id:
-            self.low_res_logits_cache[image_id] = low_res_logits
-            if image_id not in self.segmentation_cache_keys:
-                self.segmentation_cache_keys.append(image_id)
-            if len(self.segmentation_cache_keys) > SAM_MAX_EMBEDDING_CACHE_SIZE:
-                cache_key = self.segmentation_cache_keys.pop(0)
-                del self.low_res_logits_cache[cache_key]
+            self.low_res_logits_cache.put(image_id, low_res_logits)
         masks = masks[0]
         low_res_masks = low_res_logits[0]
 
         return masks, low_res_masks
+
+
+def serialize_embedding(
+    cached_embedding: Tuple[np.ndarray, Tuple[int, int]]
+) -> Dict[str, np.ndarray]:
+    embedding, image_size = cached_embedding
+    return {"embedding": embedding, "image_size": np.asarray(image_size)}
+
+
+def deserialize_embedding(
+    arrays: Dict[str, np.ndarray]
+) -> Tuple[np.ndarray, Tuple[int, int]]:
+    image_size = tuple(int(e) for e in arrays["image_size"])
+    return arrays["embedding"], image_size
@@ -1,5 +1,6 @@
 import copy
 import hashlib
+import threading
 from io import BytesIO
 from time import perf_counter
 from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union
@@ -16,6 +17,7 @@ sam2.utils.misc.get_sdp_backends = lambda z: [
 from sam2.build_sam import build_sam2
 from sam2.sam2_image_predictor import SAM2ImagePredictor
 
+from inference.core.cache.embeddings import EmbeddingsCache, build_embeddings_cache
 from inference.core.entities.requests.inference import InferenceRequestImage
 from inference.core.entities.requests.sam2 import (
     Sam2EmbeddingRequest,
@@ -33,10 +35,13 @@ from inference.core.env import (
     DEVICE,
     DISABLE_SAM2_LOGITS_CACHE,
     SAM2_MAX_EMBEDDING_CACHE_SIZE,
+    SAM2_MAX_EMBEDDING_CACHE_SIZE_MB,
     SAM2_MAX_LOGITS_CACHE_SIZE,
+    SAM2_MAX_LOGITS_CACHE_SIZE_MB,
     SAM2_VERSION_ID,
 )
 from inference.core.models.roboflow import RoboflowCoreModel
+from inference.core.utils.hash import get_image_hash
 from inference.core.utils.image_utils import load_image_rgb
 from inference.core.utils.postprocess import masks2multipoly
 
@@ -55,10 +60,10 @@ class SegmentAnything2(RoboflowCoreModel):
     Attributes:
         sam: The segmentation model.
         predictor: The predictor for the segmentation model.
+        predictor_lock: Serialises use of the (stateful) predictor across concurrent requests.
         ort_session: ONNX runtime inference session.
-        embedding_cache: Cache for embeddings.
-        image_size_cache: Cache for image sizes.
-        embedding_cache_keys: Keys for the embedding cache.
+        embedding_cache: Cache for embeddings and image sizes, keyed by image hash.
+        low_res_logits_cache: Cache for low resolution logits.
 
     """
 
@@ -90,12 +95,22 @@ class SegmentAnything2(RoboflowCoreModel):
         self.embedding_cache_size = embedding_cache_size
 
         self.predictor = SAM2ImagePredictor(self.sam)
-
-        self.embedding_cache = {}
-        self.image_size_cache = {}
-        self.embedding_cache_keys = []
-        self.low_res_logits_cache: Dict[Tuple[str, str], LogitsCacheType] = {}
-        self.low_res_logits_cache_keys = []
+        # predictor keeps the features of the image being segmented as its state - requests
+        # served concurrently must not interleave between setting that state and predicting
+        self.predictor_lock = threading.Lock()
+
+        self.embedding_cache = build_embeddings_cache(
+            model_id=model_id,
+            max_entries=embedding_cache_size,
+            max_size_mb=SAM2_MAX_EMBEDDING_CACHE_SIZE_MB,
+            serializer=serialize_embedding,
+            deserializer=deserialize_embedding,
+        )
+        self.low_res_logits_cache = build_embeddings_cache(
+            model_id=model_id,
+            max_entries=low_res_logits_cache_size,
+            max_size_mb=SAM2_MAX_LOGITS_CACHE_SIZE_MB,
+        )
 
         self.task_type = "unsupervised-segmentation"
 
@@ -114,8 +129,8 @@ class SegmentAnything2(RoboflowCoreModel):
         **kwargs,
     ):
         """
-        Embeds an image and caches the result if an image_id is provided. If the image has been embedded before and cached,
-        the cached result will be returned.
+        Embeds an image and caches the result under the image hash (and image_id, if provided). If the image has
+        been embedded before and cached, the cached result will be returned.
 
         Args:
             image (Any): The image to be embedded. The format should be compatible with the preproc_image method.
@@ -129,46 +144,43 @@ class SegmentAnything2(RoboflowCoreModel):
 
         Notes:
             - Embeddings and image sizes are cached to improve performance on repeated requests for the same image.
-            - The cache has a maximum size defined by SAM2_MAX_CACHE_SIZE. When the cache exceeds this size,
-              the oldest entries are removed.
+            - The cache has a maximum size defined by SAM2_MAX_EMBEDDING_CACHE_SIZE and SAM2_MAX_EMBEDDING_CACHE_SIZE_MB.
+              When the cache exceeds this size, the least recently used entries are removed. If EMBEDDINGS_DISK_CACHE_DIR
+              is set, embeddings are persisted on disk and survive model reloads.
 
         Example:
             >>> img_array = ... # some image array
             >>> embed_image(img_array, image_id="sample123")
             (array([...]), (224, 224))
         """
-        if image_id and image_id in self.embedding_cache:
-            return (
-                self.embedding_cache[image_id],
-                self.image_size_cache[image_id],
-                image_id,
+        if image_id:
+            cached_embedding = self.embedding_cache.get(
+                image_id, count_miss=image is None
+            )
+            if cached_embedding is not None:
+                embedding_dict, image_size = cached_embedding
+                return embedding_dict, image_size, image_id
+        if image is None:
+            raise ValueError(
+                f"Image ID {image_id} not in embedding cache, must provide the image or embeddings"
             )
 
         img_in = self.preproc_image(image)
+        image_hash = get_image_hash(img_in)
         if image_id is None:
-            image_id = hashlib.md5(img_in.tobytes()).hexdigest()[:12]
-
-        if image_id in self.embedding_cache:
-            return (
-                self.embedding_cache[image_id],
-                self.image_size_cache[image_id],
-                image_id,
-            )
-
-        with torch.inference_mode():
-            self.predictor.set_image(img_in)
-            embedding_dict = self.predictor._features
-
-        self.embedding_cache[image_id] = embedding_dict
-        self.image_size_cache[image_id] = img_in.shape[:2]
-        if image_id in self.embedding_cache_keys:
-            self.embedding_cache_keys.remove(image_id)
-        self.embedding_cache_keys.append(image_id)
-        if len(self.embedding_cache_keys) > self.embedding_cache_size:
-            cache_key = self.embedding_cache_keys.pop(0)
-            del self.embedding_cache[cache_key]
-            del self.image_size_cache[cache_key]
-        return (embedding_dict, img_in.shape[:2], image_id)
+            image_id = image_hash
+
+        cached_embedding = self.embedding_cache.get(image_hash)
+        if cached_embedding is None:
+            with torch.inference_mode(), self.predictor_lock:
+                self.predictor.set_image(img_in)
+                embedding_dict = self.predictor._features
+            cached_embedding = (embedding_dict, img_in.shape[:2])
+            self.embedding_cache.put(image_hash, cached_embedding)
+        if image_id != image_hash:
+            self.embedding_cache.add_alias(alias=image_id, key=image_hash)
+        embedding_dict, image_size = cached_embedding
+        return embedding_dict, image_size, image_id
 
     def infer_from_request(self, request: Sam2InferenceRequest):
         """Performs inference based on the request type.
@@ -270,18 +282,10 @@ class SegmentAnything2(RoboflowCoreModel):
         with torch.inference_mode():
             if image is None and not image_id:
                 raise ValueError("Must provide either image or  cached image_id")
-            elif image_id and image is None and image_id not in self.embedding_cache:
-                raise ValueError(
-                    f"Image ID {image_id} not in embedding cache, must provide the image or embeddings"
-                )
             embedding, original_image_size, image_id = self.embed_image(
                 image=image, image_id=image_id
             )
 
-            self.predictor._is_image_set = True
-            self.predictor._features = embedding
-            self.predictor._orig_hw = [original_image_size]
-            self.predictor._is_batch = False
             args = dict()
             prompt_set: Sam2PromptSet
             if prompts:
@@ -302,13 +306,18 @@ class SegmentAnything2(RoboflowCoreModel):
             args = pad_points(args)
             if not any(args.values()):
                 args = {"point_coords": [[0, 0]], "point_labels": [-1], "box": None}
-            masks, scores, low_resolution_logits = self.predictor.predict(
-                mask_input=mask_input,
-                multimask_output=multimask_output,
-                return_logits=True,
-                normalize_coords=True,
-                **args,
-            )
+            with self.predictor_lock:
+                self.predictor._is_image_set = True
+                self.predictor._features = embedding
+                self.predictor._orig_hw = [original_image_size]
+                self.predictor._is_batch = False
+                masks, scores, low_resolution_logits = self.predictor.predict(
+                    mask_input=mask_input,
+                    multimask_output=multimask_output,
+                    return_logits=True,
+                    normalize_coords=True,
+                    **args,
+                )
             masks, scores, low_resolution_logits = choose_most_confident_sam_prediction(
                 masks=masks,
                 scores=scores,
@@ -327,16 +336,46 @@ class SegmentAnything2(RoboflowCoreModel):
     ) -> None:
         logits = logits[:, None, :, :]
         prompt_id = hash_prompt_set(image_id, prompt_set)
-        self.low_res_logits_cache[prompt_id] = {
-            "logits": logits,
-            "prompt_set": prompt_set,
-        }
-        if prompt_id in self.low_res_logits_cache_keys:
-            self.low_res_logits_cache_keys.remove(prompt_id)
-        self.low_res_logits_cache_keys.append(prompt_id)
-        if len(self.low_res_logits_cache_keys) > self.low_res_logits_cache_size:
-            cache_key = self.low_res_logits_cache_keys.pop(0)
-            del self.low_res_logits_cache[cache_key]
+        self.low_res_logits_cache.put(
+            prompt_id,
+            {
+                "logits": logits,
+                "prompt_set": prompt_set,
+            },
+        )
+
+
+def serialize_embedding(
+    cached_embedding: Tuple[Dict[str, Any], Tuple[int, int]]
+) -> Dict[str, np.ndarray]:
+    embedding_dict, image_size = cached_embedding
+    arrays = {
+        "image_embed": embedding_dict["image_embed"].cpu().numpy(),
+        "image_size": np.asarray(image_size),
+    }
+    for i, features in enumerate(embedding_dict["high_res_feats"]):
+        arrays[f"high_res_feats_{i}"] = features.cpu().numpy()
+    return arrays
+
+
+def deserialize_embedding(
+    arrays: Dict[str, np.ndarray]
+) -> Tuple[Dict[str, Any], Tuple[int, int]]:
+    high_res_feats_keys = sorted(
+        (k for k in arrays if k.startswith("high_res_feats_")),
+        key=lambda k: int(k.rsplit("_", 1)[-1]),
+    )
+    embedding_dict = {
+        "image_embed": _array_to_tensor(arrays["image_embed"]),
+        "high_res_feats": [_array_to_tensor(arrays[k]) for k in high_res_feats_keys],
+    }
+    image_size = tuple(int(e) for e in arrays["image_size"])
+    return embedding_dict, image_size
+
+
+def _array_to_tensor(array: np.ndarray) -> torch.Tensor:
+    # arrays loaded from disk are read-only memory maps
+    return torch.from_numpy(np.array(array)).to(DEVICE)
 
 
 def hash_prompt_set(image_id: str, prompt_set: Sam2PromptSet) -> Tuple[str, str]:
@@ -349,7 +388,7 @@ def hash_prompt_set(image_id: str, prompt_set: Sam2PromptSet) -> Tuple[str, str]
 def maybe_load_low_res_logits_from_cache(
     image_id: str,
     prompt_set: Sam2PromptSet,
-    cache: Dict[Tuple[str, str], LogitsCacheType],
+    cache: Union[Dict[Tuple[str, str], LogitsCacheType], EmbeddingsCache],
 ) -> Optional[np.ndarray]:
     "Loads prior masks from the cache by searching over possibel prior prompts."
     prompts = prompt_set.prompts
@@ -362,7 +401,7 @@ def maybe_load_low_res_logits_from_cache(
 def find_prior_prompt_in_cache(
     initial_prompt_set: Sam2PromptSet,
     image_id: str,
-    cache: Dict[Tuple[str, str], LogitsCacheType],
+    cache: Union[Dict[Tuple[str, str], LogitsCacheType], EmbeddingsCache],
 ) -> Optional[np.ndarray]:
     """
     Performs search over the cache to see if prior used prompts are subset of this one.
@@ -7,6 +7,7 @@ from inference.core.models.stubs import (
     KeypointsDetectionModelStub,
     ObjectDetectionModelStub,
 )
+from inference.core.registries.lazy import LazyModelTypes
 from inference.core.registries.roboflow import get_model_type
 from inference.core.utils.function import deprecated
 from inference.models import (
@@ -24,265 +25,222 @@ from inference.models import (
 )
 from inference.models.yolov8.yolov8_keypoints_detection import YOLOv8KeypointsDetection
 
-ROBOFLOW_MODEL_TYPES = {
-    ("classification", "stub"): ClassificationModelStub,
-    ("classification", "vit"): VitClassification,
-    ("classification", "yolov8"): YOLOv8Classification,
-    ("classification", "yolov8n"): YOLOv8Classification,
-    ("classification", "yolov8s"): YOLOv8Classification,
-    ("classification", "yolov8m"): YOLOv8Classification,
-    ("classification", "yolov8l"): YOLOv8Classification,
-    ("classification", "yolov8x"): YOLOv8Classification,
-    ("object-detection", "stub"): ObjectDetectionModelStub,
-    ("object-detection", "yolov5"): YOLOv5ObjectDetection,
-    ("object-detection", "yolov5v2s"): YOLOv5ObjectDetection,
-    ("object-detection", "yolov5v6n"): YOLOv5ObjectDetection,
-    ("object-detection", "yolov5v6s"): YOLOv5ObjectDetection,
-    ("object-detection", "yolov5v6m"): YOLOv5ObjectDetection,
-    ("object-detection", "yolov5v6l"): YOLOv5ObjectDetection,
-    ("object-detection", "yolov5v6x"): YOLOv5ObjectDetection,
-    ("object-detection", "yolov9"): YOLOv9ObjectDetection,
-    ("object-detection", "yolov8"): YOLOv8ObjectDetection,
-    ("object-detection", "yolov8s"): YOLOv8ObjectDetection,
-    ("object-detection", "yolov8n"): YOLOv8ObjectDetection,
-    ("object-detection", "yolov8s"): YOLOv8ObjectDetection,
-    ("object-detection", "yolov8m"): YOLOv8ObjectDetection,
-    ("object-detection", "yolov8l"): YOLOv8ObjectDetection,
-    ("object-detection", "yolov8x"): YOLOv8ObjectDetection,
-    ("object-detection", "yolo_nas_s"): YOLONASObjectDetection,
-    ("object-detection", "yolo_nas_m"): YOLONASObjectDetection,
-    ("object-detection", "yolo_nas_l"): YOLONASObjectDetection,
-    ("object-detection", "yolov10"): YOLOv10ObjectDetection,
-    ("object-detection", "yolov10s"): YOLOv10ObjectDetection,
-    ("object-detection", "yolov10n"): YOLOv10ObjectDetection,
-    ("object-detection", "yolov10b"): YOLOv10ObjectDetection,
-    ("object-detection", "yolov10m"): YOLOv10ObjectDetection,
-    ("object-detection", "yolov10l"): YOLOv10ObjectDetection,
-    ("object-detection", "yolov10x"): YOLOv10ObjectDetection,
-    ("instance-segmentation", "stub"): InstanceSegmentationModelStub,
-    (
-        "instance-segmentation",
-        "yolov5-seg",
-    ): YOLOv5InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov5n-seg",
-    ): YOLOv5InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov5s-seg",
-    ): YOLOv5InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov5m-seg",
-    ): YOLOv5InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov5l-seg",
-    ): YOLOv5InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov5x-seg",
-    ): YOLOv5InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolact",
-    ): YOLACT,
-    (
-        "instance-segmentation",
-        "yolov7-seg",
-    ): YOLOv7InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8n",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8s",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8m",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8l",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8x",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8n-seg",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8s-seg",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8m-seg",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8l-seg",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8x-seg",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8-seg",
-    ): YOLOv8InstanceSegmentation,
-    ("keypoint-detection", "stub"): KeypointsDetectionModelStub,
-    ("keypoint-detection", "yolov8"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8n"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8s"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8m"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8l"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8x"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8n-pose"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8s-pose"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8m-pose"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8l-pose"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8x-pose"): YOLOv8KeypointsDetection,
-}
-
-try:
-    from inference.models import LoRAPaliGemma, PaliGemma
+ROBOFLOW_MODEL_TYPES = LazyModelTypes(
+    {
+        ("classification", "stub"): ClassificationModelStub,
+        ("classification", "vit"): VitClassification,
+        ("classification", "yolov8"): YOLOv8Classification,
+        ("classification", "yolov8n"): YOLOv8Classification,
+        ("classification", "yolov8s"): YOLOv8Classification,
+        ("classification", "yolov8m"): YOLOv8Classification,
+        ("classification", "yolov8l"): YOLOv8Classification,
+        ("classification", "yolov8x"): YOLOv8Classification,
+        ("object-detection", "stub"): ObjectDetectionModelStub,
+        ("object-detection", "yolov5"): YOLOv5ObjectDetection,
+        ("object-detection", "yolov5v2s"): YOLOv5ObjectDetection,
+        ("object-detection", "yolov5v6n"): YOLOv5ObjectDetection,
+        ("object-detection", "yolov5v6s"): YOLOv5ObjectDetection,
+        ("object-detection", "yolov5v6m"): YOLOv5ObjectDetection,
+        ("object-detection", "yolov5v6l"): YOLOv5ObjectDetection,
+        ("object-detection", "yolov5v6x"): YOLOv5ObjectDetection,
+        ("object-detection", "yolov9"): YOLOv9ObjectDetection,
+        ("object-detection", "yolov8"): YOLOv8ObjectDetection,
+        ("object-detection", "yolov8s"): YOLOv8ObjectDetection,
+        ("object-detection", "yolov8n"): YOLOv8ObjectDetection,
+        ("object-detection", "yolov8s"): YOLOv8ObjectDetection,
+        ("object-detection", "yolov8m"): YOLOv8ObjectDetection,
+        ("object-detection", "yolov8l"): YOLOv8ObjectDetection,
+        ("object-detection", "yolov8x"): YOLOv8ObjectDetection,
+        ("object-detection", "yolo_nas_s"): YOLONASObjectDetection,
+        ("object-detection", "yolo_nas_m"): YOLONASObjectDetection,
+        ("object-detection", "yolo_nas_l"): YOLONASObjectDetection,
+        ("object-detection", "yolov10"): YOLOv10ObjectDetection,
+        ("object-detection", "yolov10s"): YOLOv10ObjectDetection,
+        ("object-detection", "yolov10n"): YOLOv10ObjectDetection,
+        ("object-detection", "yolov10b"): YOLOv10ObjectDetection,
+        ("object-detection", "yolov10m"): YOLOv10ObjectDetection,
+        ("object-detection", "yolov10l"): YOLOv10ObjectDetection,
+        ("object-detection", "yolov10x"): YOLOv10ObjectDetection,
+        ("instance-segmentation", "stub"): InstanceSegmentationModelStub,
+        (
+            "instance-segmentation",
+            "yolov5-seg",
+        ): YOLOv5InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolov5n-seg",
+        ): YOLOv5InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolov5s-seg",
+        ): YOLOv5InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolov5m-seg",
+        ): YOLOv5InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolov5l-seg",
+        ): YOLOv5InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolov5x-seg",
+        ): YOLOv5InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolact",
+        ): YOLACT,
+        (
+            "instance-segmentation",
+            "yolov7-seg",
+        ): YOLOv7InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolov8n",
+        ): YOLOv8InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolov8",
+        ): YOLOv8InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolov8s",
+        ): YOLOv8InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolov8m",
+        ): YOLOv8InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolov8l",
+        ): YOLOv8InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolov8x",
+        ): YOLOv8InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolov8n-seg",
+        ): YOLOv8InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolov8s-seg",
+        ): YOLOv8InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolov8m-seg",
+        ): YOLOv8InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolov8l-seg",
+        ): YOLOv8InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolov8x-seg",
+        ): YOLOv8InstanceSegmentation,
+        (
+            "instance-segmentation",
+            "yolov8-seg",
+        ): YOLOv8InstanceSegmentation,
+        ("keypoint-detection", "stub"): KeypointsDetectionModelStub,
+        ("keypoint-detection", "yolov8"): YOLOv8KeypointsDetection,
+        ("keypoint-detection", "yolov8n"): YOLOv8KeypointsDetection,
+        ("keypoint-detection", "yolov8s"): YOLOv8KeypointsDetection,
+        ("keypoint-detection", "yolov8m"): YOLOv8KeypointsDetection,
+        ("keypoint-detection", "yolov8l"): YOLOv8KeypointsDetection,
+        ("keypoint-detection", "yolov8x"): YOLOv8KeypointsDetection,
+        ("keypoint-detection", "yolov8n-pose"): YOLOv8KeypointsDetection,
+        ("keypoint-detection", "yolov8s-pose"): YOLOv8KeypointsDetection,
+        ("keypoint-detection", "yolov8m-pose"): YOLOv8KeypointsDetection,
+        ("keypoint-detection", "yolov8l-pose"): YOLOv8KeypointsDetection,
+        ("keypoint-detection", "yolov8x-pose"): YOLOv8KeypointsDetection,
+    }
+)
 
-    paligemma_models = {
+# models below are imported only when requested, as they depend on heavy libraries
+# (like torch or transformers) - see `inference.models` for env flags disabling them
+ROBOFLOW_MODEL_TYPES.update(
+    {
         (
             "object-detection",
             "paligemma-3b-pt-224",
-        ): PaliGemma,  # TODO: change when we have a new project type
-        ("object-detection", "paligemma-3b-pt-448"): PaliGemma,
-        ("object-detection", "paligemma-3b-pt-896"): PaliGemma,
+        ): "inference.models:PaliGemma",  # TODO: change when we have a new project type
+        ("object-detection", "paligemma-3b-pt-448"): "inference.models:PaliGemma",
+        ("object-detection", "paligemma-3b-pt-896"): "inference.models:PaliGemma",
         (
             "instance-segmentation",
             "paligemma-3b-pt-224",
-        ): PaliGemma,  # TODO: change when we have a new project type
-        ("instance-segmentation", "paligemma-3b-pt-448"): PaliGemma,
-        ("instance-segmentation", "paligemma-3b-pt-896"): PaliGemma,
+        ): "inference.models:PaliGemma",  # TODO: change when we have a new project type
+        (
+            "instance-segmentation",
+            "paligemma-3b-pt-448",
+        ): "inference.models:PaliGemma",
+        (
+            "instance-segmentation",
+            "paligemma-3b-pt-896",
+        ): "inference.models:PaliGemma",
         (
             "object-detection",
             "paligemma-3b-pt-224-peft",
-        ): LoRAPaliGemma,  # TODO: change when we have a new project type
-        ("object-detection", "paligemma-3b-pt-448-peft"): LoRAPaliGemma,
-        ("object-detection", "paligemma-3b-pt-896-peft"): LoRAPaliGemma,
+        ): "inference.models:LoRAPaliGemma",  # TODO: change when we have a new project type
+        (
+            "object-detection",
+            "paligemma-3b-pt-448-peft",
+        ): "inference.models:LoRAPaliGemma",
+        (
+            "object-detection",
+            "paligemma-3b-pt-896-peft",
+        ): "inference.models:LoRAPaliGemma",
         (
             "instance-segmentation",
             "paligemma-3b-pt-224-peft",
-        ): LoRAPaliGemma,  # TODO: change when we have a new project type
-        ("instance-segmentation", "paligemma-3b-pt-448-peft"): LoRAPaliGemma,
-        ("instance-segmentation", "paligemma-3b-pt-896-peft"): LoRAPaliGemma,
-    }
-    ROBOFLOW_MODEL_TYPES.update(paligemma_models)
-except:
-    pass
-
-try:
-    from inference.models import Florence2, LoRAFlorence2
-
-    florence2_models = {
+        ): "inference.models:LoRAPaliGemma",  # TODO: change when we have a new project type
+        (
+            "instance-segmentation",
+            "paligemma-3b-pt-448-peft",
+        ): "inference.models:LoRAPaliGemma",
+        (
+            "instance-segmentation",
+            "paligemma-3b-pt-896-peft",
+        ): "inference.models:LoRAPaliGemma",
         (
             "object-detection",
             "florence-2-base",
-        ): Florence2,  # TODO: change when we have a new project type
-        ("object-detection", "florence-2-large"): Florence2,
+        ): "inference.models:Florence2",  # TODO: change when we have a new project type
+        ("object-detection", "florence-2-large"): "inference.models:Florence2",
         (
             "instance-segmentation",
             "florence-2-base",
-        ): Florence2,  # TODO: change when we have a new project type
-        ("instance-segmentation", "florence-2-large"): Florence2,
+        ): "inference.models:Florence2",  # TODO: change when we have a new project type
+        ("instance-segmentation", "florence-2-large"): "inference.models:Florence2",
         (
             "object-detection",
             "florence-2-base-peft",
-        ): LoRAFlorence2,  # TODO: change when we have a new project type
-        ("object-detection", "florence-2-large-peft"): LoRAFlorence2,
+        ): "inference.models:LoRAFlorence2",  # TODO: change when we have a new project type
+        (
+            "object-detection",
+            "florence-2-large-peft",
+        ): "inference.models:LoRAFlorence2",
         (
             "instance-segmentation",
             "florence-2-base-peft",
-        ): LoRAFlorence2,  # TODO: change when we have a new project type
-        ("instance-segmentation", "florence-2-large-peft"): LoRAFlorence2,
+        ): "inference.models:LoRAFlorence2",  # TODO: change when we have a new project type
+        (
+            "instance-segmentation",
+            "florence-2-large-peft",
+        ): "inference.models:LoRAFlorence2",
+        ("embed", "sam"): "inference.models:SegmentAnything",
+        ("embed", "sam2"): "inference.models:SegmentAnything2",
+        ("embed", "clip"): "inference.models:Clip",
+        ("object-detection", "owlv2"): "inference.models.owlv2.owlv2:OwlV2",
+        ("gaze", "l2cs"): "inference.models:Gaze",
+        ("ocr", "doctr"): "inference.models:DocTR",
+        ("ocr", "trocr"): "inference.models:TrOCR",
+        ("object-detection", "grounding-dino"): "inference.models:GroundingDINO",
+        ("llm", "cogvlm"): "inference.models:CogVLM",
+        ("object-detection", "yolo-world"): "inference.models:YOLOWorld",
     }
-    ROBOFLOW_MODEL_TYPES.update(florence2_models)
-except:
-    pass
-try:
-    from inference.models import SegmentAnything
-
-    ROBOFLOW_MODEL_TYPES[("embed", "sam")] = SegmentAnything
-except:
-    pass
-try:
-    from inference.models import SegmentAnything2
-
-    ROBOFLOW_MODEL_TYPES[("embed", "sam2")] = SegmentAnything2
-except:
-    pass
-
-try:
-    from inference.models import Clip
-
-    ROBOFLOW_MODEL_TYPES[("embed", "clip")] = Clip
-except:
-    pass
-
-try:
-    from inference.models.owlv2.owlv2 import OwlV2
-
-    ROBOFLOW_MODEL_TYPES[("object-detection", "owlv2")] = OwlV2
-except:
-    pass
-
-try:
-    from inference.models import Gaze
-
-    ROBOFLOW_MODEL_TYPES[("gaze", "l2cs")] = Gaze
-except:
-    pass
-
-try:
-    from inference.models import DocTR
-
-    ROBOFLOW_MODEL_TYPES[("ocr", "doctr")] = DocTR
-except:
-    pass
-
-try:
-    from inference.models import TrOCR
-
-    ROBOFLOW_MODEL_TYPES[("ocr", "trocr")] = TrOCR
-except:
-    pass
-
-try:
-    from inference.models import GroundingDINO
-
-    ROBOFLOW_MODEL_TYPES[("object-detection", "grounding-dino")] = GroundingDINO
-except:
-    pass
-
-try:
-    from inference.models import CogVLM
-
-    ROBOFLOW_MODEL_TYPES[("llm", "cogvlm")] = CogVLM
-except:
-    pass
-
-try:
-    from inference.models import YOLOWorld
-
-    ROBOFLOW_MODEL_TYPES[("object-detection", "yolo-world")] = YOLOWorld
-except:
-    pass
+)
 
 
 def get_model(model_id, api_key=API_KEY, **kwargs) -> Model:
@@ -91,22 +91,13 @@ class YOLACT(OnnxRoboflowInferenceModel):
     def preprocess(
         self, image: Any, **kwargs
     ) -> Tuple[np.ndarray, PreprocessReturnMetadata]:
-        if isinstance(image, list):
-            imgs_with_dims = [self.preproc_image(i) for i in image]
-            imgs, img_dims = zip(*imgs_with_dims)
-            img_in = np.concatenate(imgs, axis=0)
-            unwrap = False
-        else:
-            img_in, img_dims = self.preproc_image(image)
-            img_dims = [img_dims]
-            unwrap = True
+        img_in, img_dims = self.load_image(image)
+        unwrap = not isinstance(image, list)
 
         # IN BGR order (for some reason)
         mean = (103.94, 116.78, 123.68)
         std = (57.38, 57.12, 58.40)
 
-        img_in = img_in.astype(np.float32)
-
         # Our channels are RGB, so apply mean and std accordingly
         img_in[:, 0, :, :] = (img_in[:, 0, :, :] - mean[2]) / std[2]
         img_in[:, 1, :, :] = (img_in[:, 1, :, :] - mean[1]) / std[1]
@@ -170,47 +161,47 @@ class YOLACT(OnnxRoboflowInferenceModel):
             num_masks=32,
             box_format="xyxy",
         )
-        predictions = np.array(predictions)
         batch_preds = []
-        if predictions.shape != (1, 0):
-            for batch_idx, img_dim in enumerate(preprocess_return_metadata["img_dims"]):
-                boxes = predictions[batch_idx, :, :4]
-                scores = predictions[batch_idx, :, 4]
-                classes = predictions[batch_idx, :, 6]
-                masks = predictions[batch_idx, :, 7:]
-                proto = proto_data[batch_idx]
-                decoded_masks = self.decode_masks(boxes, masks, proto, img_in_shape[2:])
-                polys = masks2poly(decoded_masks)
-                infer_shape = (self.img_size_w, self.img_size_h)
-                boxes = post_process_bboxes(
-                    [boxes], infer_shape, [img_dim], self.preproc, self.resize_method
-                )[0]
-                polys = post_process_polygons(
-                    img_in_shape[2:],
-                    polys,
-                    img_dim,
-                    self.preproc,
-                    resize_method=self.resize_method,
-                )
-                preds = []
-                for box, poly, score, cls in zip(boxes, polys, scores, classes):
-                    confidence = float(score)
-                    class_name = self.class_names[int(cls)]
-                    points = [{"x": round(x, 1), "y": round(y, 1)} for (x, y) in poly]
-                    pred = {
-                        "x": round((box[2] + box[0]) / 2, 1),
-                        "y": round((box[3] + box[1]) / 2, 1),
-                        "width": int(box[2] - box[0]),
-                        "height": int(box[3] - box[1]),
-                        "class": class_name,
-                        "confidence": round(confidence, 3),
-                        "points": points,
-                        "class_id": int(cls),
-                    }
-                    preds.append(pred)
-                batch_preds.append(preds)
-        else:
-            batch_preds.append([])
+        for batch_idx, img_dim in enumerate(preprocess_return_metadata["img_dims"]):
+            image_predictions = predictions[batch_idx]
+            if len(image_predictions) == 0:
+                batch_preds.append([])
+                continue
+            boxes = image_predictions[:, :4]
+            scores = image_predictions[:, 4]
+            classes = image_predictions[:, 6]
+            masks = image_predictions[:, 7:]
+            proto = proto_data[batch_idx]
+            decoded_masks = self.decode_masks(boxes, masks, proto, img_in_shape[2:])
+            polys = masks2poly(decoded_masks)
+            infer_shape = (self.img_size_w, self.img_size_h)
+            boxes = post_process_bboxes(
+                [boxes], infer_shape, [img_dim], self.preproc, self.resize_method
+            )[0]
+            polys = post_process_polygons(
+                img_in_shape[2:],
+                polys,
+                img_dim,
+                self.preproc,
+                resize_method=self.resize_method,
+            )
+            preds = []
+            for box, poly, score, cls in zip(boxes, polys, scores, classes):
+                confidence = float(score)
+                class_name = self.class_names[int(cls)]
+                points = [{"x": round(x, 1), "y": round(y, 1)} for (x, y) in poly]
+                pred = {
+                    "x": round((box[2] + box[0]) / 2, 1),
+                    "y": round((box[3] + box[1]) / 2, 1),
+                    "width": int(box[2] - box[0]),
+                    "height": int(box[3] - box[1]),
+                    "class": class_name,
+                    "confidence": round(confidence, 3),
+                    "points": points,
+                    "class_id": int(cls),
+                }
+                preds.append(pred)
+            batch_preds.append(preds)
         img_dims = preprocess_return_metadata["img_dims"]
         responses = self.make_response(batch_preds, img_dims, **kwargs)
         if kwargs["return_image_dims"]:
@@ -2,7 +2,6 @@ from typing import List, Tuple
 
 import numpy as np
 
-from inference.core.entities.responses.inference import ObjectDetectionInferenceResponse
 from inference.core.models.defaults import DEFAULT_CONFIDENCE, DEFAUlT_MAX_DETECTIONS
 from inference.core.models.object_detection_base import (
     ObjectDetectionBaseOnnxRoboflowInferenceModel,
@@ -48,15 +47,16 @@ class YOLOv10ObjectDetection(ObjectDetectionBaseOnnxRoboflowInferenceModel):
 
         return (predictions,)
 
-    def postprocess(
+    def postprocess_predictions(
         self,
         predictions: Tuple[np.ndarray, ...],
         preproc_return_metadata: PreprocessReturnMetadata,
         confidence: float = DEFAULT_CONFIDENCE,
         max_detections: int = DEFAUlT_MAX_DETECTIONS,
         **kwargs,
-    ) -> List[ObjectDetectionInferenceResponse]:
-        """Postprocesses the object detection predictions.
+    ) -> List[List[List[float]]]:
+        """Filters the object detection predictions (model is NMS-free) and scales boxes into
+        the coordinates system of input images.
 
         Args:
             predictions (np.ndarray): Raw predictions from the model.
@@ -65,7 +65,7 @@ class YOLOv10ObjectDetection(ObjectDetectionBaseOnnxRoboflowInferenceModel):
             max_detections (int): Maximum number of final detections. Default is 300.
 
         Returns:
-            List[ObjectDetectionInferenceResponse]: The post-processed predictions.
+            List[List[List[float]]]: The post-processed predictions.
         """
         predictions = predictions[0]
         predictions = np.append(predictions, predictions[..., 5:], axis=-1)
@@ -78,7 +78,7 @@ class YOLOv10ObjectDetection(ObjectDetectionBaseOnnxRoboflowInferenceModel):
 
         infer_shape = (self.img_size_h, self.img_size_w)
         img_dims = preproc_return_metadata["img_dims"]
-        predictions = post_process_bboxes(
+        return post_process_bboxes(
             predictions,
             infer_shape,
             img_dims,
@@ -88,7 +88,6 @@ class YOLOv10ObjectDetection(ObjectDetectionBaseOnnxRoboflowInferenceModel):
                 "disable_preproc_static_crop"
             ],
         )
-        return self.make_response(predictions, img_dims, **kwargs)
 
     def validate_model_classes(self) -> None:
         pass
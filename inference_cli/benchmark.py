@@ -4,7 +4,9 @@ from typing import Optional
 import typer
 from typing_extensions import Annotated
 
+from inference_cli.lib.benchmark.api_speed import DEFAULT_MAX_REQUESTS_IN_FLIGHT
 from inference_cli.lib.benchmark.dataset import PREDEFINED_DATASETS
+from inference_cli.lib.benchmark.load_generator import ArrivalProcess
 from inference_cli.lib.benchmark_adapter import (
     run_infer_api_speed_benchmark,
     run_python_package_speed_benchmark,
@@ -98,6 +100,34 @@ def api_speed(
             help="Number of requests per second to emit. If not specified - requests will be sent one-by-one by requested number of client threads",
         ),
     ] = None,
+    requests_per_second_step: Annotated[
+        Optional[int],
+        typer.Option(
+            "--rps-step",
+            help="Meaningful if `rps` specified - increase of RPS between load steps, used to find the saturation point of the server",
+        ),
+    ] = None,
+    load_steps: Annotated[
+        int,
+        typer.Option(
+            "--load-steps",
+            help="Meaningful if `rps` and `rps-step` specified - number of load steps, each sending `benchmark_requests` requests",
+        ),
+    ] = 1,
+    arrival_process: Annotated[
+        ArrivalProcess,
+        typer.Option(
+            "--arrival-process",
+            help="Meaningful if `rps` specified - distribution of requests in time: evenly spaced (`constant`) or `poisson`",
+        ),
+    ] = ArrivalProcess.CONSTANT,
+    max_requests_in_flight: Annotated[
+        int,
+        typer.Option(
+            "--max-in-flight",
+            help="Meaningful if `rps` specified - max number of concurrent requests, requests scheduled above the limit are queued (and the wait is accounted in latency)",
+        ),
+    ] = DEFAULT_MAX_REQUESTS_IN_FLIGHT,
     api_key: Annotated[
         Optional[str],
         typer.Option(
@@ -158,6 +188,10 @@ def api_speed(
                 model_configuration=model_configuration,
                 output_location=output_location,
                 enforce_legacy_endpoints=enforce_legacy_endpoints,
+                requests_per_second_step=requests_per_second_step,
+                load_steps=load_steps,
+                arrival_process=arrival_process,
+                max_requests_in_flight=max_requests_in_flight,
             )
         else:
             if workflow_specification:
@@ -179,6 +213,10 @@ def api_speed(
                 api_key=api_key,
                 model_configuration=model_configuration,
                 output_location=output_location,
+                requests_per_second_step=requests_per_second_step,
+                load_steps=load_steps,
+                arrival_process=arrival_process,
+                max_requests_in_flight=max_requests_in_flight,
             )
     except Exception as error:
         typer.echo(f"Command failed. Cause: {error}")
@@ -1,6 +1,6 @@
-import math
 import random
 import time
+from dataclasses import asdict, replace
 from functools import partial
 from threading import Thread
 from typing import Any, Callable, Dict, List, Optional
@@ -9,6 +9,13 @@ import numpy as np
 import requests
 from tqdm import tqdm
 
+from inference_cli.lib.benchmark.load_generator import (
+    ArrivalProcess,
+    LoadStepReport,
+    display_load_steps_summary,
+    generate_load_steps,
+    run_open_loop_load,
+)
 from inference_cli.lib.benchmark.results_gathering import (
     InferenceStatistics,
     ResultsCollector,
@@ -16,6 +23,8 @@ from inference_cli.lib.benchmark.results_gathering import (
 from inference_sdk import InferenceHTTPClient
 from inference_sdk.http.entities import HTTPClientMode
 
+DEFAULT_MAX_REQUESTS_IN_FLIGHT = 64
+
 
 def run_api_warm_up(
     client: InferenceHTTPClient,
@@ -37,6 +46,10 @@ def coordinate_infer_api_speed_benchmark(
     request_batch_size: int,
     number_of_clients: int,
     requests_per_second: Optional[int],
+    requests_per_second_step: Optional[int] = None,
+    load_steps: int = 1,
+    arrival_process: ArrivalProcess = ArrivalProcess.CONSTANT,
+    max_requests_in_flight: int = DEFAULT_MAX_REQUESTS_IN_FLIGHT,
 ) -> InferenceStatistics:
     run_api_warm_up(client=client, image=images[0], warm_up_requests=warm_up_requests)
     image_sizes = {i.shape[:2] for i in images}
@@ -48,11 +61,11 @@ def coordinate_infer_api_speed_benchmark(
             f"input_height={model_details.input_height} | input_width={model_details.input_width}"
         )
     results_collector = ResultsCollector()
-    statistics_display_thread = Thread(
-        target=display_benchmark_statistics, args=(results_collector,)
+    statistics_display_thread = start_statistics_display(
+        results_collector=results_collector,
+        requests_per_second=requests_per_second,
     )
-    statistics_display_thread.start()
-    execute_infer_api_speed_benchmark(
+    load_steps_reports = execute_infer_api_speed_benchmark(
         results_collector=results_collector,
         client=client,
         images=images,
@@ -60,10 +73,16 @@ def coordinate_infer_api_speed_benchmark(
         request_batch_size=request_batch_size,
         number_of_clients=number_of_clients,
         requests_per_second=requests_per_second,
+        requests_per_second_step=requests_per_second_step,
+        load_steps=load_steps,
+        arrival_process=arrival_process,
+        max_requests_in_flight=max_requests_in_flight,
+    )
+    return gather_statistics(
+        results_collector=results_collector,
+        statistics_display_thread=statistics_display_thread,
+        load_steps_reports=load_steps_reports,
     )
-    statistics = results_collector.get_statistics()
-    statistics_display_thread.join()
-    return statistics
 
 
 def coordinate_workflow_api_speed_benchmark(
@@ -77,15 +96,19 @@ def coordinate_workflow_api_speed_benchmark(
     request_batch_size: int,
     number_of_clients: int,
     requests_per_second: Optional[int],
+    requests_per_second_step: Optional[int] = None,
+    load_steps: int = 1,
+    arrival_process: ArrivalProcess = ArrivalProcess.CONSTANT,
+    max_requests_in_flight: int = DEFAULT_MAX_REQUESTS_IN_FLIGHT,
 ) -> InferenceStatistics:
     image_sizes = {i.shape[:2] for i in images}
     print(f"Detected images dimensions: {image_sizes}")
     results_collector = ResultsCollector()
-    statistics_display_thread = Thread(
-        target=display_benchmark_statistics, args=(results_collector,)
+    statistics_display_thread = start_statistics_display(
+        results_collector=results_collector,
+        requests_per_second=requests_per_second,
     )
-    statistics_display_thread.start()
-    execute_workflow_api_speed_benchmark(
+    load_steps_reports = execute_workflow_api_speed_benchmark(
         workspace_name=workspace_name,
         workflow_id=workflow_id,
         workflow_specification=workflow_specification,
@@ -97,10 +120,16 @@ def coordinate_workflow_api_speed_benchmark(
         request_batch_size=request_batch_size,
         number_of_clients=number_of_clients,
         requests_per_second=requests_per_second,
+        requests_per_second_step=requests_per_second_step,
+        load_steps=load_steps,
+        arrival_process=arrival_process,
+        max_requests_in_flight=max_requests_in_flight,
+    )
+    return gather_statistics(
+        results_collector=results_collector,
+        statistics_display_thread=statistics_display_thread,
+        load_steps_reports=load_steps_reports,
     )
-    statistics = results_collector.get_statistics()
-    statistics_display_thread.join()
-    return statistics
 
 
 def execute_infer_api_speed_benchmark(
@@ -111,7 +140,11 @@ def execute_infer_api_speed_benchmark(
     request_batch_size: int,
     number_of_clients: int,
     requests_per_second: Optional[int],
-) -> None:
+    requests_per_second_step: Optional[int] = None,
+    load_steps: int = 1,
+    arrival_process: ArrivalProcess = ArrivalProcess.CONSTANT,
+    max_requests_in_flight: int = DEFAULT_MAX_REQUESTS_IN_FLIGHT,
+) -> Optional[List[LoadStepReport]]:
     while len(images) < request_batch_size:
         images = images + images
     api_request_executor = partial(
@@ -120,7 +153,6 @@ def execute_infer_api_speed_benchmark(
         client=client,
         images=images,
         request_batch_size=request_batch_size,
-        delay=requests_per_second is not None,
     )
     if requests_per_second is not None:
         if number_of_clients is not None:
@@ -129,13 +161,19 @@ def execute_infer_api_speed_benchmark(
                 "RPS to maintain is specified."
             )
         results_collector.start_benchmark()
-        execute_given_rps_sequentially(
+        load_steps_reports = run_open_loop_load(
             executor=api_request_executor,
-            benchmark_requests=benchmark_requests,
-            requests_per_second=requests_per_second,
+            requests_per_step=benchmark_requests,
+            load_steps=generate_load_steps(
+                requests_per_second=requests_per_second,
+                requests_per_second_step=requests_per_second_step,
+                steps=load_steps,
+            ),
+            arrival_process=arrival_process,
+            max_in_flight=max_requests_in_flight,
         )
         results_collector.stop_benchmark()
-        return None
+        return load_steps_reports
     client_threads = []
     results_collector.start_benchmark()
     for _ in range(number_of_clients):
@@ -163,7 +201,11 @@ def execute_workflow_api_speed_benchmark(
     request_batch_size: int,
     number_of_clients: int,
     requests_per_second: Optional[int],
-) -> None:
+    requests_per_second_step: Optional[int] = None,
+    load_steps: int = 1,
+    arrival_process: ArrivalProcess = ArrivalProcess.CONSTANT,
+    max_requests_in_flight: int = DEFAULT_MAX_REQUESTS_IN_FLIGHT,
+) -> Optional[List[LoadStepReport]]:
     while len(images) < request_batch_size:
         images = images + images
     api_request_executor = partial(
@@ -176,7 +218,6 @@ def execute_workflow_api_speed_benchmark(
         client=client,
         images=images,
         request_batch_size=request_batch_size,
-        delay=requests_per_second is not None,
     )
     if requests_per_second is not None:
         if number_of_clients is not None:
@@ -185,13 +226,19 @@ def execute_workflow_api_speed_benchmark(
                 "RPS to maintain is specified."
             )
         results_collector.start_benchmark()
-        execute_given_rps_sequentially(
+        load_steps_reports = run_open_loop_load(
             executor=api_request_executor,
-            benchmark_requests=benchmark_requests,
-            requests_per_second=requests_per_second,
+            requests_per_step=benchmark_requests,
+            load_steps=generate_load_steps(
+                requests_per_second=requests_per_second,
+                requests_per_second_step=requests_per_second_step,
+                steps=load_steps,
+            ),
+            arrival_process=arrival_process,
+            max_in_flight=max_requests_in_flight,
         )
         results_collector.stop_benchmark()
-        return None
+        return load_steps_reports
     client_threads = []
     results_collector.start_benchmark()
     for _ in range(number_of_clients):
@@ -207,6 +254,38 @@ def execute_workflow_api_speed_benchmark(
     return None
 
 
+def start_statistics_display(
+    results_collector: ResultsCollector,
+    requests_per_second: Optional[int],
+) -> Optional[Thread]:
+    if requests_per_second is not None:
+        # open-loop load generator displays statistics of its own
+        return None
+    statistics_display_thread = Thread(
+        target=display_benchmark_statistics, args=(results_collector,)
+    )
+    statistics_display_thread.start()
+    return statistics_display_thread
+
+
+def gather_statistics(
+    results_collector: ResultsCollector,
+    statistics_display_thread: Optional[Thread],
+    load_steps_reports: Optional[List[LoadStepReport]],
+) -> InferenceStatistics:
+    statistics = results_collector.get_statistics()
+    if statistics_display_thread is not None:
+        statistics_display_thread.join()
+    if not load_steps_reports:
+        return statistics
+    display_load_steps_summary(reports=load_steps_reports)
+    if statistics is None:
+        return statistics
+    return replace(
+        statistics, load_steps=[asdict(report) for report in load_steps_reports]
+    )
+
+
 def execute_requests_sequentially(
     executor: Callable[[], None], benchmark_requests: int
 ) -> None:
@@ -214,41 +293,12 @@ def execute_requests_sequentially(
         executor()
 
 
-def execute_given_rps_sequentially(
-    executor: Callable[[], None],
-    benchmark_requests: int,
-    requests_per_second: int,
-) -> None:
-    rounds = math.ceil(benchmark_requests / requests_per_second)
-    threads = []
-    for _ in range(rounds):
-        start = time.time()
-        for _ in range(requests_per_second):
-            executor_thread = Thread(target=executor, daemon=True)
-            executor_thread.start()
-            threads.append(executor_thread)
-        still_alive_threads = []
-        for thread in threads:
-            thread.join(timeout=0.0)
-            if thread.is_alive():
-                still_alive_threads.append(thread)
-        threads = still_alive_threads
-        duration = time.time() - start
-        remaining = max(0.0, 1.0 - duration)
-        time.sleep(remaining)
-    for thread in threads:
-        thread.join()
-
-
 def execute_infer_api_request(
     results_collector: ResultsCollector,
     client: InferenceHTTPClient,
     images: List[np.ndarray],
     request_batch_size: int,
-    delay: bool = False,
-) -> None:
-    if delay:
-        time.sleep(random.random())
+) -> Optional[str]:
     random.shuffle(images)
     payload = images[:request_batch_size]
     start = time.time()
@@ -270,6 +320,8 @@ def execute_infer_api_request(
         results_collector.register_error(
             batch_size=request_batch_size, status_code=status_code
         )
+        return status_code
+    return None
 
 
 def execute_workflow_api_request(
@@ -281,10 +333,7 @@ def execute_workflow_api_request(
     client: InferenceHTTPClient,
     images: List[np.ndarray],
     request_batch_size: int,
-    delay: bool = False,
-) -> None:
-    if delay:
-        time.sleep(random.random())
+) -> Optional[str]:
     random.shuffle(images)
     images = {f"image": images[:request_batch_size]}
     start = time.time()
@@ -316,6 +365,8 @@ def execute_workflow_api_request(
         results_collector.register_error(
             batch_size=request_batch_size, status_code=status_code
         )
+        return status_code
+    return None
 
 
 def display_benchmark_statistics(
@@ -0,0 +1,300 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from time import perf_counter
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from inference_cli.lib.benchmark.results_gathering import (
+    LatencyHistogram,
+    LatencySummary,
+)
+
+WINDOW_STATISTICS_FORMAT = """
+[{target_rps} rps target] sent: {requests_sent}\t| done: {requests_completed}\t| p50: {p50_ms}ms\t| p90: {p90_ms}ms\t| p99: {p99_ms}ms\t| p99.9: {p99_9_ms}ms\t| errors: {errors}
+""".strip()
+# step is considered saturated once server does not keep up with given fraction of
+# target throughput or once p99 of corrected latency grows given number of times
+# compared to the first step
+SATURATION_THROUGHPUT_RATIO = 0.9
+SATURATION_LATENCY_GROWTH = 2.0
+
+
+class ArrivalProcess(str, Enum):
+    CONSTANT = "constant"
+    POISSON = "poisson"
+
+
+@dataclass(frozen=True)
+class LoadStepReport:
+    target_requests_per_second: float
+    achieved_requests_per_second: float
+    requests_sent: int
+    errors: int
+    service_latency: LatencySummary
+    corrected_latency: LatencySummary
+
+    def to_string(self) -> str:
+        return (
+            f"target: {self.target_requests_per_second} rps\t| "
+            f"achieved: {self.achieved_requests_per_second} rps\t| "
+            f"errors: {self.errors}\t| "
+            f"p50: {self.corrected_latency.p50_ms}ms\t| "
+            f"p99: {self.corrected_latency.p99_ms}ms\t| "
+            f"p99.9: {self.corrected_latency.p99_9_ms}ms\t| "
+            f"p99 (service time): {self.service_latency.p99_ms}ms"
+        )
+
+
+@dataclass(frozen=True)
+class _RequestTiming:
+    intended_start: float
+    start: float
+    end: float
+    error: Optional[str]
+
+
+class _LoadStepState:
+
+    def __init__(self, target_requests_per_second: float):
+        self.target_requests_per_second = target_requests_per_second
+        self.service_latency = LatencyHistogram()
+        self.corrected_latency = LatencyHistogram()
+        self.requests_sent = 0
+        self.errors = 0
+        self._window_latency = LatencyHistogram()
+        self._window_requests_sent = 0
+        self._window_requests_completed = 0
+        self._window_errors = 0
+
+    def register_request_sent(self) -> None:
+        self.requests_sent += 1
+        self._window_requests_sent += 1
+
+    def register_request_completed(self, timing: _RequestTiming) -> None:
+        # latency measured against the scheduled start of the request, such that
+        # requests delayed by server (or client) falling behind are not omitted
+        corrected_latency = timing.end - timing.intended_start
+        self.service_latency.record(timing.end - timing.start)
+        self.corrected_latency.record(corrected_latency)
+        self._window_latency.record(corrected_latency)
+        self._window_requests_completed += 1
+        if timing.error is not None:
+            self.errors += 1
+            self._window_errors += 1
+
+    def register_request_future_completed(self, future: asyncio.Future) -> None:
+        if not future.cancelled():
+            self.register_request_completed(timing=future.result())
+
+    def flush_window(self) -> str:
+        summary = self._window_latency.summarise()
+        result = WINDOW_STATISTICS_FORMAT.format(
+            target_rps=self.target_requests_per_second,
+            requests_sent=self._window_requests_sent,
+            requests_completed=self._window_requests_completed,
+            p50_ms=summary.p50_ms,
+            p90_ms=summary.p90_ms,
+            p99_ms=summary.p99_ms,
+            p99_9_ms=summary.p99_9_ms,
+            errors=self._window_errors,
+        )
+        self._window_latency = LatencyHistogram()
+        self._window_requests_sent = 0
+        self._window_requests_completed = 0
+        self._window_errors = 0
+        return result
+
+
+def generate_load_steps(
+    requests_per_second: float,
+    requests_per_second_step: Optional[float],
+    steps: int,
+) -> List[float]:
+    if requests_per_second_step is None or steps < 2:
+        return [requests_per_second]
+    return [requests_per_second + i * requests_per_second_step for i in range(steps)]
+
+
+def generate_arrival_offsets(
+    requests_number: int,
+    requests_per_second: float,
+    arrival_process: ArrivalProcess,
+    random_state: Optional[np.random.RandomState] = None,
+) -> np.ndarray:
+    if requests_per_second <= 0:
+        raise ValueError("Requests per second must be a positive number.")
+    if arrival_process is ArrivalProcess.CONSTANT:
+        return np.arange(requests_number) / requests_per_second
+    if random_state is None:
+        random_state = np.random.RandomState()
+    intervals = random_state.exponential(
+        scale=1 / requests_per_second, size=requests_number
+    )
+    return np.concatenate([[0.0], np.cumsum(intervals[:-1])])[:requests_number]
+
+
+def run_open_loop_load(
+    executor: Callable[[], Optional[str]],
+    requests_per_step: int,
+    load_steps: List[float],
+    arrival_process: ArrivalProcess,
+    max_in_flight: int,
+    window_seconds: float = 5.0,
+    random_seed: Optional[int] = None,
+) -> List[LoadStepReport]:
+    """Sends requests according to the arrival process, regardless of how quickly
+    the server responds (open-loop) - such that when server falls behind, requests
+    queue up instead of being sent less frequently. `executor` is expected to send
+    single request and return error status or None, it is run in a pool of
+    `max_in_flight` threads. Each load step sends `requests_per_step` requests at
+    given rate - next step starts once all requests of the previous one are done.
+    """
+    return asyncio.run(
+        _run_open_loop_load(
+            executor=executor,
+            requests_per_step=requests_per_step,
+            load_steps=load_steps,
+            arrival_process=arrival_process,
+            max_in_flight=max_in_flight,
+            window_seconds=window_seconds,
+            random_state=np.random.RandomState(random_seed),
+        )
+    )
+
+
+def find_saturation_knee(
+    reports: List[LoadStepReport],
+) -> Optional[LoadStepReport]:
+    if not reports:
+        return None
+    baseline_p99 = reports[0].corrected_latency.p99_ms
+    for report in reports:
+        throughput_not_sustained = (
+            report.achieved_requests_per_second
+            < SATURATION_THROUGHPUT_RATIO * report.target_requests_per_second
+        )
+        latency_grown = (
+            baseline_p99 > 0
+            and report.corrected_latency.p99_ms
+            > SATURATION_LATENCY_GROWTH * baseline_p99
+        )
+        if throughput_not_sustained or latency_grown:
+            return report
+    return None
+
+
+def display_load_steps_summary(reports: List[LoadStepReport]) -> None:
+    print("Load steps summary (latency corrected for coordinated omission):")
+    for report in reports:
+        print(report.to_string())
+    if len(reports) < 2:
+        return None
+    knee = find_saturation_knee(reports=reports)
+    if knee is None:
+        print("Server kept up with all load steps - saturation not reached.")
+        return None
+    print(
+        f"Server saturated at {knee.target_requests_per_second} rps target "
+        f"(achieved: {knee.achieved_requests_per_second} rps)."
+    )
+
+
+async def _run_open_loop_load(
+    executor: Callable[[], Optional[str]],
+    requests_per_step: int,
+    load_steps: List[float],
+    arrival_process: ArrivalProcess,
+    max_in_flight: int,
+    window_seconds: float,
+    random_state: np.random.RandomState,
+) -> List[LoadStepReport]:
+    reports = []
+    with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        for requests_per_second in load_steps:
+            report = await _run_load_step(
+                executor=executor,
+                pool=pool,
+                requests_number=requests_per_step,
+                requests_per_second=requests_per_second,
+                arrival_process=arrival_process,
+                window_seconds=window_seconds,
+                random_state=random_state,
+            )
+            print(report.to_string())
+            reports.append(report)
+    return reports
+
+
+async def _run_load_step(
+    executor: Callable[[], Optional[str]],
+    pool: ThreadPoolExecutor,
+    requests_number: int,
+    requests_per_second: float,
+    arrival_process: ArrivalProcess,
+    window_seconds: float,
+    random_state: np.random.RandomState,
+) -> LoadStepReport:
+    loop = asyncio.get_running_loop()
+    offsets = generate_arrival_offsets(
+        requests_number=requests_number,
+        requests_per_second=requests_per_second,
+        arrival_process=arrival_process,
+        random_state=random_state,
+    )
+    state = _LoadStepState(target_requests_per_second=requests_per_second)
+    reporter = asyncio.create_task(
+        _display_windows_statistics(state=state, window_seconds=window_seconds)
+    )
+    requests_futures = []
+    step_start = perf_counter()
+    try:
+        for offset in offsets:
+            intended_start = step_start + offset
+            delay = intended_start - perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            future = loop.run_in_executor(
+                pool, _execute_timed_request, executor, intended_start
+            )
+            future.add_done_callback(state.register_request_future_completed)
+            state.register_request_sent()
+            requests_futures.append(future)
+        await asyncio.gather(*requests_futures)
+    finally:
+        reporter.cancel()
+    step_duration = perf_counter() - step_start
+    return LoadStepReport(
+        target_requests_per_second=requests_per_second,
+        achieved_requests_per_second=round(requests_number / step_duration, 1),
+        requests_sent=state.requests_sent,
+        errors=state.errors,
+        service_latency=state.service_latency.summarise(),
+        corrected_latency=state.corrected_latency.summarise(),
+    )
+
+
+def _execute_timed_request(
+    executor: Callable[[], Optional[str]], intended_start: float
+) -> _RequestTiming:
+    start = perf_counter()
+    try:
+        error = executor()
+    except Exception as error_details:
+        error = error_details.__class__.__name__
+    return _RequestTiming(
+        intended_start=intended_start,
+        start=start,
+        end=perf_counter(),
+        error=error,
+    )
+
+
+async def _display_windows_statistics(
+    state: _LoadStepState, window_seconds: float
+) -> None:
+    while True:
+        await asyncio.sleep(window_seconds)
+        print(state.flush_window())
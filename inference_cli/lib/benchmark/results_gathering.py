@@ -1,8 +1,9 @@
+import math
 from collections import defaultdict
 from copy import copy
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -27,6 +28,7 @@ class InferenceStatistics:
     images_per_second: float
     error_rate: float
     error_status_codes: Dict[str, int]
+    load_steps: Optional[List[Dict[str, Any]]] = None
 
     def to_string(self) -> str:
         return STATISTICS_FORMAT.format(
@@ -128,3 +130,85 @@ class ResultsCollector:
                 f"{exc}: {count}" for exc, count in error_status_codes.items()
             ),
         )
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    count: int
+    mean_ms: float
+    max_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    p99_9_ms: float
+
+
+class LatencyHistogram:
+    """HDR-style histogram of latencies - values are counted in logarithmic buckets,
+    each of which is `relative_precision` wider than the previous one, such that
+    memory footprint is constant regardless of number of recorded values and reported
+    percentiles are accurate up to `relative_precision`."""
+
+    def __init__(
+        self,
+        relative_precision: float = 0.01,
+        lowest_trackable_value: float = 1e-6,
+    ):
+        self._log_base = math.log1p(relative_precision)
+        self._lowest_trackable_value = lowest_trackable_value
+        self._buckets: Dict[int, int] = defaultdict(int)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def record(self, value: float) -> None:
+        self._buckets[self._bucket_index(value=value)] += 1
+        self._count += 1
+        self._total += value
+        self._max = max(self._max, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if self._log_base != other._log_base:
+            raise ValueError("Cannot merge histograms of different precision.")
+        for index, count in other._buckets.items():
+            self._buckets[index] += count
+        self._count += other._count
+        self._total += other._total
+        self._max = max(self._max, other._max)
+
+    def percentile(self, percentile: float) -> float:
+        if self._count == 0:
+            return 0.0
+        target_count = math.ceil(percentile / 100 * self._count)
+        cumulative_count = 0
+        for index in sorted(self._buckets):
+            cumulative_count += self._buckets[index]
+            if cumulative_count >= max(target_count, 1):
+                return min(self._bucket_value(index=index), self._max)
+        return self._max
+
+    def summarise(self) -> LatencySummary:
+        mean = self._total / self._count if self._count else 0.0
+        return LatencySummary(
+            count=self._count,
+            mean_ms=round(mean * 1000, 2),
+            max_ms=round(self._max * 1000, 2),
+            p50_ms=round(self.percentile(50) * 1000, 2),
+            p90_ms=round(self.percentile(90) * 1000, 2),
+            p99_ms=round(self.percentile(99) * 1000, 2),
+            p99_9_ms=round(self.percentile(99.9) * 1000, 2),
+        )
+
+    def _bucket_index(self, value: float) -> int:
+        if value <= self._lowest_trackable_value:
+            return 0
+        return math.ceil(
+            math.log(value / self._lowest_trackable_value) / self._log_base
+        )
+
+    def _bucket_value(self, index: int) -> float:
+        return self._lowest_trackable_value * math.exp(index * self._log_base)
@@ -5,11 +5,13 @@ from threading import Thread
 from typing import Any, Dict, Optional
 
 from inference_cli.lib.benchmark.api_speed import (
+    DEFAULT_MAX_REQUESTS_IN_FLIGHT,
     coordinate_infer_api_speed_benchmark,
     coordinate_workflow_api_speed_benchmark,
     display_benchmark_statistics,
 )
 from inference_cli.lib.benchmark.dataset import load_dataset_images
+from inference_cli.lib.benchmark.load_generator import ArrivalProcess
 from inference_cli.lib.benchmark.platform import retrieve_platform_specifics
 from inference_cli.lib.benchmark.results_gathering import (
     InferenceStatistics,
@@ -30,6 +32,10 @@ def run_infer_api_speed_benchmark(
     api_key: Optional[str] = None,
     model_configuration: Optional[str] = None,
     output_location: Optional[str] = None,
+    requests_per_second_step: Optional[int] = None,
+    load_steps: int = 1,
+    arrival_process: ArrivalProcess = ArrivalProcess.CONSTANT,
+    max_requests_in_flight: int = DEFAULT_MAX_REQUESTS_IN_FLIGHT,
     enforce_legacy_endpoints: bool = False,
 ) -> None:
     dataset_images = load_dataset_images(
@@ -40,7 +46,13 @@ def run_infer_api_speed_benchmark(
         api_key=api_key,
         model_configuration=model_configuration,
         disable_active_learning=True,
-        max_concurrent_requests=1,
+        # each request is sent with single `infer(...)` call, this only sizes the pool
+        # of connections shared by concurrent requests
+        max_concurrent_requests=(
+            max_requests_in_flight
+            if requests_per_second is not None
+            else number_of_clients
+        ),
         max_batch_size=request_batch_size,
     )
     client.select_model(model_id=model_id)
@@ -55,6 +67,10 @@ def run_infer_api_speed_benchmark(
         request_batch_size=request_batch_size,
         number_of_clients=number_of_clients,
         requests_per_second=requests_per_second,
+        requests_per_second_step=requests_per_second_step,
+        load_steps=load_steps,
+        arrival_process=arrival_process,
+        max_requests_in_flight=max_requests_in_flight,
     )
     if output_location is None:
         return None
@@ -67,6 +83,10 @@ def run_infer_api_speed_benchmark(
         "batch_size": request_batch_size,
         "number_of_clients": number_of_clients,
         "requests_per_second": requests_per_second,
+        "requests_per_second_step": requests_per_second_step,
+        "load_steps": load_steps,
+        "arrival_process": arrival_process.value,
+        "max_requests_in_flight": max_requests_in_flight,
         "model_configuration": model_configuration,
     }
     dump_benchmark_results(
@@ -91,6 +111,10 @@ def run_workflow_api_speed_benchmark(
     api_key: Optional[str] = None,
     model_configuration: Optional[str] = None,
     output_location: Optional[str] = None,
+    requests_per_second_step: Optional[int] = None,
+    load_steps: int = 1,
+    arrival_process: ArrivalProcess = ArrivalProcess.CONSTANT,
+    max_requests_in_flight: int = DEFAULT_MAX_REQUESTS_IN_FLIGHT,
 ) -> None:
     dataset_images = load_dataset_images(
         dataset_reference=dataset_reference,
@@ -100,7 +124,13 @@ def run_workflow_api_speed_benchmark(
         api_key=api_key,
         model_configuration=model_configuration,
         disable_active_learning=True,
-        max_concurrent_requests=1,
+        # each request is sent with single `infer(...)` call, this only sizes the pool
+        # of connections shared by concurrent requests
+        max_concurrent_requests=(
+            max_requests_in_flight
+            if requests_per_second is not None
+            else number_of_clients
+        ),
         max_batch_size=request_batch_size,
     )
     benchmark_results = coordinate_workflow_api_speed_benchmark(
@@ -114,6 +144,10 @@ def run_workflow_api_speed_benchmark(
         request_batch_size=request_batch_size,
         number_of_clients=number_of_clients,
         requests_per_second=requests_per_second,
+        requests_per_second_step=requests_per_second_step,
+        load_steps=load_steps,
+        arrival_process=arrival_process,
+        max_requests_in_flight=max_requests_in_flight,
     )
     if output_location is None:
         return None
@@ -125,6 +159,10 @@ def run_workflow_api_speed_benchmark(
         "batch_size": request_batch_size,
         "number_of_clients": number_of_clients,
         "requests_per_second": requests_per_second,
+        "requests_per_second_step": requests_per_second_step,
+        "load_steps": load_steps,
+        "arrival_process": arrival_process.value,
+        "max_requests_in_flight": max_requests_in_flight,
         "model_configuration": model_configuration,
     }
     if workflow_id and workspace_name:
@@ -1,3 +1,4 @@
+import threading
 from contextlib import contextmanager
 from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
@@ -37,6 +38,8 @@ from inference_sdk.http.utils.aliases import (
 )
 from inference_sdk.http.utils.executors import (
     RequestMethod,
+    build_requests_session,
+    execute_in_pipeline,
     execute_requests_packages,
     execute_requests_packages_async,
 )
@@ -143,6 +146,9 @@ class InferenceHTTPClient:
         self.__inference_configuration = InferenceConfiguration.init_default()
         self.__client_mode = _determine_client_mode(api_url=api_url)
         self.__selected_model: Optional[str] = None
+        self.__session: Optional[requests.Session] = None
+        self.__session_pool_size = 0
+        self.__session_lock = threading.Lock()
 
     @property
     def inference_configuration(self) -> InferenceConfiguration:
@@ -214,24 +220,49 @@ class InferenceHTTPClient:
 
     @wrap_errors
     def get_server_info(self) -> ServerInfo:
-        response = requests.get(f"{self.__api_url}/info")
+        response = self.__get_session().get(f"{self.__api_url}/info")
         response.raise_for_status()
         response_payload = response.json()
         return ServerInfo.from_dict(response_payload)
 
+    def close(self) -> None:
+        """Closes keep-alive connections of the client - to be called once the client
+        is no longer used. Client may still be used afterwards, opening new connections."""
+        with self.__session_lock:
+            if self.__session is not None:
+                self.__session.close()
+            self.__session = None
+            self.__session_pool_size = 0
+
     def infer_on_stream(
         self,
         input_uri: str,
         model_id: Optional[str] = None,
+        prefetch_depth: int = 1,
+        drop_frames_when_behind: bool = False,
     ) -> Generator[Tuple[Union[str, int], np.ndarray, dict], None, None]:
-        for reference, frame in load_stream_inference_input(
+        """Runs inference on frames of video or images from directory.
+
+        Frames are decoded in background while up to `prefetch_depth` previous
+        frames are being encoded and sent for inference concurrently - predictions are
+        yielded in order of frames. With `drop_frames_when_behind=True`, frames decoded
+        while `prefetch_depth` frames are still waiting for predictions are skipped
+        (such frames are not yielded, gaps are visible in frames references)."""
+        # making sure all in-flight requests can keep their connections alive
+        _ = self.__get_session(min_pool_size=prefetch_depth)
+        frames = load_stream_inference_input(
             input_uri=input_uri,
             image_extensions=self.__inference_configuration.image_extensions_for_directory_scan,
-        ):
-            prediction = self.infer(
-                inference_input=frame,
+        )
+        for (reference, frame), prediction in execute_in_pipeline(
+            items=frames,
+            function=lambda reference_and_frame: self.infer(
+                inference_input=reference_and_frame[1],
                 model_id=model_id,
-            )
+            ),
+            max_items_in_flight=prefetch_depth,
+            drop_items_when_behind=drop_frames_when_behind,
+        ):
             yield reference, frame, prediction
 
     @wrap_errors
@@ -307,6 +338,7 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=self.__get_session(),
         )
         results = []
         for request_data, response in zip(requests_data, responses):
@@ -442,6 +474,7 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=self.__get_session(),
         )
         results = []
         for request_data, response in zip(requests_data, responses):
@@ -588,7 +621,7 @@ class InferenceHTTPClient:
     @wrap_errors
     def list_loaded_models(self) -> RegisteredModels:
         self.__ensure_v1_client_mode()
-        response = requests.get(f"{self.__api_url}/model/registry")
+        response = self.__get_session().get(f"{self.__api_url}/model/registry")
         response.raise_for_status()
         response_payload = response.json()
         return RegisteredModels.from_dict(response_payload)
@@ -608,7 +641,7 @@ class InferenceHTTPClient:
     ) -> RegisteredModels:
         self.__ensure_v1_client_mode()
         de_aliased_model_id = resolve_roboflow_model_alias(model_id=model_id)
-        response = requests.post(
+        response = self.__get_session().post(
             f"{self.__api_url}/model/add",
             json={
                 "model_id": de_aliased_model_id,
@@ -648,7 +681,7 @@ class InferenceHTTPClient:
     def unload_model(self, model_id: str) -> RegisteredModels:
         self.__ensure_v1_client_mode()
         de_aliased_model_id = resolve_roboflow_model_alias(model_id=model_id)
-        response = requests.post(
+        response = self.__get_session().post(
             f"{self.__api_url}/model/remove",
             json={
                 "model_id": de_aliased_model_id,
@@ -688,7 +721,7 @@ class InferenceHTTPClient:
     @wrap_errors
     def unload_all_models(self) -> RegisteredModels:
         self.__ensure_v1_client_mode()
-        response = requests.post(f"{self.__api_url}/model/clear")
+        response = self.__get_session().post(f"{self.__api_url}/model/clear")
         response.raise_for_status()
         response_payload = response.json()
         self.__selected_model = None
@@ -726,7 +759,7 @@ class InferenceHTTPClient:
         )
         if chat_history is not None:
             payload["history"] = chat_history
-        response = requests.post(
+        response = self.__get_session().post(
             f"{self.__api_url}/llm/cogvlm",
             json=payload,
             headers=DEFAULT_HEADERS,
@@ -801,6 +834,7 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=self.__get_session(),
         )
         results = [r.json() for r in responses]
         return unwrap_single_element_list(sequence=results)
@@ -910,7 +944,7 @@ class InferenceHTTPClient:
         payload["text"] = text
         if clip_version is not None:
             payload["clip_version_id"] = clip_version
-        response = requests.post(
+        response = self.__get_session().post(
             self.__wrap_url_with_api_key(f"{self.__api_url}/clip/embed_text"),
             json=payload,
             headers=DEFAULT_HEADERS,
@@ -980,7 +1014,7 @@ class InferenceHTTPClient:
             )
         else:
             payload["prompt"] = prompt
-        response = requests.post(
+        response = self.__get_session().post(
             self.__wrap_url_with_api_key(f"{self.__api_url}/clip/compare"),
             json=payload,
             headers=DEFAULT_HEADERS,
@@ -1160,7 +1194,7 @@ class InferenceHTTPClient:
                 url = f"{self.__api_url}/infer/workflows/{workspace_name}/{workflow_id}"
             else:
                 url = f"{self.__api_url}/{workspace_name}/workflows/{workflow_id}"
-        response = requests.post(
+        response = self.__get_session().post(
             url,
             json=payload,
             headers=DEFAULT_HEADERS,
@@ -1203,6 +1237,7 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=self.__get_session(),
         )
         return [r.json() for r in responses]
 
@@ -1268,6 +1303,7 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=self.__get_session(),
         )
         results = [r.json() for r in responses]
         return unwrap_single_element_list(sequence=results)
@@ -1314,6 +1350,20 @@ class InferenceHTTPClient:
             return url
         return f"{url}?api_key={self.__api_key}"
 
+    def __get_session(self, min_pool_size: int = 1) -> requests.Session:
+        # session (and its pool of keep-alive connections) is shared by all requests
+        # sent by the client - it is re-created once pool is too small for configured
+        # concurrency. Replaced session is not closed, as requests sent from other
+        # threads may still use it - its connections are released with the session.
+        pool_size = max(
+            self.__inference_configuration.max_concurrent_requests, min_pool_size
+        )
+        with self.__session_lock:
+            if self.__session is None or self.__session_pool_size < pool_size:
+                self.__session = build_requests_session(pool_size=pool_size)
+                self.__session_pool_size = pool_size
+            return self.__session
+
     def __ensure_v1_client_mode(self) -> None:
         if self.__client_mode is not HTTPClientMode.V1:
             raise WrongClientModeError("Use client mode `v1` to run this operation.")
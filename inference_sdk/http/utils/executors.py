@@ -1,9 +1,21 @@
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from enum import Enum
 from functools import partial
-from typing import List, Tuple, Union
+from queue import Queue
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import aiohttp
 import backoff
@@ -15,12 +27,20 @@ from aiohttp import (
     RequestInfo,
 )
 from requests import Response
+from requests.adapters import HTTPAdapter
 
-from inference_sdk.http.utils.iterables import make_batches
 from inference_sdk.http.utils.request_building import RequestData
 from inference_sdk.http.utils.requests import api_key_safe_raise_for_status
 
 RETRYABLE_STATUS_CODES = {429, 503}
+# how many responses (relative to max concurrency) may wait for a straggler
+# preceding them before sending new requests is paused
+MAX_BUFFERED_RESPONSES_FACTOR = 4
+# how often threads of pipeline blocked on back-pressure check if pipeline is stopped
+PIPELINE_STOP_CHECK_INTERVAL = 0.1
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 class RequestMethod(Enum):
@@ -28,27 +48,171 @@ class RequestMethod(Enum):
     POST = "post"
 
 
+def build_requests_session(pool_size: int) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def execute_requests_packages(
     requests_data: List[RequestData],
     request_method: RequestMethod,
     max_concurrent_requests: int,
+    session: Optional[requests.Session] = None,
 ) -> List[Response]:
-    requests_data_packages = make_batches(
-        iterable=requests_data,
-        batch_size=max_concurrent_requests,
-    )
     results = []
-    for requests_data_package in requests_data_packages:
-        responses = make_parallel_requests(
-            requests_data=requests_data_package,
-            request_method=request_method,
-        )
-        results.extend(responses)
-    for response in results:
+    for response in execute_requests_in_sliding_window(
+        requests_data=requests_data,
+        request_method=request_method,
+        max_concurrent_requests=max_concurrent_requests,
+        session=session,
+    ):
         api_key_safe_raise_for_status(response=response)
+        results.append(response)
     return results
 
 
+def execute_requests_in_sliding_window(
+    requests_data: List[RequestData],
+    request_method: RequestMethod,
+    max_concurrent_requests: int,
+    session: Optional[requests.Session] = None,
+) -> Generator[Response, None, None]:
+    """Keeps `max_concurrent_requests` requests in flight - next request is sent as soon
+    as any of the previous completes, not once the whole wave of requests is done.
+    Responses are yielded in order of requests, as soon as all preceding responses are
+    received. Once consumer stops iterating (or error is raised), requests which
+    were not sent yet are cancelled."""
+    if not requests_data:
+        return None
+    workers = max(min(max_concurrent_requests, len(requests_data)), 1)
+    max_buffered_responses = workers * MAX_BUFFERED_RESPONSES_FACTOR
+    make_request_closure = partial(
+        make_request, request_method=request_method, session=session
+    )
+    in_flight: Dict[Future, int] = {}
+    received: Dict[int, Response] = {}
+    next_to_send, next_to_yield = 0, 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            while next_to_yield < len(requests_data):
+                while (
+                    next_to_send < len(requests_data)
+                    and len(in_flight) < workers
+                    and len(in_flight) + len(received) < max_buffered_responses
+                ):
+                    future = executor.submit(
+                        make_request_closure, requests_data[next_to_send]
+                    )
+                    in_flight[future] = next_to_send
+                    next_to_send += 1
+                if next_to_yield not in received:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        received[in_flight.pop(future)] = future.result()
+                while next_to_yield in received:
+                    yield received.pop(next_to_yield)
+                    next_to_yield += 1
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+def execute_in_pipeline(
+    items: Iterable[T],
+    function: Callable[[T], R],
+    max_items_in_flight: int,
+    drop_items_when_behind: bool = False,
+) -> Generator[Tuple[T, R], None, None]:
+    """Applies `function` to `items` in a pipeline - next items are pulled from the
+    iterable (e.g. frames decoded) in a background thread, while up to
+    `max_items_in_flight` of the previous ones are processed concurrently. Results are
+    yielded in order of items, together with the items.
+
+    When `drop_items_when_behind` is set - items pulled while `max_items_in_flight` items
+    are still awaiting processing or consumption are dropped (and never yielded),
+    instead of pausing the pulling."""
+    max_items_in_flight = max(max_items_in_flight, 1)
+    slots = threading.Semaphore(max_items_in_flight)
+    stop_event = threading.Event()
+    in_flight: Queue = Queue()
+    with ThreadPoolExecutor(max_workers=max_items_in_flight) as executor:
+        feeder = threading.Thread(
+            target=_feed_pipeline,
+            kwargs={
+                "items": items,
+                "function": function,
+                "executor": executor,
+                "slots": slots,
+                "stop_event": stop_event,
+                "in_flight": in_flight,
+                "drop_items_when_behind": drop_items_when_behind,
+            },
+            daemon=True,
+        )
+        feeder.start()
+        try:
+            while True:
+                entry = in_flight.get()
+                if entry is _PIPELINE_END:
+                    break
+                if isinstance(entry, _PipelineError):
+                    raise entry.error
+                item, future = entry
+                result = future.result()
+                slots.release()
+                yield item, result
+        finally:
+            stop_event.set()
+            _cancel_pipeline_entries(in_flight=in_flight)
+            feeder.join()
+            _cancel_pipeline_entries(in_flight=in_flight)
+
+
+class _PipelineError:
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+_PIPELINE_END = object()
+
+
+def _feed_pipeline(
+    items: Iterable[T],
+    function: Callable[[T], R],
+    executor: ThreadPoolExecutor,
+    slots: threading.Semaphore,
+    stop_event: threading.Event,
+    in_flight: Queue,
+    drop_items_when_behind: bool,
+) -> None:
+    try:
+        for item in items:
+            if stop_event.is_set():
+                return None
+            if drop_items_when_behind:
+                if not slots.acquire(blocking=False):
+                    continue
+            else:
+                while not slots.acquire(timeout=PIPELINE_STOP_CHECK_INTERVAL):
+                    if stop_event.is_set():
+                        return None
+            in_flight.put((item, executor.submit(function, item)))
+    except Exception as error:
+        in_flight.put(_PipelineError(error=error))
+    finally:
+        in_flight.put(_PIPELINE_END)
+
+
+def _cancel_pipeline_entries(in_flight: Queue) -> None:
+    while not in_flight.empty():
+        entry = in_flight.get_nowait()
+        if isinstance(entry, tuple):
+            entry[1].cancel()
+
+
 def make_parallel_requests(
     requests_data: List[RequestData],
     request_method: RequestMethod,
@@ -75,8 +239,17 @@ def make_parallel_requests(
     backoff_log_level=logging.DEBUG,
     giveup_log_level=logging.DEBUG,
 )
-def make_request(request_data: RequestData, request_method: RequestMethod) -> Response:
-    method = requests.get if request_method is RequestMethod.GET else requests.post
+def make_request(
+    request_data: RequestData,
+    request_method: RequestMethod,
+    session: Optional[requests.Session] = None,
+) -> Response:
+    requests_source = session if session is not None else requests
+    method = (
+        requests_source.get
+        if request_method is RequestMethod.GET
+        else requests_source.post
+    )
     return method(
         request_data.url,
         headers=request_data.headers,
@@ -91,17 +264,31 @@ async def execute_requests_packages_async(
     request_method: RequestMethod,
     max_concurrent_requests: int,
 ) -> List[Union[dict, bytes]]:
-    requests_data_packages = make_batches(
-        iterable=requests_data,
-        batch_size=max_concurrent_requests,
-    )
-    results = []
-    for requests_data_package in requests_data_packages:
-        responses = await make_parallel_requests_async(
-            requests_data=requests_data_package,
-            request_method=request_method,
-        )
-        results.extend(responses)
+    """Keeps `max_concurrent_requests` requests in flight, all sent with the same
+    session (and its connection pool) - see `execute_requests_in_sliding_window(...)`.
+    """
+    if not requests_data:
+        return []
+    results: List[Optional[Union[dict, bytes]]] = [None] * len(requests_data)
+    requests_indices = iter(range(len(requests_data)))
+    workers = max(min(max_concurrent_requests, len(requests_data)), 1)
+    connector = aiohttp.TCPConnector(limit=workers)
+    async with aiohttp.ClientSession(connector=connector) as session:
+
+        async def worker() -> None:
+            for index in requests_indices:
+                _, results[index] = await make_request_async(
+                    request_data=requests_data[index],
+                    request_method=request_method,
+                    session=session,
+                )
+
+        workers_tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+        try:
+            await asyncio.gather(*workers_tasks)
+        finally:
+            for task in workers_tasks:
+                task.cancel()
     return results
 
 
@@ -62,6 +62,7 @@ setuptools.setup(
         "waf": read_requirements("requirements/requirements.waf.txt"),
         "yolo-world": read_requirements("requirements/requirements.yolo_world.txt"),
         "transformers": read_requirements("requirements/requirements.transformers.txt"),
+        "pyav": read_requirements("requirements/requirements.pyav.txt"),
     },
     classifiers=[
         "Programming Language :: Python :: 3",
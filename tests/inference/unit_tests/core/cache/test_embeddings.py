@@ -0,0 +1,169 @@
+import os
+from typing import Dict, Tuple
+
+import numpy as np
+import pytest
+
+from inference.core.cache.embeddings import DiskEmbeddingsStore, EmbeddingsCache
+
+
+def serialize(value: Tuple[np.ndarray, Tuple[int, int]]) -> Dict[str, np.ndarray]:
+    return {"embedding": value[0], "image_size": np.asarray(value[1])}
+
+
+def deserialize(arrays: Dict[str, np.ndarray]) -> Tuple[np.ndarray, Tuple[int, int]]:
+    return np.array(arrays["embedding"]), tuple(int(e) for e in arrays["image_size"])
+
+
+def test_embeddings_cache_evicts_least_recently_used_entry_when_size_exceeded() -> None:
+    # given
+    cache = EmbeddingsCache(max_entries=10, max_size_bytes=2048)
+    cache.put("a", np.zeros((1024,), dtype=np.uint8))
+    cache.put("b", np.zeros((1024,), dtype=np.uint8))
+    _ = cache.get("a")
+
+    # when
+    cache.put("c", np.zeros((1024,), dtype=np.uint8))
+
+    # then
+    assert list(cache) == ["a", "c"]
+    assert cache.size_bytes == 2048
+    assert cache.stats.evictions == 1
+
+
+def test_embeddings_cache_evicts_entries_when_number_of_entries_exceeded() -> None:
+    # given
+    cache = EmbeddingsCache(max_entries=2, max_size_bytes=1024 * 1024)
+    cache.put("a", np.zeros((8,)))
+    cache.put("b", np.zeros((8,)))
+
+    # when
+    cache.put("c", np.zeros((8,)))
+
+    # then
+    assert list(cache) == ["b", "c"]
+
+
+def test_embeddings_cache_does_not_keep_entry_larger_than_limit_in_memory() -> None:
+    # given
+    cache = EmbeddingsCache(max_entries=2, max_size_bytes=16)
+
+    # when
+    cache.put("a", np.zeros((1024,), dtype=np.uint8))
+
+    # then
+    assert len(cache) == 0
+    assert cache.get("a") is None
+
+
+def test_embeddings_cache_resolves_aliases_and_tracks_stats() -> None:
+    # given
+    cache = EmbeddingsCache(max_entries=2, max_size_bytes=1024)
+    value = np.ones((4,), dtype=np.uint8)
+    cache.put("image_hash", value)
+
+    # when
+    cache.add_alias(alias="my_image", key="image_hash")
+    result = cache.get("my_image")
+    missing_result = cache.get("other")
+
+    # then
+    assert result is value
+    assert missing_result is None
+    assert "my_image" in cache
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert abs(cache.stats.hit_rate - 0.5) < 1e-5
+
+
+def test_embeddings_cache_drops_aliases_of_evicted_entries() -> None:
+    # given
+    cache = EmbeddingsCache(max_entries=1, max_size_bytes=1024)
+    cache.put("a", np.zeros((4,)))
+    cache.add_alias(alias="alias", key="a")
+
+    # when
+    cache.put("b", np.zeros((4,)))
+
+    # then
+    assert "alias" not in cache
+    assert cache.get("alias") is None
+
+
+def test_embeddings_cache_when_disk_store_given_without_serializers(
+    tmp_path: str,
+) -> None:
+    # given
+    disk_store = DiskEmbeddingsStore(directory=str(tmp_path), max_size_bytes=1024)
+
+    # when
+    with pytest.raises(ValueError):
+        _ = EmbeddingsCache(max_entries=1, max_size_bytes=1024, disk_store=disk_store)
+
+
+def test_embeddings_cache_restores_entries_from_disk_after_reload(
+    tmp_path: str,
+) -> None:
+    # given
+    directory = os.path.join(tmp_path, "sam", "vit_h")
+    cache = EmbeddingsCache(
+        max_entries=2,
+        max_size_bytes=1024 * 1024,
+        disk_store=DiskEmbeddingsStore(directory=directory, max_size_bytes=1024**2),
+        serializer=serialize,
+        deserializer=deserialize,
+    )
+    embedding = np.random.random((1, 8, 4, 4)).astype(np.float32)
+    cache.put("image_hash", (embedding, (480, 640)))
+    cache.add_alias(alias="my_image", key="image_hash")
+
+    # when
+    reloaded_cache = EmbeddingsCache(
+        max_entries=2,
+        max_size_bytes=1024 * 1024,
+        disk_store=DiskEmbeddingsStore(directory=directory, max_size_bytes=1024**2),
+        serializer=serialize,
+        deserializer=deserialize,
+    )
+    result = reloaded_cache.get("my_image")
+
+    # then
+    assert np.allclose(result[0], embedding)
+    assert result[1] == (480, 640)
+    assert reloaded_cache.stats.disk_hits == 1
+    assert "image_hash" in reloaded_cache, "Entry expected to be promoted to memory"
+    assert "my_image" in reloaded_cache, "Alias expected to be promoted to memory"
+
+
+def test_disk_embeddings_store_removes_least_recently_used_entries(
+    tmp_path: str,
+) -> None:
+    # given
+    store = DiskEmbeddingsStore(directory=str(tmp_path), max_size_bytes=2500)
+    store.save(key="a", arrays={"embedding": np.zeros((1024,), dtype=np.uint8)})
+    store.save(key="b", arrays={"embedding": np.zeros((1024,), dtype=np.uint8)})
+    _ = store.load(key="a")
+
+    # when
+    store.save(key="c", arrays={"embedding": np.zeros((1024,), dtype=np.uint8)})
+
+    # then
+    assert "a" in store
+    assert "b" not in store
+    assert "c" in store
+    assert store.load(key="b") is None
+    assert store.size_bytes <= 2500
+    assert len([e for e in os.listdir(tmp_path) if e != "aliases"]) == 2
+
+
+def test_disk_embeddings_store_loads_arrays_as_memory_maps(tmp_path: str) -> None:
+    # given
+    store = DiskEmbeddingsStore(directory=str(tmp_path), max_size_bytes=1024**2)
+    store.save(key="a", arrays={"embedding": np.arange(16, dtype=np.float32)})
+
+    # when
+    result = store.load(key="a")
+
+    # then
+    assert isinstance(result["embedding"], np.memmap)
+    assert np.allclose(result["embedding"], np.arange(16))
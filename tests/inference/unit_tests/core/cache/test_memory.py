@@ -0,0 +1,142 @@
+import threading
+import time
+
+from inference.core.cache.memory import MemoryCache, SortedSet
+
+
+def test_sorted_set_keeps_members_ordered_by_score() -> None:
+    # given
+    sorted_set = SortedSet()
+
+    # when
+    for member_id, score in enumerate([3.0, 1.0, 2.0, 1.0]):
+        sorted_set.add(member_id=member_id, value=f"v{member_id}", score=score)
+
+    # then
+    assert sorted_set.range_by_score(min=-1, max=float("inf")) == (
+        ["v1", "v3", "v2", "v0"],
+        [1.0, 1.0, 2.0, 3.0],
+    )
+    assert sorted_set.range_by_score(min=1.5, max=2.5) == (["v2"], [2.0])
+
+
+def test_sorted_set_remove_member() -> None:
+    # given
+    sorted_set = SortedSet()
+    sorted_set.add(member_id=0, value="a", score=1.0)
+    sorted_set.add(member_id=1, value="b", score=1.0)
+
+    # when
+    removed = sorted_set.remove_member(member_id=1, score=1.0)
+    removed_again = sorted_set.remove_member(member_id=1, score=1.0)
+
+    # then
+    assert removed is True
+    assert removed_again is False
+    assert sorted_set.range_by_score(min=0, max=2) == (["a"], [1.0])
+
+
+def test_memory_cache_zadd_does_not_overwrite_members_with_the_same_score() -> None:
+    # given
+    cache = MemoryCache()
+
+    # when
+    cache.zadd("key", value={"a": 1}, score=10.0)
+    cache.zadd("key", value={"b": 2}, score=10.0)
+    cache.zadd("key", value={"c": 3}, score=5.0)
+
+    # then
+    assert cache.zrangebyscore("key", withscores=True) == [
+        ({"c": 3}, 5.0),
+        ({"a": 1}, 10.0),
+        ({"b": 2}, 10.0),
+    ]
+
+
+def test_memory_cache_zrangebyscore_when_range_given() -> None:
+    # given
+    cache = MemoryCache()
+    cache.zadd_many([("key", i, float(i)) for i in range(10)])
+
+    # when
+    result = cache.zrangebyscore("key", min=3, max=5)
+
+    # then
+    assert result == [3, 4, 5]
+    assert cache.zrangebyscore("other") == []
+
+
+def test_memory_cache_zremrangebyscore() -> None:
+    # given
+    cache = MemoryCache()
+    cache.zadd_many([("key", i, float(i)) for i in range(10)])
+
+    # when
+    result = cache.zremrangebyscore("key", min=2, max=7)
+
+    # then
+    assert result == 6
+    assert cache.zrangebyscore("key") == [0, 1, 8, 9]
+    assert cache.zremrangebyscore("other") == 0
+
+
+def test_memory_cache_removes_expired_sorted_set_members() -> None:
+    # given
+    cache = MemoryCache()
+    cache.zadd("key", value="expiring", score=1.0, expire=0.5)
+    cache.zadd("key", value="expiring_later", score=1.0, expire=100)
+    cache.zadd("key", value="persistent", score=1.0)
+
+    # when
+    cache._remove_expired(now=time.time() + 1)
+
+    # then
+    assert cache.zrangebyscore("key") == ["expiring_later", "persistent"]
+
+
+def test_memory_cache_does_not_expire_key_which_was_overwritten() -> None:
+    # given
+    cache = MemoryCache()
+    cache.set("key", "old", expire=0.5)
+    cache.set("key", "new")
+
+    # when
+    cache._remove_expired(now=time.time() + 1)
+
+    # then
+    assert cache.get("key") == "new"
+
+
+def test_memory_cache_get_when_value_expired() -> None:
+    # given
+    cache = MemoryCache()
+    cache.set("key", "value", expire=0.01)
+    time.sleep(0.02)
+
+    # when
+    result = cache.get("key")
+
+    # then
+    assert result is None
+
+
+def test_memory_cache_zadd_from_multiple_threads() -> None:
+    # given
+    cache = MemoryCache()
+
+    def add_members(thread_id: int) -> None:
+        for i in range(1000):
+            cache.zadd("key", value=(thread_id, i), score=float(i), expire=100)
+
+    threads = [threading.Thread(target=add_members, args=(i,)) for i in range(4)]
+
+    # when
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # then
+    result = cache.zrangebyscore("key", withscores=True)
+    assert len(result) == 4000
+    assert [score for _, score in result] == sorted(score for _, score in result)
@@ -0,0 +1,121 @@
+import json
+from unittest import mock
+from unittest.mock import MagicMock
+
+import pytest
+
+from inference.core.cache import redis as redis_cache_module
+from inference.core.cache.redis import RedisCache
+
+
+@pytest.fixture
+def redis_client() -> MagicMock:
+    with mock.patch.object(
+        redis_cache_module.redis, "BlockingConnectionPool"
+    ), mock.patch.object(redis_cache_module.redis, "Redis") as redis_class_mock:
+        client = MagicMock()
+        redis_class_mock.return_value = client
+        yield client
+
+
+def test_redis_cache_zadd_many_sends_members_in_single_pipeline(
+    redis_client: MagicMock,
+) -> None:
+    # given
+    cache = RedisCache()
+    pipeline = redis_client.pipeline.return_value
+
+    # when
+    cache.zadd_many(
+        entries=[("models", "a", 1.0), ("inference:1", {"some": "value"}, 2.0)],
+        expire=10,
+    )
+
+    # then
+    redis_client.pipeline.assert_called_once_with(transaction=False)
+    assert pipeline.zadd.call_args_list == [
+        mock.call("models", {json.dumps("a"): 1.0}),
+        mock.call("inference:1", {json.dumps({"some": "value"}): 2.0}),
+    ]
+    pipeline.execute.assert_called_once()
+    redis_client.zadd.assert_not_called()
+
+
+def test_redis_cache_zadd_without_expiration(redis_client: MagicMock) -> None:
+    # given
+    cache = RedisCache()
+    pipeline = redis_client.pipeline.return_value
+
+    # when
+    cache.zadd("models", value="a", score=1.0)
+
+    # then
+    pipeline.zadd.assert_called_once_with("models", {json.dumps("a"): 1.0})
+    assert cache.remove_expired_members(now=100.0) == 0
+
+
+def test_redis_cache_removes_expired_members_of_all_keys_at_once(
+    redis_client: MagicMock,
+) -> None:
+    # given
+    cache = RedisCache()
+    cache.zadd_many(entries=[("a", 1, 1.0), ("b", 2, 1.0)], expire=10)
+    cache.zadd_many(entries=[("b", 3, 1.0)], expire=5)
+    pipeline = redis_client.pipeline.return_value
+    pipeline.execute.return_value = [1, 1]
+
+    # when
+    result = cache.remove_expired_members(now=100.0)
+
+    # then
+    assert result == 2
+    assert sorted(
+        call.args for call in pipeline.zremrangebyscore.call_args_list
+    ) == [("a", "-inf", 90.0), ("b", "-inf", 90.0)]
+
+
+def test_redis_cache_get_many(redis_client: MagicMock) -> None:
+    # given
+    cache = RedisCache()
+    redis_client.mget.return_value = [json.dumps({"a": 1}).encode(), None, b"\x80raw"]
+
+    # when
+    result = cache.get_many(["a", "b", "c"])
+
+    # then
+    redis_client.mget.assert_called_once_with(["a", "b", "c"])
+    assert result == [{"a": 1}, None, b"\x80raw"]
+
+
+def test_redis_cache_set_many(redis_client: MagicMock) -> None:
+    # given
+    cache = RedisCache()
+    pipeline = redis_client.pipeline.return_value
+
+    # when
+    cache.set_many({"a": {"some": "value"}, "b": b"raw"}, expire=5)
+
+    # then
+    pipeline.set.assert_has_calls(
+        [
+            mock.call("a", json.dumps({"some": "value"}), ex=5),
+            mock.call("b", b"raw", ex=5),
+        ]
+    )
+    pipeline.execute.assert_called_once()
+    redis_client.set.assert_not_called()
+
+
+def test_redis_cache_uses_bounded_connection_pool() -> None:
+    # given
+    with mock.patch.object(
+        redis_cache_module.redis, "BlockingConnectionPool"
+    ) as pool_class_mock, mock.patch.object(redis_cache_module.redis, "Redis"):
+        # when
+        _ = RedisCache(host="some", max_connections=7, timeout=3.0)
+
+    # then
+    _, kwargs = pool_class_mock.call_args
+    assert kwargs["host"] == "some"
+    assert kwargs["max_connections"] == 7
+    assert kwargs["timeout"] == 3.0
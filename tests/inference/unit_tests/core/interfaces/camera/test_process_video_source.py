@@ -0,0 +1,81 @@
+import pytest
+
+from inference.core.interfaces.camera.exceptions import (
+    EndOfStreamError,
+    SourceConnectionError,
+)
+from inference.core.interfaces.camera.process_video_source import ProcessVideoSource
+from inference.core.interfaces.camera.video_source import StreamState
+
+
+def test_process_video_source_when_invalid_video_reference_given() -> None:
+    # given
+    source = ProcessVideoSource.init(video_reference="invalid")
+
+    # when
+    with pytest.raises(SourceConnectionError):
+        source.start()
+
+    # then
+    assert source.get_state() is StreamState.ERROR
+
+
+def test_process_video_source_decoding_whole_video_file(
+    local_video_path: str,
+) -> None:
+    # given
+    source = ProcessVideoSource.init(video_reference=local_video_path, source_id=3)
+    source.start()
+    frames = []
+
+    # when
+    while True:
+        try:
+            frames.append(source.read_frame())
+        except EndOfStreamError:
+            break
+
+    # then
+    assert len(frames) == 431, "Expected all frames of the video to be delivered"
+    assert [f.frame_id for f in frames] == list(range(1, 432))
+    assert all(f.source_id == 3 for f in frames)
+    assert frames[0].image.shape == (240, 426, 3)
+    assert source.get_state() is StreamState.ENDED
+
+
+def test_process_video_source_describe_source_when_consumption_started(
+    local_video_path: str,
+) -> None:
+    # given
+    source = ProcessVideoSource.init(video_reference=local_video_path, source_id=1)
+    source.start()
+
+    try:
+        # when
+        result = source.describe_source()
+
+        # then
+        assert result.source_reference == local_video_path
+        assert result.source_id == 1
+        assert result.state is StreamState.RUNNING
+        assert result.source_properties.is_file is True
+        assert result.source_properties.total_frames == 431
+    finally:
+        source.terminate(wait_on_frames_consumption=False)
+
+
+def test_process_video_source_terminated_before_end_of_video(
+    local_video_path: str,
+) -> None:
+    # given
+    source = ProcessVideoSource.init(video_reference=local_video_path)
+    source.start()
+    _ = source.read_frame()
+
+    # when
+    source.terminate()
+
+    # then
+    assert source.get_state() is StreamState.ENDED
+    with pytest.raises(EndOfStreamError):
+        _ = source.read_frame()
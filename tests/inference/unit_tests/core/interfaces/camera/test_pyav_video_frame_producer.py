@@ -0,0 +1,142 @@
+from unittest import mock
+
+import pytest
+
+from inference.core.interfaces.camera import pyav_video_frame_producer
+from inference.core.interfaces.camera.exceptions import DecoderNotAvailableError
+from inference.core.interfaces.camera.pyav_video_frame_producer import (
+    PyAVVideoFrameProducer,
+    get_scaled_size,
+)
+
+
+@pytest.mark.parametrize(
+    "width, height, max_dimension, expected_result",
+    [
+        (1920, 1080, None, (1920, 1080)),
+        (1920, 1080, 1920, (1920, 1080)),
+        (1920, 1080, 640, (640, 360)),
+        (1080, 1920, 640, (360, 640)),
+        (3, 1000, 10, (1, 10)),
+    ],
+)
+def test_get_scaled_size(
+    width: int, height: int, max_dimension: int, expected_result: tuple
+) -> None:
+    # when
+    result = get_scaled_size(width=width, height=height, max_dimension=max_dimension)
+
+    # then
+    assert result == expected_result
+
+
+@mock.patch.object(pyav_video_frame_producer, "av", None)
+def test_pyav_video_frame_producer_when_pyav_not_installed(
+    local_video_path: str,
+) -> None:
+    # when
+    with pytest.raises(DecoderNotAvailableError):
+        _ = PyAVVideoFrameProducer(video=local_video_path)
+
+
+def test_pyav_video_frame_producer_when_invalid_video_reference_given() -> None:
+    # given
+    pytest.importorskip("av")
+
+    # when
+    producer = PyAVVideoFrameProducer(video="invalid")
+
+    # then
+    assert producer.isOpened() is False
+    assert producer.grab() is False
+
+
+def test_pyav_video_frame_producer_decoding_whole_video(
+    local_video_path: str,
+) -> None:
+    # given
+    pytest.importorskip("av")
+    producer = PyAVVideoFrameProducer(video=local_video_path)
+    images = []
+
+    # when
+    try:
+        while producer.grab():
+            _, image = producer.retrieve()
+            images.append(image)
+        properties = producer.discover_source_properties()
+    finally:
+        producer.release()
+
+    # then
+    assert len(images) == 431
+    assert all(image.shape == (240, 426, 3) for image in images)
+    assert properties.width == 426
+    assert properties.height == 240
+    assert properties.total_frames == 431
+    assert properties.is_file is True
+    assert abs(properties.fps - 30.0) < 1e-5
+
+
+def test_pyav_video_frame_producer_when_frames_grabbed_without_retrieval(
+    local_video_path: str,
+) -> None:
+    # given
+    pytest.importorskip("av")
+    producer = PyAVVideoFrameProducer(video=local_video_path)
+
+    # when
+    try:
+        grabbed = sum(producer.grab() for _ in range(10))
+        success, image = producer.retrieve()
+        second_success, second_image = producer.retrieve()
+    finally:
+        producer.release()
+
+    # then
+    assert grabbed == 10
+    assert success is True
+    assert image.shape == (240, 426, 3)
+    assert second_success is False, "Expected each grabbed frame to be retrieved once"
+    assert second_image is None
+
+
+def test_pyav_video_frame_producer_when_max_dimension_given(
+    local_video_path: str,
+) -> None:
+    # given
+    pytest.importorskip("av")
+    producer = PyAVVideoFrameProducer(video=local_video_path, max_dimension=213)
+
+    # when
+    try:
+        producer.grab()
+        _, image = producer.retrieve()
+        properties = producer.discover_source_properties()
+    finally:
+        producer.release()
+
+    # then
+    assert image.shape == (120, 213, 3)
+    assert (properties.width, properties.height) == (213, 120)
+
+
+def test_pyav_video_frame_producer_when_non_reference_frames_skipped(
+    local_video_path: str,
+) -> None:
+    # given
+    pytest.importorskip("av")
+    producer = PyAVVideoFrameProducer(
+        video=local_video_path, skip_non_reference_frames=True
+    )
+
+    # when
+    try:
+        frames_grabbed = 0
+        while producer.grab():
+            frames_grabbed += 1
+    finally:
+        producer.release()
+
+    # then
+    assert 0 < frames_grabbed < 431, "Expected non-reference frames not to be emitted"
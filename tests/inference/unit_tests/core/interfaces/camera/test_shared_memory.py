@@ -0,0 +1,115 @@
+from datetime import datetime
+from multiprocessing import Queue
+
+import numpy as np
+
+from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.camera.shared_memory import (
+    SharedMemoryFramesReader,
+    SharedMemoryFramesWriter,
+    restore_video_frame,
+    share_video_frame,
+)
+
+
+def test_shared_memory_frames_round_trip() -> None:
+    # given
+    free_slots = Queue()
+    writer = SharedMemoryFramesWriter(free_slots=free_slots, slots=2)
+    reader = SharedMemoryFramesReader(free_slots=free_slots)
+    images = [np.ones((16, 16, 3), dtype=np.uint8) * i for i in range(5)]
+
+    try:
+        # when
+        results = []
+        for image in images:
+            reference = writer.write(image=image, timeout=1.0)
+            results.append(reader.read(reference=reference))
+
+        # then
+        for image, result in zip(images, results):
+            assert np.array_equal(image, result)
+        assert (
+            writer.reclaim_slots(timeout=1.0) is True
+        ), "Expected all slots to be released by reader"
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_shared_memory_frames_writer_when_no_slot_released_in_time() -> None:
+    # given
+    free_slots = Queue()
+    writer = SharedMemoryFramesWriter(free_slots=free_slots, slots=1)
+    image = np.zeros((8, 8, 3), dtype=np.uint8)
+
+    try:
+        # when
+        first_reference = writer.write(image=image, timeout=1.0)
+        second_reference = writer.write(image=image, timeout=0.01)
+
+        # then
+        assert first_reference is not None
+        assert (
+            second_reference is None
+        ), "Expected writer to give up as the only slot is not released"
+    finally:
+        writer.close()
+
+
+def test_shared_memory_frames_writer_when_image_bigger_than_slot_given() -> None:
+    # given
+    free_slots = Queue()
+    writer = SharedMemoryFramesWriter(free_slots=free_slots, slots=1)
+    reader = SharedMemoryFramesReader(free_slots=free_slots)
+    small_image = np.zeros((8, 8, 3), dtype=np.uint8)
+    big_image = np.ones((16, 16, 3), dtype=np.uint8)
+
+    try:
+        # when
+        writer.write(image=small_image, timeout=1.0)
+        reference = writer.write(image=big_image, timeout=0.01)
+        result = reader.read(reference=reference)
+
+        # then
+        assert reference.slot is None, "Expected image to be carried inline"
+        assert np.array_equal(result, big_image)
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_share_video_frame_and_restore_video_frame() -> None:
+    # given
+    free_slots = Queue()
+    writer = SharedMemoryFramesWriter(free_slots=free_slots, slots=1)
+    reader = SharedMemoryFramesReader(free_slots=free_slots)
+    timestamp = datetime.now()
+    video_frame = VideoFrame(
+        image=np.ones((8, 8, 3), dtype=np.uint8),
+        frame_id=3,
+        frame_timestamp=timestamp,
+        fps=30,
+        source_id=1,
+        comes_from_video_file=True,
+    )
+
+    try:
+        # when
+        shared_video_frame = share_video_frame(
+            video_frame=video_frame, writer=writer, timeout=1.0
+        )
+        result = restore_video_frame(
+            shared_video_frame=shared_video_frame, reader=reader
+        )
+
+        # then
+        assert np.array_equal(result.image, video_frame.image)
+        assert result.frame_id == 3
+        assert result.frame_timestamp == timestamp
+        assert result.fps == 30
+        assert result.source_id == 1
+        assert result.comes_from_video_file is True
+    finally:
+        reader.close()
+        writer.close()
@@ -28,7 +28,9 @@ from inference.core.interfaces.camera.video_source import (
     SourceProperties,
     StreamState,
     VideoConsumer,
+    VideoDecoderBackend,
     VideoSource,
+    create_video_frame_producer,
     decode_video_frame_to_buffer,
     drop_single_frame_from_buffer,
     get_fps_if_tick_happens_now,
@@ -1289,3 +1291,60 @@ def test_source_properties_initialized_on_video_source_using_string_values(
         ],
         any_order=True,
     )
+
+
+def test_create_video_frame_producer_when_opencv_backend_selected(
+    local_video_path: str,
+) -> None:
+    # when
+    producer = create_video_frame_producer(
+        video=local_video_path,
+        decoder_backend=VideoDecoderBackend.OPENCV,
+    )
+
+    # then
+    try:
+        assert isinstance(producer, CV2VideoFrameProducer)
+    finally:
+        producer.release()
+
+
+def test_create_video_frame_producer_when_pyav_backend_selected(
+    local_video_path: str,
+) -> None:
+    # given
+    pytest.importorskip("av")
+
+    # when
+    producer = create_video_frame_producer(
+        video=local_video_path,
+        decoder_backend=VideoDecoderBackend.PYAV,
+    )
+
+    # then
+    try:
+        assert producer.isOpened() is True
+        assert not isinstance(producer, CV2VideoFrameProducer)
+    finally:
+        producer.release()
+
+
+def test_video_source_when_decoding_max_dimension_given(
+    local_video_path: str,
+) -> None:
+    # given
+    source = VideoSource.init(
+        video_reference=local_video_path, decoding_max_dimension=213
+    )
+    source.start()
+
+    # when
+    try:
+        frame = source.read_frame()
+        source_properties = source.describe_source().source_properties
+    finally:
+        tear_down_source(source=source)
+
+    # then
+    assert frame.image.shape == (120, 213, 3)
+    assert (source_properties.width, source_properties.height) == (213, 120)
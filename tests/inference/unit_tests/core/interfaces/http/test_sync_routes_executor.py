@@ -0,0 +1,65 @@
+import asyncio
+import threading
+
+import pytest
+
+from inference.core.exceptions import ServiceOverloadedError
+from inference.core.interfaces.http.sync_routes_executor import SyncRoutesExecutor
+
+
+def test_sync_routes_executor_when_invalid_max_workers_given() -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = SyncRoutesExecutor(max_workers=0, max_queue_size=1)
+
+
+@pytest.mark.asyncio
+async def test_sync_routes_executor_runs_function_outside_event_loop_thread() -> None:
+    # given
+    executor = SyncRoutesExecutor(max_workers=2, max_queue_size=0)
+
+    def function(a: int, b: int) -> tuple:
+        return a + b, threading.current_thread().name
+
+    # when
+    result, thread_name = await executor.run(function, 1, b=2)
+
+    # then
+    assert result == 3
+    assert thread_name.startswith("sync_route")
+    assert executor.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_sync_routes_executor_propagates_errors() -> None:
+    # given
+    executor = SyncRoutesExecutor(max_workers=1, max_queue_size=0)
+
+    def function() -> None:
+        raise KeyError("some")
+
+    # when
+    with pytest.raises(KeyError):
+        await executor.run(function)
+
+    # then
+    assert executor.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_sync_routes_executor_rejects_calls_beyond_queue_limit() -> None:
+    # given
+    executor = SyncRoutesExecutor(max_workers=1, max_queue_size=1)
+    release = threading.Event()
+    running_tasks = [asyncio.create_task(executor.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+
+    # when
+    with pytest.raises(ServiceOverloadedError):
+        await executor.run(release.wait)
+    release.set()
+    results = await asyncio.gather(*running_tasks)
+
+    # then
+    assert results == [True, True]
+    assert executor.pending == 0
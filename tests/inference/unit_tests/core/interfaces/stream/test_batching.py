@@ -0,0 +1,179 @@
+from datetime import datetime
+from threading import Event
+from typing import Generator, List
+
+import numpy as np
+import pytest
+
+from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.stream import batching
+from inference.core.interfaces.stream.batching import (
+    AdaptiveBatchCollectionTimeout,
+    collect_batches_in_background,
+    get_model_max_batch_size,
+    split_batch,
+)
+
+
+def _frames(number: int) -> List[VideoFrame]:
+    return [
+        VideoFrame(
+            image=np.zeros((8, 8, 3), dtype=np.uint8),
+            frame_id=i,
+            frame_timestamp=datetime.now(),
+            source_id=i,
+        )
+        for i in range(number)
+    ]
+
+
+def test_adaptive_batch_collection_timeout_when_no_latency_registered() -> None:
+    # given
+    tuner = AdaptiveBatchCollectionTimeout(max_timeout=0.5)
+
+    # when
+    result = tuner.get_timeout()
+
+    # then
+    assert result == 0.5
+
+
+def test_adaptive_batch_collection_timeout_when_no_latency_registered_and_no_bound() -> (
+    None
+):
+    # given
+    tuner = AdaptiveBatchCollectionTimeout()
+
+    # when
+    result = tuner.get_timeout()
+
+    # then
+    assert result is None
+
+
+def test_adaptive_batch_collection_timeout_follows_moving_average_of_latency() -> None:
+    # given
+    tuner = AdaptiveBatchCollectionTimeout(max_timeout=1.0, smoothing_factor=0.5)
+
+    # when
+    tuner.register_inference_latency(latency=0.1)
+    tuner.register_inference_latency(latency=0.3)
+
+    # then
+    assert abs(tuner.get_timeout() - 0.2) < 1e-6
+
+
+def test_adaptive_batch_collection_timeout_is_bounded() -> None:
+    # given
+    slow_model_tuner = AdaptiveBatchCollectionTimeout(max_timeout=0.05)
+    fast_model_tuner = AdaptiveBatchCollectionTimeout(min_timeout=0.01)
+
+    # when
+    slow_model_tuner.register_inference_latency(latency=1.0)
+    fast_model_tuner.register_inference_latency(latency=0.0)
+
+    # then
+    assert slow_model_tuner.get_timeout() == 0.05
+    assert fast_model_tuner.get_timeout() == 0.01
+
+
+class DynamicBatchModelStub:
+    batching_enabled = True
+    batch_size = "batch"
+
+
+class StaticBatchModelStub:
+    batching_enabled = False
+    batch_size = 4
+
+
+def test_get_model_max_batch_size_for_dynamic_batch_model() -> None:
+    # when
+    result = get_model_max_batch_size(model=DynamicBatchModelStub())
+
+    # then
+    assert result == batching.MAX_BATCH_SIZE
+
+
+def test_get_model_max_batch_size_for_static_batch_model() -> None:
+    # when
+    result = get_model_max_batch_size(model=StaticBatchModelStub())
+
+    # then
+    assert result == 4
+
+
+def test_split_batch_when_batch_does_not_exceed_max_batch_size() -> None:
+    # given
+    frames = _frames(number=3)
+
+    # when
+    result = split_batch(video_frames=frames, max_batch_size=float("inf"))
+
+    # then
+    assert result == [frames]
+
+
+def test_split_batch_when_batch_exceeds_max_batch_size() -> None:
+    # given
+    frames = _frames(number=5)
+
+    # when
+    result = split_batch(video_frames=frames, max_batch_size=2)
+
+    # then
+    assert result == [frames[:2], frames[2:4], frames[4:]]
+
+
+def test_collect_batches_in_background_yields_all_batches_in_order() -> None:
+    # given
+    batches = [_frames(number=i + 1) for i in range(10)]
+
+    # when
+    result = list(
+        collect_batches_in_background(
+            batches=iter(batches), max_batches_in_queue=1, stop_collection=Event()
+        )
+    )
+
+    # then
+    assert result == batches
+
+
+def test_collect_batches_in_background_re_raises_collection_error() -> None:
+    # given
+    def batches() -> Generator[List[VideoFrame], None, None]:
+        yield _frames(number=1)
+        raise ValueError("broken source")
+
+    results = []
+
+    # when
+    with pytest.raises(ValueError):
+        for batch in collect_batches_in_background(
+            batches=batches(), max_batches_in_queue=1, stop_collection=Event()
+        ):
+            results.append(batch)
+
+    # then
+    assert len(results) == 1
+
+
+def test_collect_batches_in_background_stops_collection_when_consumer_stops() -> None:
+    # given
+    stop_collection = Event()
+
+    def batches() -> Generator[List[VideoFrame], None, None]:
+        while not stop_collection.is_set():
+            yield _frames(number=1)
+
+    generator = collect_batches_in_background(
+        batches=batches(), max_batches_in_queue=2, stop_collection=stop_collection
+    )
+
+    # when
+    _ = next(generator)
+    generator.close()
+
+    # then
+    assert stop_collection.is_set()
@@ -4,6 +4,7 @@ from functools import partial
 from queue import Queue
 from threading import Lock
 from typing import Any, List, Optional, Tuple, Union
+from unittest import mock
 from unittest.mock import MagicMock
 
 import numpy as np
@@ -34,7 +35,12 @@ from inference.core.interfaces.stream.model_handlers.roboflow_models import (
     default_process_frame,
 )
 from inference.core.interfaces.stream.sinks import active_learning_sink, multi_sink
-from inference.core.interfaces.stream.watchdog import BasePipelineWatchDog
+from inference.core.interfaces.stream.watchdog import (
+    BasePipelineWatchDog,
+    ProfilingPipelineWatchDog,
+)
+from inference.core.utils.stage_timing import measure_stage
+from inference.core.workflows.execution_engine.core import ExecutionEngine
 
 
 class VideoSourceStub:
@@ -92,6 +98,9 @@ class VideoSourceStub:
             source_id=self.source_id,
         )
 
+    def count_buffered_frames(self) -> int:
+        return 0
+
     def read_frame(self, timeout: Optional[float] = None) -> VideoFrame:
         self._calls.append("read_frame")
         if self._emissions_in_current_round == self._frames_number:
@@ -362,6 +371,98 @@ def test_inference_pipeline_works_correctly_against_multiple_streams_including_r
     ), "Expected to process at least one frame after reconnection to source 2"
 
 
+def test_inference_pipeline_works_correctly_against_multiple_video_files_with_adaptive_batching() -> (
+    None
+):
+    # given
+    video_source_1 = VideoSourceStub(frames_number=100, is_file=True, source_id=0)
+    video_source_2 = VideoSourceStub(frames_number=130, is_file=True, source_id=1)
+    watchdog = BasePipelineWatchDog()
+    watchdog.register_video_sources(video_sources=[video_source_1, video_source_2])
+    accumulator = []
+    batch_sizes = []
+
+    def on_video_frame(video_frames: List[VideoFrame]) -> List[dict]:
+        batch_sizes.append(len(video_frames))
+        return [{"frame_id": f.frame_id} for f in video_frames]
+
+    def on_prediction(predictions: List[dict], video_frames: List[VideoFrame]) -> None:
+        for frame_prediction, video_frame in zip(predictions, video_frames):
+            if frame_prediction is None:
+                continue
+            accumulator.append((video_frame, frame_prediction))
+
+    inference_pipeline = InferencePipeline(
+        on_video_frame=on_video_frame,
+        video_sources=[video_source_1, video_source_2],
+        on_prediction=on_prediction,
+        predictions_queue=Queue(maxsize=512),
+        watchdog=watchdog,
+        status_update_handlers=[watchdog.on_status_update],
+        adaptive_batching=True,
+        max_batch_size=1,
+    )
+
+    # when
+    inference_pipeline.start()
+    inference_pipeline.join()
+
+    # then
+    assert len(accumulator) == 100 + 130, "Expected all video frames to be processed"
+    assert set(batch_sizes) == {1}, "Expected batches not to exceed max batch size"
+    frames_by_sources = defaultdict(list)
+    for video_frame, prediction in accumulator:
+        assert prediction["frame_id"] == video_frame.frame_id
+        frames_by_sources[video_frame.source_id].append(video_frame.frame_id)
+    assert frames_by_sources[0] == list(
+        range(1, 101)
+    ), "Order of prediction frames violated for source 0"
+    assert frames_by_sources[1] == list(
+        range(1, 131)
+    ), "Order of prediction frames violated for source 1"
+    assert (
+        inference_pipeline._batch_collection_timeout_tuner.latency is not None
+    ), "Expected inference latency to be measured"
+
+
+def test_inference_pipeline_reports_stages_durations_to_profiling_watchdog() -> None:
+    # given
+    video_source = VideoSourceStub(frames_number=100, is_file=True, source_id=0)
+    watchdog = ProfilingPipelineWatchDog()
+    watchdog.register_video_sources(video_sources=[video_source])
+    predictions_queue = Queue(maxsize=512)
+    watchdog.register_predictions_queue(predictions_queue=predictions_queue)
+
+    def on_video_frame(video_frames: List[VideoFrame]) -> List[dict]:
+        with measure_stage("forward"):
+            predictions = [{"frame_id": f.frame_id} for f in video_frames]
+        return predictions
+
+    inference_pipeline = InferencePipeline(
+        on_video_frame=on_video_frame,
+        video_sources=[video_source],
+        on_prediction=lambda predictions, video_frame: None,
+        predictions_queue=predictions_queue,
+        watchdog=watchdog,
+        status_update_handlers=[watchdog.on_status_update],
+    )
+
+    # when
+    inference_pipeline.start()
+    inference_pipeline.join()
+    result = watchdog.get_report().profiling_report
+
+    # then
+    samples_by_stage = {s.stage: s.samples for s in result.stages_reports}
+    assert samples_by_stage == {
+        "batch_assembly": 100,
+        "forward": 100,
+        "inference": 100,
+        "sink": 100,
+    }, "Expected stages of each batch to be measured"
+    assert result.predictions_queue_size == 0
+
+
 @pytest.mark.parametrize("use_main_thread", [True, False])
 def test_inference_pipeline_works_correctly_against_stream_including_dispatching_errors(
     use_main_thread: bool,
@@ -658,3 +759,32 @@ def test_inference_pipeline_works_correctly_against_multiple_video_files_with_ac
     assert frames_by_sources[1] == list(
         range(1, 431 * 2 + 1)
     ), "Order of prediction frames violated for source 1"
+
+
+@mock.patch.object(ExecutionEngine, "init")
+@mock.patch.object(InferencePipeline, "init_with_custom_logic")
+def test_inference_pipeline_init_with_workflow_forwards_processing_options(
+    init_with_custom_logic_mock: MagicMock,
+    execution_engine_init_mock: MagicMock,
+) -> None:
+    # when
+    result = InferencePipeline.init_with_workflow(
+        video_reference=["a.mp4", "b.mp4"],
+        workflow_specification={"version": "1.0", "inputs": [], "steps": []},
+        api_key="my-api-key",
+        batch_collection_timeout=0.05,
+        adaptive_batching=True,
+        decode_in_separate_processes=True,
+        sink_in_separate_process=True,
+    )
+
+    # then
+    assert result is init_with_custom_logic_mock.return_value
+    execution_engine_init_mock.assert_called_once()
+    call_kwargs = init_with_custom_logic_mock.call_args[1]
+    assert call_kwargs["video_reference"] == ["a.mp4", "b.mp4"]
+    assert call_kwargs["batch_collection_timeout"] == 0.05
+    assert call_kwargs["adaptive_batching"] is True
+    assert call_kwargs["decode_in_separate_processes"] is True
+    assert call_kwargs["sink_in_separate_process"] is True
+    call_kwargs["on_pipeline_end"]()
@@ -1,6 +1,8 @@
 import json
+import time
 from datetime import datetime
 from functools import partial
+from multiprocessing import Queue
 from typing import List, Union
 from unittest.mock import MagicMock
 
@@ -14,6 +16,7 @@ from inference.core.entities.responses.inference import (
 from inference.core.interfaces.camera.entities import VideoFrame
 from inference.core.interfaces.stream.sinks import (
     ImageWithSourceID,
+    ProcessSink,
     UDPSink,
     active_learning_sink,
     multi_sink,
@@ -394,3 +397,76 @@ def test_active_learning_sink_with_batch_input() -> None:
         prediction_type="object-detection",
         disable_preproc_auto_orient=False,
     )
+
+
+def _forward_to_queue(predictions, video_frame, results: Queue) -> None:
+    frames = video_frame if issubclass(type(video_frame), list) else [video_frame]
+    results.put(
+        (
+            predictions,
+            [
+                None if f is None else (f.frame_id, f.source_id, f.image.sum())
+                for f in frames
+            ],
+        )
+    )
+
+
+def test_process_sink_passes_predictions_and_frames_to_sink_process() -> None:
+    # given
+    results = Queue()
+    process_sink = ProcessSink.init(
+        on_prediction=partial(_forward_to_queue, results=results),
+        shared_memory_slots=2,
+    )
+    video_frames = [
+        VideoFrame(
+            image=np.ones((32, 32, 3), dtype=np.uint8) * i,
+            frame_id=i,
+            frame_timestamp=datetime.now(),
+            source_id=i % 2,
+        )
+        for i in range(1, 6)
+    ]
+
+    # when
+    try:
+        for video_frame in video_frames:
+            process_sink.on_prediction(
+                [{"frame": video_frame.frame_id}, None], [video_frame, None]
+            )
+    finally:
+        process_sink.stop()
+    received = [results.get(timeout=5.0) for _ in video_frames]
+
+    # then
+    assert received == [
+        ([{"frame": i}, None], [(i, i % 2, 32 * 32 * 3 * i), None]) for i in range(1, 6)
+    ], "Expected all predictions with frames restored from shared memory in order"
+
+
+def _block_for_long_time(predictions, video_frame) -> None:
+    time.sleep(60)
+
+
+def test_process_sink_terminates_sink_process_not_finished_within_timeout() -> None:
+    # given
+    process_sink = ProcessSink.init(
+        on_prediction=_block_for_long_time,
+        shared_memory_slots=1,
+    )
+    video_frame = VideoFrame(
+        image=np.ones((32, 32, 3), dtype=np.uint8),
+        frame_id=1,
+        frame_timestamp=datetime.now(),
+    )
+    process_sink.on_prediction({"frame": 1}, video_frame)
+    process = process_sink._process
+
+    # when
+    stop_started = time.monotonic()
+    process_sink.stop(timeout=0.5)
+
+    # then
+    assert time.monotonic() - stop_started < 10.0
+    assert process.is_alive() is False
@@ -1,16 +1,26 @@
 from datetime import datetime, timedelta
+from queue import Queue
 from typing import Optional
 from unittest.mock import MagicMock
 
 import numpy as np
 
-from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.camera.entities import (
+    StatusUpdate,
+    UpdateSeverity,
+    VideoFrame,
+)
+from inference.core.interfaces.camera.video_source import (
+    FRAME_DECODED_EVENT,
+    FRAME_DROPPED_EVENT,
+)
 from inference.core.interfaces.stream.entities import (
     LatencyMonitorReport,
     ModelActivityEvent,
 )
 from inference.core.interfaces.stream.watchdog import (
     BasePipelineWatchDog,
+    ProfilingPipelineWatchDog,
     are_events_compatible,
     average_property_values,
     compute_events_latency,
@@ -293,3 +303,116 @@ def test_base_watchdog_gives_correct_report_when_all_events_are_in_series_relate
     assert (
         result.sources_metadata[0] == "METADATA"
     ), "Metadata must match mocked video source response"
+
+
+def test_profiling_watchdog_measures_pipeline_stages() -> None:
+    # given
+    watchdog = ProfilingPipelineWatchDog()
+    source_mock = MagicMock()
+    source_mock.source_id = 0
+    source_mock.count_buffered_frames.return_value = 3
+    watchdog.register_video_sources(video_sources=[source_mock])
+    predictions_queue = Queue()
+    predictions_queue.put("predictions")
+    watchdog.register_predictions_queue(predictions_queue=predictions_queue)
+    frame_timestamp = datetime.now() - timedelta(seconds=0.5)
+    decoding_timestamp = frame_timestamp + timedelta(seconds=0.125)
+    video_frame = VideoFrame(
+        image=np.zeros((192, 168, 3)),
+        source_id=0,
+        frame_id=1,
+        frame_timestamp=frame_timestamp,
+    )
+
+    # when
+    watchdog.on_status_update(
+        status_update=StatusUpdate(
+            timestamp=decoding_timestamp,
+            severity=UpdateSeverity.DEBUG,
+            event_type=FRAME_DECODED_EVENT,
+            payload={
+                "frame_timestamp": frame_timestamp,
+                "frame_id": 1,
+                "source_id": 0,
+            },
+            context="video_source.video_consumer",
+        )
+    )
+    for frame_id in [2, 3]:
+        watchdog.on_status_update(
+            status_update=StatusUpdate(
+                timestamp=datetime.now(),
+                severity=UpdateSeverity.DEBUG,
+                event_type=FRAME_DROPPED_EVENT,
+                payload={
+                    "frame_timestamp": frame_timestamp,
+                    "frame_id": frame_id,
+                    "cause": "DROP_LATEST strategy",
+                    "source_id": 0,
+                },
+                context="video_source.video_consumer",
+            )
+        )
+    watchdog.on_batch_collected(frames=[video_frame], collection_duration=0.25)
+    watchdog.on_model_inference_started(frames=[video_frame])
+    watchdog.on_model_inference_stages_measured(
+        frames=[video_frame],
+        stages_durations={"preprocess": 0.5, "forward": 1.0, "inference": 2.0},
+    )
+    watchdog.on_model_prediction_ready(frames=[video_frame])
+    watchdog.on_predictions_dispatched(frames=[video_frame], dispatching_duration=0.75)
+    result = watchdog.get_report().profiling_report
+
+    # then
+    stages = {(s.stage, s.source_id): s for s in result.stages_reports}
+    assert set(stages.keys()) == {
+        ("decode", 0),
+        ("buffer_wait", 0),
+        ("batch_assembly", None),
+        ("preprocess", None),
+        ("forward", None),
+        ("inference", None),
+        ("sink", None),
+    }
+    assert abs(stages[("decode", 0)].average - 0.125) < 1e-5
+    assert stages[("buffer_wait", 0)].average >= 0.375
+    assert stages[("batch_assembly", None)].p99 == 0.25
+    assert stages[("forward", None)].samples == 1
+    assert stages[("sink", None)].p50 == 0.75
+    assert len(result.sources_reports) == 1
+    assert result.sources_reports[0].source_id == 0
+    assert result.sources_reports[0].buffered_frames == 3
+    assert result.sources_reports[0].dropped_frames == 2
+    assert result.predictions_queue_size == 1
+
+
+def test_profiling_watchdog_exports_metrics_in_prometheus_format() -> None:
+    # given
+    watchdog = ProfilingPipelineWatchDog()
+    another_watchdog = ProfilingPipelineWatchDog()
+    video_frame = VideoFrame(
+        image=np.zeros((192, 168, 3)),
+        source_id=None,
+        frame_id=1,
+        frame_timestamp=datetime.now(),
+    )
+
+    # when
+    watchdog.on_model_inference_stages_measured(
+        frames=[video_frame], stages_durations={"inference": 0.003}
+    )
+    result = watchdog.export_metrics().decode("utf-8")
+    another_result = another_watchdog.export_metrics().decode("utf-8")
+
+    # then
+    assert (
+        'inference_pipeline_stage_duration_seconds_bucket{le="0.005",source_id="",stage="inference"} 1.0'
+        in result
+    )
+    assert (
+        'inference_pipeline_stage_duration_seconds_count{source_id="",stage="inference"} 1.0'
+        in result
+    )
+    assert (
+        "inference_pipeline_stage_duration_seconds_count" not in another_result
+    ), "Expected metrics of watchdogs not to be shared"
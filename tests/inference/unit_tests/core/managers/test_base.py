@@ -102,6 +102,50 @@ async def test_infer_from_request_when_model_is_available_but_exception_raised()
     model_manager._models["some/1"].infer_from_request.assert_called_once_with(request)
 
 
+def test_infer_from_request_native_when_model_not_available() -> None:
+    # given
+    model_registry = MagicMock()
+    model_manager = ModelManager(model_registry=model_registry)
+
+    with pytest.raises(InferenceModelNotFound):
+        model_manager.infer_from_request_native(model_id="some/1", request=MagicMock())
+
+
+def test_infer_from_request_native_when_model_is_available() -> None:
+    # given
+    model_registry = MagicMock()
+    model_manager = ModelManager(model_registry=model_registry)
+    model_manager._models = {"some/1": MagicMock()}
+    request = MagicMock()
+
+    # when
+    result = model_manager.infer_from_request_native(model_id="some/1", request=request)
+
+    # then
+    model = model_manager._models["some/1"]
+    assert result == model.infer_native_from_request.return_value
+    model.infer_native_from_request.assert_called_once_with(request)
+
+
+def test_supports_native_inference() -> None:
+    # given
+    model_registry = MagicMock()
+    model_manager = ModelManager(model_registry=model_registry)
+    model_manager._models = {
+        "some/1": MagicMock(native_inference_supported=True),
+        "other/1": MagicMock(native_inference_supported=False),
+    }
+
+    # when
+    results = [
+        model_manager.supports_native_inference(model_id=model_id)
+        for model_id in ["some/1", "other/1", "not-loaded/1"]
+    ]
+
+    # then
+    assert results == [True, False, False]
+
+
 def test_make_response_when_model_available() -> None:
     # given
     model_registry = MagicMock()
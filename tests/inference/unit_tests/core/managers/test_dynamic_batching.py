@@ -0,0 +1,216 @@
+import asyncio
+from typing import List, Union
+from unittest.mock import MagicMock
+
+import pytest
+
+from inference.core.entities.requests.inference import (
+    InferenceRequestImage,
+    ObjectDetectionInferenceRequest,
+)
+from inference.core.entities.responses.inference import ObjectDetectionInferenceResponse
+from inference.core.managers.decorators.dynamic_batching import WithDynamicBatching
+
+
+class StubModelManager:
+    def __init__(
+        self,
+        batching_enabled: bool = True,
+        error: Exception = None,
+        invalid_image_value: int = None,
+    ):
+        self.batching_enabled = batching_enabled
+        self.error = error
+        self.invalid_image_value = invalid_image_value
+        self.received_requests = []
+
+    def __getitem__(self, model_id: str) -> MagicMock:
+        return MagicMock(batching_enabled=self.batching_enabled)
+
+    async def infer_from_request(
+        self, model_id: str, request: ObjectDetectionInferenceRequest, **kwargs
+    ) -> Union[
+        ObjectDetectionInferenceResponse, List[ObjectDetectionInferenceResponse]
+    ]:
+        self.received_requests.append(request)
+        if self.error is not None:
+            raise self.error
+        images = request.image if isinstance(request.image, list) else [request.image]
+        if any(int(image.value) == self.invalid_image_value for image in images):
+            raise ValueError("Invalid image")
+        responses = [
+            ObjectDetectionInferenceResponse(
+                predictions=[],
+                image={"width": int(image.value), "height": int(image.value)},
+                inference_id=request.id,
+            )
+            for image in images
+        ]
+        if isinstance(request.image, list):
+            return responses
+        return responses[0]
+
+
+def assembly_request(
+    image_sizes: Union[int, List[int]], **kwargs
+) -> ObjectDetectionInferenceRequest:
+    if isinstance(image_sizes, list):
+        image = [InferenceRequestImage(type="numpy", value=s) for s in image_sizes]
+    else:
+        image = InferenceRequestImage(type="numpy", value=image_sizes)
+    return ObjectDetectionInferenceRequest(model_id="some/1", image=image, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_coalesced_into_single_batch() -> None:
+    # given
+    model_manager = StubModelManager()
+    decorator = WithDynamicBatching(model_manager, max_batch_size=8, max_wait_ms=50)
+    requests = [
+        assembly_request(image_sizes=10),
+        assembly_request(image_sizes=[20, 30]),
+        assembly_request(image_sizes=40),
+    ]
+
+    # when
+    results = await asyncio.gather(
+        *[decorator.infer_from_request("some/1", request) for request in requests]
+    )
+
+    # then
+    assert len(model_manager.received_requests) == 1
+    assert len(model_manager.received_requests[0].image) == 4
+    assert results[0].image.width == 10
+    assert results[0].inference_id == requests[0].id
+    assert [r.image.width for r in results[1]] == [20, 30]
+    assert all(r.inference_id == requests[1].id for r in results[1])
+    assert results[2].image.width == 40
+    assert results[2].inference_id == requests[2].id
+
+
+@pytest.mark.asyncio
+async def test_batch_is_dispatched_once_max_batch_size_reached() -> None:
+    # given
+    model_manager = StubModelManager()
+    decorator = WithDynamicBatching(model_manager, max_batch_size=2, max_wait_ms=50)
+    requests = [assembly_request(image_sizes=i) for i in range(1, 4)]
+
+    # when
+    results = await asyncio.gather(
+        *[decorator.infer_from_request("some/1", request) for request in requests]
+    )
+
+    # then
+    assert [
+        len(r.image) if isinstance(r.image, list) else 1
+        for r in model_manager.received_requests
+    ] == [2, 1]
+    assert [r.image.width for r in results] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_requests_with_different_parameters_are_not_coalesced() -> None:
+    # given
+    model_manager = StubModelManager()
+    decorator = WithDynamicBatching(model_manager, max_batch_size=8, max_wait_ms=20)
+    requests = [
+        assembly_request(image_sizes=10, confidence=0.3),
+        assembly_request(image_sizes=20, confidence=0.5),
+    ]
+
+    # when
+    results = await asyncio.gather(
+        *[decorator.infer_from_request("some/1", request) for request in requests]
+    )
+
+    # then
+    assert len(model_manager.received_requests) == 2
+    assert model_manager.received_requests[0] is requests[0]
+    assert model_manager.received_requests[1] is requests[1]
+    assert [r.image.width for r in results] == [10, 20]
+
+
+@pytest.mark.asyncio
+async def test_requests_are_passed_through_when_model_does_not_support_batching() -> (
+    None
+):
+    # given
+    model_manager = StubModelManager(batching_enabled=False)
+    decorator = WithDynamicBatching(model_manager, max_batch_size=8, max_wait_ms=20)
+    requests = [assembly_request(image_sizes=10), assembly_request(image_sizes=20)]
+
+    # when
+    _ = await asyncio.gather(
+        *[decorator.infer_from_request("some/1", request) for request in requests]
+    )
+
+    # then
+    assert model_manager.received_requests == requests
+
+
+@pytest.mark.asyncio
+async def test_requests_are_passed_through_when_visualisation_requested() -> None:
+    # given
+    model_manager = StubModelManager()
+    decorator = WithDynamicBatching(model_manager, max_batch_size=8, max_wait_ms=20)
+    requests = [
+        assembly_request(image_sizes=10, visualize_predictions=True),
+        assembly_request(image_sizes=20, visualize_predictions=True),
+    ]
+
+    # when
+    _ = await asyncio.gather(
+        *[decorator.infer_from_request("some/1", request) for request in requests]
+    )
+
+    # then
+    assert model_manager.received_requests == requests
+
+
+@pytest.mark.asyncio
+async def test_batch_error_is_propagated_to_all_callers() -> None:
+    # given
+    model_manager = StubModelManager(error=RuntimeError("some"))
+    decorator = WithDynamicBatching(model_manager, max_batch_size=8, max_wait_ms=20)
+    requests = [assembly_request(image_sizes=10), assembly_request(image_sizes=20)]
+
+    # when
+    results = await asyncio.gather(
+        *[decorator.infer_from_request("some/1", request) for request in requests],
+        return_exceptions=True,
+    )
+
+    # then
+    assert (
+        len(model_manager.received_requests) == 3
+    ), "Expected batch attempt followed by retry of each request"
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_invalid_request_in_batch_only_fails_its_caller() -> None:
+    # given
+    model_manager = StubModelManager(invalid_image_value=30)
+    decorator = WithDynamicBatching(model_manager, max_batch_size=8, max_wait_ms=20)
+    requests = [
+        assembly_request(image_sizes=10),
+        assembly_request(image_sizes=[20, 30]),
+        assembly_request(image_sizes=40),
+        assembly_request(image_sizes=50),
+    ]
+
+    # when
+    results = await asyncio.gather(
+        *[decorator.infer_from_request("some/1", request) for request in requests],
+        return_exceptions=True,
+    )
+
+    # then
+    assert len(model_manager.received_requests[0].image) == 5
+    assert len(model_manager.received_requests) == 5
+    assert results[0].image.width == 10
+    assert results[0].inference_id == requests[0].id
+    assert isinstance(results[1], ValueError)
+    assert results[2].image.width == 40
+    assert results[2].inference_id == requests[2].id
+    assert results[3].image.width == 50
@@ -0,0 +1,286 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+from unittest import mock
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators import fixed_size_cache
+from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
+
+BYTES_IN_MB = 1024 * 1024
+
+
+def assembly_model_manager(
+    memory_mb: Dict[str, float], load_time: Optional[Dict[str, float]] = None
+) -> ModelManager:
+    load_time = load_time or {}
+
+    class StubModel:
+        task_type = "object-detection"
+
+        def __init__(self, model_id: str, api_key: str):
+            time.sleep(load_time.get(model_id, 0.0))
+            self.model_id = model_id
+
+        def memory_footprint(self) -> int:
+            return int(memory_mb[self.model_id] * BYTES_IN_MB)
+
+        def clear_cache(self) -> None:
+            pass
+
+    model_registry = MagicMock()
+    model_registry.get_model.return_value = StubModel
+    return ModelManager(model_registry=model_registry)
+
+
+def test_fixed_size_cache_evicts_least_recently_used_model_when_usage_is_equal() -> (
+    None
+):
+    # given
+    model_manager = assembly_model_manager(memory_mb={"a/1": 10, "b/1": 10, "c/1": 10})
+    cache = WithFixedSizeCache(model_manager, max_size=2, max_memory_mb=None)
+    cache.add_model("a/1", api_key="key")
+    cache.add_model("b/1", api_key="key")
+
+    # when
+    cache.add_model("c/1", api_key="key")
+
+    # then
+    assert set(cache.keys()) == {"b/1", "c/1"}
+
+
+def test_fixed_size_cache_keeps_frequently_used_model() -> None:
+    # given
+    model_manager = assembly_model_manager(memory_mb={"a/1": 10, "b/1": 10, "c/1": 10})
+    cache = WithFixedSizeCache(model_manager, max_size=2, max_memory_mb=None)
+    cache.add_model("a/1", api_key="key")
+    for _ in range(5):
+        cache.add_model("a/1", api_key="key")
+    cache.add_model("b/1", api_key="key")
+
+    # when
+    cache.add_model("c/1", api_key="key")
+
+    # then
+    assert set(cache.keys()) == {"a/1", "c/1"}
+
+
+def test_fixed_size_cache_evicts_cheap_to_reload_model_first() -> None:
+    # given
+    model_manager = assembly_model_manager(
+        memory_mb={"a/1": 10, "b/1": 10, "c/1": 10},
+        load_time={"a/1": 0.1},
+    )
+    cache = WithFixedSizeCache(model_manager, max_size=2, max_memory_mb=None)
+    cache.add_model("a/1", api_key="key")
+    cache.add_model("b/1", api_key="key")
+
+    # when
+    cache.add_model("c/1", api_key="key")
+
+    # then
+    assert set(cache.keys()) == {"a/1", "c/1"}
+
+
+def test_fixed_size_cache_evicts_models_when_memory_budget_exceeded() -> None:
+    # given
+    model_manager = assembly_model_manager(
+        memory_mb={"small/1": 10, "small/2": 10, "large/1": 100}
+    )
+    cache = WithFixedSizeCache(model_manager, max_size=8, max_memory_mb=115)
+    cache.add_model("small/1", api_key="key")
+    cache.add_model("small/2", api_key="key")
+
+    # when
+    cache.add_model("large/1", api_key="key")
+
+    # then
+    assert set(cache.keys()) == {"small/2", "large/1"}
+
+
+def test_fixed_size_cache_never_evicts_just_loaded_model() -> None:
+    # given
+    model_manager = assembly_model_manager(memory_mb={"small/1": 10, "large/1": 100})
+    cache = WithFixedSizeCache(model_manager, max_size=8, max_memory_mb=50)
+    cache.add_model("small/1", api_key="key")
+
+    # when
+    cache.add_model("large/1", api_key="key")
+
+    # then
+    assert set(cache.keys()) == {"large/1"}
+
+
+def test_fixed_size_cache_describes_memory_and_load_time_of_models() -> None:
+    # given
+    model_manager = assembly_model_manager(memory_mb={"a/1": 10})
+    cache = WithFixedSizeCache(model_manager, max_size=2, max_memory_mb=None)
+    cache.add_model("a/1", api_key="key")
+
+    # when
+    result = cache.describe_models()
+
+    # then
+    assert len(result) == 1
+    assert result[0].model_id == "a/1"
+    assert result[0].memory_bytes == 10 * BYTES_IN_MB
+    assert result[0].load_time >= 0
+
+
+def test_fixed_size_cache_when_model_failed_to_load() -> None:
+    # given
+    model_registry = MagicMock()
+    model_registry.get_model.return_value = MagicMock(side_effect=RuntimeError())
+    cache = WithFixedSizeCache(
+        ModelManager(model_registry=model_registry), max_size=2, max_memory_mb=None
+    )
+
+    # when
+    try:
+        cache.add_model("a/1", api_key="key")
+    except RuntimeError:
+        pass
+
+    # then
+    assert len(cache) == 0
+    assert len(cache._models_usage) == 0
+
+
+def test_estimation_of_model_memory_accounts_for_caches() -> None:
+    # given
+    model_registry = MagicMock()
+
+    class StubModel:
+        task_type = "instance-segmentation"
+
+        def __init__(self, model_id: str, api_key: str):
+            self.embedding_cache = {}
+
+    model_registry.get_model.return_value = StubModel
+    model_manager = ModelManager(model_registry=model_registry)
+    cache = WithFixedSizeCache(model_manager, max_size=2, max_memory_mb=None)
+    cache.add_model("sam/1", api_key="key")
+
+    # when
+    model_manager["sam/1"].embedding_cache["image"] = np.zeros((1024,), dtype=np.uint8)
+    result = cache.describe_models()
+
+    # then
+    assert result[0].memory_bytes == 1024
+
+
+def test_fixed_size_cache_loads_model_once_when_requested_concurrently() -> None:
+    # given
+    model_registry = MagicMock()
+    loaded_models = []
+
+    class StubModel:
+        task_type = "object-detection"
+
+        def __init__(self, model_id: str, api_key: str):
+            time.sleep(0.05)
+            loaded_models.append(model_id)
+
+    model_registry.get_model.return_value = StubModel
+    cache = WithFixedSizeCache(
+        ModelManager(model_registry=model_registry), max_size=2, max_memory_mb=None
+    )
+
+    # when
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        _ = list(
+            executor.map(lambda _: cache.add_model("a/1", api_key="key"), range(4))
+        )
+
+    # then
+    assert loaded_models == ["a/1"]
+    assert list(cache.keys()) == ["a/1"]
+
+
+@mock.patch.object(fixed_size_cache, "estimate_model_memory_bytes")
+def test_fixed_size_cache_does_not_estimate_memory_when_budget_not_set(
+    estimate_model_memory_bytes_mock: MagicMock,
+) -> None:
+    # given
+    model_manager = assembly_model_manager(memory_mb={"a/1": 10, "b/1": 10, "c/1": 10})
+    cache = WithFixedSizeCache(model_manager, max_size=2, max_memory_mb=None)
+
+    # when
+    cache.add_model("a/1", api_key="key")
+    cache.add_model("b/1", api_key="key")
+    cache.add_model("c/1", api_key="key")
+
+    # then
+    estimate_model_memory_bytes_mock.assert_not_called()
+    assert set(cache.keys()) == {"b/1", "c/1"}
+
+
+@mock.patch.object(fixed_size_cache, "estimate_weights_memory_bytes")
+def test_fixed_size_cache_estimates_model_weights_only_once(
+    estimate_weights_memory_bytes_mock: MagicMock,
+) -> None:
+    # given
+    estimate_weights_memory_bytes_mock.return_value = 10 * BYTES_IN_MB
+    model_registry = MagicMock()
+
+    class StubModel:
+        task_type = "object-detection"
+
+        def __init__(self, model_id: str, api_key: str):
+            pass
+
+    model_registry.get_model.return_value = StubModel
+    cache = WithFixedSizeCache(
+        ModelManager(model_registry=model_registry), max_size=8, max_memory_mb=100
+    )
+
+    # when
+    cache.add_model("a/1", api_key="key")
+    cache.add_model("b/1", api_key="key")
+    result = cache.describe_models()
+
+    # then
+    assert estimate_weights_memory_bytes_mock.call_count == 2
+    assert [r.memory_bytes for r in result] == [10 * BYTES_IN_MB, 10 * BYTES_IN_MB]
+
+
+def test_fixed_size_cache_never_evicts_model_which_is_still_loading() -> None:
+    # given
+    model_manager = assembly_model_manager(
+        memory_mb={"slow/1": 10, "a/1": 10, "b/1": 10},
+        load_time={"slow/1": 0.3},
+    )
+    cache = WithFixedSizeCache(model_manager, max_size=8, max_memory_mb=15)
+
+    # when
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        slow_model_loading = executor.submit(cache.add_model, "slow/1", "key")
+        time.sleep(0.05)
+        cache.add_model("a/1", api_key="key")
+        cache.add_model("b/1", api_key="key")
+        slow_model_loading.result()
+
+    # then
+    assert "slow/1" in set(cache.keys())
+    assert "a/1" not in set(cache.keys())
+
+
+def test_fixed_size_cache_does_not_keep_locks_of_models_not_being_loaded() -> None:
+    # given
+    model_manager = assembly_model_manager(memory_mb={"a/1": 10, "b/1": 10, "c/1": 10})
+    cache = WithFixedSizeCache(model_manager, max_size=2, max_memory_mb=None)
+
+    # when
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        _ = list(
+            executor.map(
+                lambda model_id: cache.add_model(model_id, api_key="key"),
+                ["a/1", "b/1", "a/1", "c/1"],
+            )
+        )
+
+    # then
+    assert cache._models_locks == {}
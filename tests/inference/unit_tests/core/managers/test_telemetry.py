@@ -0,0 +1,262 @@
+import time
+from unittest import mock
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from inference.core.cache import serializers
+from inference.core.cache.memory import MemoryCache
+from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
+from inference.core.entities.requests.inference import (
+    InferenceRequestImage,
+    ObjectDetectionInferenceRequest,
+)
+from inference.core.entities.responses.inference import (
+    InferenceResponseImage,
+    ObjectDetectionInferenceResponse,
+)
+from inference.core.managers import telemetry
+from inference.core.managers.telemetry import InferenceTelemetryBuffer
+
+
+def assembly_request() -> ObjectDetectionInferenceRequest:
+    return ObjectDetectionInferenceRequest(
+        api_key="my-key",
+        model_id="some/1",
+        image=InferenceRequestImage(
+            type="numpy", value=np.zeros((2, 2, 3), dtype=np.uint8)
+        ),
+    )
+
+
+def assembly_response() -> ObjectDetectionInferenceResponse:
+    return ObjectDetectionInferenceResponse(
+        predictions=[], image=InferenceResponseImage(width=2, height=2)
+    )
+
+
+def test_telemetry_buffer_does_not_write_into_cache_while_recording() -> None:
+    # given
+    cache = MagicMock()
+    buffer = InferenceTelemetryBuffer(cache=cache, flush_interval=100)
+    request = assembly_request()
+
+    # when
+    buffer.record_inference(
+        model_id="some/1",
+        request=request,
+        response=assembly_response(),
+        finish_time=10.0,
+    )
+
+    # then
+    assert len(buffer) == 1
+    cache.zadd_many.assert_not_called()
+    cache.zadd.assert_not_called()
+    assert isinstance(
+        request.image.value, np.ndarray
+    ), "Request expected not to be modified"
+    buffer.stop()
+
+
+def test_telemetry_buffer_flushes_events_into_cache() -> None:
+    # given
+    cache = MemoryCache()
+    buffer = InferenceTelemetryBuffer(cache=cache, flush_interval=100)
+    buffer.record_inference(
+        model_id="some/1",
+        request=assembly_request(),
+        response=assembly_response(),
+        finish_time=10.0,
+    )
+    buffer.record_error(
+        model_id="some/1",
+        request=assembly_request(),
+        error=ValueError("Some error"),
+        finish_time=11.0,
+    )
+
+    # when
+    result = buffer.flush()
+
+    # then
+    assert result == 2
+    assert len(buffer) == 0
+    assert (
+        cache.zrangebyscore("models")
+        == [f"{GLOBAL_INFERENCE_SERVER_ID}:my-key:some/1"] * 2
+    )
+    inferences = cache.zrangebyscore(f"inference:{GLOBAL_INFERENCE_SERVER_ID}:some/1")
+    assert len(inferences) == 1
+    assert inferences[0]["request"]["api_key"] == "my-key"
+    errors = cache.zrangebyscore(f"error:{GLOBAL_INFERENCE_SERVER_ID}:some/1")
+    assert len(errors) == 1
+    assert errors[0]["error"] == "Some error"
+    assert buffer.stats.flushed == 2
+    buffer.stop()
+
+
+@mock.patch.object(serializers, "TINY_CACHE", True)
+def test_telemetry_buffer_keeps_only_condensed_inference_with_tiny_cache() -> None:
+    # given
+    buffer = InferenceTelemetryBuffer(cache=MagicMock(), flush_interval=100)
+    request, response = assembly_request(), assembly_response()
+
+    # when
+    buffer.record_inference(
+        model_id="some/1", request=request, response=response, finish_time=10.0
+    )
+
+    # then
+    inference = buffer._events[0].inference
+    assert inference["request"]["api_key"] == "my-key"
+    assert "image" not in inference["request"]
+    assert inference["response"] == []
+    assert isinstance(
+        request.image.value, np.ndarray
+    ), "Request expected not to be modified"
+    buffer.stop()
+
+
+@mock.patch.object(serializers, "TINY_CACHE", False)
+def test_telemetry_buffer_does_not_keep_image_payloads_without_tiny_cache() -> None:
+    # given
+    buffer = InferenceTelemetryBuffer(cache=MagicMock(), flush_interval=100)
+    request, response = assembly_request(), assembly_response()
+
+    # when
+    buffer.record_inference(
+        model_id="some/1", request=request, response=response, finish_time=10.0
+    )
+
+    # then
+    inference = buffer._events[0].inference
+    assert inference["request"] is not request
+    assert inference["request"].image.type == "numpy"
+    assert inference["request"].image.value is None
+    assert isinstance(
+        request.image.value, np.ndarray
+    ), "Request expected not to be modified"
+    buffer.stop()
+
+
+def test_telemetry_buffer_encodes_inferences_only_when_flushing() -> None:
+    # given
+    cache = MagicMock()
+    buffer = InferenceTelemetryBuffer(cache=cache, flush_interval=100)
+
+    # when
+    with mock.patch.object(
+        telemetry, "jsonable_encoder", return_value={"some": "item"}
+    ) as jsonable_encoder_mock:
+        buffer.record_inference(
+            model_id="some/1",
+            request=assembly_request(),
+            response=assembly_response(),
+            finish_time=10.0,
+        )
+        calls_while_recording = jsonable_encoder_mock.call_count
+        buffer.flush()
+
+    # then
+    assert calls_while_recording == 0
+    assert jsonable_encoder_mock.call_count == 1
+    assert cache.zadd_many.call_args[1]["entries"][1] == (
+        f"inference:{GLOBAL_INFERENCE_SERVER_ID}:some/1",
+        {"some": "item"},
+        10.0,
+    )
+    buffer.stop()
+
+
+def test_telemetry_buffer_drops_events_when_full() -> None:
+    # given
+    buffer = InferenceTelemetryBuffer(cache=MagicMock(), capacity=2, flush_interval=100)
+
+    # when
+    for _ in range(5):
+        buffer.record_error(
+            model_id="some/1",
+            request=assembly_request(),
+            error=ValueError(),
+            finish_time=10.0,
+        )
+
+    # then
+    assert len(buffer) == 2
+    assert buffer.stats.recorded == 2
+    assert buffer.stats.dropped == 3
+    buffer.stop()
+
+
+def test_telemetry_buffer_when_inferences_are_sampled_out() -> None:
+    # given
+    cache = MagicMock()
+    buffer = InferenceTelemetryBuffer(
+        cache=cache, sampling_rate=0.0, flush_interval=100
+    )
+    buffer.record_inference(
+        model_id="some/1",
+        request=assembly_request(),
+        response=assembly_response(),
+        finish_time=10.0,
+    )
+
+    # when
+    buffer.flush()
+
+    # then
+    assert buffer.stats.sampled_out == 1
+    cache.zadd_many.assert_called_once_with(
+        entries=[("models", f"{GLOBAL_INFERENCE_SERVER_ID}:my-key:some/1", 10.0)],
+        expire=buffer._expire,
+    )
+    buffer.stop()
+
+
+def test_telemetry_buffer_when_cache_write_fails() -> None:
+    # given
+    cache = MagicMock()
+    cache.zadd_many.side_effect = ConnectionError()
+    buffer = InferenceTelemetryBuffer(cache=cache, flush_interval=100)
+    buffer.record_error(
+        model_id="some/1",
+        request=assembly_request(),
+        error=ValueError(),
+        finish_time=10.0,
+    )
+
+    # when
+    result = buffer.flush()
+
+    # then
+    assert result == 0
+    assert buffer.stats.failed_to_flush == 1
+    assert len(buffer) == 0
+    buffer.stop()
+
+
+def test_telemetry_buffer_flushes_in_background_once_batch_is_full() -> None:
+    # given
+    cache = MagicMock()
+    buffer = InferenceTelemetryBuffer(
+        cache=cache, flush_interval=100, flush_batch_size=2
+    )
+
+    # when
+    for _ in range(2):
+        buffer.record_error(
+            model_id="some/1",
+            request=assembly_request(),
+            error=ValueError(),
+            finish_time=10.0,
+        )
+    deadline = time.monotonic() + 5
+    while buffer.stats.flushed < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # then
+    assert buffer.stats.flushed == 2
+    assert cache.zadd_many.call_count == 1
+    assert len(cache.zadd_many.call_args[1]["entries"]) == 4
+    buffer.stop()
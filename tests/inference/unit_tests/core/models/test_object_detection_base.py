@@ -0,0 +1,89 @@
+import numpy as np
+
+from inference.core.models.object_detection_base import (
+    ObjectDetectionBaseOnnxRoboflowInferenceModel,
+)
+from inference.core.models.types import PreprocessReturnMetadata
+
+
+def _create_model() -> ObjectDetectionBaseOnnxRoboflowInferenceModel:
+    model = ObjectDetectionBaseOnnxRoboflowInferenceModel.__new__(
+        ObjectDetectionBaseOnnxRoboflowInferenceModel
+    )
+    model.class_names = ["cat", "dog", "car"]
+    model.img_size_h, model.img_size_w = 100, 100
+    model.preproc = {}
+    model.resize_method = "Stretch to"
+    return model
+
+
+def _raw_predictions() -> np.ndarray:
+    # x_center, y_center, width, height, objectness, classes scores
+    return np.array(
+        [
+            [
+                [20, 20, 10, 10, 0.9, 0.9, 0.0, 0.0],
+                [60, 60, 20, 20, 0.8, 0.0, 0.8, 0.0],
+                [80, 20, 10, 20, 0.7, 0.0, 0.0, 0.7],
+                [50, 50, 10, 10, 0.1, 0.0, 0.0, 0.1],
+            ]
+        ]
+    )
+
+
+def test_postprocess_native_returns_the_same_predictions_as_postprocess() -> None:
+    # given
+    model = _create_model()
+    metadata = PreprocessReturnMetadata(
+        {"img_dims": [(200, 300)], "disable_preproc_static_crop": False}
+    )
+
+    # when
+    responses = model.postprocess(
+        (_raw_predictions(),), metadata, confidence=0.5, class_filter=["cat", "car"]
+    )
+    native_detections = model.postprocess_native(
+        (_raw_predictions(),), metadata, confidence=0.5, class_filter=["cat", "car"]
+    )
+
+    # then
+    assert len(native_detections) == 1
+    result = native_detections[0]
+    expected = responses[0].predictions
+    assert len(result) == len(expected) == 2
+    assert result.image_dimensions == (200, 300)
+    assert np.allclose(
+        result.xyxy,
+        np.array(
+            [
+                [
+                    p.x - p.width / 2,
+                    p.y - p.height / 2,
+                    p.x + p.width / 2,
+                    p.y + p.height / 2,
+                ]
+                for p in expected
+            ]
+        ),
+    )
+    assert np.allclose(result.confidence, np.array([p.confidence for p in expected]))
+    assert result.class_id.tolist() == [p.class_id for p in expected]
+    assert result.class_name.tolist() == [p.class_name for p in expected]
+    assert result.mask is None
+
+
+def test_postprocess_native_when_nothing_detected() -> None:
+    # given
+    model = _create_model()
+    metadata = PreprocessReturnMetadata(
+        {"img_dims": [(200, 300)], "disable_preproc_static_crop": False}
+    )
+
+    # when
+    result = model.postprocess_native((_raw_predictions(),), metadata, confidence=0.99)
+
+    # then
+    assert len(result) == 1
+    assert len(result[0]) == 0
+    assert result[0].xyxy.shape == (0, 4)
+    assert len(result[0].class_name) == 0
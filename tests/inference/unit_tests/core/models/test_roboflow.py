@@ -3,11 +3,14 @@ from typing import Optional
 from unittest import mock
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from inference.core.exceptions import ModelArtefactError
 from inference.core.models import roboflow
+from inference.core.models.types import NativeDetections
 from inference.core.models.roboflow import (
+    OnnxRoboflowInferenceModel,
     class_mapping_not_available_in_environment,
     color_mapping_available_in_environment,
     get_class_names_from_environment_file,
@@ -194,3 +197,49 @@ def test_get_class_names_from_environment_file() -> None:
         "class_k",
         "class_l",
     ]
+
+
+class StaticBatchSizeModel(OnnxRoboflowInferenceModel):
+    def __init__(self) -> None:
+        self.batching_enabled = False
+        self.batch_size = 1
+        self.predict_input_sizes = []
+
+    def preprocess(self, image, **kwargs):
+        images = image if isinstance(image, list) else [image]
+        return np.stack(images), {"img_dims": [i.shape[:2] for i in images]}
+
+    def predict(self, img_in, **kwargs):
+        if img_in.shape[0] > self.batch_size:
+            raise ValueError("Batch exceeds static batch size of the model")
+        self.predict_input_sizes.append(img_in.shape[0])
+        return (img_in,)
+
+    def postprocess_native(self, predictions, preprocess_return_metadata, **kwargs):
+        return [
+            NativeDetections(
+                xyxy=np.zeros((0, 4)),
+                confidence=np.zeros((0,)),
+                class_id=np.zeros((0,), dtype=int),
+                class_name=np.zeros((0,), dtype=str),
+                image_dimensions=image_dimensions,
+            )
+            for image_dimensions in preprocess_return_metadata["img_dims"]
+        ]
+
+
+def test_infer_native_when_input_exceeds_static_batch_size() -> None:
+    # given
+    model = StaticBatchSizeModel()
+    images = [
+        np.zeros((10, 20, 3), dtype=np.uint8),
+        np.zeros((30, 40, 3), dtype=np.uint8),
+        np.zeros((50, 60, 3), dtype=np.uint8),
+    ]
+
+    # when
+    result = model.infer_native(images)
+
+    # then
+    assert model.predict_input_sizes == [1, 1, 1]
+    assert [r.image_dimensions for r in result] == [(10, 20), (30, 40), (50, 60)]
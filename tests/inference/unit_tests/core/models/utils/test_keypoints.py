@@ -1,7 +1,10 @@
 from typing import List
 
+import numpy as np
+
 from inference.core.entities.responses.inference import Keypoint
 from inference.core.models.utils.keypoints import (
+    model_keypoints_to_arrays,
     model_keypoints_to_response,
     superset_keypoints_count,
 )
@@ -230,3 +233,50 @@ def test_model_keypoints_to_response_padded_points() -> None:
             ),
         ],
     )
+
+
+def test_model_keypoints_to_arrays() -> None:
+    # given
+    keypoints_metadata = {
+        0: {0: "nose", 1: "left_eye", 2: "right_eye"},
+        1: {0: "head"},
+    }
+    keypoints = np.array(
+        [
+            [10, 10, 0.9, 20, 20, 0.1, 30, 30, 0.8],
+            [40, 40, 0.7, 0, 0, 0.0, 0, 0, 0.0],
+        ]
+    )
+
+    # when
+    xy, confidence, class_id, class_name = model_keypoints_to_arrays(
+        keypoints_metadata=keypoints_metadata,
+        keypoints=keypoints,
+        predicted_objects_class_ids=np.array([0, 1]),
+        keypoint_confidence_threshold=0.5,
+    )
+
+    # then
+    assert np.allclose(xy[0], np.array([[10, 10], [30, 30]]))
+    assert np.allclose(confidence[0], np.array([0.9, 0.8]))
+    assert class_id[0].tolist() == [0, 2]
+    assert class_name[0].tolist() == ["nose", "right_eye"]
+    assert np.allclose(
+        xy[1], np.array([[40, 40]])
+    ), "Expected padding keypoints to be ignored"
+    assert np.allclose(confidence[1], np.array([0.7]))
+    assert class_id[1].tolist() == [0]
+    assert class_name[1].tolist() == ["head"]
+
+
+def test_model_keypoints_to_arrays_when_no_detections_given() -> None:
+    # when
+    result = model_keypoints_to_arrays(
+        keypoints_metadata={0: {0: "nose"}},
+        keypoints=np.empty((0, 0)),
+        predicted_objects_class_ids=np.empty((0,), dtype=int),
+        keypoint_confidence_threshold=0.0,
+    )
+
+    # then
+    assert result == ([], [], [], [])
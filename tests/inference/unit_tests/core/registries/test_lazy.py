@@ -0,0 +1,84 @@
+import sys
+
+import pytest
+
+from inference.core.exceptions import ModelNotRecognisedError
+from inference.core.registries.base import ModelRegistry
+from inference.core.registries.lazy import LazyModelTypes
+
+
+def test_lazy_model_types_import_class_on_first_lookup() -> None:
+    # given
+    sys.modules.pop("json.decoder", None)
+    model_types = LazyModelTypes({("json", "decoder"): "json.decoder:JSONDecoder"})
+
+    # when
+    is_imported_before_lookup = "json.decoder" in sys.modules
+    result = model_types[("json", "decoder")]
+
+    # then
+    assert is_imported_before_lookup is False
+    assert result.__name__ == "JSONDecoder"
+    assert "json.decoder" in sys.modules
+
+
+def test_lazy_model_types_accepts_classes() -> None:
+    # given
+    model_types = LazyModelTypes({("some", "model"): dict})
+
+    # when
+    result = model_types[("some", "model")]
+
+    # then
+    assert result is dict
+
+
+def test_lazy_model_types_when_class_cannot_be_imported() -> None:
+    # given
+    model_types = LazyModelTypes(
+        {
+            ("valid", "model"): dict,
+            ("invalid", "model"): "non_existing_package.module:Model",
+        }
+    )
+
+    # when
+    is_present = ("invalid", "model") in model_types
+    with pytest.raises(KeyError):
+        _ = model_types[("invalid", "model")]
+
+    # then
+    assert is_present is False
+    assert list(model_types) == [("valid", "model")]
+    assert model_types.get(("invalid", "model")) is None
+
+
+def test_lazy_model_types_when_import_of_class_raises_arbitrary_error(
+    tmp_path, monkeypatch
+) -> None:
+    # given
+    (tmp_path / "broken_model_module.py").write_text(
+        "raise OSError('libsome.so: cannot open shared object file')"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    model_types = LazyModelTypes({("broken", "model"): "broken_model_module:Model"})
+
+    # when
+    is_present = ("broken", "model") in model_types
+
+    # then
+    assert is_present is False
+    assert model_types.get(("broken", "model")) is None
+
+
+def test_registry_backed_by_lazy_model_types_when_class_cannot_be_imported() -> None:
+    # given
+    registry = ModelRegistry(
+        registry_dict=LazyModelTypes(
+            {("invalid", "model"): "non_existing_package.module:Model"}
+        )
+    )
+
+    # when
+    with pytest.raises(ModelNotRecognisedError):
+        _ = registry.get_model(model_type=("invalid", "model"), model_id="some/1")
@@ -0,0 +1,232 @@
+import numpy as np
+import pytest
+
+from inference.core.nms import (
+    greedy_non_max_suppression,
+    offset_boxes_by_class,
+    w_np_non_max_suppression,
+    xywh_to_xyxy,
+)
+
+
+def test_xywh_to_xyxy() -> None:
+    # given
+    boxes = np.array([[[50, 50, 20, 10], [10, 20, 4, 8]]], dtype=np.float32)
+
+    # when
+    result = xywh_to_xyxy(boxes_xywh=boxes)
+
+    # then
+    assert np.allclose(result, np.array([[[40, 45, 60, 55], [8, 16, 12, 24]]]))
+    assert result.dtype == np.float32
+
+
+def test_offset_boxes_by_class_separates_boxes_of_different_classes() -> None:
+    # given
+    boxes = np.array([[0, 0, 10, 10], [0, 0, 10, 10]], dtype=np.float32)
+
+    # when
+    result = offset_boxes_by_class(boxes=boxes, class_ids=np.array([0, 1]))
+
+    # then
+    assert np.allclose(result[0], [0, 0, 10, 10])
+    assert result[1, 0] > result[0, 2] + 1, "Expected no overlap after offset"
+    assert result[1, 1] > result[0, 3] + 1, "Expected no overlap after offset"
+
+
+def test_greedy_non_max_suppression_when_no_boxes_given() -> None:
+    # when
+    result = greedy_non_max_suppression(
+        boxes=np.empty((0, 4)),
+        overlap_thresh=0.5,
+    )
+
+    # then
+    assert result.shape == (0,)
+
+
+def test_greedy_non_max_suppression_suppresses_overlapping_boxes() -> None:
+    # given
+    boxes = np.array(
+        [
+            [0, 0, 10, 10],
+            [1, 1, 10, 10],
+            [20, 20, 30, 30],
+            [0, 0, 11, 11],
+        ]
+    )
+
+    # when
+    result = greedy_non_max_suppression(boxes=boxes, overlap_thresh=0.5)
+
+    # then
+    assert result.tolist() == [0, 2]
+
+
+def test_greedy_non_max_suppression_respects_max_detections() -> None:
+    # given
+    boxes = np.array([[0, 0, 10, 10], [20, 20, 30, 30], [40, 40, 50, 50]])
+
+    # when
+    result = greedy_non_max_suppression(
+        boxes=boxes, overlap_thresh=0.5, max_detections=2
+    )
+
+    # then
+    assert result.tolist() == [0, 1]
+
+
+def assembly_prediction(
+    boxes_xywh: list, classes_confidences: list, masks: list = None
+) -> np.ndarray:
+    boxes_xywh = np.array(boxes_xywh, dtype=np.float32)
+    classes_confidences = np.array(classes_confidences, dtype=np.float32)
+    chunks = [
+        boxes_xywh,
+        classes_confidences.max(axis=1, keepdims=True),
+        classes_confidences,
+    ]
+    if masks is not None:
+        chunks.append(np.array(masks, dtype=np.float32))
+    return np.concatenate(chunks, axis=1)
+
+
+def test_w_np_non_max_suppression_when_class_aware_nms_requested() -> None:
+    # given
+    prediction = assembly_prediction(
+        boxes_xywh=[
+            [50, 50, 20, 20],
+            [51, 51, 20, 20],
+            [50, 50, 20, 20],
+            [200, 200, 10, 10],
+        ],
+        classes_confidences=[
+            [0.9, 0.1],
+            [0.8, 0.1],
+            [0.1, 0.7],
+            [0.1, 0.1],
+        ],
+    )
+
+    # when
+    result = w_np_non_max_suppression(
+        prediction=np.expand_dims(prediction, axis=0),
+        conf_thresh=0.5,
+        iou_thresh=0.5,
+    )
+
+    # then
+    assert len(result) == 1
+    assert result[0].shape == (2, 7)
+    assert np.allclose(result[0][0], [40, 40, 60, 60, 0.9, 0.9, 0])
+    assert np.allclose(result[0][1], [40, 40, 60, 60, 0.7, 0.7, 1])
+
+
+def test_w_np_non_max_suppression_when_class_agnostic_nms_requested() -> None:
+    # given
+    prediction = assembly_prediction(
+        boxes_xywh=[[50, 50, 20, 20], [50, 50, 20, 20]],
+        classes_confidences=[[0.9, 0.1], [0.1, 0.7]],
+    )
+
+    # when
+    result = w_np_non_max_suppression(
+        prediction=np.expand_dims(prediction, axis=0),
+        conf_thresh=0.5,
+        iou_thresh=0.5,
+        class_agnostic=True,
+    )
+
+    # then
+    assert result[0].shape == (1, 7)
+    assert np.allclose(result[0][0], [40, 40, 60, 60, 0.9, 0.9, 0])
+
+
+def test_w_np_non_max_suppression_when_batch_with_masks_given() -> None:
+    # given
+    first_image = assembly_prediction(
+        boxes_xywh=[[50, 50, 20, 20], [150, 150, 20, 20]],
+        classes_confidences=[[0.9], [0.6]],
+        masks=[[1, 2], [3, 4]],
+    )
+    second_image = assembly_prediction(
+        boxes_xywh=[[50, 50, 20, 20], [150, 150, 20, 20]],
+        classes_confidences=[[0.1], [0.2]],
+        masks=[[5, 6], [7, 8]],
+    )
+
+    # when
+    result = w_np_non_max_suppression(
+        prediction=np.stack([first_image, second_image], axis=0),
+        conf_thresh=0.5,
+        iou_thresh=0.5,
+        num_masks=2,
+        max_detections=1,
+    )
+
+    # then
+    assert len(result) == 2
+    assert np.allclose(result[0], [[40, 40, 60, 60, 0.9, 0.9, 0, 1, 2]])
+    assert len(result[1]) == 0, "Nothing in second image should pass threshold"
+
+
+def test_w_np_non_max_suppression_does_not_suppress_boxes_across_images_of_batch() -> (
+    None
+):
+    # given
+    first_image = assembly_prediction(
+        boxes_xywh=[[50, 50, 20, 20], [51, 51, 20, 20]],
+        classes_confidences=[[0.9], [0.8]],
+    )
+    second_image = assembly_prediction(
+        boxes_xywh=[[51, 51, 20, 20], [150, 150, 20, 20]],
+        classes_confidences=[[0.7], [0.6]],
+    )
+
+    # when
+    result = w_np_non_max_suppression(
+        prediction=np.stack([first_image, second_image], axis=0),
+        conf_thresh=0.5,
+        iou_thresh=0.5,
+        class_agnostic=True,
+    )
+
+    # then
+    assert len(result) == 2
+    assert np.allclose(result[0], [[40, 40, 60, 60, 0.9, 0.9, 0]])
+    assert np.allclose(
+        result[1],
+        [[41, 41, 61, 61, 0.7, 0.7, 0], [140, 140, 160, 160, 0.6, 0.6, 0]],
+    )
+
+
+def test_w_np_non_max_suppression_when_xyxy_format_given() -> None:
+    # given
+    prediction = assembly_prediction(
+        boxes_xywh=[[10, 10, 30, 30]],
+        classes_confidences=[[0.9]],
+    )
+
+    # when
+    result = w_np_non_max_suppression(
+        prediction=np.expand_dims(prediction, axis=0),
+        box_format="xyxy",
+    )
+
+    # then
+    assert np.allclose(result[0], [[10, 10, 30, 30, 0.9, 0.9, 0]])
+
+
+def test_w_np_non_max_suppression_when_invalid_box_format_given() -> None:
+    # given
+    prediction = assembly_prediction(
+        boxes_xywh=[[10, 10, 30, 30]],
+        classes_confidences=[[0.9]],
+    )
+
+    # when
+    with pytest.raises(ValueError):
+        _ = w_np_non_max_suppression(
+            prediction=np.expand_dims(prediction, axis=0),
+            box_format="invalid",
+        )
@@ -0,0 +1,43 @@
+import numpy as np
+
+from inference.core.utils.hash import get_image_hash
+
+
+def test_get_image_hash_when_the_same_image_given() -> None:
+    # given
+    image = np.random.randint(0, 255, (64, 64, 3), dtype=np.uint8)
+
+    # when
+    result = get_image_hash(image)
+
+    # then
+    assert result == get_image_hash(image.copy())
+    assert len(result) == 32
+
+
+def test_get_image_hash_distinguishes_shape_and_dtype_of_the_same_buffer() -> None:
+    # given
+    image = np.zeros((64, 64, 3), dtype=np.uint8)
+
+    # when
+    result = {
+        get_image_hash(image),
+        get_image_hash(image.reshape((64, 192))),
+        get_image_hash(image.view(np.int8)),
+    }
+
+    # then
+    assert len(result) == 3
+
+
+def test_get_image_hash_when_non_contiguous_image_given() -> None:
+    # given
+    image = np.random.randint(0, 255, (64, 64, 3), dtype=np.uint8)
+    flipped_image = image[:, ::-1]
+
+    # when
+    result = get_image_hash(flipped_image)
+
+    # then
+    assert result == get_image_hash(np.ascontiguousarray(flipped_image))
+    assert result != get_image_hash(image)
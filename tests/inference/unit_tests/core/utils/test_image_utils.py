@@ -37,6 +37,11 @@ from inference.core.utils.image_utils import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_url_images_cache() -> None:
+    image_utils.URL_IMAGES_CACHE.clear()
+
+
 @pytest.mark.parametrize(
     "response_status_code", [400, 401, 403, 404, 500, 501, 502, 503, 504]
 )
@@ -112,6 +117,165 @@ def test_load_image_from_url_when_png_image_should_be_successfully_decoded(
     assert np.allclose(image_as_numpy, result)
 
 
+@mock.patch.object(image_utils.URL_IMAGES_CACHE, "_max_size_bytes", 1024 * 1024)
+def test_load_image_from_url_reuses_cached_image_when_still_fresh(
+    requests_mock: Mocker,
+    image_as_numpy: np.ndarray,
+    image_as_png_bytes: bytes,
+) -> None:
+    # given
+    resource_url = "https://some.com/image.png"
+    requests_mock.get(
+        resource_url, content=image_as_png_bytes, headers={"ETag": '"v1"'}
+    )
+    first_result = load_image_from_url(value=resource_url)
+    first_result[:] = 0
+
+    # when
+    second_result = load_image_from_url(value=resource_url)
+
+    # then
+    assert requests_mock.call_count == 1
+    assert np.allclose(
+        image_as_numpy, second_result
+    ), "Cached image must not be affected by caller"
+
+
+def test_load_image_from_url_does_not_cache_images_by_default(
+    requests_mock: Mocker,
+    image_as_png_bytes: bytes,
+) -> None:
+    # given
+    resource_url = "https://some.com/image.png"
+    requests_mock.get(
+        resource_url, content=image_as_png_bytes, headers={"ETag": '"v1"'}
+    )
+    _ = load_image_from_url(value=resource_url)
+
+    # when
+    _ = load_image_from_url(value=resource_url)
+
+    # then
+    assert requests_mock.call_count == 2
+
+
+@mock.patch.object(image_utils.URL_IMAGES_CACHE, "_max_size_bytes", 1024 * 1024)
+@mock.patch.object(image_utils.URL_IMAGES_CACHE, "_ttl", 0)
+def test_load_image_from_url_revalidates_stale_cached_image_with_etag(
+    requests_mock: Mocker,
+    image_as_numpy: np.ndarray,
+    image_as_png_bytes: bytes,
+) -> None:
+    # given
+    resource_url = "https://some.com/image.png"
+    requests_mock.get(
+        resource_url,
+        [
+            {"content": image_as_png_bytes, "headers": {"ETag": '"v1"'}},
+            {"status_code": 304},
+        ],
+    )
+    _ = load_image_from_url(value=resource_url)
+
+    # when
+    result = load_image_from_url(value=resource_url)
+
+    # then
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+    assert np.allclose(image_as_numpy, result)
+
+
+@mock.patch.object(image_utils.URL_IMAGES_CACHE, "_max_size_bytes", 1024 * 1024)
+def test_load_image_from_url_revalidates_cached_image_when_no_cache_requested(
+    requests_mock: Mocker,
+    image_as_numpy: np.ndarray,
+    image_as_png_bytes: bytes,
+) -> None:
+    # given
+    resource_url = "https://some.com/image.png"
+    requests_mock.get(
+        resource_url,
+        [
+            {
+                "content": image_as_png_bytes,
+                "headers": {"ETag": '"v1"', "Cache-Control": "no-cache"},
+            },
+            {"status_code": 304, "headers": {"Cache-Control": "no-cache"}},
+        ],
+    )
+    _ = load_image_from_url(value=resource_url)
+
+    # when
+    result = load_image_from_url(value=resource_url)
+
+    # then
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+    assert np.allclose(image_as_numpy, result)
+
+
+@mock.patch.object(image_utils.URL_IMAGES_CACHE, "_max_size_bytes", 1024 * 1024)
+def test_load_image_from_url_revalidates_cached_image_after_max_age(
+    requests_mock: Mocker,
+    image_as_png_bytes: bytes,
+) -> None:
+    # given
+    resource_url = "https://some.com/image.png"
+    requests_mock.get(
+        resource_url,
+        [
+            {
+                "content": image_as_png_bytes,
+                "headers": {
+                    "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+                    "Cache-Control": "public, max-age=0",
+                },
+            },
+            {"status_code": 304},
+        ],
+    )
+    _ = load_image_from_url(value=resource_url)
+
+    # when
+    _ = load_image_from_url(value=resource_url)
+
+    # then
+    assert requests_mock.call_count == 2
+    assert (
+        requests_mock.last_request.headers["If-Modified-Since"]
+        == "Wed, 21 Oct 2015 07:28:00 GMT"
+    )
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"ETag": '"v1"', "Cache-Control": "private, no-store"},
+        {"ETag": '"v1"', "Cache-Control": "no-store"},
+        {"ETag": '"v1"', "Cache-Control": "private, max-age=600"},
+        {"Cache-Control": "max-age=600"},
+    ],
+)
+@mock.patch.object(image_utils.URL_IMAGES_CACHE, "_max_size_bytes", 1024 * 1024)
+def test_load_image_from_url_does_not_cache_image_when_response_not_cacheable(
+    requests_mock: Mocker,
+    image_as_png_bytes: bytes,
+    headers: dict,
+) -> None:
+    # given
+    resource_url = "https://some.com/image.png"
+    requests_mock.get(resource_url, content=image_as_png_bytes, headers=headers)
+    _ = load_image_from_url(value=resource_url)
+
+    # when
+    _ = load_image_from_url(value=resource_url)
+
+    # then
+    assert requests_mock.call_count == 2
+    assert "If-None-Match" not in requests_mock.last_request.headers
+
+
 @mock.patch.object(image_utils, "ALLOW_URL_INPUT", False)
 def test_load_image_from_url_when_url_loading_not_allowed() -> None:
     with pytest.raises(InvalidImageTypeDeclared):
@@ -13,6 +13,7 @@ from inference.core.utils.postprocess import (
     get_static_crop_dimensions,
     post_process_bboxes,
     post_process_keypoints,
+    post_process_masks,
     post_process_polygons,
     scale_bboxes,
     scale_polygons,
@@ -24,6 +25,7 @@ from inference.core.utils.postprocess import (
     stretch_keypoints,
     undo_image_padding_for_predicted_boxes,
     undo_image_padding_for_predicted_keypoints,
+    undo_image_padding_for_predicted_masks,
     undo_image_padding_for_predicted_polygons,
 )
 
@@ -721,6 +723,109 @@ def test_post_process_polygons_when_fit_resize_used() -> None:
     assert np.allclose(np.array(result), expected_result)
 
 
+def test_undo_image_padding_for_predicted_masks() -> None:
+    # given
+    masks = np.zeros((2, 10, 10), dtype=np.uint8)
+    masks[0, 2:7, 0:5] = 1
+    masks[1, 0:2, :] = 1
+
+    # when
+    result = undo_image_padding_for_predicted_masks(
+        masks=masks,
+        origin_shape=(20, 40),
+    )
+
+    # then
+    assert result.shape == (
+        2,
+        5,
+        10,
+    ), "Expected padding (2px top, 3px bottom) to be cut"
+    assert result[0, :, 0:5].all() and not result[0, :, 5:].any()
+    assert not result[1].any(), "Expected mask placed only in padding to be removed"
+
+
+def test_post_process_masks_when_stretching_resize_used() -> None:
+    # given
+    masks = np.zeros((2, 10, 10), dtype=np.float32)
+    masks[0, :, 0:5] = 0.7
+    masks[1, 5:, :] = 0.7
+
+    # when
+    result = post_process_masks(
+        masks=masks,
+        origin_shape=(20, 40),
+        preproc={},
+        resize_method="Stretch to",
+    )
+
+    # then
+    expected_result = np.zeros((2, 20, 40), dtype=bool)
+    expected_result[0, :, 0:20] = True
+    expected_result[1, 10:, :] = True
+    assert result.dtype == bool
+    assert np.array_equal(result, expected_result)
+
+
+def test_post_process_masks_when_fit_resize_used() -> None:
+    # given
+    masks = np.zeros((1, 10, 10), dtype=np.float32)
+    masks[0, 2:7, 0:5] = 0.7
+
+    # when
+    result = post_process_masks(
+        masks=masks,
+        origin_shape=(20, 40),
+        preproc={},
+        resize_method="Fit (black edges) in",
+    )
+
+    # then
+    expected_result = np.zeros((1, 20, 40), dtype=bool)
+    expected_result[0, :, 0:20] = True
+    assert np.array_equal(result, expected_result)
+
+
+def test_post_process_masks_when_static_crop_was_taken() -> None:
+    # given
+    masks = np.zeros((1, 10, 10), dtype=np.float32)
+    masks[0, :, 0:5] = 0.7
+    preproc = {
+        "static-crop": {
+            "enabled": True,
+            "x_min": 50,
+            "y_min": 0,
+            "x_max": 100,
+            "y_max": 100,
+        }
+    }
+
+    # when
+    result = post_process_masks(
+        masks=masks,
+        origin_shape=(20, 40),
+        preproc=preproc,
+        resize_method="Stretch to",
+    )
+
+    # then
+    expected_result = np.zeros((1, 20, 40), dtype=bool)
+    expected_result[0, :, 20:30] = True
+    assert np.array_equal(result, expected_result)
+
+
+def test_post_process_masks_when_empty_masks_given() -> None:
+    # when
+    result = post_process_masks(
+        masks=np.zeros((0, 10, 10), dtype=np.float32),
+        origin_shape=(20, 40),
+        preproc={},
+    )
+
+    # then
+    assert result.shape == (0, 20, 40)
+
+
 def test_shift_keypoints() -> None:
     # given
     keypoints = np.array([[0, 0, 0.9, 10, 10, 0.9, 20, 25, 0.8]])
@@ -1,6 +1,8 @@
 from unittest import mock
 from unittest.mock import MagicMock
 
+import cv2
+
 import numpy as np
 import pytest
 
@@ -11,7 +13,9 @@ from inference.core.utils.preprocess import (
     apply_contrast_adjustment,
     contrast_adjustments_should_be_applied,
     grayscale_conversion_should_be_applied,
+    letterbox_image,
     prepare,
+    resize_into_nchw_buffer,
     static_crop_should_be_applied,
     take_static_crop,
 )
@@ -296,3 +300,71 @@ def test_prepare_when_misconfiguration_error_is_encountered(
             image=np.zeros((128, 128, 3), dtype=np.uint8),
             preproc={"static-crop": {"enabled": True}},
         )
+
+
+def test_resize_into_nchw_buffer_when_stretch_requested() -> None:
+    # given
+    image = np.random.randint(0, 256, (48, 64, 3), dtype=np.uint8)
+    buffer = np.empty((3, 32, 32), dtype=np.float32)
+
+    # when
+    resize_into_nchw_buffer(
+        image=image, buffer=buffer, resize_method="Stretch to", bgr_to_rgb=True
+    )
+
+    # then
+    expected = cv2.cvtColor(cv2.resize(image, (32, 32)), cv2.COLOR_BGR2RGB)
+    assert np.array_equal(buffer, np.transpose(expected, (2, 0, 1)).astype(np.float32))
+
+
+@pytest.mark.parametrize(
+    "resize_method, color",
+    [
+        ("Fit (black edges) in", (0, 0, 0)),
+        ("Fit (white edges) in", (255, 255, 255)),
+        ("Fit (grey edges) in", (114, 114, 114)),
+    ],
+)
+def test_resize_into_nchw_buffer_when_letterbox_requested(
+    resize_method: str, color: tuple
+) -> None:
+    # given
+    image = np.random.randint(0, 256, (30, 64, 3), dtype=np.uint8)
+    buffer = np.full((3, 32, 40), fill_value=-1, dtype=np.float32)
+
+    # when
+    resize_into_nchw_buffer(
+        image=image, buffer=buffer, resize_method=resize_method, bgr_to_rgb=False
+    )
+
+    # then
+    expected = letterbox_image(image, desired_size=(40, 32), color=color)
+    assert np.array_equal(buffer, np.transpose(expected, (2, 0, 1)).astype(np.float32))
+
+
+def test_resize_into_nchw_buffer_writes_into_slice_of_batch() -> None:
+    # given
+    images = [np.full((10, 10, 3), fill_value=i, dtype=np.uint8) for i in range(1, 4)]
+    batch = np.zeros((3, 3, 8, 8), dtype=np.float32)
+
+    # when
+    for image, buffer in zip(images, batch):
+        resize_into_nchw_buffer(
+            image=image, buffer=buffer, resize_method="Stretch to", bgr_to_rgb=True
+        )
+
+    # then
+    for i in range(3):
+        assert np.all(batch[i] == i + 1)
+
+
+def test_resize_into_nchw_buffer_when_channels_mismatch() -> None:
+    # given
+    image = np.zeros((10, 10, 4), dtype=np.uint8)
+    buffer = np.empty((3, 8, 8), dtype=np.float32)
+
+    # when
+    with pytest.raises(PreProcessingError):
+        resize_into_nchw_buffer(
+            image=image, buffer=buffer, resize_method="Stretch to", bgr_to_rgb=False
+        )
@@ -0,0 +1,43 @@
+import time
+
+from inference.core.utils.stage_timing import collect_stages_durations, measure_stage
+
+
+def test_measure_stage_when_durations_not_collected() -> None:
+    # when
+    with measure_stage("forward"):
+        result = 1
+
+    # then
+    assert result == 1
+
+
+def test_collect_stages_durations_sums_durations_of_repeated_stages() -> None:
+    # when
+    with collect_stages_durations() as stages_durations:
+        for _ in range(2):
+            with measure_stage("forward"):
+                time.sleep(0.01)
+        with measure_stage("postprocess"):
+            pass
+
+    # then
+    assert set(stages_durations.keys()) == {"forward", "postprocess"}
+    assert stages_durations["forward"] >= 0.02
+    assert stages_durations["postprocess"] < stages_durations["forward"]
+
+
+def test_collect_stages_durations_when_contexts_are_nested() -> None:
+    # when
+    with collect_stages_durations() as outer_durations:
+        with measure_stage("preprocess"):
+            pass
+        with collect_stages_durations() as inner_durations:
+            with measure_stage("forward"):
+                pass
+        with measure_stage("postprocess"):
+            pass
+
+    # then
+    assert set(outer_durations.keys()) == {"preprocess", "postprocess"}
+    assert set(inner_durations.keys()) == {"forward"}
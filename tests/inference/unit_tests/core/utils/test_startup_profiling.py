@@ -0,0 +1,54 @@
+import sys
+import time
+
+from inference.core.utils.startup_profiling import StartupProfiler, get_package_name
+
+
+def test_startup_profiler_records_import_time_of_modules() -> None:
+    # given
+    profiler = StartupProfiler()
+    sys.modules.pop("json.tool", None)
+
+    # when
+    profiler.start()
+    try:
+        import json.tool  # noqa: F401
+    finally:
+        profiler.stop()
+    report = profiler.report()
+
+    # then
+    assert "json.tool" in {m.name for m in report.slowest_modules}
+    assert report.imports_time > 0
+    assert "json" in report.packages_import_time
+    assert profiler.is_running is False
+
+
+def test_startup_profiler_records_time_of_stages() -> None:
+    # given
+    profiler = StartupProfiler()
+
+    # when
+    with profiler.stage("initialisation"):
+        time.sleep(0.01)
+    report = profiler.report()
+
+    # then
+    assert report.stages_time["initialisation"] >= 0.01
+    assert "initialisation" in report.format()
+
+
+def test_get_package_name_for_inference_module() -> None:
+    # when
+    result = get_package_name(module_name="inference.core.workflows.core_steps.loader")
+
+    # then
+    assert result == "inference.core.workflows"
+
+
+def test_get_package_name_for_third_party_module() -> None:
+    # when
+    result = get_package_name(module_name="supervision.annotators.core")
+
+    # then
+    assert result == "supervision"
@@ -0,0 +1,181 @@
+import math
+import urllib.request
+
+import numpy as np
+import pytest
+import requests
+
+from inference.core.utils import url_images_cache
+from inference.core.utils.url_images_cache import (
+    UrlImagesCache,
+    get_response_cache_ttl,
+    get_revalidated_response_cache_ttl,
+)
+
+
+def test_url_images_cache_when_entry_not_cached() -> None:
+    # given
+    cache = UrlImagesCache(max_size_bytes=1024, ttl=60)
+
+    # when
+    result = cache.get(url="https://some.com/image.jpg", cv_imread_flags=1)
+
+    # then
+    assert result is None
+
+
+def test_url_images_cache_distinguishes_decoding_flags() -> None:
+    # given
+    cache = UrlImagesCache(max_size_bytes=1024, ttl=60)
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+    cache.put(url="https://some.com/image.jpg", cv_imread_flags=1, image=image)
+
+    # when
+    result = cache.get(url="https://some.com/image.jpg", cv_imread_flags=129)
+
+    # then
+    assert result is None
+
+
+def test_url_images_cache_evicts_least_recently_used_entries_by_size() -> None:
+    # given
+    cache = UrlImagesCache(max_size_bytes=100, ttl=60)
+    cache.put(url="a", cv_imread_flags=1, image=np.zeros((40,), dtype=np.uint8))
+    cache.put(url="b", cv_imread_flags=1, image=np.zeros((40,), dtype=np.uint8))
+    _ = cache.get(url="a", cv_imread_flags=1)
+
+    # when
+    cache.put(url="c", cv_imread_flags=1, image=np.zeros((40,), dtype=np.uint8))
+
+    # then
+    assert cache.get(url="a", cv_imread_flags=1) is not None
+    assert cache.get(url="b", cv_imread_flags=1) is None
+    assert cache.get(url="c", cv_imread_flags=1) is not None
+    assert cache.size_bytes == 80
+
+
+def test_url_images_cache_does_not_store_images_larger_than_limit() -> None:
+    # given
+    cache = UrlImagesCache(max_size_bytes=100, ttl=60)
+
+    # when
+    cache.put(url="a", cv_imread_flags=1, image=np.zeros((101,), dtype=np.uint8))
+
+    # then
+    assert cache.get(url="a", cv_imread_flags=1) is None
+    assert cache.size_bytes == 0
+
+
+def test_url_images_cache_freshness() -> None:
+    # given
+    fresh_cache = UrlImagesCache(max_size_bytes=100, ttl=60)
+    stale_cache = UrlImagesCache(max_size_bytes=100, ttl=0)
+    image = np.zeros((10,), dtype=np.uint8)
+    fresh_cache.put(url="a", cv_imread_flags=1, image=image, etag='"v1"')
+    stale_cache.put(url="a", cv_imread_flags=1, image=image, etag='"v1"')
+
+    # when
+    fresh_entry = fresh_cache.get(url="a", cv_imread_flags=1)
+    stale_entry = stale_cache.get(url="a", cv_imread_flags=1)
+
+    # then
+    assert fresh_cache.is_fresh(entry=fresh_entry) is True
+    assert stale_cache.is_fresh(entry=stale_entry) is False
+    assert stale_entry.revalidation_headers() == {"If-None-Match": '"v1"'}
+
+
+def test_url_images_cache_caps_entry_ttl_with_max_age() -> None:
+    # given
+    cache = UrlImagesCache(max_size_bytes=100, ttl=60)
+    image = np.zeros((10,), dtype=np.uint8)
+    cache.put(url="a", cv_imread_flags=1, image=image, etag='"v1"', ttl=0)
+    cache.put(url="b", cv_imread_flags=1, image=image, etag='"v1"', ttl=600)
+
+    # when
+    entry_a = cache.get(url="a", cv_imread_flags=1)
+    entry_b = cache.get(url="b", cv_imread_flags=1)
+
+    # then
+    assert cache.is_fresh(entry=entry_a) is False
+    assert cache.is_fresh(entry=entry_b) is True
+    assert entry_b.ttl == 60
+
+
+def test_url_images_cache_never_considers_entries_without_validators_fresh() -> None:
+    # given
+    cache = UrlImagesCache(max_size_bytes=100, ttl=60)
+    cache.put(url="a", cv_imread_flags=1, image=np.zeros((10,), dtype=np.uint8))
+
+    # when
+    entry = cache.get(url="a", cv_imread_flags=1)
+
+    # then
+    assert cache.is_fresh(entry=entry) is False
+
+
+def _build_response(headers: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update(headers)
+    return response
+
+
+@pytest.mark.parametrize(
+    "headers, expected_result",
+    [
+        ({}, None),
+        ({"Cache-Control": "max-age=30"}, None),
+        ({"ETag": '"v1"'}, math.inf),
+        ({"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}, math.inf),
+        ({"ETag": '"v1"', "Cache-Control": "no-store"}, None),
+        ({"ETag": '"v1"', "Cache-Control": "Private"}, None),
+        ({"ETag": '"v1"', "Cache-Control": 'private="Set-Cookie"'}, None),
+        ({"ETag": '"v1"', "Cache-Control": "no-cache, max-age=30"}, 0.0),
+        ({"ETag": '"v1"', "Cache-Control": "public, max-age=30"}, 30.0),
+        ({"ETag": '"v1"', "Cache-Control": "max-age=invalid"}, math.inf),
+    ],
+)
+def test_get_response_cache_ttl(headers: dict, expected_result) -> None:
+    # given
+    response = _build_response(headers=headers)
+
+    # when
+    result = get_response_cache_ttl(response=response)
+
+    # then
+    assert result == expected_result
+
+
+@pytest.mark.parametrize(
+    "headers, expected_result",
+    [
+        ({}, math.inf),
+        ({"Cache-Control": "no-cache"}, 0.0),
+        ({"Cache-Control": "max-age=15"}, 15.0),
+    ],
+)
+def test_get_revalidated_response_cache_ttl(headers: dict, expected_result) -> None:
+    # given
+    response = _build_response(headers=headers)
+
+    # when
+    result = get_revalidated_response_cache_ttl(response=response)
+
+    # then
+    assert result == expected_result
+
+
+def test_get_url_images_session_does_not_keep_cookies(monkeypatch) -> None:
+    # given
+    monkeypatch.setattr(url_images_cache, "_SESSION", None)
+    session = url_images_cache.get_url_images_session(pool_size=4)
+    cookie = requests.cookies.create_cookie(
+        name="session", value="secret", domain="some.com"
+    )
+    request = urllib.request.Request("https://some.com/image.jpg")
+
+    # when
+    accepted = session.cookies.get_policy().set_ok(cookie, request)
+
+    # then
+    assert accepted is False
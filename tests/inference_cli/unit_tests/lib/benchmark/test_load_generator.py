@@ -0,0 +1,189 @@
+import time
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from inference_cli.lib.benchmark.load_generator import (
+    ArrivalProcess,
+    LoadStepReport,
+    find_saturation_knee,
+    generate_arrival_offsets,
+    generate_load_steps,
+    run_open_loop_load,
+)
+from inference_cli.lib.benchmark.results_gathering import LatencySummary
+
+
+def test_generate_arrival_offsets_for_constant_process() -> None:
+    # when
+    result = generate_arrival_offsets(
+        requests_number=4,
+        requests_per_second=2,
+        arrival_process=ArrivalProcess.CONSTANT,
+    )
+
+    # then
+    assert np.allclose(result, [0.0, 0.5, 1.0, 1.5])
+
+
+def test_generate_arrival_offsets_for_poisson_process() -> None:
+    # when
+    result = generate_arrival_offsets(
+        requests_number=10_000,
+        requests_per_second=100,
+        arrival_process=ArrivalProcess.POISSON,
+        random_state=np.random.RandomState(42),
+    )
+
+    # then
+    assert len(result) == 10_000
+    assert result[0] == 0.0
+    assert np.all(np.diff(result) >= 0)
+    assert np.mean(np.diff(result)) == pytest.approx(0.01, rel=0.05)
+
+
+def test_generate_arrival_offsets_when_requests_per_second_is_invalid() -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = generate_arrival_offsets(
+            requests_number=4,
+            requests_per_second=0,
+            arrival_process=ArrivalProcess.CONSTANT,
+        )
+
+
+def test_generate_load_steps() -> None:
+    # when
+    result = generate_load_steps(
+        requests_per_second=10, requests_per_second_step=5, steps=3
+    )
+
+    # then
+    assert result == [10, 15, 20]
+
+
+def test_generate_load_steps_when_step_not_given() -> None:
+    # when
+    result = generate_load_steps(
+        requests_per_second=10, requests_per_second_step=None, steps=3
+    )
+
+    # then
+    assert result == [10]
+
+
+def test_run_open_loop_load_keeps_sending_requests_when_server_falls_behind() -> None:
+    # given
+    def executor() -> Optional[str]:
+        time.sleep(0.05)
+        return None
+
+    # when
+    result = run_open_loop_load(
+        executor=executor,
+        requests_per_step=20,
+        load_steps=[100],
+        arrival_process=ArrivalProcess.CONSTANT,
+        max_in_flight=1,
+    )
+
+    # then
+    assert len(result) == 1
+    assert result[0].requests_sent == 20
+    assert result[0].errors == 0
+    assert result[0].service_latency.p50_ms == pytest.approx(50, rel=0.2)
+    assert (
+        result[0].corrected_latency.max_ms > 500
+    ), "Time spent waiting for the busy executor expected to be accounted in latency"
+
+
+def test_run_open_loop_load_when_errors_occur() -> None:
+    # given
+    calls = []
+
+    def executor() -> Optional[str]:
+        calls.append(1)
+        if len(calls) % 2 == 0:
+            return "500"
+        if len(calls) == 3:
+            raise ValueError()
+        return None
+
+    # when
+    result = run_open_loop_load(
+        executor=executor,
+        requests_per_step=10,
+        load_steps=[200, 400],
+        arrival_process=ArrivalProcess.POISSON,
+        max_in_flight=4,
+        random_seed=42,
+    )
+
+    # then
+    assert [r.target_requests_per_second for r in result] == [200, 400]
+    assert [r.requests_sent for r in result] == [10, 10]
+    assert sum(r.errors for r in result) == 11
+
+
+def test_find_saturation_knee_when_throughput_is_not_sustained() -> None:
+    # given
+    reports = [
+        assembly_report(target=10, achieved=10, p99_ms=20),
+        assembly_report(target=20, achieved=19.5, p99_ms=25),
+        assembly_report(target=30, achieved=22, p99_ms=30),
+    ]
+
+    # when
+    result = find_saturation_knee(reports=reports)
+
+    # then
+    assert result is reports[2]
+
+
+def test_find_saturation_knee_when_latency_grows() -> None:
+    # given
+    reports = [
+        assembly_report(target=10, achieved=10, p99_ms=20),
+        assembly_report(target=20, achieved=20, p99_ms=50),
+    ]
+
+    # when
+    result = find_saturation_knee(reports=reports)
+
+    # then
+    assert result is reports[1]
+
+
+def test_find_saturation_knee_when_server_is_not_saturated() -> None:
+    # given
+    reports = [
+        assembly_report(target=10, achieved=10, p99_ms=20),
+        assembly_report(target=20, achieved=20, p99_ms=22),
+    ]
+
+    # when
+    result = find_saturation_knee(reports=reports)
+
+    # then
+    assert result is None
+
+
+def assembly_report(target: float, achieved: float, p99_ms: float) -> LoadStepReport:
+    latency = LatencySummary(
+        count=100,
+        mean_ms=p99_ms / 2,
+        max_ms=p99_ms,
+        p50_ms=p99_ms / 2,
+        p90_ms=p99_ms,
+        p99_ms=p99_ms,
+        p99_9_ms=p99_ms,
+    )
+    return LoadStepReport(
+        target_requests_per_second=target,
+        achieved_requests_per_second=achieved,
+        requests_sent=100,
+        errors=0,
+        service_latency=latency,
+        corrected_latency=latency,
+    )
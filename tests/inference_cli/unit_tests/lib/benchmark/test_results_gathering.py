@@ -0,0 +1,67 @@
+import math
+
+import numpy as np
+import pytest
+
+from inference_cli.lib.benchmark.results_gathering import LatencyHistogram
+
+
+def test_latency_histogram_percentiles_are_accurate_up_to_precision() -> None:
+    # given
+    histogram = LatencyHistogram(relative_precision=0.01)
+    values = np.random.RandomState(42).exponential(scale=0.05, size=10_000)
+
+    # when
+    for value in values:
+        histogram.record(value)
+
+    # then
+    sorted_values = np.sort(values)
+    for percentile in (50, 90, 99, 99.9):
+        expected = sorted_values[math.ceil(percentile / 100 * len(values)) - 1]
+        assert histogram.percentile(percentile) == pytest.approx(expected, rel=0.01)
+    assert histogram.count == 10_000
+
+
+def test_latency_histogram_summary() -> None:
+    # given
+    histogram = LatencyHistogram()
+    for _ in range(99):
+        histogram.record(0.01)
+    histogram.record(1.0)
+
+    # when
+    result = histogram.summarise()
+
+    # then
+    assert result.count == 100
+    assert result.p50_ms == pytest.approx(10, rel=0.01)
+    assert result.p99_ms == pytest.approx(10, rel=0.01)
+    assert result.p99_9_ms == pytest.approx(1000, rel=0.01)
+    assert result.max_ms == 1000
+    assert result.mean_ms == pytest.approx(19.9, rel=0.01)
+
+
+def test_latency_histogram_summary_when_empty() -> None:
+    # when
+    result = LatencyHistogram().summarise()
+
+    # then
+    assert result.count == 0
+    assert result.p99_ms == 0.0
+
+
+def test_latency_histogram_merge() -> None:
+    # given
+    histogram_a, histogram_b = LatencyHistogram(), LatencyHistogram()
+    histogram_a.record(0.01)
+    histogram_b.record(0.02)
+    histogram_b.record(0.03)
+
+    # when
+    histogram_a.merge(histogram_b)
+
+    # then
+    assert histogram_a.count == 3
+    assert histogram_a.percentile(50) == pytest.approx(0.02, rel=0.01)
+    assert histogram_a.percentile(100) == pytest.approx(0.03, rel=0.01)
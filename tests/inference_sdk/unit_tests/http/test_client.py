@@ -4,6 +4,7 @@ from io import BytesIO
 from unittest import mock
 from unittest.mock import AsyncMock, MagicMock
 
+import numpy as np
 import pytest
 from aiohttp import ClientConnectionError, ClientResponseError, RequestInfo
 from aioresponses import aioresponses
@@ -1421,6 +1422,56 @@ async def test_infer_from_api_v0_async_when_request_succeed_for_object_detection
         ]
 
 
+@mock.patch.object(client, "load_stream_inference_input")
+@mock.patch.object(InferenceHTTPClient, "infer")
+def test_infer_on_stream_when_multiple_frames_are_in_flight(
+    infer_mock: MagicMock,
+    load_stream_inference_input_mock: MagicMock,
+) -> None:
+    # given
+    frames = [np.ones((2, 2, 3), dtype=np.uint8) * i for i in range(5)]
+    load_stream_inference_input_mock.return_value = iter(enumerate(frames))
+    infer_mock.side_effect = lambda inference_input, model_id: {
+        "frame_value": int(inference_input[0, 0, 0]),
+        "model_id": model_id,
+    }
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url="http://some.com")
+
+    # when
+    result = list(
+        http_client.infer_on_stream(
+            input_uri="video.mp4", model_id="some/1", prefetch_depth=3
+        )
+    )
+
+    # then
+    assert [r[0] for r in result] == [0, 1, 2, 3, 4]
+    assert all(r[1] is frame for r, frame in zip(result, frames))
+    assert [r[2] for r in result] == [
+        {"frame_value": i, "model_id": "some/1"} for i in range(5)
+    ]
+
+
+@mock.patch.object(client, "build_requests_session")
+def test_client_does_not_close_session_replaced_with_bigger_one(
+    build_requests_session_mock: MagicMock,
+) -> None:
+    # given
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url="https://some.com")
+    first_session, second_session = MagicMock(), MagicMock()
+    build_requests_session_mock.side_effect = [first_session, second_session]
+
+    # when
+    _ = http_client._InferenceHTTPClient__get_session()
+    _ = http_client._InferenceHTTPClient__get_session(min_pool_size=64)
+    http_client.close()
+
+    # then
+    assert build_requests_session_mock.call_count == 2
+    first_session.close.assert_not_called()
+    second_session.close.assert_called_once()
+
+
 @mock.patch.object(client, "load_static_inference_input")
 def test_infer_from_api_v0_when_request_succeed_for_object_detection_with_visualisation_and_json(
     load_static_inference_input_mock: MagicMock,
@@ -1,3 +1,6 @@
+import threading
+import time
+from typing import Generator
 from unittest import mock
 from unittest.mock import MagicMock, call
 
@@ -11,6 +14,9 @@ from requests_mock import Mocker
 from inference_sdk.http.utils import executors
 from inference_sdk.http.utils.executors import (
     RequestMethod,
+    build_requests_session,
+    execute_in_pipeline,
+    execute_requests_in_sliding_window,
     execute_requests_packages,
     execute_requests_packages_async,
     make_parallel_requests,
@@ -314,6 +320,278 @@ def test_execute_requests_packages_when_api_calls_are_successful(
     ), "All responses should be returned with the same, predefined JSON response"
 
 
+def test_execute_requests_packages_when_session_is_given(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    request_data = RequestData(
+        url="https://some.com",
+        request_elements=1,
+        headers=None,
+        data=None,
+        parameters=None,
+        payload={"some": "value"},
+        image_scaling_factors=[None],
+    )
+    requests_mock.post(url="https://some.com", json={"message": "ok"})
+    session = build_requests_session(pool_size=2)
+
+    # when
+    with mock.patch.object(session, "post", wraps=session.post) as session_post:
+        result = execute_requests_packages(
+            requests_data=[request_data] * 3,
+            request_method=RequestMethod.POST,
+            max_concurrent_requests=2,
+            session=session,
+        )
+
+    # then
+    assert len(result) == 3, "3 requests made - 3 responses are expected"
+    assert session_post.call_count == 3, "All requests expected to be sent via session"
+
+
+@mock.patch.object(executors, "make_request")
+def test_execute_requests_in_sliding_window_yields_responses_in_order_of_requests(
+    make_request_mock: MagicMock,
+) -> None:
+    # given
+    requests_data = [
+        RequestData(
+            url=f"https://some.com/{i}",
+            request_elements=1,
+            headers=None,
+            data=None,
+            parameters=None,
+            payload=None,
+            image_scaling_factors=[None],
+        )
+        for i in range(6)
+    ]
+
+    def make_request(request_data: RequestData, **kwargs) -> str:
+        if request_data.url.endswith("/0"):
+            time.sleep(0.1)
+        return request_data.url
+
+    make_request_mock.side_effect = make_request
+
+    # when
+    result = list(
+        execute_requests_in_sliding_window(
+            requests_data=requests_data,
+            request_method=RequestMethod.GET,
+            max_concurrent_requests=2,
+        )
+    )
+
+    # then
+    assert result == [r.url for r in requests_data]
+
+
+@mock.patch.object(executors, "make_request")
+def test_execute_requests_in_sliding_window_does_not_wait_for_whole_wave(
+    make_request_mock: MagicMock,
+) -> None:
+    # given
+    requests_data = [
+        RequestData(
+            url=f"https://some.com/{i}",
+            request_elements=1,
+            headers=None,
+            data=None,
+            parameters=None,
+            payload=None,
+            image_scaling_factors=[None],
+        )
+        for i in range(4)
+    ]
+    slow_request_released = threading.Event()
+    completed_while_slow_request_in_flight = []
+
+    def make_request(request_data: RequestData, **kwargs) -> str:
+        if request_data.url.endswith("/0"):
+            slow_request_released.wait(timeout=5)
+            return request_data.url
+        completed_while_slow_request_in_flight.append(request_data.url)
+        if len(completed_while_slow_request_in_flight) == 3:
+            slow_request_released.set()
+        return request_data.url
+
+    make_request_mock.side_effect = make_request
+
+    # when
+    result = list(
+        execute_requests_in_sliding_window(
+            requests_data=requests_data,
+            request_method=RequestMethod.GET,
+            max_concurrent_requests=2,
+        )
+    )
+
+    # then
+    assert result == [r.url for r in requests_data]
+    assert slow_request_released.is_set(), (
+        "Remaining requests expected to be sent while the first one was still "
+        "in flight"
+    )
+
+
+@mock.patch.object(executors, "make_request")
+def test_execute_requests_packages_when_error_occurs_early(
+    make_request_mock: MagicMock,
+) -> None:
+    # given
+    request_data = RequestData(
+        url="https://some.com",
+        request_elements=1,
+        headers=None,
+        data=None,
+        parameters=None,
+        payload=None,
+        image_scaling_factors=[None],
+    )
+    failed_response = Response()
+    failed_response.status_code = 500
+    failed_response.url = "https://some.com"
+    make_request_mock.return_value = failed_response
+
+    # when
+    with pytest.raises(HTTPError):
+        _ = execute_requests_packages(
+            requests_data=[request_data] * 100,
+            request_method=RequestMethod.GET,
+            max_concurrent_requests=2,
+        )
+
+    # then
+    assert (
+        make_request_mock.call_count < 100
+    ), "Requests not sent before error is spotted expected to be cancelled"
+
+
+def test_execute_in_pipeline_yields_results_in_order_of_items() -> None:
+    # given
+    def function(item: int) -> int:
+        time.sleep(0.01 * (item % 3))
+        return item * 2
+
+    # when
+    result = list(
+        execute_in_pipeline(items=range(10), function=function, max_items_in_flight=4)
+    )
+
+    # then
+    assert result == [(i, i * 2) for i in range(10)]
+
+
+def test_execute_in_pipeline_processes_items_concurrently() -> None:
+    # given
+    barrier = threading.Barrier(3, timeout=5)
+
+    def function(item: int) -> int:
+        barrier.wait()
+        return item
+
+    # when
+    result = list(
+        execute_in_pipeline(items=range(6), function=function, max_items_in_flight=3)
+    )
+
+    # then
+    assert [r[1] for r in result] == list(range(6))
+
+
+def test_execute_in_pipeline_when_items_are_dropped_while_processing_is_behind() -> (
+    None
+):
+    # given
+    item_processed = threading.Event()
+
+    def items() -> Generator[int, None, None]:
+        yield 0
+        for i in range(1, 5):
+            # items pulled while first one is in flight
+            yield i
+        item_processed.set()
+        time.sleep(0.1)
+        yield 5
+
+    def function(item: int) -> int:
+        item_processed.wait(timeout=5)
+        return item
+
+    # when
+    result = list(
+        execute_in_pipeline(
+            items=items(),
+            function=function,
+            max_items_in_flight=1,
+            drop_items_when_behind=True,
+        )
+    )
+
+    # then
+    assert result == [(0, 0), (5, 5)]
+
+
+def test_execute_in_pipeline_when_processing_fails() -> None:
+    # given
+    def function(item: int) -> int:
+        if item == 3:
+            raise ValueError()
+        return item
+
+    # when
+    result = []
+    with pytest.raises(ValueError):
+        for element in execute_in_pipeline(
+            items=range(10), function=function, max_items_in_flight=2
+        ):
+            result.append(element)
+
+    # then
+    assert result == [(0, 0), (1, 1), (2, 2)]
+
+
+def test_execute_in_pipeline_when_pulling_items_fails() -> None:
+    # given
+    def items() -> Generator[int, None, None]:
+        yield 0
+        raise ValueError()
+
+    # when
+    result = []
+    with pytest.raises(ValueError):
+        for element in execute_in_pipeline(
+            items=items(), function=lambda e: e, max_items_in_flight=2
+        ):
+            result.append(element)
+
+    # then
+    assert result == [(0, 0)]
+
+
+def test_execute_in_pipeline_stops_pulling_items_when_consumer_stops() -> None:
+    # given
+    pulled_items = []
+
+    def items() -> Generator[int, None, None]:
+        for i in range(100):
+            pulled_items.append(i)
+            yield i
+
+    # when
+    pipeline = execute_in_pipeline(
+        items=items(), function=lambda e: e, max_items_in_flight=2
+    )
+    result = next(pipeline)
+    pipeline.close()
+
+    # then
+    assert result == (0, 0)
+    assert len(pulled_items) < 100, "Pulling items expected to be stopped"
+
+
 @pytest.mark.asyncio
 @pytest.mark.slow
 async def test_make_request_async_when_connection_error_occurs_and_does_not_recover() -> (
@@ -0,0 +1,66 @@
+from inference.core.managers.base import ModelManager
+from inference.core.workflows.core_steps.common.entities import StepExecutionMode
+from inference.core.workflows.execution_engine.v1.compiler import core
+from inference.core.workflows.execution_engine.v1.compiler.core import (
+    clear_compilation_cache,
+    compile_workflow,
+)
+
+WORKFLOW_DEFINITION = {
+    "version": "1.0",
+    "inputs": [
+        {"type": "WorkflowImage", "name": "image"},
+        {"type": "WorkflowParameter", "name": "model_id"},
+    ],
+    "steps": [
+        {
+            "type": "ObjectDetectionModel",
+            "name": "detection",
+            "image": "$inputs.image",
+            "model_id": "$inputs.model_id",
+        }
+    ],
+    "outputs": [
+        {
+            "type": "JsonField",
+            "name": "predictions",
+            "selector": "$steps.detection.predictions",
+        },
+    ],
+}
+
+
+def test_compilation_of_the_same_workflow_reuses_compiled_definition(
+    model_manager: ModelManager,
+) -> None:
+    # given
+    clear_compilation_cache()
+    workflow_init_parameters = {
+        "workflows_core.model_manager": model_manager,
+        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
+    }
+    reordered_definition = {
+        key: WORKFLOW_DEFINITION[key] for key in reversed(WORKFLOW_DEFINITION)
+    }
+
+    # when
+    first_result = compile_workflow(
+        workflow_definition=WORKFLOW_DEFINITION,
+        init_parameters={**workflow_init_parameters, "workflows_core.api_key": "a"},
+    )
+    second_result = compile_workflow(
+        workflow_definition=reordered_definition,
+        init_parameters={**workflow_init_parameters, "workflows_core.api_key": "b"},
+    )
+
+    # then
+    statistics = core.COMPILATION_CACHE.get_statistics()
+    assert statistics.hits == 1
+    assert statistics.misses == 1
+    assert first_result.execution_graph is second_result.execution_graph
+    assert (
+        first_result.steps["detection"].step
+        is not second_result.steps["detection"].step
+    ), "Expected steps to be initialised separately for each compilation"
+    assert second_result.init_parameters["workflows_core.api_key"] == "b"
+    assert second_result.steps["detection"].step._api_key == "b"
@@ -6,6 +6,7 @@ import supervision as sv
 
 from inference.core.workflows.core_steps.analytics.line_counter.v1 import (
     LineCounterBlockV1,
+    line_zone_matches,
 )
 from inference.core.workflows.execution_engine.entities.base import VideoMetadata
 
@@ -58,6 +59,105 @@ def test_line_counter() -> None:
     assert frame2_result == {"count_in": 1, "count_out": 1}
 
 
+def test_line_counter_resets_counts_when_line_segment_changes() -> None:
+    # given
+    frame1_detections = sv.Detections(
+        xyxy=np.array([[10, 10, 11, 11]]),
+        tracker_id=np.array([1]),
+    )
+    frame2_detections = sv.Detections(
+        xyxy=np.array([[20, 10, 21, 21]]),
+        tracker_id=np.array([1]),
+    )
+    metadata = VideoMetadata(
+        video_identifier="vid_1",
+        frame_number=10,
+        frame_timestamp=datetime.datetime.fromtimestamp(1726570875).astimezone(
+            tz=datetime.timezone.utc
+        ),
+    )
+    line_counter_block = LineCounterBlockV1(step_name="line_counter")
+    _ = line_counter_block.run(
+        detections=frame1_detections,
+        metadata=metadata,
+        line_segment=[[15, 0], [15, 1000]],
+        triggering_anchor="TOP_LEFT",
+    )
+
+    # when
+    result = line_counter_block.run(
+        detections=frame2_detections,
+        metadata=metadata,
+        line_segment=[[500, 0], [500, 1000]],
+        triggering_anchor="TOP_LEFT",
+    )
+
+    # then
+    assert result == {"count_in": 0, "count_out": 0}
+
+
+def test_line_counter_rebuilds_restored_line_zone_not_matching_configuration() -> None:
+    # given
+    line_segment = [[15, 0], [15, 1000]]
+    metadata = VideoMetadata(
+        video_identifier="vid_1",
+        frame_number=10,
+        frame_timestamp=datetime.datetime.fromtimestamp(1726570875).astimezone(
+            tz=datetime.timezone.utc
+        ),
+    )
+    line_counter_block = LineCounterBlockV1(step_name="line_counter")
+    _ = line_counter_block.run(
+        detections=sv.Detections(
+            xyxy=np.array([[10, 10, 11, 11]]), tracker_id=np.array([1])
+        ),
+        metadata=metadata,
+        line_segment=line_segment,
+        triggering_anchor="TOP_LEFT",
+    )
+    store = line_counter_block._batch_of_line_zones
+    for state_key in list(store._entries.keys()):
+        store.set(
+            state_key,
+            sv.LineZone(start=sv.Point(500, 0), end=sv.Point(500, 1000)),
+        )
+
+    # when
+    result = line_counter_block.run(
+        detections=sv.Detections(
+            xyxy=np.array([[20, 10, 21, 21]]), tracker_id=np.array([1])
+        ),
+        metadata=metadata,
+        line_segment=line_segment,
+        triggering_anchor="TOP_LEFT",
+    )
+
+    # then
+    assert result == {"count_in": 0, "count_out": 0}
+    assert all(
+        line_zone_matches(
+            line_zone=line_zone,
+            line_segment=line_segment,
+            triggering_anchor="TOP_LEFT",
+        )
+        for line_zone in (entry.value for entry in store._entries.values())
+    )
+
+
+def test_line_zone_matches() -> None:
+    # given
+    line_zone = sv.LineZone(
+        start=sv.Point(15, 0),
+        end=sv.Point(15, 1000),
+        triggering_anchors=[sv.Position.CENTER],
+    )
+
+    # then
+    assert line_zone_matches(line_zone, [[15, 0], [15, 1000]], "CENTER") is True
+    assert line_zone_matches(line_zone, [[15, 0], [16, 1000]], "CENTER") is False
+    assert line_zone_matches(line_zone, [[15, 0], [15, 1000]], "TOP_LEFT") is False
+
+
 def test_line_counter_no_trackers() -> None:
     # given
     line_segment = [[15, 0], [15, 1000]]
@@ -5,7 +5,10 @@ import pytest
 import supervision as sv
 
 from inference.core.workflows.core_steps.analytics.time_in_zone.v1 import (
+    CompactPolygonZone,
     TimeInZoneBlockV1,
+    TrackedIdsInZone,
+    update_tracked_ids_in_zone,
 )
 from inference.core.workflows.execution_engine.entities.base import (
     ImageParentMetadata,
@@ -654,3 +657,128 @@ def test_time_in_zone_coordianates_not_numeric() -> None:
             remove_out_of_zone_detections=True,
             reset_out_of_zone_detections=True,
         )
+
+
+@pytest.mark.parametrize(
+    "anchor", [sv.Position.CENTER, sv.Position.TOP_LEFT, sv.Position.BOTTOM_RIGHT]
+)
+def test_compact_polygon_zone_gives_the_same_results_as_supervision_zone(
+    anchor: sv.Position,
+) -> None:
+    # given
+    polygon = np.array([[120, 40], [260, 90], [200, 180], [140, 120]])
+    xy = np.random.default_rng(42).uniform(-20, 300, size=(500, 2))
+    detections = sv.Detections(xyxy=np.concatenate([xy, xy + 15], axis=1))
+    compact_zone = CompactPolygonZone(polygon=polygon, triggering_anchor=anchor)
+    reference_zone = sv.PolygonZone(polygon=polygon, triggering_anchors=(anchor,))
+
+    # when
+    result = compact_zone.trigger(detections)
+
+    # then
+    assert compact_zone.mask.shape == (142, 142)
+    assert result.any(), "Some detections expected to be in zone"
+    assert np.array_equal(result, reference_zone.trigger(detections))
+
+
+def test_compact_polygon_zone_matches() -> None:
+    # given
+    zone = CompactPolygonZone(
+        polygon=np.array([[10, 10], [10, 20], [20, 20]]),
+        triggering_anchor=sv.Position.CENTER,
+    )
+
+    # then
+    assert (
+        zone.matches(
+            polygon=np.array([[10, 10], [10, 20], [20, 20]]),
+            triggering_anchor=sv.Position.CENTER,
+        )
+        is True
+    )
+    assert (
+        zone.matches(
+            polygon=np.array([[10, 10], [10, 20], [20, 21]]),
+            triggering_anchor=sv.Position.CENTER,
+        )
+        is False
+    )
+    assert (
+        zone.matches(
+            polygon=np.array([[10, 10], [10, 20], [20, 20]]),
+            triggering_anchor=sv.Position.TOP_LEFT,
+        )
+        is False
+    )
+
+
+def test_tracked_ids_in_zone_lookup() -> None:
+    # given
+    tracked_ids_in_zone = TrackedIdsInZone(
+        tracker_ids=np.array([2, 5, 7]),
+        entry_timestamps=np.array([1.0, 2.0, 3.0]),
+    )
+
+    # when
+    found, indices = tracked_ids_in_zone.lookup(tracker_ids=np.array([7, 1, 2, 9]))
+
+    # then
+    assert found.tolist() == [True, False, True, False]
+    assert indices[found].tolist() == [2, 0]
+
+
+def test_update_tracked_ids_in_zone() -> None:
+    # given
+    tracked_ids_in_zone = TrackedIdsInZone(
+        tracker_ids=np.array([2, 5, 7]),
+        entry_timestamps=np.array([1.0, 2.0, 3.0]),
+    )
+
+    # when
+    result = update_tracked_ids_in_zone(
+        tracked_ids_in_zone=tracked_ids_in_zone,
+        removed_indices=np.array([1]),
+        added_tracker_ids=np.array([6, 1]),
+        timestamp=4.0,
+    )
+
+    # then
+    assert result.tracker_ids.tolist() == [1, 2, 6, 7]
+    assert result.entry_timestamps.tolist() == [4.0, 1.0, 4.0, 3.0]
+
+
+def test_time_in_zone_does_not_modify_input_detections() -> None:
+    # given
+    detections = sv.Detections(
+        xyxy=np.array([[9, 15, 10, 16], [15, 15, 16, 16]]),
+        tracker_id=np.array([1, 2]),
+    )
+    metadata = VideoMetadata(
+        video_identifier="vid_1",
+        frame_number=10,
+        fps=1,
+        frame_timestamp=datetime.datetime.fromtimestamp(1726570875).astimezone(
+            tz=datetime.timezone.utc
+        ),
+        comes_from_video_file=True,
+    )
+    image_data = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="img1"),
+        numpy_image=np.zeros((720, 1280, 3)),
+    )
+    time_in_zone_block = TimeInZoneBlockV1()
+
+    # when
+    result = time_in_zone_block.run(
+        image=image_data,
+        detections=detections,
+        metadata=metadata,
+        zone=[[10, 10], [10, 20], [20, 20], [20, 10]],
+        triggering_anchor="TOP_LEFT",
+        remove_out_of_zone_detections=False,
+        reset_out_of_zone_detections=False,
+    )
+
+    # then
+    assert "time_in_zone" not in detections.data
+    assert result["timed_detections"]["time_in_zone"].tolist() == [0.0, 0.0]
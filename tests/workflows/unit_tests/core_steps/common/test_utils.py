@@ -4,12 +4,14 @@ import numpy as np
 import pytest
 import supervision as sv
 
+from inference.core.models.types import NativeDetections
 from inference.core.workflows.core_steps.common.utils import (
     add_inference_keypoints_to_sv_detections,
     attach_parents_coordinates_to_sv_detections,
     attach_prediction_type_info,
     attach_prediction_type_info_to_sv_detections_batch,
     convert_inference_detections_batch_to_sv_detections,
+    convert_native_detections_batch_to_sv_detections,
     filter_out_unwanted_classes_from_sv_detections_batch,
     grab_batch_parameters,
     grab_non_batch_parameters,
@@ -201,6 +203,94 @@ def test_convert_inference_detections_batch_to_sv_detections() -> None:
     )
 
 
+def test_convert_native_detections_batch_to_sv_detections() -> None:
+    # given
+    mask = np.zeros((2, 200, 100), dtype=bool)
+    mask[0, 80:121, 30:71] = True
+    mask[1, 170:191, 70:91] = True
+    predictions = [
+        NativeDetections(
+            xyxy=np.array([[25, 50, 75, 150], [50, 125, 100, 225]]),
+            confidence=np.array([0.1, 0.2]),
+            class_id=np.array([1, 0]),
+            class_name=np.array(["dog", "cat"]),
+            image_dimensions=(200, 100),
+            mask=mask,
+        ),
+        NativeDetections(
+            xyxy=np.empty((0, 4)),
+            confidence=np.empty((0,)),
+            class_id=np.empty((0,), dtype=int),
+            class_name=np.empty((0,), dtype=str),
+            image_dimensions=(200, 100),
+            mask=np.empty((0, 200, 100), dtype=bool),
+        ),
+    ]
+
+    # when
+    result = convert_native_detections_batch_to_sv_detections(
+        predictions=predictions,
+        inference_id="some",
+    )
+
+    # then
+    assert len(result) == 2, "Expected output batch to be of size of input batch"
+    assert np.allclose(
+        result[0].xyxy, np.array([[25, 50, 75, 150], [50, 125, 100, 225]])
+    )
+    assert np.array_equal(result[0].mask, mask)
+    assert np.allclose(result[0].confidence, np.array([0.1, 0.2]))
+    assert result[0].class_id.tolist() == [1, 0]
+    assert result[0]["class_name"].tolist() == ["dog", "cat"]
+    assert result[0]["parent_id"].tolist() == ["", ""]
+    assert result[0]["inference_id"].tolist() == ["some", "some"]
+    assert result[0]["image_dimensions"].tolist() == [[200, 100], [200, 100]]
+    assert (
+        len(set(result[0]["detection_id"].tolist())) == 2
+    ), "Expected unique detection ids to be generated"
+    assert len(result[1]) == 0
+    assert result[1].mask is None, "Expected no mask for empty detections"
+    assert len(result[1]["class_name"]) == 0
+
+
+def test_convert_native_detections_batch_to_sv_detections_when_keypoints_given() -> (
+    None
+):
+    # given
+    predictions = [
+        NativeDetections(
+            xyxy=np.array([[25, 50, 75, 150], [50, 125, 100, 225]]),
+            confidence=np.array([0.1, 0.2]),
+            class_id=np.array([0, 0]),
+            class_name=np.array(["person", "person"]),
+            image_dimensions=(200, 100),
+            keypoints_xy=[
+                np.array([[30, 60], [40, 70]], dtype=np.float32),
+                np.array([[60, 130]], dtype=np.float32),
+            ],
+            keypoints_confidence=[
+                np.array([0.5, 0.6], dtype=np.float32),
+                np.array([0.7], dtype=np.float32),
+            ],
+            keypoints_class_id=[np.array([0, 1]), np.array([0])],
+            keypoints_class_name=[np.array(["nose", "eye"]), np.array(["nose"])],
+        ),
+    ]
+
+    # when
+    result = convert_native_detections_batch_to_sv_detections(
+        predictions=predictions,
+    )
+
+    # then
+    assert "inference_id" not in result[0].data
+    assert np.allclose(result[0]["keypoints_xy"][0], np.array([[30, 60], [40, 70]]))
+    assert np.allclose(result[0]["keypoints_xy"][1], np.array([[60, 130]]))
+    assert np.allclose(result[0]["keypoints_confidence"][0], np.array([0.5, 0.6]))
+    assert result[0]["keypoints_class_id"][1].tolist() == [0]
+    assert result[0]["keypoints_class_name"][0].tolist() == ["nose", "eye"]
+
+
 def test_add_inference_keypoints_to_sv_detections() -> None:
     # given
     mask = np.zeros((2, 200, 100), dtype=np.bool_)
@@ -0,0 +1,316 @@
+import numpy as np
+
+from inference.core.workflows.core_steps.common.video_state_store import (
+    SnapshotsFlusher,
+    VideoStateStore,
+    compose_namespace,
+    compute_config_hash,
+    estimate_memory_usage,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_or_create_when_state_not_present() -> None:
+    # given
+    store = VideoStateStore(name="test")
+
+    # when
+    result = store.get_or_create(video_identifier="a", factory=lambda: {"x": 1})
+
+    # then
+    assert result == {"x": 1}
+    assert "a" in store
+    assert len(store) == 1
+
+
+def test_get_or_create_when_state_already_present() -> None:
+    # given
+    store = VideoStateStore(name="test")
+    state = store.get_or_create(video_identifier="a", factory=dict)
+    state["x"] = 1
+
+    # when
+    result = store.get_or_create(video_identifier="a", factory=dict)
+
+    # then
+    assert result is state
+    assert result == {"x": 1}
+
+
+def test_get_when_state_not_present() -> None:
+    # given
+    store = VideoStateStore(name="test")
+
+    # when
+    result = store.get(video_identifier="a")
+
+    # then
+    assert result is None
+
+
+def test_store_evicts_state_of_videos_not_seen_for_ttl() -> None:
+    # given
+    clock = FakeClock()
+    store = VideoStateStore(name="test", ttl=10, clock=clock)
+    store.set("a", 1)
+    clock.now = 5
+    store.set("b", 2)
+
+    # when
+    clock.now = 12
+    result = store.get("b")
+
+    # then
+    assert result == 2
+    assert "a" not in store, "State of video a not seen for 12s expected to be evicted"
+    assert store.get_statistics().evictions == 1
+
+
+def test_store_does_not_evict_state_of_videos_seen_within_ttl() -> None:
+    # given
+    clock = FakeClock()
+    store = VideoStateStore(name="test", ttl=10, clock=clock)
+    store.set("a", 1)
+    store.set("b", 2)
+    clock.now = 8
+    _ = store.get("a")
+
+    # when
+    clock.now = 15
+    result = store.get("a")
+
+    # then
+    assert result == 1
+    assert "b" not in store, "Only video b is expected to be not seen for more than 10s"
+
+
+def test_store_evicts_least_recently_seen_video_when_max_entries_exceeded() -> None:
+    # given
+    clock = FakeClock()
+    store = VideoStateStore(name="test", max_entries=2, clock=clock)
+    store.set("a", 1)
+    clock.now = 1
+    store.set("b", 2)
+    clock.now = 2
+    _ = store.get("a")
+
+    # when
+    clock.now = 3
+    store.set("c", 3)
+
+    # then
+    assert "a" in store
+    assert "b" not in store
+    assert "c" in store
+
+
+def test_store_initialised_from_env_is_bounded_by_default() -> None:
+    # when
+    store = VideoStateStore.init_from_env(name="test")
+
+    # then
+    assert store._max_entries is not None
+    assert store._ttl is not None
+
+
+def test_store_evicts_least_recently_seen_video_when_memory_limit_exceeded() -> None:
+    # given
+    store = VideoStateStore(name="test", max_memory_bytes=1500)
+    store.set("a", np.zeros((1000,), dtype=np.uint8))
+
+    # when
+    store.set("b", np.zeros((1000,), dtype=np.uint8))
+
+    # then
+    assert "a" not in store
+    assert "b" in store
+    assert store.memory_usage_bytes == 1000
+
+
+def test_store_never_evicts_state_of_currently_accessed_video() -> None:
+    # given
+    store = VideoStateStore(name="test", max_memory_bytes=500)
+
+    # when
+    result = store.get_or_create(
+        video_identifier="a", factory=lambda: np.zeros((1000,), dtype=np.uint8)
+    )
+
+    # then
+    assert len(result) == 1000
+    assert "a" in store
+
+
+def test_pop_releases_state_memory() -> None:
+    # given
+    store = VideoStateStore(name="test", max_memory_bytes=10_000)
+    store.set("a", np.zeros((1000,), dtype=np.uint8))
+
+    # when
+    result = store.pop("a")
+
+    # then
+    assert len(result) == 1000
+    assert "a" not in store
+    assert store.memory_usage_bytes == 0
+
+
+def test_store_state_restored_from_snapshot(tmp_path) -> None:
+    # given
+    store = VideoStateStore(name="test", snapshot_dir=str(tmp_path))
+    store.set("a", {1: 2.0})
+    store.set("b", {3: 4.0})
+    store.save_snapshot()
+
+    # when
+    restored_store = VideoStateStore(name="test", snapshot_dir=str(tmp_path))
+
+    # then
+    assert restored_store.get("a") == {1: 2.0}
+    assert restored_store.get("b") == {3: 4.0}
+
+
+def test_store_saves_snapshot_only_when_interval_elapses(tmp_path) -> None:
+    # given
+    clock = FakeClock()
+    store = VideoStateStore(
+        name="test", snapshot_dir=str(tmp_path), snapshot_interval=10, clock=clock
+    )
+    store.set("a", 1)
+
+    # when
+    clock.now = 5
+    store.save_snapshot_if_due()
+    snapshot_present_before_interval = (tmp_path / "test.pickle").exists()
+    store.set("b", 2)
+    clock.now = 11
+    store.set("c", 3)
+    snapshot_present_after_update = (tmp_path / "test.pickle").exists()
+    store.save_snapshot_if_due()
+
+    # then
+    assert snapshot_present_before_interval is False
+    assert (
+        snapshot_present_after_update is False
+    ), "Snapshot is not expected to be saved on state access"
+    restored_store = VideoStateStore(name="test", snapshot_dir=str(tmp_path))
+    assert len(restored_store) == 3
+
+
+def test_snapshots_flusher_saves_snapshots_of_registered_stores(tmp_path) -> None:
+    # given
+    clock = FakeClock()
+    flusher = SnapshotsFlusher(interval=1.0)
+    store = VideoStateStore(
+        name="test", snapshot_dir=str(tmp_path), snapshot_interval=10, clock=clock
+    )
+    flusher._stores.add(store)
+    store.set("a", 1)
+
+    # when
+    flusher.flush()
+    snapshot_present_before_interval = (tmp_path / "test.pickle").exists()
+    clock.now = 11
+    flusher.flush()
+
+    # then
+    assert snapshot_present_before_interval is False
+    restored_store = VideoStateStore(name="test", snapshot_dir=str(tmp_path))
+    assert restored_store.get("a") == 1
+
+
+def test_stores_with_different_namespaces_keep_separate_snapshots(tmp_path) -> None:
+    # given
+    store_a = VideoStateStore(
+        name="test", namespace="step/a", snapshot_dir=str(tmp_path)
+    )
+    store_b = VideoStateStore(
+        name="test", namespace="step_b", snapshot_dir=str(tmp_path)
+    )
+    store_a.set("video", 1)
+    store_b.set("video", 2)
+
+    # when
+    store_a.save_snapshot()
+    store_b.save_snapshot()
+
+    # then
+    assert (tmp_path / "test.step_a.pickle").exists()
+    assert (
+        VideoStateStore(
+            name="test", namespace="step/a", snapshot_dir=str(tmp_path)
+        ).get("video")
+        == 1
+    )
+    assert (
+        VideoStateStore(
+            name="test", namespace="step_b", snapshot_dir=str(tmp_path)
+        ).get("video")
+        == 2
+    )
+
+
+def test_store_does_not_leave_temporary_files_after_snapshot(tmp_path) -> None:
+    # given
+    store = VideoStateStore(name="test", snapshot_dir=str(tmp_path))
+    store.set("a", 1)
+
+    # when
+    store.save_snapshot()
+    store.save_snapshot()
+
+    # then
+    assert [p.name for p in tmp_path.iterdir()] == ["test.pickle"]
+
+
+def test_compose_namespace() -> None:
+    # when
+    result = compose_namespace("pipeline_1", None, "byte_tracker")
+
+    # then
+    assert result == "pipeline_1.byte_tracker"
+    assert compose_namespace(None, None) is None
+
+
+def test_compute_config_hash() -> None:
+    # when
+    result = compute_config_hash([[0, 0], [10, 10]], "CENTER")
+
+    # then
+    assert result == compute_config_hash([[0, 0], [10, 10]], "CENTER")
+    assert result != compute_config_hash([[0, 0], [10, 11]], "CENTER")
+    assert result != compute_config_hash([[0, 0], [10, 10]], "TOP_LEFT")
+    assert len(result) == 32
+
+
+def test_store_ignores_corrupted_snapshot(tmp_path) -> None:
+    # given
+    (tmp_path / "test.pickle").write_bytes(b"invalid")
+
+    # when
+    store = VideoStateStore(name="test", snapshot_dir=str(tmp_path))
+
+    # then
+    assert len(store) == 0
+
+
+def test_estimate_memory_usage_accounts_numpy_arrays_in_nested_objects() -> None:
+    # given
+    class State:
+        def __init__(self):
+            self.tracks = [np.zeros((100,), dtype=np.float64) for _ in range(10)]
+            self.lookup = {"a": np.zeros((1000,), dtype=np.uint8)}
+
+    # when
+    result = estimate_memory_usage(value=State())
+
+    # then
+    assert result >= 10 * 800 + 1000
+    assert result < 10 * 800 + 1000 + 5000
@@ -13,10 +13,9 @@ from inference.core.workflows.core_steps.fusion.detections_consensus.v1 import (
     BlockManifest,
     aggregate_field_values,
     agree_on_consensus_for_all_detections_sources,
-    calculate_iou,
+    calculate_pairwise_iou,
     check_objects_presence_in_consensus_detections,
     does_not_detect_objects_in_any_source,
-    enumerate_detections,
     filter_predictions,
     get_average_bounding_box,
     get_class_of_least_confident_detection,
@@ -654,213 +653,117 @@ def test_merge_detections(uuid4_mock: MagicMock) -> None:
     )
 
 
-def test_calculate_iou_when_detections_are_zero_size() -> None:
+def test_calculate_pairwise_iou_when_detections_are_zero_size() -> None:
     # given
-    detections = sv.Detections(
-        xyxy=np.array(
-            [[99.5, 200, 100.5, 200], [100, 219.5, 100, 221.5]], dtype=np.float64
-        ),
-        confidence=np.array([0.5, 0.6], dtype=np.float64),
-        class_id=np.array([1, 2]),
-        data={"class_name": np.array(["a", "b"])},
-    )
-
-    detection_a = detections[0]
-    detection_b = detections[1]
-
-    # when
-    result = calculate_iou(
-        detection_a=detection_a,
-        detection_b=detection_b,
+    source_a = sv.Detections(
+        xyxy=np.array([[99.5, 200, 100.5, 200]], dtype=np.float64),
+        confidence=np.array([0.5], dtype=np.float64),
+        class_id=np.array([1]),
+        data={"class_name": np.array(["a"])},
     )
-
-    # then
-    assert abs(result) < 1e-5
-
-
-def test_calculate_iou_when_detections_do_not_overlap() -> None:
-    # given
-    detections = sv.Detections(
-        xyxy=np.array([[80, 190, 120, 210], [80, 210, 120, 230]], dtype=np.float64),
-        confidence=np.array([0.5, 0.6], dtype=np.float64),
-        class_id=np.array([1, 2]),
-        data={"class_name": np.array(["a", "b"])},
+    source_b = sv.Detections(
+        xyxy=np.array([[100, 219.5, 100, 221.5]], dtype=np.float64),
+        confidence=np.array([0.6], dtype=np.float64),
+        class_id=np.array([2]),
+        data={"class_name": np.array(["b"])},
     )
-    detection_a = detections[0]
-    detection_b = detections[1]
 
     # when
-    result = calculate_iou(
-        detection_a=detection_a,
-        detection_b=detection_b,
+    result = calculate_pairwise_iou(
+        detections_from_sources=[source_a, source_b],
+        class_aware=False,
     )
 
     # then
-    assert abs(result) < 1e-5
+    assert np.allclose(result[(0, 1)], np.array([[0.0]]))
 
 
-def test_calculate_iou_when_detections_do_overlap_fully() -> None:
+def test_calculate_pairwise_iou_when_detections_do_not_overlap() -> None:
     # given
-    detection_a = sv.Detections(
+    source_a = sv.Detections(
         xyxy=np.array([[80, 190, 120, 210]], dtype=np.float64),
         confidence=np.array([0.5], dtype=np.float64),
         class_id=np.array([1]),
         data={"class_name": np.array(["a"])},
     )
+    source_b = sv.Detections(
+        xyxy=np.array([[80, 210, 120, 230]], dtype=np.float64),
+        confidence=np.array([0.6], dtype=np.float64),
+        class_id=np.array([2]),
+        data={"class_name": np.array(["b"])},
+    )
 
     # when
-    result = calculate_iou(
-        detection_a=detection_a,
-        detection_b=detection_a,
+    result = calculate_pairwise_iou(
+        detections_from_sources=[source_a, source_b],
+        class_aware=False,
     )
 
     # then
-    assert abs(result - 1.0) < 1e-5
+    assert np.allclose(result[(0, 1)], np.array([[0.0]]))
 
 
-def test_calculate_iou_when_detections_do_overlap_partially() -> None:
+def test_calculate_pairwise_iou_when_detections_do_overlap() -> None:
     # given
-    detections = sv.Detections(
-        xyxy=np.array([[80, 190, 120, 210], [100, 200, 140, 220]], dtype=np.float64),
-        confidence=np.array([0.5, 0.6], dtype=np.float64),
-        class_id=np.array([1, 2]),
-        data={"class_name": np.array(["a", "b"])},
+    source_a = sv.Detections(
+        xyxy=np.array([[80, 190, 120, 210], [0, 0, 10, 10]], dtype=np.float64),
+        confidence=np.array([0.5, 0.5], dtype=np.float64),
+        class_id=np.array([1, 1]),
+        data={"class_name": np.array(["a", "a"])},
+    )
+    source_b = sv.Detections(
+        xyxy=np.array([[80, 190, 120, 210], [100, 200, 140, 220], [0, 0, 10, 10]]),
+        confidence=np.array([0.6, 0.6, 0.6], dtype=np.float64),
+        class_id=np.array([2, 2, 2]),
+        data={"class_name": np.array(["b", "b", "b"])},
     )
-    detection_a = detections[0]
-    detection_b = detections[1]
 
     # box A size = box B size = 800
     # intersection = (100, 200, 120, 210) -> size = 200
-    # expected result = 200 / 1400 = 100 / 700 = 1 / 7
-
-    # when
-    result = calculate_iou(
-        detection_a=detection_a,
-        detection_b=detection_b,
-    )
-
-    # then
-    assert abs(result - 1 / 7) < 1e-5
-
+    # expected partial overlap = 200 / 1400 = 100 / 700 = 1 / 7
 
-def test_enumerate_detections_when_no_predictions_given() -> None:
     # when
-    result = list(enumerate_detections(detections_from_sources=[]))
-
-    # then
-    assert result == []
-
-
-def test_enumerate_detections_when_source_with_no_predictions_given() -> None:
-    # given
-    empty_detections = sv.Detections(
-        xyxy=np.array([[1, 1, 2, 2]], dtype=np.float64),
-        confidence=np.array([0.5], dtype=np.float64),
-        class_id=np.array([1]),
-        data={"class_name": np.array(["a"])},
-    )[[]]
-    source_b = sv.Detections(
-        xyxy=np.array([[1, 1, 2, 2], [3, 3, 4, 4]], dtype=np.float64),
-        confidence=np.array([0.5, 0.6], dtype=np.float64),
-        class_id=np.array([1, 2]),
-        data={"class_name": np.array(["a", "b"])},
-    )
-
-    # when
-    result = list(
-        enumerate_detections(detections_from_sources=[empty_detections, source_b])
+    result = calculate_pairwise_iou(
+        detections_from_sources=[source_a, source_b],
+        class_aware=False,
     )
 
     # then
-    assert result == [
-        (
-            1,
-            sv.Detections(
-                xyxy=np.array(
-                    [
-                        [1, 1, 2, 2],
-                    ],
-                    dtype=np.float64,
-                ),
-                confidence=np.array([0.5], dtype=np.float64),
-                class_id=np.array([1]),
-                data={"class_name": np.array(["a"])},
-            ),
-        ),
-        (
-            1,
-            sv.Detections(
-                xyxy=np.array([[3, 3, 4, 4]], dtype=np.float64),
-                confidence=np.array([0.6], dtype=np.float64),
-                class_id=np.array([2]),
-                data={"class_name": np.array(["b"])},
-            ),
-        ),
-    ]
+    assert set(result.keys()) == {(0, 1), (1, 0)}
+    assert np.allclose(
+        result[(0, 1)], np.array([[1.0, 1 / 7, 0.0], [0.0, 0.0, 1.0]])
+    ), "Expected IoU of each detection from source 0 against each from source 1"
+    assert np.allclose(result[(1, 0)], result[(0, 1)].T)
 
 
-def test_enumerate_detections_when_sources_with_predictions_given() -> None:
+def test_calculate_pairwise_iou_when_class_aware_mode_enabled() -> None:
     # given
     source_a = sv.Detections(
-        xyxy=np.array([[1, 1, 2, 2], [3, 3, 4, 4]], dtype=np.float64),
-        confidence=np.array([0.5, 0.6], dtype=np.float64),
+        xyxy=np.array([[80, 190, 120, 210], [80, 190, 120, 210]], dtype=np.float64),
+        confidence=np.array([0.5, 0.5], dtype=np.float64),
         class_id=np.array([1, 2]),
         data={"class_name": np.array(["a", "b"])},
     )
     source_b = sv.Detections(
-        xyxy=np.array([[5, 5, 6, 6], [7, 7, 8, 8]], dtype=np.float64),
-        confidence=np.array([0.7, 0.8], dtype=np.float64),
-        class_id=np.array([3, 4]),
-        data={"class_name": np.array(["c", "d"])},
+        xyxy=np.array([[80, 190, 120, 210]], dtype=np.float64),
+        confidence=np.array([0.6], dtype=np.float64),
+        class_id=np.array([2]),
+        data={"class_name": np.array(["b"])},
     )
 
     # when
-    result = list(enumerate_detections(detections_from_sources=[source_a, source_b]))
+    result = calculate_pairwise_iou(
+        detections_from_sources=[source_a, source_b],
+        class_aware=True,
+    )
 
     # then
-    assert result == [
-        (
-            0,
-            sv.Detections(
-                xyxy=np.array([[1, 1, 2, 2]], dtype=np.float64),
-                confidence=np.array([0.5], dtype=np.float64),
-                class_id=np.array([1]),
-                data={"class_name": np.array(["a"])},
-            ),
-        ),
-        (
-            0,
-            sv.Detections(
-                xyxy=np.array([[3, 3, 4, 4]], dtype=np.float64),
-                confidence=np.array([0.6], dtype=np.float64),
-                class_id=np.array([2]),
-                data={"class_name": np.array(["b"])},
-            ),
-        ),
-        (
-            1,
-            sv.Detections(
-                xyxy=np.array([[5, 5, 6, 6]], dtype=np.float64),
-                confidence=np.array([0.7], dtype=np.float64),
-                class_id=np.array([3]),
-                data={"class_name": np.array(["c"])},
-            ),
-        ),
-        (
-            1,
-            sv.Detections(
-                xyxy=np.array([[7, 7, 8, 8]], dtype=np.float64),
-                confidence=np.array([0.8], dtype=np.float64),
-                class_id=np.array([4]),
-                data={"class_name": np.array(["d"])},
-            ),
-        ),
-    ]
+    assert np.allclose(
+        result[(0, 1)], np.array([[0.0], [1.0]])
+    ), "Overlap of detections with different classes is not expected to be taken into account"
 
 
-def test_enumerate_detections_when_sources_with_predictions_given_and_source_to_be_excluded() -> (
-    None
-):
+def test_calculate_pairwise_iou_when_source_with_no_predictions_given() -> None:
     # given
     source_a = sv.Detections(
         xyxy=np.array([[1, 1, 2, 2], [3, 3, 4, 4]], dtype=np.float64),
@@ -868,70 +771,32 @@ def test_enumerate_detections_when_sources_with_predictions_given_and_source_to_
         class_id=np.array([1, 2]),
         data={"class_name": np.array(["a", "b"])},
     )
-    source_b = sv.Detections(
-        xyxy=np.array([[5, 5, 6, 6], [7, 7, 8, 8]], dtype=np.float64),
-        confidence=np.array([0.7, 0.8], dtype=np.float64),
-        class_id=np.array([3, 4]),
-        data={"class_name": np.array(["c", "d"])},
-    )
 
     # when
-    result = list(
-        enumerate_detections(
-            detections_from_sources=[source_a, source_b],
-            excluded_source_id=1,
-        )
+    result = calculate_pairwise_iou(
+        detections_from_sources=[source_a, sv.Detections.empty()],
+        class_aware=True,
     )
 
     # then
-    assert result == [
-        (
-            0,
-            sv.Detections(
-                xyxy=np.array([[1, 1, 2, 2]], dtype=np.float64),
-                confidence=np.array([0.5], dtype=np.float64),
-                class_id=np.array([1]),
-                data={"class_name": np.array(["a"])},
-            ),
-        ),
-        (
-            0,
-            sv.Detections(
-                xyxy=np.array([[3, 3, 4, 4]], dtype=np.float64),
-                confidence=np.array([0.6], dtype=np.float64),
-                class_id=np.array([2]),
-                data={"class_name": np.array(["b"])},
-            ),
-        ),
-    ]
+    assert result[(0, 1)].shape == (2, 0)
+    assert result[(1, 0)].shape == (0, 2)
 
 
 def test_get_detections_from_different_sources_with_max_overlap_when_candidate_already_considered() -> (
     None
 ):
     # given
-    source_a = sv.Detections(
-        xyxy=np.array([[1, 1, 2, 2], [3, 3, 4, 4]], dtype=np.float64),
-        confidence=np.array([0.5, 0.6], dtype=np.float64),
-        class_id=np.array([1, 2]),
-        data={"class_name": np.array(["a", "b"]), "detection_id": np.array(["a", "b"])},
-    )
-    source_b = sv.Detections(
-        xyxy=np.array([[7, 7, 8, 8]], dtype=np.float64),
-        confidence=np.array([0.8], dtype=np.float64),
-        class_id=np.array([4]),
-        data={"class_name": np.array(["d"]), "detection_id": np.array(["d"])},
-    )
-    detections_from_sources = [source_a, source_b]
+    pairwise_iou = {(0, 1): np.array([[0.9], [0.0]]), (1, 0): np.array([[0.9, 0.0]])}
+    detections_already_considered = [np.array([False, True]), np.array([True])]
 
     # when
     result = get_detections_from_different_sources_with_max_overlap(
-        detection=source_a[0],
-        source=0,
-        detections_from_sources=detections_from_sources,
+        source_id=0,
+        detection_index=0,
+        pairwise_iou=pairwise_iou,
         iou_threshold=0.5,
-        class_aware=True,
-        detections_already_considered={"b", "d"},
+        detections_already_considered=detections_already_considered,
     )
 
     # then
@@ -954,15 +819,21 @@ def test_get_detections_from_different_sources_with_max_overlap_when_candidate_o
         class_id=np.array([1]),
         data={"detection_id": ["b"], "class_name": ["a"]},
     )
+    pairwise_iou = calculate_pairwise_iou(
+        detections_from_sources=[source_a, source_b],
+        class_aware=True,
+    )
 
     # when
     result = get_detections_from_different_sources_with_max_overlap(
-        detection=source_a[0],
-        source=0,
-        detections_from_sources=[source_a, source_b],
+        source_id=0,
+        detection_index=0,
+        pairwise_iou=pairwise_iou,
         iou_threshold=0.5,
-        class_aware=True,
-        detections_already_considered=set(),
+        detections_already_considered=[
+            np.zeros(2, dtype=bool),
+            np.zeros(1, dtype=bool),
+        ],
     )
 
     # then
@@ -991,15 +862,22 @@ def test_get_detections_from_different_sources_with_max_overlap_when_class_does_
         class_id=np.array([1]),
         data={"detection_id": ["d"], "class_name": ["b"]},
     )
+    pairwise_iou = calculate_pairwise_iou(
+        detections_from_sources=[source_a, source_b, source_c],
+        class_aware=True,
+    )
 
     # when
     result = get_detections_from_different_sources_with_max_overlap(
-        detection=source_a[0],
-        source=0,
-        detections_from_sources=[source_a, source_b, source_c],
+        source_id=0,
+        detection_index=0,
+        pairwise_iou=pairwise_iou,
         iou_threshold=0.5,
-        class_aware=True,
-        detections_already_considered=set(),
+        detections_already_considered=[
+            np.zeros(2, dtype=bool),
+            np.zeros(1, dtype=bool),
+            np.zeros(1, dtype=bool),
+        ],
     )
 
     # then
@@ -1028,27 +906,28 @@ def test_get_detections_from_different_sources_with_max_overlap_when_class_does_
         class_id=np.array([1]),
         data={"detection_id": ["d"], "class_name": ["b"]},
     )
+    pairwise_iou = calculate_pairwise_iou(
+        detections_from_sources=[source_a, source_b, source_c],
+        class_aware=False,
+    )
 
     # when
     result = get_detections_from_different_sources_with_max_overlap(
-        detection=source_a[0],
-        source=0,
-        detections_from_sources=[source_a, source_b, source_c],
+        source_id=0,
+        detection_index=0,
+        pairwise_iou=pairwise_iou,
         iou_threshold=0.5,
-        class_aware=False,
-        detections_already_considered=set(),
+        detections_already_considered=[
+            np.zeros(2, dtype=bool),
+            np.zeros(1, dtype=bool),
+            np.zeros(1, dtype=bool),
+        ],
     )
 
     # then
     assert result == {
-        1: (
-            source_b,
-            1.0,
-        ),
-        2: (
-            source_c,
-            1.0,
-        ),
+        1: (0, 1.0),
+        2: (0, 1.0),
     }, "In both sources other than source 0 it is expected to find fully overlapping prediction, but differ in class"
 
 
@@ -1074,30 +953,56 @@ def test_get_detections_from_different_sources_with_max_overlap_when_multiple_ca
         class_id=np.array([1, 1]),
         data={"detection_id": ["too_small", "d"], "class_name": ["a", "a"]},
     )
+    pairwise_iou = calculate_pairwise_iou(
+        detections_from_sources=[source_a, source_b, source_c],
+        class_aware=True,
+    )
 
     # when
     result = get_detections_from_different_sources_with_max_overlap(
-        detection=source_a,
-        source=0,
-        detections_from_sources=[source_a, source_b, source_c],
+        source_id=0,
+        detection_index=0,
+        pairwise_iou=pairwise_iou,
         iou_threshold=0.5,
-        class_aware=True,
-        detections_already_considered=set(),
+        detections_already_considered=[
+            np.zeros(2, dtype=bool),
+            np.zeros(2, dtype=bool),
+            np.zeros(2, dtype=bool),
+        ],
     )
 
     # then
     assert result == {
-        1: (
-            source_b[1],
-            1.0,
-        ),
-        2: (
-            source_c[1],
-            1.0,
-        ),
+        1: (1, 1.0),
+        2: (1, 1.0),
     }, "In both sources other than source 0 it is expected to find fully overlapping prediction"
 
 
+def test_get_detections_from_different_sources_with_max_overlap_when_candidates_overlap_equally() -> (
+    None
+):
+    # given
+    pairwise_iou = {
+        (0, 1): np.array([[0.25, 0.75, 0.75]]),
+        (1, 0): np.array([[0.25], [0.75], [0.75]]),
+    }
+
+    # when
+    result = get_detections_from_different_sources_with_max_overlap(
+        source_id=0,
+        detection_index=0,
+        pairwise_iou=pairwise_iou,
+        iou_threshold=0.5,
+        detections_already_considered=[
+            np.zeros(1, dtype=bool),
+            np.zeros(3, dtype=bool),
+        ],
+    )
+
+    # then
+    assert result == {1: (1, 0.75)}, "First of equally overlapping candidates expected"
+
+
 def test_filter_predictions_when_no_classes_to_consider_given() -> None:
     # given
     source_a = sv.Detections(
@@ -1297,18 +1202,21 @@ def test_get_consensus_for_single_detection_when_only_single_source_and_single_s
     detections_from_sources = [
         detections,
     ]
-    detections_already_considered = set()
+    detections_already_considered = [
+        np.zeros(len(d), dtype=bool) for d in detections_from_sources
+    ]
+    pairwise_iou = calculate_pairwise_iou(
+        detections_from_sources=detections_from_sources,
+        class_aware=True,
+    )
 
     # when
-    (
-        consensus_detections,
-        detections_already_considered,
-    ) = get_consensus_for_single_detection(
-        detection=detections,
+    consensus_detections = get_consensus_for_single_detection(
         source_id=0,
+        detection_index=0,
         detections_from_sources=detections_from_sources,
+        pairwise_iou=pairwise_iou,
         iou_threshold=0.5,
-        class_aware=True,
         required_votes=1,
         confidence=0.5,
         detections_merge_confidence_aggregation=AggregationMode.AVERAGE,
@@ -1317,7 +1225,9 @@ def test_get_consensus_for_single_detection_when_only_single_source_and_single_s
     )
 
     # then
-    assert detections_already_considered == {"c"}
+    assert [considered.tolist() for considered in detections_already_considered] == [
+        [True]
+    ]
     assert consensus_detections == [
         sv.Detections(
             xyxy=np.array([[80, 190, 120, 210]], dtype=np.float64),
@@ -1366,18 +1276,21 @@ def test_get_consensus_for_single_detection_when_only_single_source_and_single_s
     detections_from_sources = [
         detections,
     ]
-    detections_already_considered = set()
+    detections_already_considered = [
+        np.zeros(len(d), dtype=bool) for d in detections_from_sources
+    ]
+    pairwise_iou = calculate_pairwise_iou(
+        detections_from_sources=detections_from_sources,
+        class_aware=True,
+    )
 
     # when
-    (
-        consensus_detections,
-        detections_already_considered,
-    ) = get_consensus_for_single_detection(
-        detection=detections,
+    consensus_detections = get_consensus_for_single_detection(
         source_id=0,
+        detection_index=0,
         detections_from_sources=detections_from_sources,
+        pairwise_iou=pairwise_iou,
         iou_threshold=0.5,
-        class_aware=True,
         required_votes=2,
         confidence=0.5,
         detections_merge_confidence_aggregation=AggregationMode.AVERAGE,
@@ -1386,7 +1299,7 @@ def test_get_consensus_for_single_detection_when_only_single_source_and_single_s
     )
 
     # then
-    assert detections_already_considered == set()
+    assert not any(considered.any() for considered in detections_already_considered)
     assert consensus_detections == []
 
 
@@ -1437,18 +1350,21 @@ def test_get_consensus_for_single_detection_when_only_multiple_sources_matches_a
             },
         ),
     ]
-    detections_already_considered = set()
+    detections_already_considered = [
+        np.zeros(len(d), dtype=bool) for d in detections_from_sources
+    ]
+    pairwise_iou = calculate_pairwise_iou(
+        detections_from_sources=detections_from_sources,
+        class_aware=True,
+    )
 
     # when
-    (
-        consensus_detections,
-        detections_already_considered,
-    ) = get_consensus_for_single_detection(
-        detection=detections,
+    consensus_detections = get_consensus_for_single_detection(
         source_id=0,
+        detection_index=0,
         detections_from_sources=detections_from_sources,
+        pairwise_iou=pairwise_iou,
         iou_threshold=0.5,
-        class_aware=True,
         required_votes=2,
         confidence=0.5,
         detections_merge_confidence_aggregation=AggregationMode.AVERAGE,
@@ -1457,7 +1373,10 @@ def test_get_consensus_for_single_detection_when_only_multiple_sources_matches_a
     )
 
     # then
-    assert detections_already_considered == {"c", "d"}
+    assert [considered.tolist() for considered in detections_already_considered] == [
+        [True],
+        [True],
+    ]
     assert consensus_detections == [
         sv.Detections(
             xyxy=np.array([[80, 187.5, 120, 212.5]], dtype=np.float64),
@@ -1532,18 +1451,21 @@ def test_get_consensus_for_single_detection_when_only_multiple_sources_matches_b
         empty_detections,
     ]
 
-    detections_already_considered = set()
+    detections_already_considered = [
+        np.zeros(len(d), dtype=bool) for d in detections_from_sources
+    ]
+    pairwise_iou = calculate_pairwise_iou(
+        detections_from_sources=detections_from_sources,
+        class_aware=True,
+    )
 
     # when
-    (
-        consensus_detections,
-        detections_already_considered,
-    ) = get_consensus_for_single_detection(
-        detection=detections,
+    consensus_detections = get_consensus_for_single_detection(
         source_id=0,
+        detection_index=0,
         detections_from_sources=detections_from_sources,
+        pairwise_iou=pairwise_iou,
         iou_threshold=0.5,
-        class_aware=True,
         required_votes=3,
         confidence=0.5,
         detections_merge_confidence_aggregation=AggregationMode.AVERAGE,
@@ -1552,7 +1474,7 @@ def test_get_consensus_for_single_detection_when_only_multiple_sources_matches_b
     )
 
     # then
-    assert detections_already_considered == set()
+    assert not any(considered.any() for considered in detections_already_considered)
     assert consensus_detections == []
 
 
@@ -1603,18 +1525,21 @@ def test_get_consensus_for_single_detection_when_only_multiple_sources_matches_b
             },
         ),
     ]
-    detections_already_considered = set()
+    detections_already_considered = [
+        np.zeros(len(d), dtype=bool) for d in detections_from_sources
+    ]
+    pairwise_iou = calculate_pairwise_iou(
+        detections_from_sources=detections_from_sources,
+        class_aware=True,
+    )
 
     # when
-    (
-        consensus_detections,
-        detections_already_considered,
-    ) = get_consensus_for_single_detection(
-        detection=detections,
+    consensus_detections = get_consensus_for_single_detection(
         source_id=0,
+        detection_index=0,
         detections_from_sources=detections_from_sources,
+        pairwise_iou=pairwise_iou,
         iou_threshold=0.5,
-        class_aware=True,
         required_votes=2,
         confidence=0.8,
         detections_merge_confidence_aggregation=AggregationMode.AVERAGE,
@@ -1623,7 +1548,7 @@ def test_get_consensus_for_single_detection_when_only_multiple_sources_matches_b
     )
 
     # then
-    assert detections_already_considered == set()
+    assert not any(considered.any() for considered in detections_already_considered)
     assert consensus_detections == []
 
 
@@ -1674,18 +1599,21 @@ def test_get_consensus_for_single_detection_when_only_multiple_sources_matches_b
             },
         ),
     ]
-    detections_already_considered = set()
+    detections_already_considered = [
+        np.zeros(len(d), dtype=bool) for d in detections_from_sources
+    ]
+    pairwise_iou = calculate_pairwise_iou(
+        detections_from_sources=detections_from_sources,
+        class_aware=True,
+    )
 
     # when
-    (
-        consensus_detections,
-        detections_already_considered,
-    ) = get_consensus_for_single_detection(
-        detection=detections,
+    consensus_detections = get_consensus_for_single_detection(
         source_id=0,
+        detection_index=0,
         detections_from_sources=detections_from_sources,
+        pairwise_iou=pairwise_iou,
         iou_threshold=0.5,
-        class_aware=True,
         required_votes=2,
         confidence=0.5,
         detections_merge_confidence_aggregation=AggregationMode.AVERAGE,
@@ -1694,7 +1622,7 @@ def test_get_consensus_for_single_detection_when_only_multiple_sources_matches_b
     )
 
     # then
-    assert detections_already_considered == set()
+    assert not any(considered.any() for considered in detections_already_considered)
     assert consensus_detections == []
 
 
@@ -7,7 +7,10 @@ import supervision as sv
 from inference.core.workflows.core_steps.transformations.byte_tracker.v1 import (
     ByteTrackerBlockV1,
 )
-from inference.core.workflows.execution_engine.entities.base import VideoMetadata
+from inference.core.workflows.execution_engine.entities.base import (
+    Batch,
+    VideoMetadata,
+)
 
 
 def test_byte_tracker() -> None:
@@ -62,29 +65,29 @@ def test_byte_tracker() -> None:
 
     # when
     frame1_result = byte_tracker_block.run(
-        metadata=frame1_metadata,
-        detections=frame1_detections,
+        metadata=Batch(content=[frame1_metadata], indices=[(0,)]),
+        detections=Batch(content=[frame1_detections], indices=[(0,)]),
     )
     frame2_result = byte_tracker_block.run(
-        metadata=frame2_metadata,
-        detections=frame2_detections,
+        metadata=Batch(content=[frame2_metadata], indices=[(0,)]),
+        detections=Batch(content=[frame2_detections], indices=[(0,)]),
     )
     frame3_result = byte_tracker_block.run(
-        metadata=frame3_metadata,
-        detections=frame3_detections,
+        metadata=Batch(content=[frame3_metadata], indices=[(0,)]),
+        detections=Batch(content=[frame3_detections], indices=[(0,)]),
     )
 
     # then
     assert (
-        len(set(frame1_result["tracked_detections"].tracker_id.tolist())) == 4
+        len(set(frame1_result[0]["tracked_detections"].tracker_id.tolist())) == 4
     ), "Expected 4 unique tracking ids"
     assert (
-        frame1_result["tracked_detections"].tracker_id.tolist()[:3]
-        == frame2_result["tracked_detections"].tracker_id.tolist()
+        frame1_result[0]["tracked_detections"].tracker_id.tolist()[:3]
+        == frame2_result[0]["tracked_detections"].tracker_id.tolist()
     ), "Expected the same 3 first objects in second frame"
     assert (
-        frame1_result["tracked_detections"].tracker_id.tolist()[:3]
-        == frame3_result["tracked_detections"].tracker_id.tolist()
+        frame1_result[0]["tracked_detections"].tracker_id.tolist()[:3]
+        == frame3_result[0]["tracked_detections"].tracker_id.tolist()
     ), "Expected the same 3 first objects in third frame"
 
 
@@ -113,8 +116,8 @@ def test_byte_tracker_no_fps() -> None:
         match="Malformed fps in VideoMetadata, ByteTrackerBlockV1 requires fps in order to initialize ByteTrack",
     ):
         _ = byte_tracker_block.run(
-            metadata=frame1_metadata,
-            detections=frame1_detections,
+            metadata=Batch(content=[frame1_metadata], indices=[(0,)]),
+            detections=Batch(content=[frame1_detections], indices=[(0,)]),
         )
 
 
@@ -170,27 +173,129 @@ def test_byte_tracker_not_video() -> None:
 
     # when
     frame1_result = byte_tracker_block.run(
-        metadata=frame1_metadata,
-        detections=frame1_detections,
+        metadata=Batch(content=[frame1_metadata], indices=[(0,)]),
+        detections=Batch(content=[frame1_detections], indices=[(0,)]),
     )
     frame2_result = byte_tracker_block.run(
-        metadata=frame2_metadata,
-        detections=frame2_detections,
+        metadata=Batch(content=[frame2_metadata], indices=[(0,)]),
+        detections=Batch(content=[frame2_detections], indices=[(0,)]),
     )
     frame3_result = byte_tracker_block.run(
-        metadata=frame3_metadata,
-        detections=frame3_detections,
+        metadata=Batch(content=[frame3_metadata], indices=[(0,)]),
+        detections=Batch(content=[frame3_detections], indices=[(0,)]),
     )
 
     # then
     assert (
-        len(set(frame1_result["tracked_detections"].tracker_id.tolist())) == 4
+        len(set(frame1_result[0]["tracked_detections"].tracker_id.tolist())) == 4
     ), "Expected 4 unique tracking ids"
     assert (
-        frame1_result["tracked_detections"].tracker_id.tolist()[:3]
-        == frame2_result["tracked_detections"].tracker_id.tolist()
+        frame1_result[0]["tracked_detections"].tracker_id.tolist()[:3]
+        == frame2_result[0]["tracked_detections"].tracker_id.tolist()
     ), "Expected the same 3 first objects in second frame"
     assert (
-        frame1_result["tracked_detections"].tracker_id.tolist()[:3]
-        == frame3_result["tracked_detections"].tracker_id.tolist()
+        frame1_result[0]["tracked_detections"].tracker_id.tolist()[:3]
+        == frame3_result[0]["tracked_detections"].tracker_id.tolist()
     ), "Expected the same 3 first objects in third frame"
+
+
+def test_byte_tracker_when_batch_of_frames_from_different_videos_given() -> None:
+    # given
+    frame1_detections = sv.Detections(
+        xyxy=np.array([[10, 10, 20, 20], [100, 100, 110, 110]]),
+        confidence=np.array([0.9, 0.9]),
+        class_id=np.array([1, 1]),
+    )
+    frame2_detections = sv.Detections(
+        xyxy=np.array([[12, 10, 22, 20], [102, 100, 112, 110]]),
+        confidence=np.array([0.9, 0.9]),
+        class_id=np.array([1, 1]),
+    )
+    other_video_detections = sv.Detections(
+        xyxy=np.array([[300, 300, 310, 310]]),
+        confidence=np.array([0.9]),
+        class_id=np.array([1]),
+    )
+
+    def metadata(video_identifier: str, frame_number: int) -> VideoMetadata:
+        return VideoMetadata(
+            video_identifier=video_identifier,
+            frame_number=frame_number,
+            fps=1,
+            frame_timestamp=datetime.datetime.fromtimestamp(1726570875).astimezone(
+                tz=datetime.timezone.utc
+            ),
+            comes_from_video_file=True,
+        )
+
+    byte_tracker_block = ByteTrackerBlockV1()
+
+    # when
+    batch1_result = byte_tracker_block.run(
+        metadata=Batch(
+            content=[metadata("vid_1", 10), metadata("vid_2", 10)],
+            indices=[(0,), (1,)],
+        ),
+        detections=Batch(
+            content=[frame1_detections, other_video_detections],
+            indices=[(0,), (1,)],
+        ),
+    )
+    batch2_result = byte_tracker_block.run(
+        metadata=Batch(
+            content=[metadata("vid_2", 11), metadata("vid_1", 11)],
+            indices=[(0,), (1,)],
+        ),
+        detections=Batch(
+            content=[other_video_detections, frame2_detections],
+            indices=[(0,), (1,)],
+        ),
+    )
+
+    # then
+    assert len(batch1_result) == 2
+    assert len(batch2_result) == 2
+    assert (
+        batch1_result[0]["tracked_detections"].tracker_id.tolist()
+        == batch2_result[1]["tracked_detections"].tracker_id.tolist()
+    ), "Expected the same objects tracked in consecutive frames of vid_1"
+    assert (
+        batch1_result[1]["tracked_detections"].tracker_id.tolist()
+        == batch2_result[0]["tracked_detections"].tracker_id.tolist()
+    ), "Expected the same object tracked in consecutive frames of vid_2"
+    assert len(batch1_result[0]["tracked_detections"]) == 2
+    assert len(batch1_result[1]["tracked_detections"]) == 1
+
+
+def test_byte_tracker_keeps_input_detections_intact() -> None:
+    # given
+    mask = np.zeros((2, 480, 640), dtype=bool)
+    mask[0, 10:20, 10:20] = True
+    mask[1, 100:110, 100:110] = True
+    detections = sv.Detections(
+        xyxy=np.array([[10, 10, 20, 20], [100, 100, 110, 110]]),
+        mask=mask,
+        confidence=np.array([0.9, 0.9]),
+        class_id=np.array([1, 1]),
+    )
+    metadata = VideoMetadata(
+        video_identifier="vid_1",
+        frame_number=10,
+        fps=1,
+        frame_timestamp=datetime.datetime.fromtimestamp(1726570875).astimezone(
+            tz=datetime.timezone.utc
+        ),
+        comes_from_video_file=True,
+    )
+    byte_tracker_block = ByteTrackerBlockV1()
+
+    # when
+    result = byte_tracker_block.run(
+        metadata=Batch(content=[metadata], indices=[(0,)]),
+        detections=Batch(content=[detections], indices=[(0,)]),
+    )
+
+    # then
+    assert detections.tracker_id is None, "Input detections expected to be untouched"
+    assert len(result[0]["tracked_detections"]) == 2
+    assert np.array_equal(result[0]["tracked_detections"].mask, mask)
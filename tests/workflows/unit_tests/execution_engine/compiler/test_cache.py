@@ -0,0 +1,118 @@
+from inference.core.workflows.execution_engine.v1.compiler.cache import (
+    BasicWorkflowsCache,
+    compute_workflow_definition_hash,
+)
+
+
+def test_basic_workflows_cache_when_entry_not_cached() -> None:
+    # given
+    cache = BasicWorkflowsCache[int](max_size=2)
+
+    # when
+    result = cache.get(key="some")
+
+    # then
+    assert result is None
+    statistics = cache.get_statistics()
+    assert statistics.hits == 0
+    assert statistics.misses == 1
+
+
+def test_basic_workflows_cache_when_entry_cached() -> None:
+    # given
+    cache = BasicWorkflowsCache[int](max_size=2)
+    cache.cache(key="some", value=37)
+
+    # when
+    result = cache.get(key="some")
+
+    # then
+    assert result == 37
+    statistics = cache.get_statistics()
+    assert statistics.hits == 1
+    assert statistics.misses == 0
+    assert abs(statistics.hit_rate - 1.0) < 1e-5
+
+
+def test_basic_workflows_cache_evicts_least_recently_used_entry() -> None:
+    # given
+    cache = BasicWorkflowsCache[int](max_size=2)
+    cache.cache(key="a", value=1)
+    cache.cache(key="b", value=2)
+    _ = cache.get(key="a")
+
+    # when
+    cache.cache(key="c", value=3)
+
+    # then
+    assert cache.get(key="a") == 1
+    assert cache.get(key="b") is None, "Expected b to be evicted as least recent"
+    assert cache.get(key="c") == 3
+    assert cache.get_statistics().size == 2
+
+
+def test_basic_workflows_cache_when_disabled() -> None:
+    # given
+    cache = BasicWorkflowsCache[int](max_size=0)
+    cache.cache(key="a", value=1)
+
+    # when
+    result = cache.get(key="a")
+
+    # then
+    assert result is None
+    assert cache.enabled is False
+    assert cache.get_statistics().size == 0
+
+
+def test_basic_workflows_cache_invalidation() -> None:
+    # given
+    cache = BasicWorkflowsCache[int](max_size=2)
+    cache.cache(key="a", value=1)
+    cache.cache(key="b", value=2)
+
+    # when
+    invalidation_result = cache.invalidate(key="a")
+    cache.clear()
+
+    # then
+    assert invalidation_result is True
+    assert cache.invalidate(key="a") is False
+    assert cache.get_statistics().size == 0
+
+
+def test_compute_workflow_definition_hash_is_insensitive_to_keys_order() -> None:
+    # given
+    definition_a = {"version": "1.0", "inputs": [{"type": "a", "name": "b"}]}
+    definition_b = {"inputs": [{"name": "b", "type": "a"}], "version": "1.0"}
+
+    # when
+    hash_a = compute_workflow_definition_hash(workflow_definition=definition_a)
+    hash_b = compute_workflow_definition_hash(workflow_definition=definition_b)
+
+    # then
+    assert hash_a == hash_b
+
+
+def test_compute_workflow_definition_hash_when_discriminators_differ() -> None:
+    # given
+    definition = {"version": "1.0", "inputs": []}
+
+    # when
+    hash_a = compute_workflow_definition_hash(
+        workflow_definition=definition, discriminators=["1.0.0"]
+    )
+    hash_b = compute_workflow_definition_hash(
+        workflow_definition=definition, discriminators=["1.0.0", "my_plugin"]
+    )
+
+    # then
+    assert hash_a != hash_b
+
+
+def test_compute_workflow_definition_hash_when_definition_is_not_serialisable() -> None:
+    # when
+    result = compute_workflow_definition_hash(workflow_definition={"version": object()})
+
+    # then
+    assert result is None
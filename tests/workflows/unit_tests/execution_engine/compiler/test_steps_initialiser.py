@@ -124,6 +124,20 @@ def test_retrieve_init_parameter_values_when_initializers_define_generic_value_f
     assert result == 42
 
 
+def test_retrieve_init_parameter_values_when_step_name_requested() -> None:
+    # when
+    result = retrieve_init_parameter_values(
+        block_name="block",
+        block_init_parameter="step_name",
+        block_source="some",
+        explicit_init_parameters={"step_name": "other"},
+        initializers={},
+    )
+
+    # then
+    assert result == "block", "Expected name of the step to be always injected"
+
+
 def test_retrieve_init_parameter_values_when_parameter_cannot_be_resolved() -> None:
     # when
     with pytest.raises(BlockInitParameterNotProvidedError):
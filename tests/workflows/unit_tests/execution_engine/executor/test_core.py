@@ -0,0 +1,60 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+from unittest import mock
+from unittest.mock import MagicMock
+
+from inference.core.workflows.execution_engine.v1.executor import core
+from inference.core.workflows.execution_engine.v1.executor.core import (
+    execute_steps_in_data_flow_order,
+)
+
+
+class IndependentStepsCoordinator:
+    def __init__(self, steps: List[str]):
+        self._steps = steps
+        self._executed = set()
+
+    def get_steps_to_execute_next(self) -> Optional[List[str]]:
+        steps, self._steps = self._steps, []
+        return steps or None
+
+    def mark_step_as_executed(self, step_selector: str) -> None:
+        self._executed.add(step_selector)
+
+
+@mock.patch.object(core, "safe_execute_step")
+def test_execute_steps_in_data_flow_order_does_not_exceed_max_concurrent_steps_of_shared_executor(
+    safe_execute_step_mock: MagicMock,
+) -> None:
+    # given
+    lock = threading.Lock()
+    in_progress, max_in_progress = 0, 0
+
+    def execute_step(**kwargs) -> None:
+        nonlocal in_progress, max_in_progress
+        with lock:
+            in_progress += 1
+            max_in_progress = max(max_in_progress, in_progress)
+        time.sleep(0.01)
+        with lock:
+            in_progress -= 1
+
+    safe_execute_step_mock.side_effect = execute_step
+    coordinator = IndependentStepsCoordinator(steps=[f"$steps.s{i}" for i in range(8)])
+
+    # when
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        execute_steps_in_data_flow_order(
+            workflow=MagicMock(),
+            execution_coordinator=coordinator,
+            execution_data_manager=MagicMock(),
+            executor=executor,
+            max_concurrent_steps=2,
+        )
+
+    # then
+    assert safe_execute_step_mock.call_count == 8
+    assert len(coordinator._executed) == 8
+    assert max_in_progress == 2
@@ -9,11 +9,11 @@ from inference.core.workflows.execution_engine.v1.compiler.entities import (
     StepNode,
 )
 from inference.core.workflows.execution_engine.v1.executor.flow_coordinator import (
-    ParallelStepExecutionCoordinator,
+    DataFlowStepExecutionCoordinator,
 )
 
 
-def test_parallel_flow_coordinator_when_there_is_simple_execution_path() -> None:
+def test_data_flow_coordinator_when_there_is_simple_execution_path() -> None:
     # given
     graph = nx.DiGraph()
     graph.add_node("input_1", node_compilation_output=assembly_dummy_input("input_1"))
@@ -27,18 +27,21 @@ def test_parallel_flow_coordinator_when_there_is_simple_execution_path() -> None
     graph.add_edge("step_2", "output_1")
 
     # when
-    coordinator = ParallelStepExecutionCoordinator.init(execution_graph=graph)
+    coordinator = DataFlowStepExecutionCoordinator.init(execution_graph=graph)
 
     # then
     result = coordinator.get_steps_to_execute_next()
     assert set(result) == {"step_1"}, "At first step_1 must be executed"
     result = coordinator.get_steps_to_execute_next()
+    assert result == [], "step_2 must not be released before step_1 is executed"
+    coordinator.mark_step_as_executed(step_selector="step_1")
+    result = coordinator.get_steps_to_execute_next()
     assert set(result) == {"step_2"}, "As second - step_2 should be executed"
     result = coordinator.get_steps_to_execute_next()
     assert result is None, "Execution path should end up to this point"
 
 
-def test_parallel_flow_coordinator_when_there_is_ensemble_of_models() -> None:
+def test_data_flow_coordinator_when_there_is_ensemble_of_models() -> None:
     # given
     graph = nx.DiGraph()
     graph.add_node("input_1", node_compilation_output=assembly_dummy_input("input_1"))
@@ -55,7 +58,7 @@ def test_parallel_flow_coordinator_when_there_is_ensemble_of_models() -> None:
     graph.add_edge("step_3", "output_1")
 
     # when
-    coordinator = ParallelStepExecutionCoordinator.init(execution_graph=graph)
+    coordinator = DataFlowStepExecutionCoordinator.init(execution_graph=graph)
 
     # then
     result = coordinator.get_steps_to_execute_next()
@@ -63,58 +66,17 @@ def test_parallel_flow_coordinator_when_there_is_ensemble_of_models() -> None:
         "step_1",
         "step_2",
     }, "As first two steps - step_1 and step_2 must be taken in any order"
+    coordinator.mark_step_as_executed(step_selector="step_2")
     result = coordinator.get_steps_to_execute_next()
-    assert set(result) == {"step_3"}, "As third - step_3 should be executed"
+    assert result == [], "step_3 must wait until both of its predecessors finish"
+    coordinator.mark_step_as_executed(step_selector="step_1")
     result = coordinator.get_steps_to_execute_next()
-    assert result is None, "Execution path should end up to this point"
-
-
-def test_parallel_flow_coordinator_when_there_is_condition_step() -> None:
-    # given
-    graph = nx.DiGraph()
-    graph.add_node("input_1", node_compilation_output=assembly_dummy_input("input_1"))
-    graph.add_node("step_1", node_compilation_output=assembly_dummy_step("step_1"))
-    graph.add_node("step_2", node_compilation_output=assembly_dummy_step("step_2"))
-    graph.add_node("step_3", node_compilation_output=assembly_dummy_step("step_3"))
-    graph.add_node("step_4", node_compilation_output=assembly_dummy_step("step_4"))
-    graph.add_node("step_5", node_compilation_output=assembly_dummy_step("step_5"))
-    graph.add_node(
-        "output_1", node_compilation_output=assembly_dummy_output("output_1")
-    )
-    graph.add_node(
-        "output_2", node_compilation_output=assembly_dummy_output("output_2")
-    )
-    graph.add_edge("input_1", "step_1")
-    graph.add_edge("step_1", "step_2")
-    graph.add_edge("step_2", "step_5")
-    graph.add_edge("step_1", "step_3")
-    graph.add_edge("step_3", "step_4")
-    graph.add_edge("step_5", "output_1")
-    graph.add_edge("step_4", "output_2")
-
-    # when
-    coordinator = ParallelStepExecutionCoordinator.init(execution_graph=graph)
-
-    # then
-    result = coordinator.get_steps_to_execute_next()
-    assert set(result) == {"step_1"}, "Step_1 should be executed at first"
-    result = coordinator.get_steps_to_execute_next()
-    assert set(result) == {
-        "step_2",
-        "step_3",
-    }, "As third - step_2, step_3 should be suggested to be executed, as this is the branching start"
-    result = coordinator.get_steps_to_execute_next()
-    assert set(result) == {
-        "step_4",
-        "step_5",
-    }, "step_4 is the only successor of step_3 and step_5 is the successor of step_2 - both should be suggested"
+    assert set(result) == {"step_3"}, "As third - step_3 should be executed"
     result = coordinator.get_steps_to_execute_next()
     assert result is None, "Execution path should end up to this point"
 
 
-def test_parallel_flow_coordinator_when_there_are_two_parallel_execution_paths() -> (
-    None
-):
+def test_data_flow_coordinator_does_not_wait_for_unrelated_branch() -> None:
     # given
     graph = nx.DiGraph()
     graph.add_node("input_1", node_compilation_output=assembly_dummy_input("input_1"))
@@ -136,7 +98,7 @@ def test_parallel_flow_coordinator_when_there_are_two_parallel_execution_paths()
     graph.add_edge("step_4", "output_2")
 
     # when
-    coordinator = ParallelStepExecutionCoordinator.init(execution_graph=graph)
+    coordinator = DataFlowStepExecutionCoordinator.init(execution_graph=graph)
 
     # then
     result = coordinator.get_steps_to_execute_next()
@@ -144,11 +106,15 @@ def test_parallel_flow_coordinator_when_there_are_two_parallel_execution_paths()
         "step_1",
         "step_3",
     }, "As first, two steps - step_1 and step_3 must be taken in any order"
+    coordinator.mark_step_as_executed(step_selector="step_3")
     result = coordinator.get_steps_to_execute_next()
     assert set(result) == {
-        "step_2",
-        "step_4",
-    }, "As second, two steps - step_2 and step_4 must be taken in any order"
+        "step_4"
+    }, "step_4 should be released while step_1 is still running"
+    coordinator.mark_step_as_executed(step_selector="step_4")
+    coordinator.mark_step_as_executed(step_selector="step_1")
+    result = coordinator.get_steps_to_execute_next()
+    assert set(result) == {"step_2"}, "step_2 should be released after step_1"
     result = coordinator.get_steps_to_execute_next()
     assert result is None, "Execution path should end up to this point"
 
@@ -67,6 +67,33 @@ def test_assemble_runtime_parameters_when_image_is_provided_as_single_element_di
     ), "Expected parent id to be given after input param name"
 
 
+@mock.patch.object(runtime_input_assembler, "load_image_from_url")
+def test_assemble_runtime_parameters_when_batch_of_urls_provided(
+    load_image_from_url_mock: MagicMock,
+) -> None:
+    # given
+    load_image_from_url_mock.side_effect = lambda value: np.full(
+        (8, 8, 3), fill_value=int(value.split("/")[-1]), dtype=np.uint8
+    )
+    runtime_parameters = {
+        "image1": [{"type": "url", "value": f"https://some.com/{i}"} for i in range(10)]
+    }
+    defined_inputs = [WorkflowImage(type="WorkflowImage", name="image1")]
+
+    # when
+    result = assemble_runtime_parameters(
+        runtime_parameters=runtime_parameters,
+        defined_inputs=defined_inputs,
+    )
+
+    # then
+    assert len(result["image1"]) == 10
+    for i, image in enumerate(result["image1"]):
+        assert np.all(image.numpy_image == i), "Expected order of images preserved"
+        assert image.parent_metadata.parent_id == f"image1.[{i}]"
+        assert image._image_reference == f"https://some.com/{i}"
+
+
 def test_assemble_runtime_parameters_when_image_is_provided_as_single_element_dict_pointing_local_file_when_load_of_local_files_allowed(
     example_image_file: str,
 ) -> None:
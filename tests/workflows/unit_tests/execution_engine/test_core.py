@@ -1,4 +1,7 @@
+import gc
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
+from unittest.mock import MagicMock
 
 import pytest
 from packaging.version import Version
@@ -9,11 +12,14 @@ from inference.core.workflows.errors import (
 )
 from inference.core.workflows.execution_engine import core
 from inference.core.workflows.execution_engine.core import (
+    ExecutionEngine,
     _select_execution_engine,
     retrieve_requested_execution_engine_version,
 )
+from inference.core.workflows.execution_engine.v1 import core as v1_core
 from inference.core.workflows.execution_engine.v1.core import (
     EXECUTION_ENGINE_V1_VERSION,
+    ExecutionEngineV1,
 )
 
 
@@ -79,3 +85,76 @@ def test_select_execution_engine_when_no_version_match() -> None:
     # when
     with pytest.raises(NotSupportedExecutionEngineError):
         _ = _select_execution_engine(requested_engine_version=Version("2.0.0"))
+
+
+def test_execution_engine_v1_close_shuts_down_owned_steps_executor() -> None:
+    # given
+    engine = ExecutionEngineV1(
+        compiled_workflow=MagicMock(),
+        max_concurrent_steps=2,
+        prevent_local_images_loading=False,
+    )
+    steps_executor = engine._steps_executor
+
+    # when
+    engine.close()
+
+    # then
+    with pytest.raises(RuntimeError):
+        _ = steps_executor.submit(print)
+
+
+def test_execution_engine_v1_shuts_down_owned_steps_executor_when_garbage_collected() -> (
+    None
+):
+    # given
+    engine = ExecutionEngineV1(
+        compiled_workflow=MagicMock(),
+        max_concurrent_steps=2,
+        prevent_local_images_loading=False,
+    )
+    steps_executor = engine._steps_executor
+
+    # when
+    del engine
+    gc.collect()
+
+    # then
+    with pytest.raises(RuntimeError):
+        _ = steps_executor.submit(print)
+
+
+def test_execution_engine_v1_close_does_not_shut_down_injected_steps_executor() -> None:
+    # given
+    with ThreadPoolExecutor(max_workers=2) as steps_executor:
+        engine = ExecutionEngineV1(
+            compiled_workflow=MagicMock(),
+            max_concurrent_steps=2,
+            prevent_local_images_loading=False,
+            steps_executor=steps_executor,
+        )
+
+        # when
+        engine.close()
+
+        # then
+        assert steps_executor.submit(lambda: 37).result() == 37
+
+
+@mock.patch.object(v1_core, "compile_workflow")
+def test_execution_engine_init_passes_steps_executor_to_engine(
+    compile_workflow_mock: MagicMock,
+) -> None:
+    # given
+    with ThreadPoolExecutor(max_workers=2) as steps_executor:
+        # when
+        engine = ExecutionEngine.init(
+            workflow_definition={"version": "1.0"},
+            max_concurrent_steps=2,
+            steps_executor=steps_executor,
+        )
+        engine.close()
+
+        # then
+        assert engine._engine._steps_executor is steps_executor
+        assert steps_executor.submit(lambda: 37).result() == 37